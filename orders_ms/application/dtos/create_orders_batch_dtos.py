@@ -0,0 +1,28 @@
+"""
+DTOs para la creación de pedidos en lote.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+# Item inicial de un pedido del lote
+@dataclass
+class BatchOrderItemDTO:
+    sku: str
+    quantity: int
+
+# Pedido del lote: cliente e items iniciales opcionales
+@dataclass
+class BatchOrderDTO:
+    customer_id: str
+    items: List[BatchOrderItemDTO] = field(default_factory=list)
+
+# DTOs para crear pedidos en lote
+@dataclass
+class CreateOrdersBatchRequestDTO:
+    orders: List[BatchOrderDTO]
+
+# DTOs para la respuesta de creación en lote (IDs en el orden de la petición)
+@dataclass
+class CreateOrdersBatchResponseDTO:
+    order_ids: List[str]
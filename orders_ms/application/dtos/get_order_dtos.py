@@ -2,7 +2,7 @@
 DTOs para obtener detalles de una orden
 """
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 @dataclass
 class GetOrderRequestDTO:
@@ -14,4 +14,5 @@ class GetOrderResponseDTO:
     customer_id: str
     items: List[Dict[str, Any]]  # Lista de items con sus detalles
     total_amount: float
-    items_count: int
\ No newline at end of file
+    items_count: int
+    version: Optional[int] = None  # Versión de la orden leída (para ETags y cachés de respuestas)
\ No newline at end of file
@@ -1,9 +1,11 @@
 """
 DTOs para el caso de uso de listar todas las órdenes
 """
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
 from decimal import Decimal
+from application.pagination import DEFAULT_PAGE_SIZE
 
 @dataclass
 class OrderSummaryDTO:
@@ -12,14 +14,20 @@ class OrderSummaryDTO:
     customer_id: str
     items_count: int
     total_amount: Decimal
+    # Fecha de alta: solo la posición para el cursor (sort="created_at"), no forma parte del resumen
+    created_at: Optional[datetime] = field(default=None, compare=False)
 
 @dataclass
 class ListOrdersRequestDTO:
-    """DTO para la petición de listar órdenes"""
-    pass  # No necesita parámetros por ahora
+    """DTO para la petición de listar órdenes (una página)"""
+    cursor: Optional[str] = None  # Cursor opaco devuelto en la página anterior
+    limit: int = DEFAULT_PAGE_SIZE
+    sort: str = "order_id"        # "order_id" o "created_at"
+    customer_id: Optional[str] = None  # Solo las órdenes de este cliente
 
 @dataclass
 class ListOrdersResponseDTO:
     """DTO para la respuesta de listar órdenes"""
     orders: List[OrderSummaryDTO]
-    total_orders: int
\ No newline at end of file
+    total_orders: int                  # Órdenes incluidas en esta página
+    next_cursor: Optional[str] = None  # None si no hay más páginas
\ No newline at end of file
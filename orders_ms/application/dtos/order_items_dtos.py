@@ -0,0 +1,33 @@
+"""
+DTOs para añadir o reemplazar varias líneas de un pedido en una petición.
+"""
+
+from dataclasses import dataclass, field
+from typing import List
+
+# Línea solicitada (sku, cantidad)
+@dataclass
+class OrderLineDTO:
+    sku: str
+    quantity: int
+
+# DTOs para añadir/reemplazar líneas de un pedido
+@dataclass
+class OrderItemsRequestDTO:
+    order_id: str
+    lines: List[OrderLineDTO]
+
+# Error de validación de una línea concreta (posición en la petición)
+@dataclass
+class LineErrorDTO:
+    index: int
+    sku: str
+    message: str
+
+# DTOs para la respuesta: order_found=False si el pedido no existe;
+# si hay errores de línea no se aplica ningún cambio
+@dataclass
+class OrderItemsResponseDTO:
+    success: bool
+    order_found: bool = True
+    errors: List[LineErrorDTO] = field(default_factory=list)
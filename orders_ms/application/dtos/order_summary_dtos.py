@@ -0,0 +1,37 @@
+"""
+DTOs de los agregados de la proyección de resúmenes (por cliente y globales)
+"""
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List
+
+
+@dataclass
+class CustomerSummaryDTO:
+    """Totales de las órdenes de un cliente"""
+    customer_id: str
+    orders_count: int = 0
+    items_count: int = 0
+    total_amount: Decimal = Decimal("0")
+
+
+@dataclass
+class OrdersOverviewDTO:
+    """Totales de todas las órdenes (panel de administración)"""
+    orders_count: int
+    items_count: int
+    total_amount: Decimal
+    customers_count: int
+
+
+@dataclass
+class SummaryConsistencyReportDTO:
+    """Resultado de comparar la proyección con las órdenes guardadas"""
+    checked: int = 0
+    mismatched: List[str] = field(default_factory=list)  # Totales distintos
+    missing: List[str] = field(default_factory=list)     # Guardadas pero no proyectadas
+    unexpected: List[str] = field(default_factory=list)  # Proyectadas pero no guardadas
+
+    @property
+    def consistent(self) -> bool:
+        return not (self.mismatched or self.missing or self.unexpected)
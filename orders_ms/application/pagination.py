@@ -0,0 +1,91 @@
+"""
+Paginación por cursor (keyset) - Codificación de cursores opacos
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Tuple, Union
+
+# Campos por los que se puede paginar
+SORT_FIELDS = ("order_id", "created_at")
+
+# Tamaños de página
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+# Posición tras la que continuar una página: el order_id con sort="order_id"
+# y el par (created_at, order_id) con sort="created_at"
+PagePosition = Union[str, Tuple[datetime, str]]
+
+
+class InvalidCursorError(ValueError):
+    """El cursor recibido no es válido o no corresponde al orden pedido"""
+    pass
+
+
+def validate_page_params(limit: int, sort: str) -> None:
+    """
+    Valida los parámetros de paginación.
+
+    :raises ValueError: Si el límite o el campo de ordenación no son válidos.
+    """
+    if sort not in SORT_FIELDS:
+        raise ValueError(f"Sort must be one of {', '.join(SORT_FIELDS)}")
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+
+
+def page_position(sort: str, summary) -> PagePosition:
+    """Posición de un resumen (o de cualquier objeto con order_id y created_at) para el orden dado"""
+    if sort == "created_at":
+        return (summary.created_at, summary.order_id)
+    return summary.order_id
+
+
+def encode_cursor(sort: str, after: PagePosition) -> str:
+    """
+    Codifica la posición de la última orden devuelta en un cursor opaco.
+
+    Con sort="created_at" el cursor lleva también la fecha de la orden: la
+    página siguiente compara (created_at, order_id) directamente y no depende
+    de que la orden siga existiendo (borrada o archivada entre páginas).
+
+    :param sort: Campo de ordenación de la página.
+    :param after: Posición de la última orden devuelta (ver PagePosition).
+    :return: Cursor en base64 url-safe.
+    """
+    if sort == "created_at":
+        created_at, order_id = after
+        payload = {"s": sort, "a": order_id, "c": created_at.isoformat()}
+    else:
+        payload = {"s": sort, "a": after}
+    encoded = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(encoded.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> PagePosition:
+    """
+    Decodifica un cursor y devuelve la posición tras la que continuar.
+
+    :param cursor: Cursor recibido del cliente.
+    :param sort: Campo de ordenación de la petición actual.
+    :raises InvalidCursorError: Si el cursor está mal formado o es de otro orden.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        cursor_sort, after = payload["s"], payload["a"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise InvalidCursorError("Malformed cursor")
+    if not isinstance(after, str):
+        raise InvalidCursorError("Malformed cursor")
+
+    if cursor_sort != sort:
+        raise InvalidCursorError("Cursor does not match the requested sort")
+    if sort == "created_at":
+        try:
+            return (datetime.fromisoformat(payload["c"]), after)
+        except (KeyError, TypeError, ValueError):
+            raise InvalidCursorError("Malformed cursor")
+    return after
@@ -0,0 +1,83 @@
+"""
+Async Order Repository Interface - Puerto asíncrono para persistencia de pedidos
+"""
+from abc import ABC, abstractmethod
+from domain.entities.order import Order
+from typing import Optional
+from application.pagination import PagePosition
+
+class AsyncOrderRepository(ABC):
+    """
+    Versión asíncrona de OrderRepository para adaptadores con drivers asyncio.
+    Mismo contrato, pero cada operación es una corrutina.
+    """
+    @abstractmethod
+    async def save(self, order: 'Order') -> 'Order':
+        """
+        Guarda una orden en el repositorio.
+        
+        :param order: La orden a guardar.
+        :return: La orden guardada.
+        :raises ConcurrencyConflictError: Si la orden cambió desde que se cargó.
+        """
+        pass
+
+    @abstractmethod
+    async def save_many(self, orders: list['Order']) -> None:
+        """
+        Guarda varias órdenes en una sola operación.
+        
+        :param orders: Las órdenes a guardar.
+        """
+        pass
+
+    @abstractmethod
+    async def get(self, order_id: str) -> Optional['Order']:
+        """
+        Recupera una orden por su ID.
+        
+        :param order_id: El ID de la orden a recuperar.
+        :return: La orden si se encuentra, None en caso contrario.
+        """
+        pass
+
+    @abstractmethod
+    async def get_version(self, order_id: str) -> Optional[int]:
+        """
+        Versión actual de una orden sin reconstruirla.
+        
+        :param order_id: El ID de la orden.
+        :return: La versión, o None si la orden no existe o si la versión
+            guardada no identifica su estado.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, order_id: str) -> None:
+        """
+        Elimina una orden por su ID.
+        
+        :param order_id: El ID de la orden a eliminar.
+        """
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> list['Order']:
+        """
+        Obtiene todas las órdenes.
+        
+        :return: Lista con todas las órdenes.
+        """
+        pass
+
+    @abstractmethod
+    async def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> list['Order']:
+        """
+        Obtiene una página de órdenes ordenadas (paginación keyset).
+        
+        :param after: Posición de la última orden de la página anterior (PagePosition), None para la primera.
+        :param limit: Número máximo de órdenes a devolver.
+        :param sort: Campo de ordenación ("order_id" o "created_at").
+        :return: Lista ordenada de órdenes posteriores a `after`.
+        """
+        pass
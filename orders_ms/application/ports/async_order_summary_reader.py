@@ -0,0 +1,40 @@
+"""
+Async Order Summary Reader Interface - Puerto asíncrono de lectura de resúmenes
+"""
+from abc import ABC, abstractmethod
+from typing import Optional
+from application.pagination import PagePosition
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+
+
+class AsyncOrderSummaryReader(ABC):
+    """
+    Versión asíncrona de OrderSummaryReader.
+    """
+    @abstractmethod
+    async def list_summaries(self, after: Optional[PagePosition], limit: int,
+                             sort: str = "order_id") -> list[OrderSummaryDTO]:
+        """
+        Obtiene una página de resúmenes de órdenes (paginación keyset).
+        
+        :param after: Posición de la última orden de la página anterior (PagePosition), None para la primera.
+        :param limit: Número máximo de resúmenes a devolver.
+        :param sort: Campo de ordenación ("order_id" o "created_at").
+        :return: Lista ordenada de resúmenes posteriores a `after`.
+        """
+        pass
+
+    @abstractmethod
+    async def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                      sort: str = "order_id") -> list[OrderSummaryDTO]:
+        """
+        Obtiene una página de resúmenes de las órdenes de un cliente. El coste
+        depende del número de órdenes de ese cliente, no del total.
+
+        :param customer_id: Cliente cuyas órdenes se listan.
+        :param after: Posición de la última orden de la página anterior (PagePosition), None para la primera.
+        :param limit: Número máximo de resúmenes a devolver.
+        :param sort: Campo de ordenación ("order_id" o "created_at").
+        :return: Lista ordenada de resúmenes del cliente posteriores a `after`.
+        """
+        pass
@@ -0,0 +1,43 @@
+"""
+Async Pricing Service Interface - Puerto asíncrono para obtención de precios
+"""
+from typing import Dict, List, Optional
+from abc import ABC, abstractmethod
+from domain.value_objects.sku import SKU
+from domain.value_objects.price import Price
+
+
+class AsyncPricingService(ABC):
+    """
+    Versión asíncrona de PricingService, para los casos de uso asíncronos:
+    esperar al catálogo no debe bloquear el event loop.
+    """
+    @abstractmethod
+    async def get_price(self, sku: SKU) -> Optional[Price]:
+        """
+        Obtiene el precio de un producto por su SKU.
+
+        :param sku: El SKU del producto.
+        :return: El precio del producto.
+        """
+        pass
+
+    @abstractmethod
+    async def product_exists(self, sku: SKU) -> bool:
+        """
+        Verifica si un producto existe por su SKU.
+
+        :param sku: El SKU del producto.
+        :return: True si el producto existe, False en caso contrario.
+        """
+        pass
+
+    @abstractmethod
+    async def get_prices(self, skus: List[SKU]) -> Dict[str, Price]:
+        """
+        Obtiene los precios de varios productos con una sola consulta.
+
+        :param skus: Los SKUs de los productos.
+        :return: Precio por código de SKU; los productos inexistentes no aparecen.
+        """
+        pass
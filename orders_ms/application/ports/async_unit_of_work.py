@@ -0,0 +1,44 @@
+"""
+Async Unit of Work pattern - Puerto (interface) asíncrono para gestión transaccional
+"""
+from abc import ABC, abstractmethod
+from application.ports.async_order_repository import AsyncOrderRepository
+from application.ports.async_order_summary_reader import AsyncOrderSummaryReader
+
+
+class AsyncUnitOfWork(ABC):
+    """
+    Port (interface) para Unit of Work con drivers asyncio.
+    
+    Se usa con `async with`, de modo que el event loop queda libre
+    mientras se espera a la base de datos.
+    """
+    
+    # Repositorios disponibles en esta UoW
+    orders: AsyncOrderRepository
+    summaries: AsyncOrderSummaryReader
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is not None:
+            await self.rollback()
+        else:
+            await self.commit()
+        await self.close()
+    
+    @abstractmethod
+    async def commit(self):
+        """Confirma los cambios"""
+        pass
+    
+    @abstractmethod
+    async def rollback(self):
+        """Deshace los cambios"""
+        pass
+    
+    @abstractmethod
+    async def close(self):
+        """Cierra la unidad de trabajo"""
+        pass
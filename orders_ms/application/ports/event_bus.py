@@ -2,6 +2,7 @@
 Event Bus Interface - Puerto para la comunicación entre módulos
 """
 from abc import ABC, abstractmethod
+from typing import Callable, Type
 from domain.events.domain_event import DomainEvent
 
 
@@ -26,4 +27,14 @@ class EventBus(ABC):
         
         :param events: La lista de eventos a publicar.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def subscribe(self, event_type: Type[DomainEvent], handler: Callable[[DomainEvent], None]) -> None:
+        """
+        Registra un manejador para los eventos de un tipo (y sus subclases).
+        
+        :param event_type: La clase de evento.
+        :param handler: Se llama con cada evento publicado de ese tipo.
+        """
+        pass
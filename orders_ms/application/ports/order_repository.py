@@ -4,6 +4,19 @@ Order Repository Interface - Puerto para persistencia de pedidos
 from abc import ABC, abstractmethod
 from domain.entities.order import Order
 from typing import Optional
+from application.pagination import PagePosition
+
+class ConcurrencyConflictError(Exception):
+    """
+    La orden se modificó en otra transacción desde que se cargó
+    (control de concurrencia optimista). Reintentar desde la carga.
+    """
+
+    def __init__(self, order_id: str, expected_version: int):
+        super().__init__(f"Order {order_id} was modified concurrently (expected version {expected_version})")
+        self.order_id = order_id
+        self.expected_version = expected_version
+
 
 class OrderRepository(ABC):
     """
@@ -17,6 +30,16 @@ class OrderRepository(ABC):
         
         :param order: La orden a guardar.
         :return: La orden guardada.
+        :raises ConcurrencyConflictError: Si la orden cambió desde que se cargó.
+        """
+        pass
+
+    @abstractmethod
+    def save_many(self, orders: list['Order']) -> None:
+        """
+        Guarda varias órdenes en una sola operación.
+        
+        :param orders: Las órdenes a guardar.
         """
         pass
 
@@ -30,6 +53,18 @@ class OrderRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_version(self, order_id: str) -> Optional[int]:
+        """
+        Versión actual de una orden sin reconstruirla (para ETags y cachés
+        de respuestas).
+        
+        :param order_id: El ID de la orden.
+        :return: La versión, o None si la orden no existe o si la versión
+            guardada no identifica su estado (p. ej. cambios aún sin escribir).
+        """
+        pass
+
     @abstractmethod
     def delete(self, order_id: str) -> None:
         """
@@ -46,4 +81,16 @@ class OrderRepository(ABC):
         
         :return: Lista con todas las órdenes.
         """
+        pass
+
+    @abstractmethod
+    def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> list['Order']:
+        """
+        Obtiene una página de órdenes ordenadas (paginación keyset).
+        
+        :param after: Posición de la última orden de la página anterior (PagePosition), None para la primera.
+        :param limit: Número máximo de órdenes a devolver.
+        :param sort: Campo de ordenación ("order_id" o "created_at").
+        :return: Lista ordenada de órdenes posteriores a `after`.
+        """
         pass
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Pricing Service Interface - Puerto para obtención de precios
 """
-from  typing import Optional
+from  typing import Dict, List, Optional
 from abc import ABC, abstractmethod
 from domain.value_objects.sku import SKU
 from domain.value_objects.price import Price
@@ -29,4 +29,14 @@ class PricingService(ABC):
         :param sku: El SKU del producto.
         :return: True si el producto existe, False en caso contrario.
         """
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def get_prices(self, skus: List[SKU]) -> Dict[str, Price]:
+        """
+        Obtiene los precios de varios productos con una sola consulta.
+        
+        :param skus: Los SKUs de los productos.
+        :return: Precio por código de SKU; los productos inexistentes no aparecen.
+        """
+        pass
@@ -3,6 +3,7 @@ Unit of Work pattern - Puerto (interface) para gestión transaccional
 """
 from abc import ABC, abstractmethod
 from application.ports.order_repository import OrderRepository
+from application.ports.order_summary_reader import OrderSummaryReader
 
 
 class UnitOfWork(ABC):
@@ -15,6 +16,7 @@ class UnitOfWork(ABC):
     
     # Repository disponible en esta UoW
     orders: OrderRepository # Tipo de repositorio para órdenes
+    summaries: OrderSummaryReader # Lectura de resúmenes sin hidratar agregados
     
     def __enter__(self):
         return self
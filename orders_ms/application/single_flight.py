@@ -0,0 +1,105 @@
+"""
+Single-flight: peticiones concurrentes con la misma clave comparten una sola
+ejecución y su resultado (hilos y asyncio)
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class _FlightGroup:
+    """Estado y métricas comunes de SingleFlight y AsyncSingleFlight"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # clave -> Future (o Task) de la ejecución en curso
+        self._in_flight: Dict[Hashable, Any] = {}
+        # Métricas
+        self.loads = 0
+        self.coalesced = 0
+        self.forgotten = 0
+
+    def forget(self, key: Hashable) -> None:
+        """
+        Las peticiones siguientes con `key` ya no se unen a la ejecución en
+        curso (quien ya espera recibe su resultado). Se usa cuando una
+        escritura confirmada puede dejar ese resultado desfasado.
+        """
+        with self._lock:
+            if self._in_flight.pop(key, None) is not None:
+                self.forgotten += 1
+
+    def forget_all(self) -> None:
+        with self._lock:
+            self.forgotten += len(self._in_flight)
+            self._in_flight.clear()
+
+    def _release(self, key: Hashable, flight: Any) -> None:
+        # Solo si sigue siendo la ejecución registrada (forget pudo sustituirla)
+        with self._lock:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+
+    def status(self) -> dict:
+        """Métricas del grupo"""
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "loads": self.loads,
+                "coalesced": self.coalesced,
+                "forgotten": self.forgotten,
+            }
+
+
+class SingleFlight(_FlightGroup):
+    """
+    Para llamadores en hilos (pool de hilos de FastAPI, ThreadPoolExecutor):
+    el primero con una clave ejecuta la función y el resto se bloquea hasta
+    recibir su resultado o su excepción. No es una caché: al terminar la
+    ejecución la clave se libera y la siguiente petición vuelve a ejecutar.
+    """
+
+    def do(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = self._in_flight[key] = Future()
+                self.loads += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            return flight.result()
+
+        try:
+            result = load()
+        except BaseException as error:
+            self._release(key, flight)
+            flight.set_exception(error)
+            raise
+        self._release(key, flight)
+        flight.set_result(result)
+        return result
+
+
+class AsyncSingleFlight(_FlightGroup):
+    """
+    Variante para corrutinas: la carga se ejecuta en una Task propia y todos
+    los llamadores (también el primero) la esperan con asyncio.shield, así
+    que cancelar una petición (p. ej. el cliente cierra la conexión) no
+    cancela la carga de las demás.
+    """
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        with self._lock:
+            task = self._in_flight.get(key)
+            if task is None or task.get_loop() is not asyncio.get_running_loop():
+                task = self._in_flight[key] = asyncio.ensure_future(load())
+                task.add_done_callback(lambda done: self._release(key, done))
+                self.loads += 1
+            else:
+                self.coalesced += 1
+        return await asyncio.shield(task)
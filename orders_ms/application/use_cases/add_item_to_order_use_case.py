@@ -1,14 +1,58 @@
 """
 Caso de uso: Agregar Item a Pedido
 """
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable
 from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from application.ports.order_repository import ConcurrencyConflictError
 from application.ports.pricing_service import PricingService
+from application.ports.async_pricing_service import AsyncPricingService
 from application.ports.event_bus import EventBus
 from domain.value_objects.order_id import OrderId
 from domain.value_objects.sku import SKU
 from domain.value_objects.quantity import Quantity
 from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO, AddItemToOrderResponseDTO
 
+# Reintentos ante ConcurrencyConflictError (otra transacción modificó la orden)
+MAX_ATTEMPTS = 10
+BASE_BACKOFF_SECONDS = 0.005
+MAX_BACKOFF_SECONDS = 0.2
+
+
+def _backoff(attempt: int) -> float:
+    """Espera exponencial acotada con jitter antes del reintento número `attempt`"""
+    return random.uniform(0, min(MAX_BACKOFF_SECONDS, BASE_BACKOFF_SECONDS * 2 ** attempt))
+
+
+def retry_on_conflict(operation: Callable[[], Any]) -> Any:
+    """
+    Ejecuta `operation` (una transacción completa: cargar, modificar, guardar)
+    y la repite tras una espera si otra transacción modificó la orden.
+    Tras MAX_ATTEMPTS conflictos el ConcurrencyConflictError llega al llamador.
+    """
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return operation()
+        except ConcurrencyConflictError:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            time.sleep(_backoff(attempt))
+
+
+async def async_retry_on_conflict(operation: Callable[[], Awaitable[Any]]) -> Any:
+    """Variante asíncrona de retry_on_conflict (la espera no bloquea el event loop)"""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return await operation()
+        except ConcurrencyConflictError:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            await asyncio.sleep(_backoff(attempt))
+
+
 class AddItemToOrderUseCase:
     def __init__(self, uow: UnitOfWork, pricing_service: PricingService, event_bus: EventBus):
         self.uow = uow
@@ -20,21 +64,65 @@ class AddItemToOrderUseCase:
         sku = SKU(add_item_request_dto.sku)
         quantity = Quantity(add_item_request_dto.quantity)
 
-        if not self.pricing_service.product_exists(sku):
+        # Una sola consulta al catálogo: sin precio es que el producto no existe
+        price = self.pricing_service.get_prices([sku]).get(sku.code)
+        if price is None:
             return AddItemToOrderResponseDTO(success=False)
 
+        # ✅ Control optimista: si otra petición modificó la orden se recarga y reintenta
+        events = retry_on_conflict(lambda: self._add_item(order_id, sku, quantity, price))
+
+        if events is None:
+            return AddItemToOrderResponseDTO(success=False)
+
+        # ✅ Publicar eventos solo si la transacción fue exitosa
+        self.event_bus.publish_many(events)
+        return AddItemToOrderResponseDTO(success=True)
+
+    def _add_item(self, order_id, sku, quantity, price):
         # ✅ Unit of Work: Transacción para agregar item a la orden
         with self.uow:
             order = self.uow.orders.get(order_id.code)
             if not order:
-                return AddItemToOrderResponseDTO(success=False)
+                return None
 
-            price = self.pricing_service.get_price(sku)
             order.add_item(sku, quantity, price)
             self.uow.orders.save(order)
             # Extraer eventos antes de salir de la transacción
-            events = order.pull_domain_events()
+            return order.pull_domain_events()
+
+
+class AsyncAddItemToOrderUseCase:
+    """Variante asíncrona de AddItemToOrderUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork, pricing_service: AsyncPricingService, event_bus: EventBus):
+        self.uow = uow
+        self.pricing_service = pricing_service
+        self.event_bus = event_bus
+
+    async def execute(self, add_item_request_dto: AddItemToOrderRequestDTO) -> AddItemToOrderResponseDTO:
+        order_id = OrderId(add_item_request_dto.order_id)
+        sku = SKU(add_item_request_dto.sku)
+        quantity = Quantity(add_item_request_dto.quantity)
+
+        price = (await self.pricing_service.get_prices([sku])).get(sku.code)
+        if price is None:
+            return AddItemToOrderResponseDTO(success=False)
+
+        events = await async_retry_on_conflict(lambda: self._add_item(order_id, sku, quantity, price))
+
+        if events is None:
+            return AddItemToOrderResponseDTO(success=False)
 
-        # ✅ Publicar eventos solo si la transacción fue exitosa
         self.event_bus.publish_many(events)
-        return AddItemToOrderResponseDTO(success=True)
\ No newline at end of file
+        return AddItemToOrderResponseDTO(success=True)
+
+    async def _add_item(self, order_id, sku, quantity, price):
+        async with self.uow:
+            order = await self.uow.orders.get(order_id.code)
+            if not order:
+                return None
+
+            order.add_item(sku, quantity, price)
+            await self.uow.orders.save(order)
+            return order.pull_domain_events()
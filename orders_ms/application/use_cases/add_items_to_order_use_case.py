@@ -0,0 +1,126 @@
+"""
+Caso de uso: Agregar Varios Items a un Pedido
+Todas las líneas se validan y se valoran antes de tocar el pedido
+"""
+from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from application.ports.pricing_service import PricingService
+from application.ports.async_pricing_service import AsyncPricingService
+from application.ports.event_bus import EventBus
+from application.use_cases.add_item_to_order_use_case import async_retry_on_conflict, retry_on_conflict
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from application.dtos.order_items_dtos import LineErrorDTO, OrderItemsRequestDTO, OrderItemsResponseDTO
+
+
+def price_lines(lines: list, pricing_service: PricingService) -> tuple:
+    """
+    Valida las líneas y obtiene todos sus precios con una sola llamada a get_prices.
+
+    :return: (items [(sku, quantity, price)], errores por línea [LineErrorDTO])
+    """
+    parsed, errors = _parse_lines(lines)
+    prices = pricing_service.get_prices(_line_skus(parsed)) if parsed else {}
+    return _priced_items(parsed, errors, prices)
+
+
+async def async_price_lines(lines: list, pricing_service: AsyncPricingService) -> tuple:
+    """Variante asíncrona de price_lines (AsyncPricingService)"""
+    parsed, errors = _parse_lines(lines)
+    prices = await pricing_service.get_prices(_line_skus(parsed)) if parsed else {}
+    return _priced_items(parsed, errors, prices)
+
+
+def _parse_lines(lines: list) -> tuple:
+    parsed, errors = [], []
+    for index, line in enumerate(lines):
+        try:
+            parsed.append((index, SKU(line.sku), Quantity(line.quantity)))
+        except ValueError as e:
+            errors.append(LineErrorDTO(index=index, sku=line.sku, message=str(e)))
+    return parsed, errors
+
+
+def _line_skus(parsed: list) -> list:
+    return list({sku.code: sku for _, sku, _ in parsed}.values())
+
+
+def _priced_items(parsed: list, errors: list, prices: dict) -> tuple:
+    items = []
+    for index, sku, quantity in parsed:
+        price = prices.get(sku.code)
+        if price is None:
+            errors.append(LineErrorDTO(index=index, sku=sku.code, message="Product not found"))
+        else:
+            items.append((sku, quantity, price))
+
+    errors.sort(key=lambda error: error.index)
+    return items, errors
+
+
+class AddItemsToOrderUseCase:
+    def __init__(self, uow: UnitOfWork, pricing_service: PricingService, event_bus: EventBus):
+        self.uow = uow
+        self.pricing_service = pricing_service
+        self.event_bus = event_bus
+
+    def execute(self, request_dto: OrderItemsRequestDTO) -> OrderItemsResponseDTO:
+        order_id = OrderId(request_dto.order_id)
+        items, errors = price_lines(request_dto.lines, self.pricing_service)
+        if errors:
+            return OrderItemsResponseDTO(success=False, errors=errors)
+
+        # ✅ Control optimista: si otra petición modificó la orden se recarga y reintenta
+        events = retry_on_conflict(lambda: self._add_items(order_id, items))
+        if events is None:
+            return OrderItemsResponseDTO(success=False, order_found=False)
+
+        # ✅ Publicar eventos solo si la transacción fue exitosa
+        self.event_bus.publish_many(events)
+        return OrderItemsResponseDTO(success=True)
+
+    def _add_items(self, order_id, items):
+        # ✅ Unit of Work: todas las líneas en una sola transacción
+        with self.uow:
+            order = self.uow.orders.get(order_id.code)
+            if not order:
+                return None
+
+            for sku, quantity, price in items:
+                order.add_item(sku, quantity, price)
+            self.uow.orders.save(order)
+            return order.pull_domain_events()
+
+
+class AsyncAddItemsToOrderUseCase:
+    """Variante asíncrona de AddItemsToOrderUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork, pricing_service: AsyncPricingService, event_bus: EventBus):
+        self.uow = uow
+        self.pricing_service = pricing_service
+        self.event_bus = event_bus
+
+    async def execute(self, request_dto: OrderItemsRequestDTO) -> OrderItemsResponseDTO:
+        order_id = OrderId(request_dto.order_id)
+        items, errors = await async_price_lines(request_dto.lines, self.pricing_service)
+        if errors:
+            return OrderItemsResponseDTO(success=False, errors=errors)
+
+        events = await async_retry_on_conflict(lambda: self._add_items(order_id, items))
+        if events is None:
+            return OrderItemsResponseDTO(success=False, order_found=False)
+
+        self.event_bus.publish_many(events)
+        return OrderItemsResponseDTO(success=True)
+
+    async def _add_items(self, order_id, items):
+        async with self.uow:
+            order = await self.uow.orders.get(order_id.code)
+            if not order:
+                return None
+
+            for sku, quantity, price in items:
+                order.add_item(sku, quantity, price)
+            await self.uow.orders.save(order)
+            return order.pull_domain_events()
@@ -0,0 +1,100 @@
+"""
+Coalescencia (single-flight) de lecturas concurrentes idénticas delante de
+GetOrderUseCase y ListOrdersUseCase
+"""
+from dataclasses import astuple
+from typing import Any, Callable, Hashable
+from application.ports.event_bus import EventBus
+from application.single_flight import AsyncSingleFlight, SingleFlight
+from domain.events.domain_event import DomainEvent
+from domain.events.item_added import ItemAdded
+from domain.events.items_cleared import ItemsCleared
+from domain.events.order_created import OrderCreated
+
+
+class CoalescingUseCase:
+    """
+    Decorador de un caso de uso de lectura: las peticiones concurrentes con
+    la misma clave comparten una sola ejecución (un Unit of Work, una carga)
+    y reciben el mismo DTO de respuesta, que no debe modificarse.
+    """
+
+    def __init__(self, use_case, flight: SingleFlight, key: Callable[[Any], Hashable]):
+        self.use_case = use_case
+        self.flight = flight
+        self.key = key
+
+    def execute(self, request_dto):
+        return self.flight.do(self.key(request_dto), lambda: self.use_case.execute(request_dto))
+
+
+class AsyncCoalescingUseCase:
+    """Variante asíncrona de CoalescingUseCase"""
+
+    def __init__(self, use_case, flight: AsyncSingleFlight, key: Callable[[Any], Hashable]):
+        self.use_case = use_case
+        self.flight = flight
+        self.key = key
+
+    async def execute(self, request_dto):
+        return await self.flight.do(self.key(request_dto), lambda: self.use_case.execute(request_dto))
+
+
+def order_key(request_dto) -> Hashable:
+    """Clave de GetOrder: el ID de la orden"""
+    return request_dto.order_id
+
+
+def page_key(request_dto) -> Hashable:
+    """Clave de ListOrders: todos los campos de la petición (cursor, límite, orden, cliente)"""
+    return astuple(request_dto)
+
+
+class ReadCoalescer:
+    """
+    Grupos single-flight de GetOrder y ListOrders, para hilos y para asyncio.
+
+    Una petición que llega mientras otra idéntica está en curso se une a
+    ella. Para que quien acaba de escribir no reciba el resultado de una
+    lectura que empezó antes de su escritura, los eventos de una orden
+    (publicados tras confirmar) liberan su clave y todos los listados.
+    """
+
+    def __init__(self):
+        self.orders = SingleFlight()
+        self.pages = SingleFlight()
+        self.async_orders = AsyncSingleFlight()
+        self.async_pages = AsyncSingleFlight()
+
+    def get_order(self, use_case):
+        return CoalescingUseCase(use_case, self.orders, order_key)
+
+    def list_orders(self, use_case):
+        return CoalescingUseCase(use_case, self.pages, page_key)
+
+    def async_get_order(self, use_case):
+        return AsyncCoalescingUseCase(use_case, self.async_orders, order_key)
+
+    def async_list_orders(self, use_case):
+        return AsyncCoalescingUseCase(use_case, self.async_pages, page_key)
+
+    def on_event(self, event: DomainEvent) -> None:
+        """Manejador para el EventBus"""
+        self.orders.forget(event.order_id)
+        self.async_orders.forget(event.order_id)
+        self.pages.forget_all()
+        self.async_pages.forget_all()
+
+    def subscribe_to(self, event_bus: EventBus) -> None:
+        """Suscribe el coalescedor a los eventos que cambian órdenes"""
+        for event_type in (OrderCreated, ItemAdded, ItemsCleared):
+            event_bus.subscribe(event_type, self.on_event)
+
+    def status(self) -> dict:
+        """Métricas de cada grupo"""
+        return {
+            "get_order": self.orders.status(),
+            "list_orders": self.pages.status(),
+            "async_get_order": self.async_orders.status(),
+            "async_list_orders": self.async_pages.status(),
+        }
@@ -3,6 +3,7 @@ Caso de uso: Crear Pedido
 Refactorizado para usar Unit of Work pattern
 """
 from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
 from application.ports.event_bus import EventBus
 from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
@@ -26,4 +27,22 @@ class CreateOrderUseCase:
         # ✅ Publicar eventos solo si la transacción fue exitosa
         self.event_bus.publish_many(events)
         
-        return CreateOrderResponseDTO(order_id=str(order.order_id))
\ No newline at end of file
+        return CreateOrderResponseDTO(order_id=str(order.order_id))
+
+
+class AsyncCreateOrderUseCase:
+    """Variante asíncrona de CreateOrderUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork, event_bus: EventBus):
+        self.uow = uow
+        self.event_bus = event_bus
+
+    async def execute(self, create_order_request_dto: CreateOrderRequestDTO) -> CreateOrderResponseDTO:
+        async with self.uow:
+            order = Order.create(OrderId(), create_order_request_dto.customer_id)
+            await self.uow.orders.save(order)
+            events = order.pull_domain_events()
+
+        self.event_bus.publish_many(events)
+
+        return CreateOrderResponseDTO(order_id=str(order.order_id))
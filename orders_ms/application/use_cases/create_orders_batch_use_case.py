@@ -0,0 +1,109 @@
+"""
+Caso de uso: Crear Pedidos en Lote
+Todas las órdenes del lote se escriben en una única transacción
+"""
+from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from application.ports.pricing_service import PricingService
+from application.ports.async_pricing_service import AsyncPricingService
+from application.ports.event_bus import EventBus
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from application.dtos.create_orders_batch_dtos import CreateOrdersBatchRequestDTO, CreateOrdersBatchResponseDTO
+
+# Tamaño máximo de lote aceptado en una petición
+MAX_BATCH_SIZE = 1000
+
+
+def _build_orders(request_dto: CreateOrdersBatchRequestDTO, pricing_service: PricingService) -> list:
+    """
+    Valida el lote y construye las órdenes con sus items iniciales.
+
+    Los precios de todos los SKUs del lote se obtienen con una sola llamada a
+    get_prices. Cualquier error rechaza el lote completo (ValueError
+    indicando la posición).
+    """
+    parsed, skus = _parse_batch(request_dto)
+    return _create_orders(parsed, pricing_service.get_prices(skus) if skus else {})
+
+
+async def _async_build_orders(request_dto: CreateOrdersBatchRequestDTO, pricing_service: AsyncPricingService) -> list:
+    """Variante asíncrona de _build_orders (AsyncPricingService)"""
+    parsed, skus = _parse_batch(request_dto)
+    return _create_orders(parsed, await pricing_service.get_prices(skus) if skus else {})
+
+
+def _parse_batch(request_dto: CreateOrdersBatchRequestDTO) -> tuple:
+    """:return: (órdenes [(customer_id, items)], SKUs distintos del lote)"""
+    if not request_dto.orders:
+        raise ValueError("Batch must contain at least one order")
+    if len(request_dto.orders) > MAX_BATCH_SIZE:
+        raise ValueError(f"Batch size must be at most {MAX_BATCH_SIZE}")
+
+    parsed = []
+    for i, order_dto in enumerate(request_dto.orders):
+        items = []
+        for j, item_dto in enumerate(order_dto.items):
+            try:
+                items.append((j, SKU(item_dto.sku), Quantity(item_dto.quantity)))
+            except ValueError as e:
+                raise ValueError(f"orders[{i}].items[{j}]: {e}")
+        parsed.append((order_dto.customer_id, items))
+
+    skus = {sku.code: sku for _, items in parsed for _, sku, _ in items}
+    return parsed, list(skus.values())
+
+
+def _create_orders(parsed: list, prices: dict) -> list:
+    orders = []
+    for i, (customer_id, items) in enumerate(parsed):
+        order = Order.create(OrderId(), customer_id)
+        for j, sku, quantity in items:
+            price = prices.get(sku.code)
+            if price is None:
+                raise ValueError(f"orders[{i}].items[{j}]: unknown SKU {sku.code}")
+            order.add_item(sku, quantity, price)
+        orders.append(order)
+    return orders
+
+
+class CreateOrdersBatchUseCase:
+    def __init__(self, uow: UnitOfWork, pricing_service: PricingService, event_bus: EventBus):
+        self.uow = uow
+        self.pricing_service = pricing_service
+        self.event_bus = event_bus
+
+    def execute(self, request_dto: CreateOrdersBatchRequestDTO) -> CreateOrdersBatchResponseDTO:
+        orders = _build_orders(request_dto, self.pricing_service)
+
+        # ✅ Unit of Work: una sola transacción para todo el lote
+        with self.uow:
+            self.uow.orders.save_many(orders)
+            events = [event for order in orders for event in order.pull_domain_events()]
+
+        # ✅ Publicar los eventos del lote de una vez, solo si la transacción fue exitosa
+        self.event_bus.publish_many(events)
+
+        return CreateOrdersBatchResponseDTO(order_ids=[order.order_id.code for order in orders])
+
+
+class AsyncCreateOrdersBatchUseCase:
+    """Variante asíncrona de CreateOrdersBatchUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork, pricing_service: AsyncPricingService, event_bus: EventBus):
+        self.uow = uow
+        self.pricing_service = pricing_service
+        self.event_bus = event_bus
+
+    async def execute(self, request_dto: CreateOrdersBatchRequestDTO) -> CreateOrdersBatchResponseDTO:
+        orders = await _async_build_orders(request_dto, self.pricing_service)
+
+        async with self.uow:
+            await self.uow.orders.save_many(orders)
+            events = [event for order in orders for event in order.pull_domain_events()]
+
+        self.event_bus.publish_many(events)
+
+        return CreateOrdersBatchResponseDTO(order_ids=[order.order_id.code for order in orders])
@@ -2,7 +2,9 @@
 Caso de uso para obtener los detalles de una orden
 """
 from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
 from application.dtos.get_order_dtos import GetOrderRequestDTO, GetOrderResponseDTO
+from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
 
 
@@ -34,28 +36,49 @@ class GetOrderUseCase:
             if order_entity is None:
                 return None
         
-            # Obtener items de la orden
-            order_items = order_entity.items
-            
-            # Calcular total sumando todos los subtotales
-            total = sum(item[2].amount * item[1].amount for item in order_items)
-        
-            # Mapear items para el DTO de respuesta
-            items_data = [
-                {
-                    "sku": item[0].code,
-                    "quantity": item[1].amount,
-                    "price": item[2].amount,
-                    "subtotal": item[2].amount * item[1].amount
-                }
-                for item in order_items
-            ]
-        
-            # Crear y retornar DTO de respuesta
-            return GetOrderResponseDTO(
-                order_id=order_entity.order_id.code,
-                customer_id=order_entity.customer_id,
-                items=items_data,
-                total_amount=total,
-                items_count=len(order_items)
-            )
\ No newline at end of file
+            return _build_response(order_entity)
+
+
+class AsyncGetOrderUseCase:
+    """Variante asíncrona de GetOrderUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork):
+        self.uow = uow
+
+    async def execute(self, request_dto: GetOrderRequestDTO) -> GetOrderResponseDTO | None:
+        async with self.uow:
+            order_entity = await self.uow.orders.get(request_dto.order_id)
+
+        if order_entity is None:
+            return None
+        return _build_response(order_entity)
+
+
+def _build_response(order_entity: Order) -> GetOrderResponseDTO:
+    """Construye el DTO de respuesta con items y total calculado"""
+    # Obtener items de la orden
+    order_items = order_entity.items
+    
+    # Calcular total sumando todos los subtotales
+    total = sum(item[2].amount * item[1].amount for item in order_items)
+
+    # Mapear items para el DTO de respuesta
+    items_data = [
+        {
+            "sku": item[0].code,
+            "quantity": item[1].amount,
+            "price": item[2].amount,
+            "subtotal": item[2].amount * item[1].amount
+        }
+        for item in order_items
+    ]
+
+    # Crear y retornar DTO de respuesta
+    return GetOrderResponseDTO(
+        order_id=order_entity.order_id.code,
+        customer_id=order_entity.customer_id,
+        items=items_data,
+        total_amount=total,
+        items_count=len(order_items),
+        version=order_entity.version
+    )
@@ -0,0 +1,39 @@
+"""
+Caso de uso para obtener la versión actual de una orden
+"""
+from typing import Optional
+from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+
+
+class GetOrderVersionUseCase:
+    """
+    Obtiene la versión de una orden sin reconstruir el agregado. Permite
+    responder peticiones condicionales (ETag) o servir una respuesta ya
+    serializada para esa versión sin leer los items.
+    """
+
+    def __init__(self, uow: UnitOfWork):
+        self.uow = uow
+
+    def execute(self, request_dto: GetOrderRequestDTO) -> Optional[int]:
+        """
+        Returns:
+            int: Versión actual de la orden
+            None: Si la orden no existe o su versión no identifica su estado
+                  (hay que leer la orden completa)
+        """
+        with self.uow:
+            return self.uow.orders.get_version(request_dto.order_id)
+
+
+class AsyncGetOrderVersionUseCase:
+    """Variante asíncrona de GetOrderVersionUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork):
+        self.uow = uow
+
+    async def execute(self, request_dto: GetOrderRequestDTO) -> Optional[int]:
+        async with self.uow:
+            return await self.uow.orders.get_version(request_dto.order_id)
@@ -1,57 +1,95 @@
 """
-Caso de uso para listar todas las órdenes
+Caso de uso para listar las órdenes (paginado por cursor)
 """
+from typing import Optional
 from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from application.ports.order_summary_reader import OrderSummaryReader
 from application.dtos.list_orders_dtos import ListOrdersRequestDTO, ListOrdersResponseDTO, OrderSummaryDTO
-from decimal import Decimal
+from application.pagination import validate_page_params, encode_cursor, decode_cursor, page_position, PagePosition
 
 class ListOrdersUseCase:
     """
-    Caso de uso para obtener todas las órdenes con información resumida
+    Caso de uso para obtener una página de órdenes con información resumida.
+    Lee los resúmenes del puerto de consulta, sin reconstruir agregados Order.
+
+    Con `customer_id` en la petición se listan solo las órdenes de ese
+    cliente (list_customer_summaries, sobre el índice por cliente).
+
+    Con `summaries` (p. ej. la proyección en memoria) se lee de ese lector
+    en lugar de abrir el Unit of Work.
     """
 
-    def __init__(self, uow: UnitOfWork):
+    def __init__(self, uow: UnitOfWork, summaries: Optional[OrderSummaryReader] = None):
         self.uow = uow
+        self.summaries = summaries
 
     def execute(self, request: ListOrdersRequestDTO) -> ListOrdersResponseDTO:
         """
-        Ejecuta el caso de uso para listar todas las órdenes
+        Ejecuta el caso de uso para listar una página de órdenes
         
-        :param request: DTO con los datos de la petición
-        :return: DTO con la lista de órdenes
+        :param request: DTO con cursor, límite y campo de ordenación
+        :return: DTO con la página de órdenes y el cursor de la siguiente
+        :raises ValueError: Si los parámetros de paginación no son válidos
         """
+        after = _parse_request(request)
+        if self.summaries is not None:
+            return _build_page(request, _read_page(self.summaries, request, after))
+
         # ✅ Unit of Work: Transacción para listar órdenes
         with self.uow:
-            # Obtener todas las órdenes del repositorio
-            orders = self.uow.orders.get_all()
-
-            # Convertir a DTOs de resumen
-            order_summaries = []
-
-            for order in orders:
-                # Calcular total de la orden sumando todos los items
-                total_amount = Decimal('0')
-                items_count = 0
-                
-                for item_tuple in order._items:
-                    sku, quantity, price = item_tuple
-                    subtotal = price.amount * quantity.amount
-                    total_amount += subtotal
-                    items_count += quantity.amount
-                
-                # Crear DTO de resumen
-                summary = OrderSummaryDTO(
-                    order_id=order.order_id.code,
-                    customer_id=order.customer_id,
-                    items_count=items_count,
-                    total_amount=total_amount
-                )
-                order_summaries.append(summary)
-            
-            # Ordenar por order_id para consistencia
-            order_summaries.sort(key=lambda x: x.order_id)
-            
-            return ListOrdersResponseDTO(
-                orders=order_summaries,
-                total_orders=len(order_summaries)
-            )
\ No newline at end of file
+            # Pedir un elemento extra para saber si existe una página siguiente
+            order_summaries = _read_page(self.uow.summaries, request, after)
+
+        return _build_page(request, order_summaries)
+
+
+class AsyncListOrdersUseCase:
+    """Variante asíncrona de ListOrdersUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork, summaries: Optional[OrderSummaryReader] = None):
+        self.uow = uow
+        self.summaries = summaries
+
+    async def execute(self, request: ListOrdersRequestDTO) -> ListOrdersResponseDTO:
+        after = _parse_request(request)
+        if self.summaries is not None:
+            # Lector en memoria: sin E/S, no hace falta el Unit of Work asíncrono
+            return _build_page(request, _read_page(self.summaries, request, after))
+
+        async with self.uow:
+            order_summaries = await _read_page(self.uow.summaries, request, after)
+
+        return _build_page(request, order_summaries)
+
+
+def _parse_request(request: ListOrdersRequestDTO) -> Optional[PagePosition]:
+    """Valida la petición y devuelve la posición tras la que continuar"""
+    validate_page_params(request.limit, request.sort)
+    return decode_cursor(request.cursor, request.sort) if request.cursor else None
+
+
+def _read_page(reader, request: ListOrdersRequestDTO, after: Optional[PagePosition]):
+    """
+    Pide al lector (síncrono o asíncrono) la página con un elemento extra,
+    de todas las órdenes o de las de un cliente
+    """
+    if request.customer_id is not None:
+        return reader.list_customer_summaries(request.customer_id, after, request.limit + 1, request.sort)
+    return reader.list_summaries(after=after, limit=request.limit + 1, sort=request.sort)
+
+
+def _build_page(request: ListOrdersRequestDTO, order_summaries: list[OrderSummaryDTO]) -> ListOrdersResponseDTO:
+    """Recorta la página pedida y genera el cursor de la siguiente"""
+    has_more = len(order_summaries) > request.limit
+    order_summaries = order_summaries[:request.limit]
+
+    next_cursor = None
+    if has_more:
+        next_cursor = encode_cursor(request.sort, page_position(request.sort, order_summaries[-1]))
+    
+    return ListOrdersResponseDTO(
+        orders=order_summaries,
+        total_orders=len(order_summaries),
+        next_cursor=next_cursor
+    )
@@ -0,0 +1,82 @@
+"""
+Caso de uso: Reemplazar los Items de un Pedido
+El carrito se vacía y se rellena con las líneas recibidas en una transacción
+"""
+from application.ports.unit_of_work import UnitOfWork
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from application.ports.pricing_service import PricingService
+from application.ports.async_pricing_service import AsyncPricingService
+from application.ports.event_bus import EventBus
+from application.use_cases.add_item_to_order_use_case import async_retry_on_conflict, retry_on_conflict
+from application.use_cases.add_items_to_order_use_case import async_price_lines, price_lines
+from domain.value_objects.order_id import OrderId
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderItemsResponseDTO
+
+
+class ReplaceOrderItemsUseCase:
+    def __init__(self, uow: UnitOfWork, pricing_service: PricingService, event_bus: EventBus):
+        self.uow = uow
+        self.pricing_service = pricing_service
+        self.event_bus = event_bus
+
+    def execute(self, request_dto: OrderItemsRequestDTO) -> OrderItemsResponseDTO:
+        order_id = OrderId(request_dto.order_id)
+        items, errors = price_lines(request_dto.lines, self.pricing_service)
+        if errors:
+            return OrderItemsResponseDTO(success=False, errors=errors)
+
+        # ✅ Control optimista: si otra petición modificó la orden se recarga y reintenta
+        events = retry_on_conflict(lambda: self._replace_items(order_id, items))
+        if events is None:
+            return OrderItemsResponseDTO(success=False, order_found=False)
+
+        # ✅ Publicar eventos solo si la transacción fue exitosa
+        self.event_bus.publish_many(events)
+        return OrderItemsResponseDTO(success=True)
+
+    def _replace_items(self, order_id, items):
+        # ✅ Unit of Work: vaciar y rellenar el carrito de forma atómica
+        with self.uow:
+            order = self.uow.orders.get(order_id.code)
+            if not order:
+                return None
+
+            order.clear_items()
+            for sku, quantity, price in items:
+                order.add_item(sku, quantity, price)
+            self.uow.orders.save(order)
+            return order.pull_domain_events()
+
+
+class AsyncReplaceOrderItemsUseCase:
+    """Variante asíncrona de ReplaceOrderItemsUseCase (AsyncUnitOfWork)"""
+
+    def __init__(self, uow: AsyncUnitOfWork, pricing_service: AsyncPricingService, event_bus: EventBus):
+        self.uow = uow
+        self.pricing_service = pricing_service
+        self.event_bus = event_bus
+
+    async def execute(self, request_dto: OrderItemsRequestDTO) -> OrderItemsResponseDTO:
+        order_id = OrderId(request_dto.order_id)
+        items, errors = await async_price_lines(request_dto.lines, self.pricing_service)
+        if errors:
+            return OrderItemsResponseDTO(success=False, errors=errors)
+
+        events = await async_retry_on_conflict(lambda: self._replace_items(order_id, items))
+        if events is None:
+            return OrderItemsResponseDTO(success=False, order_found=False)
+
+        self.event_bus.publish_many(events)
+        return OrderItemsResponseDTO(success=True)
+
+    async def _replace_items(self, order_id, items):
+        async with self.uow:
+            order = await self.uow.orders.get(order_id.code)
+            if not order:
+                return None
+
+            order.clear_items()
+            for sku, quantity, price in items:
+                order.add_item(sku, quantity, price)
+            await self.uow.orders.save(order)
+            return order.pull_domain_events()
@@ -0,0 +1,3 @@
+"""
+Benchmarks - Scripts de rendimiento (ejecutar con: python -m benchmarks.<nombre>)
+"""
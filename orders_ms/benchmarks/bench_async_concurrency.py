@@ -0,0 +1,96 @@
+"""
+Benchmark: GetOrder con 1.000 peticiones concurrentes, stack síncrono vs asyncio.
+
+Simula una base de datos con 5 ms de latencia por operación sobre los
+repositorios en memoria:
+- Síncrono: time.sleep en el repositorio; cada petición ocupa un hilo del
+  threadpool de anyio (40 por defecto), igual que un endpoint `def` de FastAPI.
+- Asíncrono: asyncio.sleep en el repositorio; las peticiones solo ceden el
+  event loop mientras esperan, igual que un endpoint `async def`.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_async_concurrency
+"""
+import asyncio
+import time
+
+import anyio.to_thread
+
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.use_cases.get_order_use_case import GetOrderUseCase, AsyncGetOrderUseCase
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.database.in_memory_async_unit_of_work import InMemoryAsyncUnitOfWork
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_async_order_repository import InMemoryAsyncOrderRepository
+
+LATENCY = 0.005
+REQUESTS = 1000
+
+
+class SlowInMemoryOrderRepository(InMemoryOrderRepository):
+    """Repositorio en memoria que bloquea el hilo como un driver síncrono"""
+
+    def get(self, order_id):
+        time.sleep(LATENCY)
+        return super().get(order_id)
+
+
+class SlowInMemoryAsyncOrderRepository(InMemoryAsyncOrderRepository):
+    """Repositorio en memoria que espera como un driver asyncio"""
+
+    async def get(self, order_id):
+        await asyncio.sleep(LATENCY)
+        return await super().get(order_id)
+
+
+def _seed(repository):
+    order = Order(OrderId("ORDER-BENCH"), "bench-customer")
+    order.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+    repository.save(order)
+
+
+async def _run_sync_stack():
+    repository = SlowInMemoryOrderRepository()
+    _seed(repository)
+    request = GetOrderRequestDTO(order_id="ORDER-BENCH")
+
+    async def handle():
+        use_case = GetOrderUseCase(InMemoryUnitOfWork(repository))
+        await anyio.to_thread.run_sync(use_case.execute, request)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handle() for _ in range(REQUESTS)))
+    return time.perf_counter() - start
+
+
+async def _run_async_stack():
+    repository = InMemoryOrderRepository()
+    _seed(repository)
+    request = GetOrderRequestDTO(order_id="ORDER-BENCH")
+
+    async def handle():
+        uow = InMemoryAsyncUnitOfWork(repository)
+        uow.orders = SlowInMemoryAsyncOrderRepository(repository)
+        await AsyncGetOrderUseCase(uow).execute(request)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(handle() for _ in range(REQUESTS)))
+    return time.perf_counter() - start
+
+
+def run():
+    print(f"{REQUESTS} peticiones concurrentes, {LATENCY * 1000:.0f} ms de latencia simulada")
+    print(f"{'stack':<10} | {'tiempo (s)':>10} | {'peticiones/s':>12}")
+    print("-" * 38)
+    for name, runner in (("síncrono", _run_sync_stack), ("asyncio", _run_async_stack)):
+        elapsed = asyncio.run(runner())
+        print(f"{name:<10} | {elapsed:>10.2f} | {REQUESTS / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    run()
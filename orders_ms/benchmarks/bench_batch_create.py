@@ -0,0 +1,83 @@
+"""
+Benchmark: crear N órdenes (con 2 items cada una) una a una o en lote.
+
+Compara CreateOrderUseCase + AddItemToOrderUseCase por orden (una transacción
+y un commit por operación, como N llamadas a POST /orders) con
+CreateOrdersBatchUseCase (una transacción, INSERT multi-fila y un único
+publish_many) sobre SQLite en memoria.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_batch_create
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.create_orders_batch_dtos import (
+    BatchOrderDTO,
+    BatchOrderItemDTO,
+    CreateOrdersBatchRequestDTO,
+)
+from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase
+from application.use_cases.create_orders_batch_use_case import CreateOrdersBatchUseCase
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel  # noqa: F401
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+SIZES = [10, 100, 1000]
+ITEMS = [("LAPTOP123", 1), ("MOUSE456", 2)]
+
+
+def _build_session_factory():
+    engine = instrument_engine(create_engine("sqlite://", poolclass=StaticPool))
+    Base.metadata.create_all(engine)
+    return engine, sessionmaker(bind=engine)
+
+
+def _one_by_one(session_factory, count):
+    pricing_service, event_bus = StaticPricingService(), InMemoryEventBus()
+    for i in range(count):
+        create = CreateOrderUseCase(SQLAlchemyUnitOfWork(session_factory), event_bus)
+        order_id = create.execute(CreateOrderRequestDTO(customer_id=f"customer-{i}")).order_id
+        for sku, quantity in ITEMS:
+            add_item = AddItemToOrderUseCase(SQLAlchemyUnitOfWork(session_factory), pricing_service, event_bus)
+            add_item.execute(AddItemToOrderRequestDTO(order_id=order_id, sku=sku, quantity=quantity))
+
+
+def _batch(session_factory, count):
+    use_case = CreateOrdersBatchUseCase(
+        SQLAlchemyUnitOfWork(session_factory), StaticPricingService(), InMemoryEventBus()
+    )
+    use_case.execute(CreateOrdersBatchRequestDTO(orders=[
+        BatchOrderDTO(
+            customer_id=f"customer-{i}",
+            items=[BatchOrderItemDTO(sku=sku, quantity=quantity) for sku, quantity in ITEMS]
+        )
+        for i in range(count)
+    ]))
+
+
+def run():
+    print(f"{'órdenes':>8} | {'modo':<9} | {'sentencias':>10} | {'tiempo (ms)':>11} | {'órdenes/s':>10}")
+    print("-" * 61)
+    for size in SIZES:
+        for mode, create in (("una a una", _one_by_one), ("lote", _batch)):
+            engine, session_factory = _build_session_factory()
+            with track_statements() as stats:
+                start = time.perf_counter()
+                create(session_factory, size)
+                elapsed = time.perf_counter() - start
+            print(f"{size:>8} | {mode:<9} | {stats.count:>10} | {elapsed * 1000:>11.2f} | {size / elapsed:>10.0f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
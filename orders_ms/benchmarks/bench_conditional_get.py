@@ -0,0 +1,93 @@
+"""
+Benchmark: GET /orders/{id} completo frente a respuesta ya serializada y 304.
+
+Compara, por petición y sobre SQLite en memoria, lo que hace el endpoint en
+cada caso: reconstruir la orden y serializarla (sin caché de respuestas),
+consultar solo la versión y servir los bytes cacheados, y consultar la
+versión y responder 304 al cliente que ya tiene el ETag.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_conditional_get
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.use_cases.get_order_use_case import GetOrderUseCase
+from application.use_cases.get_order_version_use_case import GetOrderVersionUseCase
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel  # noqa: F401
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+from infrastructure.web.response_cache import OrderResponseCache, encode_response, etag_matches
+
+REQUESTS = 2000
+LINE_COUNTS = (10, 100)
+
+
+def _seed(session_factory, lines: int) -> str:
+    session = session_factory()
+    order = Order.create(OrderId(f"ORDER-{lines}"), "bench-customer")
+    for line in range(lines):
+        order.add_item(SKU(f"SKU{line:08d}"), Quantity(1), Price(10.00))
+    PostgreSQLOrderRepository(session).save(order)
+    session.commit()
+    session.close()
+    return order.order_id.code
+
+
+def _encode(response_dto):
+    return encode_response({
+        "order_id": response_dto.order_id,
+        "customer_id": response_dto.customer_id,
+        "items": response_dto.items,
+        "total_amount": response_dto.total_amount,
+        "items_count": response_dto.items_count
+    })
+
+
+def run():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+
+    def uow():
+        return SQLAlchemyUnitOfWork(session_factory, read_only=True, core_reads=True)
+
+    print(f"{'líneas':>6} | {'modo':<22} | {'µs/petición':>11}")
+    print("-" * 46)
+    for lines in LINE_COUNTS:
+        dto = GetOrderRequestDTO(order_id=_seed(session_factory, lines))
+        cache = OrderResponseCache()
+        encoded = _encode(GetOrderUseCase(uow()).execute(dto))
+        cache.put(dto.order_id, GetOrderVersionUseCase(uow()).execute(dto), encoded)
+
+        def full():
+            return _encode(GetOrderUseCase(uow()).execute(dto))
+
+        def cached():
+            return cache.get(dto.order_id, GetOrderVersionUseCase(uow()).execute(dto))
+
+        def not_modified():
+            return etag_matches(encoded.etag, cached().etag)
+
+        for name, request in (("reconstruir+serializar", full), ("versión+bytes en caché", cached),
+                              ("versión+304", not_modified)):
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                request()
+            elapsed = (time.perf_counter() - start) / REQUESTS
+            print(f"{lines:>6} | {name:<22} | {elapsed * 1e6:>11.1f}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
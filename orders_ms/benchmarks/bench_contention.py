@@ -0,0 +1,146 @@
+"""
+Benchmark: add_item concurrente sobre una misma orden.
+
+Compara el control optimista (UPDATE ... WHERE version = ? + reintentos con
+backoff en AddItemToOrderUseCase) con el bloqueo pesimista
+(SELECT ... FOR UPDATE vía PostgreSQLOrderRepository.get_for_update).
+Informa throughput, reintentos, peticiones rechazadas (reintentos agotados,
+el cliente recibe el error) e items perdidos: confirmados pero no guardados,
+que debe ser 0 en ambos modos.
+
+Por defecto usa un fichero SQLite temporal. SQLite ignora FOR UPDATE, así que
+allí el modo pesimista usa BEGIN IMMEDIATE (bloqueo de escritura de toda la
+base de datos). Para medir contra PostgreSQL:
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.bench_contention
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_contention
+"""
+import os
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import application.use_cases.add_item_to_order_use_case as add_item_module
+from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from application.ports.order_repository import ConcurrencyConflictError
+from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+THREADS = [1, 4, 16]
+ITEMS_PER_THREAD = 25
+ORDER_CODE = "ORDER-CONTENTION"
+
+
+def _build_engine(url, pessimistic):
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"timeout": 60, "check_same_thread": False})
+        if pessimistic:
+            # Receta de SQLAlchemy para controlar BEGIN en pysqlite
+            @event.listens_for(engine, "connect")
+            def _disable_pysqlite_begin(dbapi_connection, connection_record):
+                dbapi_connection.isolation_level = None
+
+            @event.listens_for(engine, "begin")
+            def _begin_immediate(conn):
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+        return engine
+    return create_engine(url, pool_size=max(THREADS), max_overflow=0)
+
+
+def _reset(session_factory):
+    session = session_factory()
+    session.query(OrderItemModel).filter(OrderItemModel.order_id == ORDER_CODE).delete()
+    session.query(OrderModel).filter(OrderModel.order_id == ORDER_CODE).delete()
+    session.commit()
+    session.close()
+    with SQLAlchemyUnitOfWork(session_factory) as uow:
+        uow.orders.save(Order.create(OrderId(ORDER_CODE), "bench-customer"))
+
+
+def _optimistic_worker(session_factory, results):
+    pricing_service, event_bus = StaticPricingService(), InMemoryEventBus()
+    request = AddItemToOrderRequestDTO(order_id=ORDER_CODE, sku="MOUSE456", quantity=1)
+    for _ in range(ITEMS_PER_THREAD):
+        use_case = AddItemToOrderUseCase(SQLAlchemyUnitOfWork(session_factory), pricing_service, event_bus)
+        try:
+            use_case.execute(request)
+            results.append(True)
+        except ConcurrencyConflictError:
+            results.append(False)
+
+
+def _pessimistic_worker(session_factory, results):
+    for _ in range(ITEMS_PER_THREAD):
+        with SQLAlchemyUnitOfWork(session_factory) as uow:
+            order = uow.orders.get_for_update(ORDER_CODE)
+            order.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+            uow.orders.save(order)
+        results.append(True)
+
+
+def _run(url, pessimistic, threads):
+    engine = _build_engine(url, pessimistic)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    _reset(session_factory)
+
+    # Contar reintentos envolviendo la función de backoff del caso de uso
+    retries = []
+    original_backoff = add_item_module._backoff
+    add_item_module._backoff = lambda attempt: retries.append(attempt) or original_backoff(attempt)
+
+    results = []
+    worker = _pessimistic_worker if pessimistic else _optimistic_worker
+    pool = [threading.Thread(target=worker, args=(session_factory, results)) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    add_item_module._backoff = original_backoff
+
+    session = session_factory()
+    stored = session.query(OrderItemModel).filter(OrderItemModel.order_id == ORDER_CODE).count()
+    session.close()
+    engine.dispose()
+    acknowledged = results.count(True)
+    return elapsed, len(retries), results.count(False), acknowledged - stored
+
+
+def run():
+    url = os.getenv("BENCH_DATABASE_URL")
+    tmp_path = None
+    if url is None:
+        fd, tmp_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        url = f"sqlite:///{tmp_path}"
+
+    print(f"Base de datos: {url.split('@')[-1]}")
+    print(f"{'hilos':>6} | {'modo':<10} | {'ops/s':>8} | {'reintentos':>10} | {'rechazadas':>10} | {'perdidos':>8}")
+    print("-" * 67)
+    for threads in THREADS:
+        for mode, pessimistic in (("optimista", False), ("pesimista", True)):
+            elapsed, retries, rejected, lost = _run(url, pessimistic, threads)
+            ops = (threads * ITEMS_PER_THREAD - rejected) / elapsed
+            print(f"{threads:>6} | {mode:<10} | {ops:>8.0f} | {retries:>10} | {rejected:>10} | {lost:>8}")
+
+    if tmp_path:
+        os.remove(tmp_path)
+
+
+if __name__ == "__main__":
+    run()
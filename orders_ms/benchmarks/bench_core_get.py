@@ -0,0 +1,72 @@
+"""
+Benchmark: CPU por petición de GET /orders/{id} por el ORM y por SQLAlchemy Core.
+
+Cada petición abre un Unit of Work de solo lectura, obtiene la orden y la
+cierra, como GetOrderUseCase. La ruta ORM hace dos consultas (cabecera e
+items) y pasa por el identity map; la ruta Core (order_core_reader) hace
+una consulta con JOIN y construye la entidad desde las tuplas. Se usa
+SQLite en memoria para que el tiempo medido sea sobre todo Python.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_core_get
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel  # noqa: F401
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+SIZES = [1, 10, 100]
+REQUESTS = 2000
+
+
+def _seed(session_factory, lines):
+    session = session_factory()
+    order = Order.create(OrderId("ORDER-BENCH"), "bench-customer")
+    for i in range(lines):
+        order.add_item(SKU(f"SKU{i:08d}"), Quantity(1), Price(10.00))
+    PostgreSQLOrderRepository(session).save(order)
+    session.commit()
+    session.close()
+
+
+def _cpu_per_request(session_factory, core_reads):
+    def request():
+        with SQLAlchemyUnitOfWork(session_factory, read_only=True, core_reads=core_reads) as uow:
+            uow.orders.get("ORDER-BENCH")
+
+    # Calentar la caché de sentencias compiladas
+    for _ in range(50):
+        request()
+    start = time.process_time()
+    for _ in range(REQUESTS):
+        request()
+    return (time.process_time() - start) / REQUESTS
+
+
+def run():
+    print(f"{'líneas':>8} | {'ORM (µs)':>10} | {'Core (µs)':>10} | {'ahorro':>7}")
+    print("-" * 45)
+    for size in SIZES:
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        _seed(session_factory, size)
+        orm = _cpu_per_request(session_factory, core_reads=False)
+        core = _cpu_per_request(session_factory, core_reads=True)
+        print(f"{size:>8} | {orm * 1e6:>10.1f} | {core * 1e6:>10.1f} | {1 - core / orm:>7.0%}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
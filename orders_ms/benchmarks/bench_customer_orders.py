@@ -0,0 +1,89 @@
+"""
+Benchmark: listar las 20 órdenes de un cliente con 1.000, 10.000 y 100.000
+órdenes en total.
+
+Compara recorrer el listado completo filtrando por cliente (lo que hacía un
+cliente HTTP con GET /orders) con list_customer_summaries sobre el índice por
+cliente, en memoria (InMemoryOrderSummaryReader) y en SQLite
+(PostgreSQLOrderSummaryReader). Con el índice el tiempo no crece con el total.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_customer_orders
+"""
+import time
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_order_summary_reader import InMemoryOrderSummaryReader
+from infrastructure.repositories.postgresql_order_summary_reader import PostgreSQLOrderSummaryReader
+
+TOTAL_ORDERS = [1_000, 10_000, 100_000]
+CUSTOMER_ORDERS = 20
+PAGE_SIZE = 500
+ROUNDS = 20
+
+
+def _customer(i: int, total: int) -> str:
+    # El cliente medido tiene CUSTOMER_ORDERS órdenes repartidas por todo el rango
+    return "customer-target" if i % (total // CUSTOMER_ORDERS) == 0 else f"customer-{i}"
+
+
+def _scan(reader):
+    """Recorre todas las páginas y filtra por cliente"""
+    found, after = [], None
+    while True:
+        page = reader.list_summaries(after, PAGE_SIZE)
+        found.extend(summary for summary in page if summary.customer_id == "customer-target")
+        if len(page) < PAGE_SIZE:
+            return found
+        after = page[-1].order_id
+
+
+def _time(list_orders):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        assert len(list_orders()) == CUSTOMER_ORDERS
+    return (time.perf_counter() - start) / ROUNDS
+
+
+def run():
+    print(f"{'órdenes':>8} | {'memoria recorrido':>17} | {'memoria índice':>14} | "
+          f"{'SQLite recorrido':>16} | {'SQLite índice':>13}  (ms)")
+    print("-" * 84)
+    for total in TOTAL_ORDERS:
+        repository = InMemoryOrderRepository()
+        for i in range(total):
+            repository.save(Order.create(OrderId(f"ORDER-{i:06d}"), _customer(i, total)))
+        memory = InMemoryOrderSummaryReader(repository)
+
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(OrderModel), [
+                {"order_id": f"ORDER-{i:06d}", "customer_id": _customer(i, total),
+                 "total_amount": 0, "currency": "EUR", "items_count": 0}
+                for i in range(total)
+            ])
+        session = sessionmaker(bind=engine)()
+        sql = PostgreSQLOrderSummaryReader(session)
+
+        timings = [
+            _time(lambda: _scan(memory)),
+            _time(lambda: memory.list_customer_summaries("customer-target", None, PAGE_SIZE)),
+            _time(lambda: _scan(sql)),
+            _time(lambda: sql.list_customer_summaries("customer-target", None, PAGE_SIZE)),
+        ]
+        print(f"{total:>8} | {timings[0] * 1000:>17.2f} | {timings[1] * 1000:>14.3f} | "
+              f"{timings[2] * 1000:>16.2f} | {timings[3] * 1000:>13.3f}")
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,79 @@
+"""
+Benchmark: añadir un item a órdenes de 1, 100 y 10.000 líneas.
+
+Compara la reescritura completa (DELETE + INSERT de todos los items) con el
+guardado incremental de PostgreSQLOrderRepository.save sobre SQLite en memoria.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_incremental_save
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel  # noqa: F401
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+SIZES = [1, 100, 10_000]
+
+
+def _build_engine():
+    engine = instrument_engine(create_engine("sqlite://"))
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _seed(session_factory, order_code, lines):
+    session = session_factory()
+    order = Order.create(OrderId(order_code), "bench-customer")
+    for i in range(lines):
+        order.add_item(SKU(f"SKU{i:08d}"), Quantity(1), Price(10.00))
+    PostgreSQLOrderRepository(session).save(order)
+    session.commit()
+    session.close()
+
+
+def _add_item(session_factory, order_code, full_rewrite):
+    session = session_factory()
+    repository = PostgreSQLOrderRepository(session)
+    order = repository.get(order_code)
+    if full_rewrite:
+        # Orden sin seguimiento de cambios: fuerza la ruta de reescritura completa
+        order = Order(order.order_id, order.customer_id)
+        for sku, quantity, price in repository.get(order_code).items:
+            order.add_item(sku, quantity, price)
+    order.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+
+    with track_statements() as stats:
+        start = time.perf_counter()
+        repository.save(order)
+        session.commit()
+        elapsed = time.perf_counter() - start
+    session.close()
+    return elapsed, stats.count
+
+
+def run():
+    print(f"{'líneas':>8} | {'modo':<12} | {'sentencias':>10} | {'tiempo (ms)':>11}")
+    print("-" * 52)
+    for size in SIZES:
+        for full_rewrite in (True, False):
+            engine = _build_engine()
+            session_factory = sessionmaker(bind=engine)
+            _seed(session_factory, "ORDER-BENCH", size)
+            elapsed, statements = _add_item(session_factory, "ORDER-BENCH", full_rewrite)
+            mode = "completo" if full_rewrite else "incremental"
+            print(f"{size:>8} | {mode:<12} | {statements:>10} | {elapsed * 1000:>11.2f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
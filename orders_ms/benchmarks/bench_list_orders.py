@@ -0,0 +1,68 @@
+"""
+Benchmark: listar una página de 50 órdenes con 1, 20 y 200 líneas por orden.
+
+Compara hidratar agregados Order (get_page) con leer resúmenes de las
+columnas denormalizadas (PostgreSQLOrderSummaryReader) sobre SQLite en memoria.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_list_orders
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.database.connection import Base
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+from infrastructure.repositories.postgresql_order_summary_reader import PostgreSQLOrderSummaryReader
+
+ORDERS = 50
+LINES_PER_ORDER = [1, 20, 200]
+ROUNDS = 20
+
+
+def _seed(session_factory, lines):
+    session = session_factory()
+    repository = PostgreSQLOrderRepository(session)
+    for i in range(ORDERS):
+        order = Order.create(OrderId(f"ORDER-{i:05d}"), f"customer-{i}")
+        for j in range(lines):
+            order.add_item(SKU(f"SKU{j:08d}"), Quantity(1), Price(10.00))
+        repository.save(order)
+    session.commit()
+    session.close()
+
+
+def _time(session_factory, list_page):
+    session = session_factory()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        list_page(session)
+        session.expunge_all()
+    elapsed = (time.perf_counter() - start) / ROUNDS
+    session.close()
+    return elapsed
+
+
+def run():
+    print(f"{'líneas/orden':>12} | {'agregados (ms)':>14} | {'resúmenes (ms)':>14}")
+    print("-" * 48)
+    for lines in LINES_PER_ORDER:
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        _seed(session_factory, lines)
+
+        hydrated = _time(session_factory, lambda s: PostgreSQLOrderRepository(s).get_page(None, ORDERS))
+        summaries = _time(session_factory, lambda s: PostgreSQLOrderSummaryReader(s).list_summaries(None, ORDERS))
+        print(f"{lines:>12} | {hydrated * 1000:>14.2f} | {summaries * 1000:>14.2f}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
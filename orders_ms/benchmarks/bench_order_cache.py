@@ -0,0 +1,80 @@
+"""
+Benchmark: GET /orders/{id} repetidos con y sin la caché de órdenes.
+
+Cada petición abre un Unit of Work de solo lectura (ruta Core), como
+GetOrderUseCase, sobre SQLite en memoria; los ids siguen una distribución
+sesgada (pocas órdenes calientes). Con caché un acierto no llega a la base
+de datos ni reconstruye la orden desde filas.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_order_cache
+"""
+import random
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.caching_unit_of_work import CachingUnitOfWork
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel  # noqa: F401
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.repositories.order_cache import OrderCache
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+ORDERS = 1000
+LINES = 10
+REQUESTS = 5000
+CACHE_SIZE = 200
+
+
+def _seed(session_factory) -> list:
+    session = session_factory()
+    orders = []
+    for i in range(ORDERS):
+        order = Order.create(OrderId(f"ORDER-{i:06d}"), "bench-customer")
+        for line in range(LINES):
+            order.add_item(SKU(f"SKU{line:08d}"), Quantity(1), Price(10.00))
+        orders.append(order)
+    PostgreSQLOrderRepository(session).save_many(orders)
+    session.commit()
+    session.close()
+    return [order.order_id.code for order in orders]
+
+
+def run():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session_factory = sessionmaker(bind=engine)
+    order_ids = _seed(session_factory)
+    rng = random.Random(42)
+    requests = [order_ids[min(int(rng.paretovariate(1.2)) - 1, ORDERS - 1)] for _ in range(REQUESTS)]
+
+    cache = OrderCache(max_size=CACHE_SIZE)
+    modes = [
+        ("sin caché", lambda: SQLAlchemyUnitOfWork(session_factory, read_only=True, core_reads=True)),
+        ("con caché", lambda: CachingUnitOfWork(
+            SQLAlchemyUnitOfWork(session_factory, read_only=True, core_reads=True), cache
+        )),
+    ]
+    print(f"{'modo':<10} | {'µs/petición':>11} | {'aciertos':>8}")
+    print("-" * 36)
+    for name, uow_factory in modes:
+        start = time.perf_counter()
+        for order_id in requests:
+            with uow_factory() as uow:
+                uow.orders.get(order_id)
+        elapsed = (time.perf_counter() - start) / REQUESTS
+        hits = cache.status()["hits"] / REQUESTS if name == "con caché" else 0
+        print(f"{name:<10} | {elapsed * 1e6:>11.1f} | {hits:>8.0%}")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
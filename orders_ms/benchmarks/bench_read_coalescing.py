@@ -0,0 +1,68 @@
+"""
+Benchmark: 64 hilos leen a la vez la misma orden de 200 líneas (SQLite en
+fichero), con y sin coalescencia de lecturas (ORDER_READ_COALESCING).
+
+Mide el tiempo total y cuántas cargas llegan a la base de datos.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_read_coalescing
+"""
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from container import Container
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+
+READERS = 64
+ROUNDS = 10
+LINES = 200
+
+
+def _container(path: str, coalescing: str) -> Container:
+    with patch.dict(os.environ, {
+        "ORDERS_BACKEND": "sqlite", "SQLITE_PATH": path, "SQLITE_THREADS": str(READERS + 1),
+        "ORDER_READ_COALESCING": coalescing,
+    }):
+        return Container()
+
+
+def run():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "orders.db")
+        seeded = _container(path, "off")
+        with seeded._get_unit_of_work() as uow:
+            order = Order.create(OrderId("ORDER-HOT"), "customer-1")
+            for i in range(LINES):
+                order.add_item(SKU(f"SKU{i:08d}"), Quantity(1), Price(10.00))
+            uow.orders.save(order)
+            uow.commit()
+        seeded.shutdown()
+
+        print(f"{'coalescencia':>12} | {'total (ms)':>10} | {'cargas':>6} | {'coalescidas':>11}")
+        print("-" * 50)
+        for coalescing in ("off", "on"):
+            container = _container(path, coalescing)
+            with ThreadPoolExecutor(max_workers=READERS) as executor:
+                start = time.perf_counter()
+                for _ in range(ROUNDS):
+                    list(executor.map(
+                        lambda _: container.get_order_use_case().execute(GetOrderRequestDTO(order_id="ORDER-HOT")),
+                        range(READERS)
+                    ))
+                elapsed = (time.perf_counter() - start) / ROUNDS
+            status = container.get_read_coalescing_status() or {}
+            flight = status.get("get_order", {"loads": READERS * ROUNDS, "coalesced": 0})
+            print(f"{coalescing:>12} | {elapsed * 1000:>10.1f} | {flight['loads']:>6} | {flight['coalesced']:>11}")
+            container.shutdown()
+
+
+if __name__ == "__main__":
+    run()
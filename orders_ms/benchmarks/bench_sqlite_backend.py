@@ -0,0 +1,87 @@
+"""
+Benchmark: backend SQLite con la configuración por defecto frente a WAL
+con los PRAGMAs de sqlite_connection.
+
+Crea órdenes con un COMMIT por caso de uso (cada una con dos items) y
+después las lee con varios hilos a la vez, sobre un fichero temporal.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_sqlite_backend
+"""
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderLineDTO
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase
+from application.use_cases.get_order_use_case import GetOrderUseCase
+from infrastructure.database.init_db import migrate
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.database.sqlite_connection import create_sqlite_engine
+from infrastructure.database.sqlite_unit_of_work import SQLiteUnitOfWork
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+ORDERS = 300
+READERS = 4
+READS_PER_ORDER = 4
+
+
+def _write(uow_factory) -> list:
+    pricing, bus = StaticPricingService(), InMemoryEventBus()
+    order_ids = []
+    for i in range(ORDERS):
+        order_id = CreateOrderUseCase(uow_factory(), bus).execute(
+            CreateOrderRequestDTO(customer_id=f"customer-{i % 10}")
+        ).order_id
+        AddItemsToOrderUseCase(uow_factory(), pricing, bus).execute(OrderItemsRequestDTO(
+            order_id=order_id, lines=[OrderLineDTO("LAPTOP123", 1), OrderLineDTO("MOUSE456", 2)]
+        ))
+        order_ids.append(order_id)
+    return order_ids
+
+
+def _read(read_uow_factory, order_ids: list) -> None:
+    def read_all(offset):
+        for order_id in order_ids[offset::READERS] * READS_PER_ORDER:
+            GetOrderUseCase(read_uow_factory()).execute(GetOrderRequestDTO(order_id=order_id))
+
+    with ThreadPoolExecutor(max_workers=READERS) as executor:
+        list(executor.map(read_all, range(READERS)))
+
+
+def run():
+    modes = [
+        ("por defecto", lambda path: create_engine(f"sqlite:///{path}"), SQLAlchemyUnitOfWork),
+        ("WAL", lambda path: create_sqlite_engine(path), SQLiteUnitOfWork),
+    ]
+    print(f"{'modo':<12} | {'escrituras/s':>12} | {'lecturas/s':>10}")
+    print("-" * 40)
+    for name, make_engine, uow_class in modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "orders.db")
+            migrate(f"sqlite:///{path}")
+            engine = make_engine(path)
+            session_factory = sessionmaker(bind=engine)
+
+            start = time.perf_counter()
+            order_ids = _write(lambda: uow_class(session_factory))
+            writes = ORDERS * 2 / (time.perf_counter() - start)
+
+            start = time.perf_counter()
+            _read(lambda: uow_class(session_factory, read_only=True, core_reads=True), order_ids)
+            reads = ORDERS * READS_PER_ORDER / (time.perf_counter() - start)
+
+            print(f"{name:<12} | {writes:>12.0f} | {reads:>10.0f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
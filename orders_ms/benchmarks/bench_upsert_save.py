@@ -0,0 +1,109 @@
+"""
+Benchmark: sentencias SQL por guardado de órdenes no cargadas (escritura completa).
+
+Compara el guardado anterior (SELECT de la cabecera y alta/actualización
+con el ORM, un INSERT por item) con el upsert actual de
+PostgreSQLOrderRepository (INSERT ... ON CONFLICT DO UPDATE de cabecera e
+INSERT multi-fila de items) sobre SQLite en memoria, para una orden nueva,
+una orden que sobrescribe a otra existente y un lote de órdenes nuevas.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_upsert_save
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.repositories.order_model_mapper import order_totals
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+ITEMS_PER_ORDER = 5
+BATCH_SIZE = 100
+
+
+def _order(order_code):
+    order = Order.create(OrderId(order_code), "bench-customer")
+    for i in range(ITEMS_PER_ORDER):
+        order.add_item(SKU(f"SKU{i:08d}"), Quantity(1), Price(10.00))
+    return order
+
+
+def _legacy_save(session, order):
+    """Guardado completo previo al upsert: consulta la cabecera antes de escribir"""
+    code = order.order_id.code
+    total, lines = order_totals(order.items)
+    existing = session.query(OrderModel).filter(OrderModel.order_id == code).first()
+    if existing:
+        existing.total_amount = float(total)
+        existing.items_count = lines
+        existing.version = (existing.version or 0) + 1
+        session.query(OrderItemModel).filter(OrderItemModel.order_id == code).delete()
+    else:
+        session.add(OrderModel(
+            order_id=code, customer_id=order.customer_id, total_amount=float(total),
+            currency="EUR", items_count=lines, version=1
+        ))
+    for sku, quantity, price in order.items:
+        session.add(OrderItemModel(
+            order_id=code, sku=sku.code, quantity=quantity.amount,
+            price=float(price.amount), subtotal=float(price.amount * quantity.amount)
+        ))
+    session.flush()
+
+
+def _upsert_save(session, orders):
+    repository = PostgreSQLOrderRepository(session)
+    if len(orders) == 1:
+        repository.save(orders[0])
+    else:
+        repository.save_many(orders)
+
+
+def _legacy(session, orders):
+    for order in orders:
+        _legacy_save(session, order)
+
+
+def _measure(session_factory, save, orders):
+    session = session_factory()
+    with track_statements() as stats:
+        start = time.perf_counter()
+        save(session, orders)
+        session.commit()
+        elapsed = time.perf_counter() - start
+    session.close()
+    return elapsed, stats.count
+
+
+def run():
+    scenarios = [
+        ("nueva", False, 1),
+        ("sobrescribe", True, 1),
+        (f"lote x{BATCH_SIZE}", False, BATCH_SIZE),
+    ]
+    print(f"{'escenario':<12} | {'modo':<8} | {'sentencias':>10} | {'sent./orden':>11} | {'tiempo (ms)':>11}")
+    print("-" * 65)
+    for name, overwrite, size in scenarios:
+        for mode, save in (("anterior", _legacy), ("upsert", _upsert_save)):
+            engine = instrument_engine(create_engine("sqlite://"))
+            Base.metadata.create_all(engine)
+            session_factory = sessionmaker(bind=engine)
+            codes = [f"ORDER-{i:05d}" for i in range(size)]
+            if overwrite:
+                _measure(session_factory, save, [_order(code) for code in codes])
+            elapsed, statements = _measure(session_factory, save, [_order(code) for code in codes])
+            print(f"{name:<12} | {mode:<8} | {statements:>10} | {statements / size:>11.2f} | {elapsed * 1000:>11.2f}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,81 @@
+"""
+Benchmark: ráfagas de guardados de la misma orden, con escritura directa
+frente al write-behind en modo sync y async.
+
+Varios hilos añaden items a un puñado de órdenes (como al construir
+carritos) sobre SQLite en un fichero temporal. Se mide el tiempo hasta
+que todo está escrito y cuántos lotes (COMMITs de escritura) hicieron falta.
+
+Uso (desde orders_ms/):
+    python -m benchmarks.bench_write_behind
+"""
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderLineDTO
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase
+from infrastructure.database.init_db import migrate
+from infrastructure.database.sqlite_connection import create_sqlite_engine
+from infrastructure.database.sqlite_unit_of_work import SQLiteUnitOfWork
+from infrastructure.database.write_behind import ASYNC, SYNC, WriteBehindBuffer
+from infrastructure.database.write_behind_unit_of_work import WriteBehindUnitOfWork
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+ORDERS = 5
+SAVES_PER_ORDER = 200
+WRITERS = 8
+
+
+def _burst(uow_factory) -> None:
+    pricing, bus = StaticPricingService(), InMemoryEventBus()
+    order_ids = [
+        CreateOrderUseCase(uow_factory(), bus).execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+        for _ in range(ORDERS)
+    ]
+
+    def add(index):
+        AddItemsToOrderUseCase(uow_factory(), pricing, bus).execute(
+            OrderItemsRequestDTO(order_id=order_ids[index % ORDERS], lines=[OrderLineDTO("MOUSE456", 1)])
+        )
+
+    with ThreadPoolExecutor(max_workers=WRITERS) as executor:
+        list(executor.map(add, range(ORDERS * SAVES_PER_ORDER)))
+
+
+def run():
+    print(f"{'modo':<12} | {'guardados/s':>11} | {'lotes':>6}")
+    print("-" * 36)
+    for mode in (None, SYNC, ASYNC):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "orders.db")
+            migrate(f"sqlite:///{path}")
+            engine = create_sqlite_engine(path)
+            session_factory = sessionmaker(bind=engine)
+
+            buffer = None
+            uow_factory = lambda: SQLiteUnitOfWork(session_factory)
+            if mode is not None:
+                buffer = WriteBehindBuffer(lambda: SQLiteUnitOfWork(session_factory), mode)
+                uow_factory = lambda: WriteBehindUnitOfWork(SQLiteUnitOfWork(session_factory), buffer)
+
+            start = time.perf_counter()
+            _burst(uow_factory)
+            if buffer is not None:
+                buffer.close()
+            elapsed = time.perf_counter() - start
+
+            # Sin write-behind cada caso de uso confirma su propia transacción
+            batches = buffer.status()["flushes"] if buffer is not None else ORDERS * (SAVES_PER_ORDER + 1)
+            print(f"{mode or 'directo':<12} | {ORDERS * SAVES_PER_ORDER / elapsed:>11.0f} | {batches:>6}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    run()
@@ -1,13 +1,20 @@
 """
 Composition Root - Container para inyección de dependencias
 """
-from infrastructure.services.static_pricing_service import StaticPricingService
+from typing import Optional
+from infrastructure.services.static_pricing_service import AsyncStaticPricingService, StaticPricingService
 from infrastructure.events.in_memory_event_bus import InMemoryEventBus
-from application.use_cases.create_order_use_case import CreateOrderUseCase
-from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
-from application.use_cases.get_order_use_case import GetOrderUseCase
-from application.use_cases.list_orders_use_case import ListOrdersUseCase
+from infrastructure.events.group_commit_event_bus import GroupCommitEventBus
+from application.use_cases.create_order_use_case import CreateOrderUseCase, AsyncCreateOrderUseCase
+from application.use_cases.create_orders_batch_use_case import CreateOrdersBatchUseCase, AsyncCreateOrdersBatchUseCase
+from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase, AsyncAddItemToOrderUseCase
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase, AsyncAddItemsToOrderUseCase
+from application.use_cases.replace_order_items_use_case import ReplaceOrderItemsUseCase, AsyncReplaceOrderItemsUseCase
+from application.use_cases.get_order_use_case import GetOrderUseCase, AsyncGetOrderUseCase
+from application.use_cases.get_order_version_use_case import GetOrderVersionUseCase, AsyncGetOrderVersionUseCase
+from application.use_cases.list_orders_use_case import ListOrdersUseCase, AsyncListOrdersUseCase
 from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.database.in_memory_async_unit_of_work import InMemoryAsyncUnitOfWork
 from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
 
 class Container:
@@ -30,56 +37,471 @@ class Container:
             'unittest' in ' '.join(sys.argv)
         )
         
-        if is_testing:
+        # Backend: ORDERS_BACKEND=memory|sqlite|postgresql (por defecto memory en tests)
+        backend = os.getenv('ORDERS_BACKEND', 'memory' if is_testing else 'postgresql').lower()
+        
+        if backend == 'memory':
             # Usar InMemory para tests
             from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
             self._repository = InMemoryOrderRepository()
+        elif backend == 'sqlite':
+            # SQLite embebido (WAL): un solo nodo, sin servidor de base de datos
+            self._configure_sqlite()
         else:
             # Usar PostgreSQL para producción
             from infrastructure.database.connection import SessionLocal
             from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+            from infrastructure.database.async_connection import AsyncSessionLocal
+            from infrastructure.database.connection import ReplicaSessionLocal
+            from infrastructure.database.async_connection import AsyncReplicaSessionLocal
+            from infrastructure.database.read_routing import ReplicaRouter, AsyncReplicaRouter, read_settings_from_env
             # Almacenar la factory de sesiones, no una sesión específica
+            from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+            self._backend = 'postgresql'
+            self._unit_of_work_class = SQLAlchemyUnitOfWork
+            self._async_unit_of_work_class = SQLAlchemyAsyncUnitOfWork
             self._session_factory = SessionLocal
+            self._async_session_factory = AsyncSessionLocal
             self._repository = None  # Se creará bajo demanda
+            # Lecturas: solo lectura y, si hay réplica (DATABASE_REPLICA_URL), enrutadas a ella
+            self._read_settings = read_settings_from_env()
+            self._replica_router = ReplicaRouter(SessionLocal, ReplicaSessionLocal) if ReplicaSessionLocal else None
+            self._async_replica_router = (
+                AsyncReplicaRouter(AsyncSessionLocal, AsyncReplicaSessionLocal) if AsyncReplicaSessionLocal else None
+            )
+            # Sharding opcional (DATABASE_SHARD_URLS): un Unit of Work por shard
+            from infrastructure.database.connection import ShardSessionLocals
+            from infrastructure.database.async_connection import AsyncShardSessionLocals
+            self._shard_factories = ShardSessionLocals
+            self._async_shard_factories = AsyncShardSessionLocals
+            self._shard_executor = None
+            if ShardSessionLocals:
+                from concurrent.futures import ThreadPoolExecutor
+                from infrastructure.database.sharding import shard_workers_from_env
+                self._shard_executor = ThreadPoolExecutor(
+                    max_workers=shard_workers_from_env(len(ShardSessionLocals)), thread_name_prefix="order-shard"
+                )
+        
+        if backend != 'memory' and os.getenv('ORDER_STORE', 'tables').lower() == 'events':
+            # Almacén de eventos con snapshots (order_events/order_snapshots)
+            self._configure_event_store()
         
         self._pricing_service = StaticPricingService()
+        # Los casos de uso asíncronos esperan al catálogo sin bloquear el event loop
+        self._async_pricing_service = AsyncStaticPricingService(self._pricing_service)
+        # Caché de precios opcional (PRICING_CACHE_SIZE > 0) delante del catálogo
+        from infrastructure.services.caching_pricing_service import (
+            AsyncCachingPricingService,
+            CachingPricingService,
+            pricing_cache_settings_from_env,
+        )
+        pricing_cache_settings = pricing_cache_settings_from_env()
+        self._pricing_cache = (
+            CachingPricingService(self._pricing_service, **pricing_cache_settings)
+            if pricing_cache_settings else None
+        )
+        if self._pricing_cache is not None:
+            # La variante asíncrona comparte la caché con la síncrona
+            self._pricing_service = self._pricing_cache
+            self._async_pricing_service = AsyncCachingPricingService(self._pricing_cache)
         self._event_bus = InMemoryEventBus()
+        # Los casos de uso publican por aquí: dentro de group_commit, tras el COMMIT del grupo
+        self._event_publisher = GroupCommitEventBus(self._event_bus)
+
+        # Write-behind opcional (ORDER_WRITE_BEHIND=sync|async): guardados en lotes
+        from infrastructure.database.write_behind import WriteBehindBuffer, write_behind_settings_from_env
+        write_behind_settings = write_behind_settings_from_env()
+        self._write_behind = (
+            WriteBehindBuffer(self._get_store_unit_of_work, **write_behind_settings)
+            if write_behind_settings else None
+        )
+
+        # Caché de lecturas opcional (ORDER_CACHE_SIZE > 0), invalidada por los eventos del bus
+        from infrastructure.repositories.order_cache import OrderCache, cache_settings_from_env
+        cache_settings = cache_settings_from_env()
+        self._order_cache = OrderCache(**cache_settings) if cache_settings else None
+        if self._order_cache is not None:
+            self._order_cache.subscribe_to(self._event_bus)
+
+        # Respuestas de GET /orders/{order_id} ya serializadas, por (orden, versión)
+        from infrastructure.web.response_cache import OrderResponseCache, response_cache_settings_from_env
+        response_cache_settings = response_cache_settings_from_env()
+        self._response_cache = OrderResponseCache(**response_cache_settings) if response_cache_settings else None
+        if self._response_cache is not None:
+            self._response_cache.subscribe_to(self._event_bus)
+
+        # Proyección de resúmenes opcional (ORDER_SUMMARY_PROJECTION=on): los
+        # listados y el panel leen de ella; se carga al arrancar y se mantiene con el bus
+        from infrastructure.repositories.order_summary_projection import OrderSummaryProjection
+        self._summary_projection = None
+        if os.getenv('ORDER_SUMMARY_PROJECTION', 'off').lower() in ('1', 'true', 'on'):
+            self._summary_projection = OrderSummaryProjection()
+            self._summary_projection.subscribe_to(self._event_bus)
+            self.rebuild_summary_projection()
+
+        # Coalescencia opcional (ORDER_READ_COALESCING=on) de lecturas concurrentes idénticas
+        from application.use_cases.coalescing_use_case import ReadCoalescer
+        self._read_coalescer = None
+        if os.getenv('ORDER_READ_COALESCING', 'off').lower() in ('1', 'true', 'on'):
+            self._read_coalescer = ReadCoalescer()
+            self._read_coalescer.subscribe_to(self._event_bus)
+
+    def _configure_sqlite(self):
+        """Motores SQLite (SQLITE_PATH), esquema al día y factories de sesiones"""
+        from sqlalchemy.orm import sessionmaker
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        from infrastructure.database.init_db import migrate
+        from infrastructure.database.read_routing import read_settings_from_env
+        from infrastructure.database.sqlite_connection import (
+            create_async_sqlite_engine, create_sqlite_engine, sqlite_settings_from_env
+        )
+        from infrastructure.database.sqlite_unit_of_work import SQLiteUnitOfWork
+        from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+        settings = sqlite_settings_from_env()
+        # Sin paso de despliegue aparte: las migraciones se aplican al arrancar
+        migrate(f"sqlite:///{settings['path']}")
+        self._sqlite_engine = create_sqlite_engine(settings['path'], settings['threads'])
+        self._async_sqlite_engine = create_async_sqlite_engine(settings['path'])
+        self._backend = 'sqlite'
+        self._unit_of_work_class = SQLiteUnitOfWork
+        self._async_unit_of_work_class = SQLAlchemyAsyncUnitOfWork
+        self._session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self._sqlite_engine)
+        self._async_session_factory = async_sessionmaker(
+            self._async_sqlite_engine, autoflush=False, expire_on_commit=False
+        )
+        self._repository = None
+        self._read_settings = read_settings_from_env()
+        self._replica_router = None
+        self._async_replica_router = None
+        self._shard_factories = []
+        self._async_shard_factories = []
+        self._shard_executor = None
+
+    def _configure_event_store(self):
+        """
+        Unit of Work event-sourced (ORDER_STORE=events), sobre SQLite o
+        PostgreSQL. La frecuencia de snapshots se lee de ORDER_SNAPSHOT_EVERY.
+        """
+        from infrastructure.database.event_sourced_unit_of_work import EventSourcedUnitOfWork
+        from infrastructure.database.event_sourced_async_unit_of_work import AsyncEventSourcedUnitOfWork
+        self._unit_of_work_class = EventSourcedUnitOfWork
+        self._async_unit_of_work_class = AsyncEventSourcedUnitOfWork
     
     def _get_repository(self):
         """Obtiene el repositorio apropiado (con nueva sesión para PostgreSQL)"""
         if hasattr(self, '_session_factory'):
             # PostgreSQL: crear nueva sesión cada vez
-            from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
             db_session = self._session_factory()
-            return PostgreSQLOrderRepository(db_session)
+            return self._unit_of_work_class.order_repository_class(db_session)
         else:
             # InMemory para testing
             return self._repository
         
-    def _get_unit_of_work(self):
+    def _get_store_unit_of_work(self):
         """Obtiene el Unit of Work apropiado"""
+        if getattr(self, '_shard_factories', None):
+            # Shards: cada orden se escribe en su shard
+            from infrastructure.database.sharded_unit_of_work import ShardedUnitOfWork
+            return ShardedUnitOfWork(
+                [self._unit_of_work_class(factory) for factory in self._shard_factories], self._shard_executor
+            )
         if hasattr(self, '_session_factory'):
-            # PostgreSQL Unit of Work
-            return SQLAlchemyUnitOfWork(self._session_factory)
+            # PostgreSQL (o SQLite) Unit of Work
+            return self._unit_of_work_class(self._session_factory)
         else:
             # InMemory Unit of Work
             return InMemoryUnitOfWork(self._repository)
+
+    def _get_store_read_unit_of_work(self, consistency_token: str = None):
+        """
+        Unit of Work de solo lectura (sin COMMIT). Con réplica configurada la
+        lectura va a ella, salvo que el token indique una escritura que la
+        réplica aún no ha reproducido. Con shards se lee de los primarios de
+        cada shard (la réplica no se combina con el sharding).
+        """
+        if getattr(self, '_shard_factories', None):
+            from infrastructure.database.sharded_unit_of_work import ShardedUnitOfWork
+            return ShardedUnitOfWork(
+                [self._unit_of_work_class(factory, read_only=True, **self._read_settings)
+                 for factory in self._shard_factories],
+                self._shard_executor
+            )
+        if hasattr(self, '_session_factory'):
+            session_factory = self._session_factory
+            if self._replica_router:
+                session_factory = self._replica_router.read_session_factory(consistency_token)
+            return self._unit_of_work_class(session_factory, read_only=True, **self._read_settings)
+        else:
+            return InMemoryUnitOfWork(self._repository)
+
+    def _get_store_async_read_unit_of_work(self, consistency_token: str = None):
+        """Variante asíncrona de _get_store_read_unit_of_work (la réplica se elige al entrar)"""
+        if getattr(self, '_async_shard_factories', None):
+            from infrastructure.database.sharded_async_unit_of_work import AsyncShardedUnitOfWork
+            return AsyncShardedUnitOfWork([
+                self._async_unit_of_work_class(factory, read_only=True, **self._read_settings)
+                for factory in self._async_shard_factories
+            ])
+        if hasattr(self, '_async_session_factory'):
+            from functools import partial
+            route = None
+            if self._async_replica_router:
+                route = partial(self._async_replica_router.read_session_factory, consistency_token)
+            return self._async_unit_of_work_class(
+                self._async_session_factory, read_only=True, route_session_factory=route, **self._read_settings
+            )
+        else:
+            return InMemoryAsyncUnitOfWork(self._repository)
+
+    def _get_store_async_unit_of_work(self):
+        """Obtiene el Unit of Work asíncrono apropiado"""
+        if getattr(self, '_async_shard_factories', None):
+            from infrastructure.database.sharded_async_unit_of_work import AsyncShardedUnitOfWork
+            return AsyncShardedUnitOfWork(
+                [self._async_unit_of_work_class(factory) for factory in self._async_shard_factories]
+            )
+        if hasattr(self, '_async_session_factory'):
+            # PostgreSQL (asyncpg) Unit of Work
+            return self._async_unit_of_work_class(self._async_session_factory)
+        else:
+            # InMemory: comparte repositorio con la ruta síncrona
+            return InMemoryAsyncUnitOfWork(self._repository)
     
+    def _get_unit_of_work(self):
+        """Unit of Work de escritura (envuelto en write-behind si está activo)"""
+        return self._write_behind_unit_of_work(self._get_store_unit_of_work())
+
+    def _get_read_unit_of_work(self, consistency_token: str = None):
+        """
+        Unit of Work de lectura: con write-behind ve también lo pendiente de
+        escribir y, con caché, orders.get la consulta primero. Con réplica,
+        solo las lecturas con token de consistencia rellenan la caché: sin
+        token la réplica puede ir por detrás de la última invalidación.
+        """
+        uow = self._write_behind_unit_of_work(self._get_store_read_unit_of_work(consistency_token))
+        if self._order_cache is None:
+            return uow
+        from infrastructure.database.caching_unit_of_work import CachingUnitOfWork
+        fill = not getattr(self, '_replica_router', None) or consistency_token is not None
+        return CachingUnitOfWork(uow, self._order_cache, fill)
+
+    def _get_async_unit_of_work(self):
+        """Variante asíncrona de _get_unit_of_work"""
+        return self._async_write_behind_unit_of_work(self._get_store_async_unit_of_work())
+
+    def _get_async_read_unit_of_work(self, consistency_token: str = None):
+        """Variante asíncrona de _get_read_unit_of_work"""
+        uow = self._async_write_behind_unit_of_work(self._get_store_async_read_unit_of_work(consistency_token))
+        if self._order_cache is None:
+            return uow
+        from infrastructure.database.caching_async_unit_of_work import AsyncCachingUnitOfWork
+        fill = not getattr(self, '_async_replica_router', None) or consistency_token is not None
+        return AsyncCachingUnitOfWork(uow, self._order_cache, fill)
+
+    def _write_behind_unit_of_work(self, uow):
+        if self._write_behind is None:
+            return uow
+        from infrastructure.database.write_behind_unit_of_work import WriteBehindUnitOfWork
+        return WriteBehindUnitOfWork(uow, self._write_behind)
+
+    def _async_write_behind_unit_of_work(self, uow):
+        if self._write_behind is None:
+            return uow
+        from infrastructure.database.write_behind_async_unit_of_work import AsyncWriteBehindUnitOfWork
+        return AsyncWriteBehindUnitOfWork(uow, self._write_behind)
+
+    def shutdown(self) -> None:
+        """Hook de apagado: escribe lo pendiente del write-behind y para su hilo"""
+        if self._write_behind is not None:
+            self._write_behind.close()
+
     def create_order_use_case(self) -> CreateOrderUseCase:
         """Retorna caso de uso configurado para crear órdenes"""
-        return CreateOrderUseCase(self._get_unit_of_work(), self._event_bus)
+        return CreateOrderUseCase(self._get_unit_of_work(), self._event_publisher)
     
+    def create_orders_batch_use_case(self) -> CreateOrdersBatchUseCase:
+        """Retorna caso de uso configurado para crear órdenes en lote"""
+        return CreateOrdersBatchUseCase(self._get_unit_of_work(), self._pricing_service, self._event_publisher)
+
     def add_item_use_case(self) -> AddItemToOrderUseCase:
         """Retorna caso de uso configurado para añadir items"""
-        return AddItemToOrderUseCase(self._get_unit_of_work(), self._pricing_service, self._event_bus)
+        return AddItemToOrderUseCase(self._get_unit_of_work(), self._pricing_service, self._event_publisher)
+
+    def add_items_use_case(self) -> AddItemsToOrderUseCase:
+        """Retorna caso de uso configurado para añadir varios items a la vez"""
+        return AddItemsToOrderUseCase(self._get_unit_of_work(), self._pricing_service, self._event_publisher)
+
+    def replace_items_use_case(self) -> ReplaceOrderItemsUseCase:
+        """Retorna caso de uso configurado para reemplazar los items de una orden"""
+        return ReplaceOrderItemsUseCase(self._get_unit_of_work(), self._pricing_service, self._event_publisher)
 
-    def get_order_use_case(self) -> GetOrderUseCase:
+    def get_order_use_case(self, consistency_token: str = None) -> GetOrderUseCase:
         """Retorna caso de uso configurado para obtener órdenes"""
-        return GetOrderUseCase(self._get_unit_of_work())
+        use_case = GetOrderUseCase(self._get_read_unit_of_work(consistency_token))
+        if self._coalesces(consistency_token):
+            use_case = self._read_coalescer.get_order(use_case)
+        return use_case
 
-    def list_orders_use_case(self) -> ListOrdersUseCase:
+    def get_order_version_use_case(self, consistency_token: str = None) -> GetOrderVersionUseCase:
+        """Retorna caso de uso configurado para obtener la versión de una orden"""
+        return GetOrderVersionUseCase(self._get_read_unit_of_work(consistency_token))
+
+    def list_orders_use_case(self, consistency_token: str = None) -> ListOrdersUseCase:
         """Retorna caso de uso configurado para listar todas las órdenes"""
-        return ListOrdersUseCase(self._get_unit_of_work())
+        use_case = ListOrdersUseCase(self._get_read_unit_of_work(consistency_token), self._summary_projection)
+        if self._coalesces(consistency_token):
+            use_case = self._read_coalescer.list_orders(use_case)
+        return use_case
+
+    # Variantes asíncronas (usadas por los endpoints async de FastAPI)
+    def async_create_order_use_case(self) -> AsyncCreateOrderUseCase:
+        """Retorna caso de uso asíncrono para crear órdenes"""
+        return AsyncCreateOrderUseCase(self._get_async_unit_of_work(), self._event_publisher)
+
+    def async_create_orders_batch_use_case(self) -> AsyncCreateOrdersBatchUseCase:
+        """Retorna caso de uso asíncrono para crear órdenes en lote"""
+        return AsyncCreateOrdersBatchUseCase(self._get_async_unit_of_work(), self._async_pricing_service, self._event_publisher)
+
+    def async_add_item_use_case(self) -> AsyncAddItemToOrderUseCase:
+        """Retorna caso de uso asíncrono para añadir items"""
+        return AsyncAddItemToOrderUseCase(self._get_async_unit_of_work(), self._async_pricing_service, self._event_publisher)
+
+    def async_add_items_use_case(self) -> AsyncAddItemsToOrderUseCase:
+        """Retorna caso de uso asíncrono para añadir varios items a la vez"""
+        return AsyncAddItemsToOrderUseCase(self._get_async_unit_of_work(), self._async_pricing_service, self._event_publisher)
+
+    def async_replace_items_use_case(self) -> AsyncReplaceOrderItemsUseCase:
+        """Retorna caso de uso asíncrono para reemplazar los items de una orden"""
+        return AsyncReplaceOrderItemsUseCase(self._get_async_unit_of_work(), self._async_pricing_service, self._event_publisher)
+
+    def async_get_order_use_case(self, consistency_token: str = None) -> AsyncGetOrderUseCase:
+        """Retorna caso de uso asíncrono para obtener órdenes"""
+        use_case = AsyncGetOrderUseCase(self._get_async_read_unit_of_work(consistency_token))
+        if self._coalesces(consistency_token):
+            use_case = self._read_coalescer.async_get_order(use_case)
+        return use_case
+
+    def async_get_order_version_use_case(self, consistency_token: str = None) -> AsyncGetOrderVersionUseCase:
+        """Retorna caso de uso asíncrono para obtener la versión de una orden"""
+        return AsyncGetOrderVersionUseCase(self._get_async_read_unit_of_work(consistency_token))
+
+    def async_list_orders_use_case(self, consistency_token: str = None) -> AsyncListOrdersUseCase:
+        """Retorna caso de uso asíncrono para listar órdenes"""
+        use_case = AsyncListOrdersUseCase(
+            self._get_async_read_unit_of_work(consistency_token), self._summary_projection
+        )
+        if self._coalesces(consistency_token):
+            use_case = self._read_coalescer.async_list_orders(use_case)
+        return use_case
+
+    def _coalesces(self, consistency_token: str = None) -> bool:
+        """
+        Si una lectura se coalesce con otras idénticas en curso. Las que traen
+        token de consistencia no: deben ver una escritura concreta y la
+        lectura en curso podría haber empezado antes.
+        """
+        return self._read_coalescer is not None and consistency_token is None
+
+    # Read-your-writes: token de la última escritura para las lecturas siguientes
+    def consistency_token(self):
+        """
+        Token de consistencia tras una escritura (posición del primario), o
+        None si no hay réplica: sin réplica todas las lecturas ven las escrituras
+        """
+        if getattr(self, '_replica_router', None):
+            return self._replica_router.consistency_token()
+        return None
+
+    async def async_consistency_token(self):
+        """Variante asíncrona de consistency_token"""
+        if getattr(self, '_async_replica_router', None):
+            return await self._async_replica_router.consistency_token()
+        return None
+
+    # Group commit: varios casos de uso, una sola transacción
+    def group_commit(self):
+        """
+        Context manager que agrupa en una transacción (un COMMIT) las
+        escrituras de los casos de uso síncronos creados dentro del bloque.
+        Con shards no hay transacción común: cada caso de uso confirma por su cuenta.
+        """
+        if hasattr(self, '_session_factory') and not self._shard_factories:
+            from infrastructure.database.group_commit import group_commit
+            return group_commit(self._session_factory)
+        from contextlib import nullcontext
+        return nullcontext()
+
+    def async_group_commit(self):
+        """Variante para casos de uso asíncronos (usar con `async with`)"""
+        if hasattr(self, '_async_session_factory') and not self._async_shard_factories:
+            from infrastructure.database.group_commit import async_group_commit
+            return async_group_commit(self._async_session_factory)
+        from contextlib import nullcontext
+        return nullcontext()
+
+    def get_write_behind_status(self) -> Optional[dict]:
+        """Métricas del write-behind (None si no está activo)"""
+        return self._write_behind.status() if self._write_behind is not None else None
+
+    def get_order_cache_status(self) -> Optional[dict]:
+        """Métricas de la caché de órdenes (None si no está activa)"""
+        return self._order_cache.status() if self._order_cache is not None else None
+
+    def get_pricing_cache_status(self) -> Optional[dict]:
+        """Métricas de la caché de precios (None si no está activa)"""
+        return self._pricing_cache.status() if self._pricing_cache is not None else None
+
+    def get_read_coalescing_status(self) -> Optional[dict]:
+        """Métricas de la coalescencia de lecturas (None si no está activa)"""
+        return self._read_coalescer.status() if self._read_coalescer is not None else None
+
+    def get_summary_projection(self):
+        """Proyección de resúmenes (None si está desactivada)"""
+        return self._summary_projection
+
+    def rebuild_summary_projection(self) -> int:
+        """
+        Recarga la proyección desde los resúmenes del primario (no de la
+        réplica, que puede ir por detrás). Con shards se lee por order_id.
+
+        :return: Número de órdenes cargadas.
+        """
+        sort = "order_id" if getattr(self, '_shard_factories', None) else "created_at"
+        return self._summary_projection.rebuild(self._get_store_unit_of_work(), sort=sort)
+
+    def check_summary_projection(self):
+        """Compara la proyección con las órdenes guardadas (SummaryConsistencyReportDTO)"""
+        return self._summary_projection.check(self._get_store_unit_of_work())
+
+    def get_response_cache(self):
+        """Caché de respuestas de órdenes ya serializadas (None si está desactivada)"""
+        return self._response_cache
+
+    def get_response_cache_status(self) -> Optional[dict]:
+        """Métricas de la caché de respuestas (None si no está activa)"""
+        return self._response_cache.status() if self._response_cache is not None else None
+
+    def get_database_pool_status(self) -> dict:
+        """Estado y métricas de los pools de conexiones (síncrono y asíncrono)"""
+        if not hasattr(self, '_session_factory'):
+            return {"backend": "in_memory", "pools": {}}
+        if self._backend == 'sqlite':
+            # SingletonThreadPool: una conexión por hilo, sin métricas de cola
+            return {"backend": "sqlite", "pools": {}}
+
+        from infrastructure.database.pool import pool_status
+        from infrastructure.database.connection import engine
+        from infrastructure.database.connection import shard_engines
+        from infrastructure.database.async_connection import async_engine, async_shard_engines
+        pools = {
+            "sync": pool_status(engine),
+            "async": pool_status(async_engine.sync_engine)
+        }
+        for index, shard_engine in enumerate(shard_engines):
+            pools[f"shard_{index}"] = pool_status(shard_engine)
+        for index, shard_engine in enumerate(async_shard_engines):
+            pools[f"async_shard_{index}"] = pool_status(shard_engine.sync_engine)
+        return {"backend": "postgresql", "pools": pools}
 
     # Métodos de acceso a infrastructure (útiles para testing)
     def get_repository(self):
@@ -4,6 +4,7 @@ from ..value_objects.quantity import Quantity
 from ..value_objects.price import Price
 from ..events.order_created import OrderCreated
 from ..events.item_added import ItemAdded
+from ..events.items_cleared import ItemsCleared
 
 # Import logger - handle both direct execution and module execution
 try:
@@ -17,6 +18,10 @@ class Order:
         self._order_id = order_id
         self._customer_id = customer_id
         self._items = []          # ← Agregar: Lista de items del pedido
+        self._new_items = []      # Items añadidos desde la última carga/guardado
+        self._persisted = False   # True si la orden ya existe en persistencia
+        self._items_cleared = False  # True si los items se vaciaron desde la última carga
+        self._version = 0         # Versión persistida (0 = nunca guardada), control optimista
         self._domain_events = []  # ← Agregar: Eventos pendientes de publicar
         self._logger.debug(f"Order created with ID: {order_id.code} for customer: {customer_id}")
 
@@ -31,6 +36,24 @@ class Order:
     @property
     def items(self) -> list:
         return self._items.copy()  # Retornar copia para inmutabilidad
+
+    @property
+    def new_items(self) -> list:
+        # Items pendientes de persistir desde que la orden se cargó
+        return self._new_items.copy()
+
+    @property
+    def is_persisted(self) -> bool:
+        return self._persisted
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def items_cleared(self) -> bool:
+        # Si es True, persistir new_items no basta: hay que reemplazar los items guardados
+        return self._items_cleared
     
     @classmethod
     def create(cls, order_id: OrderId, customer_id: str) -> 'Order':
@@ -40,14 +63,40 @@ class Order:
         order._domain_events.append(OrderCreated(order_id.code, customer_id))
         logger.info(f"Order created successfully with ID: {order_id.code}")
         return order
+
+    @classmethod
+    def restore(cls, order_id: OrderId, customer_id: str, items: list, version: int = 1) -> 'Order':
+        # Reconstruye una orden desde persistencia: sin eventos ni items pendientes
+        order = cls(order_id, customer_id)
+        order._items = list(items)
+        order._persisted = True
+        order._version = version
+        return order
     
     def add_item(self, sku: SKU, quantity: Quantity, price: Price):
         # Agrega item y emite ItemAdded event
         self._logger.info(f"Adding item to order {self._order_id.code}: SKU={sku.code}, Quantity={quantity.amount}, Price={price.amount}")
         self._items.append((sku, quantity, price))
+        self._new_items.append((sku, quantity, price))
         self._domain_events.append(ItemAdded(self._order_id.code, sku.code, quantity.amount, price.amount))
         self._logger.debug(f"Item added successfully. Order {self._order_id.code} now has {len(self._items)} items")
 
+    def clear_items(self):
+        # Vacía el carrito (p. ej. para reemplazarlo) y emite ItemsCleared event
+        self._logger.info(f"Clearing items of order {self._order_id.code}")
+        self._items.clear()
+        self._new_items.clear()
+        self._items_cleared = True
+        self._domain_events.append(ItemsCleared(self._order_id.code))
+
+    def mark_persisted(self, version: int = None):
+        # Los repositorios lo llaman tras guardar: los items nuevos ya están almacenados
+        self._new_items.clear()
+        self._items_cleared = False
+        self._persisted = True
+        if version is not None:
+            self._version = version
+
     def __str__(self):
         return f"Order(ID: {self._order_id}, CustomerID: {self._customer_id})"
     
@@ -0,0 +1,6 @@
+from .domain_event import DomainEvent
+
+class ItemsCleared(DomainEvent):
+    def __init__(self, order_id: str):
+        super().__init__()
+        self.order_id = order_id
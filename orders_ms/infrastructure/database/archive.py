@@ -0,0 +1,207 @@
+"""
+Archivo de órdenes antiguas (cold storage).
+
+Un job por lotes mueve las órdenes con created_at anterior a una antigüedad
+configurable desde orders/order_items a orders_archive: una fila inmutable
+por orden con cabecera e items en JSON comprimido con zlib. Las tablas
+calientes (y sus índices y VACUUM) solo contienen las órdenes recientes.
+
+Uso (desde orders_ms/, p. ej. desde cron o como proceso aparte):
+    python -m infrastructure.database.archive [--older-than-days 365]
+        [--batch-size 500] [--interval SEGUNDOS] [--url URL[,URL...]]
+
+Las órdenes archivadas son de solo lectura: los repositorios las leen en
+get cuando no están en la tabla caliente (archive_reads, activo en los
+Unit of Work de solo lectura), pero no aparecen en listados ni se pueden
+modificar.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import List, Mapping, Optional, Sequence
+from sqlalchemy import bindparam, create_engine, delete, insert, select
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.models.order_archive_model import OrderArchiveModel
+
+DEFAULT_ARCHIVE_AFTER_DAYS = 365
+DEFAULT_ARCHIVE_BATCH_SIZE = 500
+
+_orders = OrderModel.__table__
+_items = OrderItemModel.__table__
+_archive = OrderArchiveModel.__table__
+
+ARCHIVED_ORDER = select(_archive.c.payload).where(_archive.c.order_id == bindparam("order_id"))
+
+
+def archive_settings_from_env(environ: Mapping[str, str] = None) -> dict:
+    """Antigüedad (ORDER_ARCHIVE_AFTER_DAYS) y tamaño de lote (ORDER_ARCHIVE_BATCH_SIZE)"""
+    environ = os.environ if environ is None else environ
+    return {
+        "older_than_days": int(environ.get("ORDER_ARCHIVE_AFTER_DAYS", DEFAULT_ARCHIVE_AFTER_DAYS)),
+        "batch_size": int(environ.get("ORDER_ARCHIVE_BATCH_SIZE", DEFAULT_ARCHIVE_BATCH_SIZE)),
+    }
+
+
+def serialize_order(order_row: Mapping, item_rows: Sequence[Mapping]) -> bytes:
+    """Serializa cabecera e items (en orden de inserción) en JSON"""
+    document = {
+        "order_id": order_row["order_id"],
+        "customer_id": order_row["customer_id"],
+        "currency": order_row["currency"],
+        "version": order_row["version"],
+        "total_amount": str(order_row["total_amount"]),
+        "created_at": order_row["created_at"].isoformat() if order_row["created_at"] else None,
+        "items": [[item["sku"], item["quantity"], str(item["price"])] for item in item_rows],
+    }
+    return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+
+def decode_order(payload: bytes) -> Order:
+    """Reconstruye la entidad Order desde un payload (serialize_order comprimido)"""
+    document = json.loads(zlib.decompress(payload))
+    currency = document["currency"]
+    items = [
+        (SKU(sku), Quantity(quantity), Price(amount=float(Decimal(price)), currency=currency))
+        for sku, quantity, price in document["items"]
+    ]
+    return Order.restore(
+        order_id=OrderId(document["order_id"]),
+        customer_id=document["customer_id"],
+        items=items,
+        version=document["version"]
+    )
+
+
+def fetch_archived_order(connection, order_id: str) -> Optional[Order]:
+    """Busca una orden en el archivo (una consulta por clave primaria)"""
+    payload = connection.execute(ARCHIVED_ORDER, {"order_id": order_id}).scalar()
+    return decode_order(payload) if payload is not None else None
+
+
+async def async_fetch_archived_order(connection, order_id: str) -> Optional[Order]:
+    """Variante de fetch_archived_order sobre una AsyncConnection"""
+    result = await connection.execute(ARCHIVED_ORDER, {"order_id": order_id})
+    payload = result.scalar()
+    return decode_order(payload) if payload is not None else None
+
+
+@dataclass
+class ArchiveReport:
+    """Resultado de una ejecución del job de archivo"""
+    archived: int = 0
+    batches: int = 0
+    raw_bytes: int = 0
+    compressed_bytes: int = 0
+
+
+def archive_batch(connection, cutoff: datetime, batch_size: int, report: ArchiveReport) -> int:
+    """
+    Archiva hasta batch_size órdenes anteriores a cutoff dentro de la
+    transacción de `connection`: copia al archivo y borra de las tablas
+    calientes, todo o nada.
+
+    Las cabeceras se bloquean con FOR UPDATE SKIP LOCKED (PostgreSQL): una
+    orden que se está modificando se archiva en una ejecución posterior, y
+    una escritura que llegue después del borrado falla con
+    ConcurrencyConflictError en lugar de perderse en silencio.
+
+    :return: Número de órdenes archivadas en el lote.
+    """
+    order_rows = [dict(row._mapping) for row in connection.execute(
+        select(_orders)
+        .where(_orders.c.created_at < cutoff)
+        .order_by(_orders.c.created_at, _orders.c.order_id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )]
+    if not order_rows:
+        return 0
+
+    order_ids = [row["order_id"] for row in order_rows]
+    items_by_order = {order_id: [] for order_id in order_ids}
+    for item in connection.execute(
+        select(_items).where(_items.c.order_id.in_(order_ids)).order_by(_items.c.id)
+    ):
+        items_by_order[item.order_id].append(item._mapping)
+
+    archive_rows = []
+    for row in order_rows:
+        document = serialize_order(row, items_by_order[row["order_id"]])
+        payload = zlib.compress(document)
+        report.raw_bytes += len(document)
+        report.compressed_bytes += len(payload)
+        archive_rows.append({
+            "order_id": row["order_id"],
+            "customer_id": row["customer_id"],
+            "created_at": row["created_at"],
+            "payload": payload,
+        })
+
+    connection.execute(insert(_archive), archive_rows)
+    connection.execute(delete(_items).where(_items.c.order_id.in_(order_ids)))
+    connection.execute(delete(_orders).where(_orders.c.order_id.in_(order_ids)))
+    return len(order_rows)
+
+
+def archive_orders(engine, older_than_days: int = DEFAULT_ARCHIVE_AFTER_DAYS,
+                   batch_size: int = DEFAULT_ARCHIVE_BATCH_SIZE, now: datetime = None) -> ArchiveReport:
+    """
+    Archiva por lotes (una transacción por lote) todas las órdenes con más
+    de `older_than_days` días. Recorre ix_orders_created_at.
+    """
+    cutoff = (now or datetime.now(timezone.utc)) - timedelta(days=older_than_days)
+    report = ArchiveReport()
+    while True:
+        with engine.begin() as connection:
+            archived = archive_batch(connection, cutoff, batch_size, report)
+        if not archived:
+            return report
+        report.archived += archived
+        report.batches += 1
+
+
+def _default_urls() -> List[str]:
+    from infrastructure.database.connection import DATABASE_URL, DATABASE_SHARD_URLS
+    return DATABASE_SHARD_URLS or [DATABASE_URL]
+
+
+def main(argv: Sequence[str] = None) -> int:
+    settings = archive_settings_from_env()
+    parser = argparse.ArgumentParser(description="Archiva las órdenes antiguas")
+    parser.add_argument("--older-than-days", type=int, default=settings["older_than_days"])
+    parser.add_argument("--batch-size", type=int, default=settings["batch_size"])
+    parser.add_argument("--interval", type=float, default=None,
+                        help="Repetir cada N segundos (por defecto, una sola pasada)")
+    parser.add_argument("--url", default=None,
+                        help="URLs separadas por comas (por defecto DATABASE_SHARD_URLS o DATABASE_URL)")
+    args = parser.parse_args(argv)
+
+    urls = [url.strip() for url in args.url.split(",") if url.strip()] if args.url else _default_urls()
+    engines = [create_engine(url) for url in urls]
+    try:
+        while True:
+            for url, engine in zip(urls, engines):
+                report = archive_orders(engine, args.older_than_days, args.batch_size)
+                print(f"{url}: {report.archived} órdenes archivadas en {report.batches} lotes "
+                      f"({report.raw_bytes} -> {report.compressed_bytes} bytes)")
+            if args.interval is None:
+                return 0
+            time.sleep(args.interval)
+    finally:
+        for engine in engines:
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,57 @@
+"""
+Configuración de conexión asíncrona a PostgreSQL usando SQLAlchemy asyncio
+"""
+
+import os
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from infrastructure.database.connection import DATABASE_URL, DATABASE_REPLICA_URL, DATABASE_SHARD_URLS, POOL_SETTINGS
+from infrastructure.database.pool import InstrumentedAsyncAdaptedQueuePool
+from infrastructure.database.sharding import shard_urls_from_env
+from infrastructure.database.statement_counter import instrument_engine
+
+# URL asíncrona: por defecto la misma base de datos con el driver asyncpg
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+)
+
+# Motor asíncrono de SQLAlchemy (mismo tamaño de pool que el síncrono)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    **POOL_SETTINGS
+)
+
+# Contar sentencias SQL por petición también en la ruta asíncrona
+instrument_engine(async_engine.sync_engine)
+
+# Fábrica de sesiones asíncronas (sin expirar objetos tras commit: no hay lazy loading)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# Réplica de lectura opcional, con el driver asyncpg por defecto
+ASYNC_DATABASE_REPLICA_URL = os.getenv(
+    "ASYNC_DATABASE_REPLICA_URL",
+    DATABASE_REPLICA_URL.replace("postgresql://", "postgresql+asyncpg://", 1) if DATABASE_REPLICA_URL else ""
+)
+async_replica_engine = None
+AsyncReplicaSessionLocal = None
+if ASYNC_DATABASE_REPLICA_URL:
+    async_replica_engine = create_async_engine(
+        ASYNC_DATABASE_REPLICA_URL,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        **POOL_SETTINGS
+    )
+    instrument_engine(async_replica_engine.sync_engine)
+    AsyncReplicaSessionLocal = async_sessionmaker(async_replica_engine, autoflush=False, expire_on_commit=False)
+
+# Shards opcionales: ASYNC_DATABASE_SHARD_URLS o, por defecto, los síncronos con asyncpg
+ASYNC_DATABASE_SHARD_URLS = shard_urls_from_env(name="ASYNC_DATABASE_SHARD_URLS") or [
+    url.replace("postgresql://", "postgresql+asyncpg://", 1) for url in DATABASE_SHARD_URLS
+]
+async_shard_engines = []
+AsyncShardSessionLocals = []
+for _shard_url in ASYNC_DATABASE_SHARD_URLS:
+    _shard_engine = create_async_engine(_shard_url, poolclass=InstrumentedAsyncAdaptedQueuePool, **POOL_SETTINGS)
+    instrument_engine(_shard_engine.sync_engine)
+    async_shard_engines.append(_shard_engine)
+    AsyncShardSessionLocals.append(async_sessionmaker(_shard_engine, autoflush=False, expire_on_commit=False))
@@ -0,0 +1,32 @@
+"""
+Unit of Work asíncrono de lectura con caché de órdenes
+"""
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from infrastructure.repositories.caching_async_order_repository import AsyncCachingOrderRepository
+from infrastructure.repositories.order_cache import OrderCache
+
+
+class AsyncCachingUnitOfWork(AsyncUnitOfWork):
+    """Variante asíncrona de CachingUnitOfWork"""
+
+    def __init__(self, unit_of_work: AsyncUnitOfWork, cache: OrderCache, fill: bool = True):
+        self._unit_of_work = unit_of_work
+        self._cache = cache
+        self._fill = fill
+        self.orders: AsyncCachingOrderRepository = None
+        self.summaries = None
+
+    async def __aenter__(self):
+        await self._unit_of_work.__aenter__()
+        self.orders = AsyncCachingOrderRepository(self._unit_of_work.orders, self._cache, self._fill)
+        self.summaries = self._unit_of_work.summaries
+        return await super().__aenter__()
+
+    async def commit(self):
+        await self._unit_of_work.commit()
+
+    async def rollback(self):
+        await self._unit_of_work.rollback()
+
+    async def close(self):
+        await self._unit_of_work.close()
@@ -0,0 +1,37 @@
+"""
+Unit of Work de lectura con caché de órdenes
+"""
+from application.ports.unit_of_work import UnitOfWork
+from infrastructure.repositories.caching_order_repository import CachingOrderRepository
+from infrastructure.repositories.order_cache import OrderCache
+
+
+class CachingUnitOfWork(UnitOfWork):
+    """
+    Envuelve un Unit of Work de lectura: orders.get pasa por la caché. Un
+    acierto no llega a pedir conexión al pool (la sesión la pide al consultar).
+    Con fill=False (lectura que puede ir a una réplica atrasada) los fallos
+    no rellenan la caché.
+    """
+
+    def __init__(self, unit_of_work: UnitOfWork, cache: OrderCache, fill: bool = True):
+        self._unit_of_work = unit_of_work
+        self._cache = cache
+        self._fill = fill
+        self.orders: CachingOrderRepository = None
+        self.summaries = None
+
+    def __enter__(self):
+        self._unit_of_work.__enter__()
+        self.orders = CachingOrderRepository(self._unit_of_work.orders, self._cache, self._fill)
+        self.summaries = self._unit_of_work.summaries
+        return super().__enter__()
+
+    def commit(self):
+        self._unit_of_work.commit()
+
+    def rollback(self):
+        self._unit_of_work.rollback()
+
+    def close(self):
+        self._unit_of_work.close()
@@ -0,0 +1,23 @@
+"""
+Unit of Work asíncrono sobre el almacén de eventos de órdenes
+"""
+from functools import partial
+from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+from infrastructure.repositories.event_sourced_async_order_repository import AsyncEventSourcedOrderRepository
+from infrastructure.repositories.event_sourced_async_order_summary_reader import AsyncEventSourcedOrderSummaryReader
+
+
+class AsyncEventSourcedUnitOfWork(SQLAlchemyAsyncUnitOfWork):
+    """Variante asíncrona de EventSourcedUnitOfWork"""
+
+    order_repository_class = AsyncEventSourcedOrderRepository
+
+    def __init__(self, session_factory, snapshot_every: int = None, **options):
+        super().__init__(session_factory, **options)
+        if snapshot_every:
+            self.order_repository_class = partial(AsyncEventSourcedOrderRepository, snapshot_every=snapshot_every)
+
+    async def __aenter__(self):
+        uow = await super().__aenter__()
+        self.summaries = AsyncEventSourcedOrderSummaryReader(self._session)
+        return uow
@@ -0,0 +1,33 @@
+"""
+Unit of Work sobre el almacén de eventos de órdenes
+"""
+from functools import partial
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.repositories.event_sourced_order_repository import EventSourcedOrderRepository
+from infrastructure.repositories.event_sourced_order_summary_reader import EventSourcedOrderSummaryReader
+
+
+class EventSourcedUnitOfWork(SQLAlchemyUnitOfWork):
+    """
+    SQLAlchemyUnitOfWork cuyos repositorios leen y escriben order_events y
+    order_snapshots en lugar de orders/order_items. Misma transacción, mismo
+    modo de solo lectura y mismo group_commit.
+    """
+
+    order_repository_class = EventSourcedOrderRepository
+
+    def __init__(self, session_factory, snapshot_every: int = None, **options):
+        """
+        Args:
+            session_factory: Callable que crea sesiones SQLAlchemy
+            snapshot_every: Versiones entre snapshots (None: ORDER_SNAPSHOT_EVERY)
+            **options: Las de SQLAlchemyUnitOfWork (read_only, isolation_level...)
+        """
+        super().__init__(session_factory, **options)
+        if snapshot_every:
+            self.order_repository_class = partial(EventSourcedOrderRepository, snapshot_every=snapshot_every)
+
+    def __enter__(self):
+        uow = super().__enter__()
+        self.summaries = EventSourcedOrderSummaryReader(self._session)
+        return uow
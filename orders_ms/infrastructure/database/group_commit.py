@@ -0,0 +1,135 @@
+"""
+Group commit: varios Unit of Work comparten una única transacción
+"""
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Iterator, List, Optional, Tuple
+
+
+class GroupCommitAborted(Exception):
+    """
+    Un Unit of Work del grupo falló y la transacción compartida se deshizo:
+    ninguna escritura del grupo (tampoco las de casos de uso que ya
+    devolvieron su respuesta) se ha confirmado.
+    """
+
+    def __init__(self):
+        super().__init__("Group commit aborted: a unit of work in the group failed and every write was rolled back")
+
+
+class GroupTransaction:
+    """
+    Sesión compartida por los Unit of Work que se ejecutan dentro de un
+    bloque group_commit(). Se confirma una sola vez al salir del bloque.
+    """
+
+    def __init__(self, session_factory, session):
+        self.session_factory = session_factory
+        self.session = session
+        # Si algún Unit of Work del grupo falla, el grupo entero se deshace
+        self.rollback_only = False
+        # Eventos de los casos de uso del grupo: se publican tras el COMMIT (bus, eventos)
+        self._deferred_events: List[Tuple[object, list]] = []
+
+    def ensure_active(self) -> None:
+        """
+        Falla si el grupo ya se va a deshacer: un Unit of Work que se une (o
+        confirma) después de un fallo no puede dar su escritura por buena.
+        """
+        if self.rollback_only:
+            raise GroupCommitAborted()
+
+    def defer_publish(self, event_bus, events: list) -> None:
+        """Retiene eventos hasta que el grupo confirme; si se deshace se descartan"""
+        self._deferred_events.append((event_bus, list(events)))
+
+    def publish_deferred(self) -> None:
+        """Publica, en orden, los eventos retenidos (tras el COMMIT del grupo)"""
+        deferred, self._deferred_events = self._deferred_events, []
+        for event_bus, events in deferred:
+            event_bus.publish_many(events)
+
+
+# Grupo activo en el contexto actual (uno para sesiones síncronas y otro para asyncio)
+_current_group: ContextVar[Optional[GroupTransaction]] = ContextVar("group_transaction", default=None)
+_current_async_group: ContextVar[Optional[GroupTransaction]] = ContextVar("async_group_transaction", default=None)
+
+
+def active_group() -> Optional[GroupTransaction]:
+    """Grupo (síncrono o asíncrono) activo en el contexto actual, sea cual sea su factory"""
+    return _current_group.get() or _current_async_group.get()
+
+
+def current_group(session_factory) -> Optional[GroupTransaction]:
+    """Grupo síncrono activo para esta factory de sesiones, si lo hay"""
+    group = _current_group.get()
+    return group if group is not None and group.session_factory is session_factory else None
+
+
+def current_async_group(session_factory) -> Optional[GroupTransaction]:
+    """Grupo asíncrono activo para esta factory de sesiones, si lo hay"""
+    group = _current_async_group.get()
+    return group if group is not None and group.session_factory is session_factory else None
+
+
+@contextmanager
+def group_commit(session_factory) -> Iterator[GroupTransaction]:
+    """
+    Agrupa las escrituras de varios casos de uso en una sola transacción.
+
+    Los SQLAlchemyUnitOfWork creados con la misma factory dentro del bloque
+    reutilizan su sesión y solo hacen flush; el COMMIT se emite una vez al
+    salir. Un bloque anidado se une al grupo exterior.
+
+    Si un Unit of Work del grupo falla, los siguientes fallan con
+    GroupCommitAborted y, aunque el llamador capture el error, el bloque
+    también lanza GroupCommitAborted al salir: nadie recibe como confirmada
+    una escritura que se ha deshecho.
+
+    Los eventos publicados con GroupCommitEventBus dentro del bloque se
+    publican después del COMMIT, ya fuera del grupo; si el grupo se deshace
+    se descartan.
+    """
+    group = current_group(session_factory)
+    if group is not None:
+        yield group
+        return
+
+    group = GroupTransaction(session_factory, session_factory())
+    token = _current_group.set(group)
+    try:
+        yield group
+        group.ensure_active()
+        group.session.commit()
+    except BaseException:
+        group.session.rollback()
+        raise
+    finally:
+        _current_group.reset(token)
+        group.session.close()
+    group.publish_deferred()
+
+
+@asynccontextmanager
+async def async_group_commit(session_factory) -> AsyncIterator[GroupTransaction]:
+    """
+    Variante asíncrona de group_commit para SQLAlchemyAsyncUnitOfWork
+    """
+    group = current_async_group(session_factory)
+    if group is not None:
+        yield group
+        return
+
+    group = GroupTransaction(session_factory, session_factory())
+    token = _current_async_group.set(group)
+    try:
+        yield group
+        group.ensure_active()
+        await group.session.commit()
+    except BaseException:
+        await group.session.rollback()
+        raise
+    finally:
+        _current_async_group.reset(token)
+        await group.session.close()
+    group.publish_deferred()
@@ -0,0 +1,38 @@
+"""
+Unit of Work asíncrono para tests - InMemory
+"""
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_async_order_repository import InMemoryAsyncOrderRepository
+from infrastructure.repositories.in_memory_async_order_summary_reader import InMemoryAsyncOrderSummaryReader
+
+
+class InMemoryAsyncUnitOfWork(AsyncUnitOfWork):
+    """
+    Implementación InMemory del Unit of Work asíncrono.
+    
+    Envuelve el mismo InMemoryOrderRepository que la ruta síncrona,
+    así ambas rutas ven los mismos datos.
+    """
+    
+    def __init__(self, repository: InMemoryOrderRepository):
+        """
+        Inicializa con un repositorio InMemory ya creado.
+        
+        Args:
+            repository: Instancia de InMemoryOrderRepository
+        """
+        self.orders = InMemoryAsyncOrderRepository(repository)
+        self.summaries = InMemoryAsyncOrderSummaryReader(repository)
+    
+    async def commit(self):
+        """En InMemory no hay transacciones reales"""
+        pass
+    
+    async def rollback(self):
+        """En InMemory no hay nada que deshacer"""
+        pass
+    
+    async def close(self):
+        """En InMemory no hay conexiones que cerrar"""
+        pass
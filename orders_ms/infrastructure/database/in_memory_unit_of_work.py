@@ -3,6 +3,7 @@ Unit of Work implementation para tests - InMemory
 """
 from application.ports.unit_of_work import UnitOfWork
 from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_order_summary_reader import InMemoryOrderSummaryReader
 
 
 class InMemoryUnitOfWork(UnitOfWork):
@@ -21,6 +22,7 @@ class InMemoryUnitOfWork(UnitOfWork):
             repository: Instancia de InMemoryOrderRepository
         """
         self.orders = repository
+        self.summaries = InMemoryOrderSummaryReader(repository)
     
     def commit(self):
         """
@@ -0,0 +1,108 @@
+"""
+Comprobación con EXPLAIN de que las consultas calientes usan sus índices.
+
+Uso (desde orders_ms/, contra DATABASE_URL):
+    python -m infrastructure.database.index_check
+
+En PostgreSQL el plan se obtiene con enable_seqscan desactivado en la
+transacción: con tablas pequeñas el planificador prefiere un recorrido
+secuencial, y lo que interesa comprobar es que el índice existe y es
+utilizable para la consulta. En SQLite se usa EXPLAIN QUERY PLAN.
+"""
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Tuple
+from sqlalchemy import select, text
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.repositories.order_core_reader import ORDER_WITH_ITEMS
+from infrastructure.repositories.postgresql_order_summary_reader import SUMMARY_COLUMNS, summary_columns
+
+# Posición de ejemplo para las páginas por created_at
+_CREATED_AT_ANCHOR = (datetime(2026, 1, 1, tzinfo=timezone.utc), "ORDER-1")
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """Consulta caliente y nombres de índice aceptables en su plan"""
+    name: str
+    statement: object
+    # En order_items particionada los índices de cada partición se llaman <partición>_order_id_idx
+    indexes: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class IndexCheckResult:
+    name: str
+    uses_index: bool
+    plan: str
+
+
+HOT_QUERIES = [
+    HotQuery(
+        "order_items_by_order",
+        select(OrderItemModel.sku, OrderItemModel.quantity).where(OrderItemModel.order_id == "ORDER-1"),
+        ("ix_order_items_order_id", "_order_id_idx"),
+    ),
+    HotQuery(
+        "order_with_items",
+        ORDER_WITH_ITEMS.params(order_id="ORDER-1"),
+        ("ix_order_items_order_id", "_order_id_idx"),
+    ),
+    HotQuery(
+        "list_by_created_at",
+        apply_keyset(select(OrderModel.order_id, OrderModel.total_amount), _CREATED_AT_ANCHOR, "created_at").limit(20),
+        ("ix_orders_created_at",),
+    ),
+    HotQuery(
+        "customer_orders_by_order_id",
+        apply_keyset(SUMMARY_COLUMNS.where(OrderModel.customer_id == "customer-1"), "ORDER-1").limit(20),
+        ("ix_orders_customer_id_order_id",),
+    ),
+    HotQuery(
+        "customer_orders_by_created_at",
+        apply_keyset(
+            summary_columns("created_at").where(OrderModel.customer_id == "customer-1"), _CREATED_AT_ANCHOR,
+            "created_at"
+        ).limit(20),
+        ("ix_orders_customer_id_created_at_order_id",),
+    ),
+]
+
+
+def explain(connection, statement) -> str:
+    """Plan de una sentencia en texto (EXPLAIN o EXPLAIN QUERY PLAN según el motor)"""
+    sql = str(statement.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True}))
+    if connection.dialect.name == "sqlite":
+        return "\n".join(row[-1] for row in connection.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+    return "\n".join(row[0] for row in connection.execute(text(f"EXPLAIN {sql}")))
+
+
+def check_indexes(engine, queries: List[HotQuery] = None) -> List[IndexCheckResult]:
+    """Explica cada consulta caliente e indica si su plan usa alguno de sus índices"""
+    results = []
+    with engine.connect() as connection:
+        with connection.begin() as transaction:
+            if connection.dialect.name == "postgresql":
+                connection.execute(text("SET LOCAL enable_seqscan = off"))
+            for query in queries or HOT_QUERIES:
+                plan = explain(connection, query.statement)
+                results.append(IndexCheckResult(query.name, any(index in plan for index in query.indexes), plan))
+            transaction.rollback()
+    return results
+
+
+def main() -> int:
+    from infrastructure.database.connection import engine
+
+    results = check_indexes(engine)
+    for result in results:
+        print(f"{'✅' if result.uses_index else '❌'} {result.name}")
+        if not result.uses_index:
+            print("    " + result.plan.replace("\n", "\n    "))
+    return 0 if all(result.uses_index for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,57 @@
 """
-Inicialización de base de datos - Crear tablas
+Inicialización de base de datos - Aplicar migraciones (Alembic)
 """
+import os
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, inspect
+from infrastructure.database.connection import DATABASE_URL
+
+# Directorio orders_ms/, donde está alembic.ini
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def alembic_config(url: str = None) -> Config:
+    """
+    Configuración de Alembic para ejecutar migraciones desde código.
+
+    :param url: URL de la base de datos; por defecto DATABASE_URL.
+    """
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "infrastructure", "database", "migrations"))
+    # ConfigParser interpreta '%': hay que escaparlo en la URL
+    config.set_main_option("sqlalchemy.url", (url or DATABASE_URL).replace("%", "%%"))
+    # Respetar la configuración de logging de la aplicación
+    config.attributes["configure_logger"] = False
+    return config
+
+
+def migrate(url: str = None) -> None:
+    """
+    Lleva el esquema a la última revisión (alembic upgrade head).
+
+    Las bases de datos creadas con create_all antes de usar Alembic se marcan
+    primero con la revisión equivalente, para no volver a crear sus tablas.
+    """
+    config = alembic_config(url)
+    engine = create_engine(config.get_main_option("sqlalchemy.url").replace("%%", "%"))
+    try:
+        inspector = inspect(engine)
+        if inspector.has_table("orders") and not inspector.has_table("alembic_version"):
+            columns = {column["name"] for column in inspector.get_columns("orders")}
+            command.stamp(config, "0002" if "version" in columns else "0001")
+    finally:
+        engine.dispose()
+    command.upgrade(config, "head")
 
-from infrastructure.database.connection import engine, Base
-from infrastructure.database.models.order_model import OrderModel, OrderItemModel
 
 def create_tables():
     """
-    Crea todas las tablas en PostgreSQL
+    Crea o actualiza las tablas en PostgreSQL aplicando las migraciones
     """
-    print("🗃️ Creando tablas en PostgreSQL...")
-    Base.metadata.create_all(bind=engine)
-    print("✅ Tablas creadas exitosamente!")
+    print("🗃️ Aplicando migraciones en PostgreSQL...")
+    migrate()
+    print("✅ Esquema actualizado!")
 
 if __name__ == "__main__":
-    create_tables()
\ No newline at end of file
+    create_tables()
@@ -0,0 +1,36 @@
+"""
+Filtros de paginación keyset compartidos por los adaptadores SQLAlchemy
+"""
+from typing import Optional
+from sqlalchemy import literal, tuple_
+from application.pagination import PagePosition
+from infrastructure.database.models.order_model import OrderModel
+
+
+def apply_keyset(statement, after: Optional[PagePosition], sort: str = "order_id", model=OrderModel):
+    """
+    Aplica el filtro y el orden keyset sobre `orders` (o sobre otra tabla con
+    order_id y created_at, como order_snapshots) a una Query o Select.
+
+    Con sort="created_at" `after` es el par (created_at, order_id) de la
+    última orden devuelta y se compara como tupla, sin volver a buscar esa
+    orden: la página sigue siendo correcta aunque se haya borrado o archivado.
+
+    :param statement: Query ORM o Select sobre OrderModel.
+    :param after: Posición de la última orden de la página anterior, None para la primera.
+    :param sort: Campo de ordenación ("order_id" o "created_at").
+    :param model: Modelo sobre el que se pagina (por defecto OrderModel).
+    :return: La sentencia filtrada y ordenada (sin LIMIT).
+    """
+    if sort == "created_at":
+        if after is not None:
+            created_at, order_id = after
+            statement = statement.filter(
+                tuple_(model.created_at, model.order_id)
+                > tuple_(literal(created_at, model.created_at.type), order_id)
+            )
+        return statement.order_by(model.created_at, model.order_id)
+
+    if after is not None:
+        statement = statement.filter(model.order_id > after)
+    return statement.order_by(model.order_id)
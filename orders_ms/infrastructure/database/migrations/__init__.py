@@ -0,0 +1,3 @@
+"""
+Migraciones Alembic del esquema de orders_ms (ver alembic.ini e init_db.migrate)
+"""
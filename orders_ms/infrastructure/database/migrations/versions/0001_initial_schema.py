@@ -0,0 +1,54 @@
+"""
+Esquema inicial: orders y order_items tal como los creaba create_all
+
+Las bases de datos creadas antes de usar Alembic se marcan con esta
+revisión (o con la 0002 si ya tienen la columna version) en init_db.migrate.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "orders",
+        sa.Column("order_id", sa.String(), nullable=False),
+        sa.Column("customer_id", sa.String(), nullable=False),
+        sa.Column("total_amount", sa.Numeric(10, 2), nullable=False),
+        sa.Column("currency", sa.String(3), nullable=False),
+        sa.Column("items_count", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.Column("updated_at", sa.DateTime(timezone=True)),
+        sa.PrimaryKeyConstraint("order_id"),
+    )
+    op.create_index("ix_orders_order_id", "orders", ["order_id"])
+    op.create_index("ix_orders_customer_id", "orders", ["customer_id"])
+
+    op.create_table(
+        "order_items",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("order_id", sa.String(), nullable=False),
+        sa.Column("sku", sa.String(), nullable=False),
+        sa.Column("quantity", sa.Integer(), nullable=False),
+        sa.Column("price", sa.Numeric(10, 2), nullable=False),
+        sa.Column("subtotal", sa.Numeric(10, 2), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.ForeignKeyConstraint(["order_id"], ["orders.order_id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("order_items")
+    op.drop_index("ix_orders_customer_id", table_name="orders")
+    op.drop_index("ix_orders_order_id", table_name="orders")
+    op.drop_table("orders")
@@ -0,0 +1,25 @@
+"""
+Columna orders.version para el control de concurrencia optimista
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Con server_default las filas existentes quedan con version 1 sin reescribir la tabla
+    op.add_column("orders", sa.Column("version", sa.Integer(), nullable=False, server_default="1"))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("orders") as batch_op:
+        batch_op.drop_column("version")
@@ -0,0 +1,62 @@
+"""
+Índices de order_items.order_id y de listado de orders
+
+- ix_order_items_order_id: get, save y delete filtran siempre por order_id.
+- ix_orders_customer_id_created_at: órdenes de un cliente por fecha. Sustituye
+  a ix_orders_customer_id, que pasa a ser un prefijo redundante.
+- ix_orders_created_at (created_at, order_id): paginación keyset por created_at.
+
+En PostgreSQL se crean con CREATE INDEX CONCURRENTLY, fuera de transacción,
+para no bloquear escrituras en tablas grandes. Si una creación concurrente
+falla deja un índice INVALID: volver a ejecutar la migración lo sustituye.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ("ix_order_items_order_id", "order_items", ["order_id"]),
+    ("ix_orders_customer_id_created_at", "orders", ["customer_id", "created_at"]),
+    ("ix_orders_created_at", "orders", ["created_at", "order_id"]),
+]
+
+
+def _drop_invalid_indexes() -> None:
+    # Restos de un CREATE INDEX CONCURRENTLY interrumpido: IF NOT EXISTS los daría por buenos
+    if context.is_offline_mode() or op.get_bind().dialect.name != "postgresql":
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+        ),
+        {"names": [name for name, _, _ in INDEXES]},
+    ).scalars().all()
+    for name in invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY {name}")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        _drop_invalid_indexes()
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, if_not_exists=True, postgresql_concurrently=True)
+        op.drop_index("ix_orders_customer_id", table_name="orders", if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_orders_customer_id", "orders", ["customer_id"], if_not_exists=True, postgresql_concurrently=True
+        )
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,60 @@
+"""
+Particionado opcional de order_items (solo PostgreSQL)
+
+Se activa con `alembic -x partition=hash:16 upgrade head` (o range:N, ver
+infrastructure/database/partitioning.py) o con ORDER_ITEMS_PARTITIONING.
+Sin configurar, o en otros motores, la revisión no cambia nada. Para
+particionar más tarde: `alembic downgrade 0003` y repetir el upgrade con
+la opción.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+import os
+from alembic import context, op
+import sqlalchemy as sa
+
+from infrastructure.database.partitioning import (
+    parse_partitioning,
+    partition_order_items_ddl,
+    unpartition_order_items_ddl,
+)
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def _is_postgresql() -> bool:
+    return op.get_context().dialect.name == "postgresql"
+
+
+def _is_partitioned() -> bool:
+    return bool(op.get_bind().execute(sa.text(
+        "SELECT 1 FROM pg_partitioned_table p JOIN pg_class c ON c.oid = p.partrelid "
+        "WHERE c.relname = 'order_items'"
+    )).scalar())
+
+
+def upgrade() -> None:
+    spec = context.get_x_argument(as_dictionary=True).get("partition", os.getenv("ORDER_ITEMS_PARTITIONING"))
+    partitioning = parse_partitioning(spec)
+    if partitioning is None or not _is_postgresql():
+        return
+
+    strategy, count = partitioning
+    first_month = None
+    if strategy == "range" and not context.is_offline_mode():
+        first_month = op.get_bind().execute(sa.text("SELECT min(created_at)::date FROM order_items")).scalar()
+    for statement in partition_order_items_ddl(strategy, count, first_month):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    if not _is_postgresql() or context.is_offline_mode() or not _is_partitioned():
+        return
+    for statement in unpartition_order_items_ddl():
+        op.execute(statement)
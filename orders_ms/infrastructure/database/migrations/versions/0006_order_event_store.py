@@ -0,0 +1,44 @@
+"""
+Tablas order_events y order_snapshots para el repositorio event-sourced
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "order_events",
+        sa.Column("order_id", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("seq", sa.Integer(), nullable=False),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("data", sa.Text(), nullable=False),
+        sa.Column("recorded_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("order_id", "version", "seq"),
+    )
+    op.create_table(
+        "order_snapshots",
+        sa.Column("order_id", sa.String(), nullable=False),
+        sa.Column("customer_id", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("state", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        sa.PrimaryKeyConstraint("order_id"),
+    )
+    op.create_index("ix_order_snapshots_created_at", "order_snapshots", ["created_at", "order_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_order_snapshots_created_at", table_name="order_snapshots")
+    op.drop_table("order_snapshots")
+    op.drop_table("order_events")
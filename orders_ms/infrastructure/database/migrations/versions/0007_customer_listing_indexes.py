@@ -0,0 +1,72 @@
+"""
+Índices para listar las órdenes de un cliente (GET /customers/{id}/orders)
+
+- ix_orders_customer_id_order_id y ix_orders_customer_id_created_at_order_id:
+  paginación keyset por cliente en los dos órdenes. En PostgreSQL incluyen
+  items_count y total_amount (INCLUDE), así que la página sale del índice sin
+  visitar la tabla. Sustituyen a ix_orders_customer_id_created_at, que pasa a
+  ser un prefijo redundante.
+- ix_order_snapshots_customer_id_*: lo mismo sobre order_snapshots para el
+  almacén de eventos.
+
+Como en 0003, en PostgreSQL se crean con CREATE INDEX CONCURRENTLY.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+SUMMARY_COLUMNS = ["items_count", "total_amount"]
+
+INDEXES = [
+    ("ix_orders_customer_id_order_id", "orders", ["customer_id", "order_id"], SUMMARY_COLUMNS),
+    ("ix_orders_customer_id_created_at_order_id", "orders", ["customer_id", "created_at", "order_id"], SUMMARY_COLUMNS),
+    ("ix_order_snapshots_customer_id_order_id", "order_snapshots", ["customer_id", "order_id"], None),
+    ("ix_order_snapshots_customer_id_created_at", "order_snapshots", ["customer_id", "created_at", "order_id"], None),
+]
+
+
+def _drop_invalid_indexes() -> None:
+    # Restos de un CREATE INDEX CONCURRENTLY interrumpido: IF NOT EXISTS los daría por buenos
+    if context.is_offline_mode() or op.get_bind().dialect.name != "postgresql":
+        return
+    invalid = op.get_bind().execute(
+        sa.text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE NOT i.indisvalid AND c.relname = ANY(:names)"
+        ),
+        {"names": [name for name, _, _, _ in INDEXES]},
+    ).scalars().all()
+    for name in invalid:
+        op.execute(f"DROP INDEX CONCURRENTLY {name}")
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        _drop_invalid_indexes()
+        for name, table, columns, include in INDEXES:
+            op.create_index(
+                name, table, columns, if_not_exists=True, postgresql_concurrently=True,
+                postgresql_include=include or [],
+            )
+        op.drop_index(
+            "ix_orders_customer_id_created_at", table_name="orders", if_exists=True, postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_orders_customer_id_created_at", "orders", ["customer_id", "created_at"],
+            if_not_exists=True, postgresql_concurrently=True,
+        )
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, if_exists=True, postgresql_concurrently=True)
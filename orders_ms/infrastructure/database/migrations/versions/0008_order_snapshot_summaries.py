@@ -0,0 +1,75 @@
+"""
+Resumen (items_count, total_amount) en order_snapshots
+
+El repositorio event-sourced mantiene estas columnas en cada guardado y los
+listados del almacén de eventos las leen sin reproducir items. Las órdenes
+existentes se rellenan reproduciendo sus eventos por lotes de order_id.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18
+"""
+from alembic import context, op
+import sqlalchemy as sa
+
+from infrastructure.repositories.order_event_store import events_after_snapshots_statement, replay_many
+
+
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 500
+
+_snapshots = sa.table(
+    "order_snapshots",
+    sa.column("order_id", sa.String()),
+    sa.column("customer_id", sa.String()),
+    sa.column("version", sa.Integer()),
+    sa.column("state", sa.Text()),
+    sa.column("items_count", sa.Integer()),
+    sa.column("total_amount", sa.Numeric(10, 2)),
+)
+
+
+def _backfill() -> None:
+    connection = op.get_bind()
+    update = _snapshots.update().where(_snapshots.c.order_id == sa.bindparam("b_order_id"))
+    after = None
+    while True:
+        statement = sa.select(_snapshots).order_by(_snapshots.c.order_id).limit(BACKFILL_BATCH_SIZE)
+        if after is not None:
+            statement = statement.where(_snapshots.c.order_id > after)
+        snapshots = connection.execute(statement).all()
+        if not snapshots:
+            return
+        after = snapshots[-1].order_id
+        events = connection.execute(
+            events_after_snapshots_statement([snapshot.order_id for snapshot in snapshots])
+        ).all()
+        rows = [
+            {
+                "b_order_id": order_id,
+                "items_count": len(order.items),
+                "total_amount": sum(price.amount * quantity.amount for _, quantity, price in order.items),
+            }
+            for order_id, order in replay_many(snapshots, events).items()
+        ]
+        if rows:
+            connection.execute(update, rows)
+
+
+def upgrade() -> None:
+    op.add_column("order_snapshots", sa.Column("items_count", sa.Integer(), nullable=False, server_default="0"))
+    op.add_column(
+        "order_snapshots", sa.Column("total_amount", sa.Numeric(10, 2), nullable=False, server_default="0")
+    )
+    if not context.is_offline_mode():
+        _backfill()
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("order_snapshots") as batch_op:
+        batch_op.drop_column("total_amount")
+        batch_op.drop_column("items_count")
@@ -0,0 +1,23 @@
+"""
+Modelo SQLAlchemy para el archivo de órdenes antiguas
+"""
+
+from sqlalchemy import Column, String, DateTime, LargeBinary
+from sqlalchemy.sql import func
+from infrastructure.database.connection import Base
+
+
+class OrderArchiveModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla orders_archive.
+
+    Cada fila es una orden archivada, inmutable: cabecera e items
+    serializados y comprimidos en payload (ver archive.py).
+    """
+    __tablename__ = "orders_archive"
+
+    order_id = Column(String, primary_key=True)
+    customer_id = Column(String, nullable=False)
+    created_at = Column(DateTime(timezone=True))
+    archived_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    payload = Column(LargeBinary, nullable=False)
@@ -0,0 +1,56 @@
+"""
+Modelos SQLAlchemy del almacén de eventos de órdenes (event sourcing)
+"""
+
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Integer, Numeric, Text, DateTime, Index
+from sqlalchemy.sql import func
+from infrastructure.database.connection import Base
+
+
+class OrderEventModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla order_events (solo se añaden filas).
+
+    Cada guardado de una orden añade sus eventos con la nueva versión; la
+    clave primaria (order_id, version, seq) hace que dos guardados
+    concurrentes sobre la misma versión no puedan confirmarse ambos.
+    """
+    __tablename__ = "order_events"
+
+    order_id = Column(String, primary_key=True)
+    version = Column(Integer, primary_key=True)
+    seq = Column(Integer, primary_key=True)
+    event_type = Column(String, nullable=False)
+    data = Column(Text, nullable=False)
+    recorded_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class OrderSnapshotModel(Base):
+    """
+    Modelo SQLAlchemy para la tabla order_snapshots.
+
+    Estado completo de la orden en `version`. Se crea en el primer guardado
+    (sirve también de índice de órdenes para listar) y se reescribe cada
+    `snapshot_every` versiones. items_count y total_amount se mantienen al
+    día en cada guardado: los listados leen el resumen sin reproducir eventos.
+    """
+    __tablename__ = "order_snapshots"
+    __table_args__ = (
+        # Paginación keyset por created_at, desempatando por order_id
+        Index("ix_order_snapshots_created_at", "created_at", "order_id"),
+        # Órdenes de un cliente por order_id o por fecha
+        Index("ix_order_snapshots_customer_id_order_id", "customer_id", "order_id"),
+        Index("ix_order_snapshots_customer_id_created_at", "customer_id", "created_at", "order_id"),
+    )
+
+    order_id = Column(String, primary_key=True)
+    customer_id = Column(String, nullable=False)
+    version = Column(Integer, nullable=False)
+    state = Column(Text, nullable=False)
+    items_count = Column(Integer, nullable=False, default=0, server_default="0")
+    total_amount = Column(Numeric(10, 2), nullable=False, default=0, server_default="0")
+    # Fijada al insertar, como orders.created_at: es la posición del cursor sort="created_at"
+    created_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now()
+    )
@@ -2,7 +2,8 @@
 Modelo SQLAlchemy para la entidad Order
 """
 
-from sqlalchemy import Column, String, Numeric, Integer, DateTime, ForeignKey
+from datetime import datetime, timezone
+from sqlalchemy import Column, String, Numeric, Integer, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from infrastructure.database.connection import Base
@@ -13,18 +14,39 @@ class OrderModel(Base):
     Modelo SQLAlchemy para la tabla orders
     """
     __tablename__ = "orders"
+    __table_args__ = (
+        # Órdenes de un cliente por order_id o por fecha (paginación keyset). En
+        # PostgreSQL incluyen las columnas del resumen: listar las órdenes de un
+        # cliente es un index-only scan sin visitar la tabla
+        Index(
+            "ix_orders_customer_id_order_id", "customer_id", "order_id",
+            postgresql_include=["items_count", "total_amount"],
+        ),
+        Index(
+            "ix_orders_customer_id_created_at_order_id", "customer_id", "created_at", "order_id",
+            postgresql_include=["items_count", "total_amount"],
+        ),
+        # Paginación keyset por created_at, desempatando por order_id
+        Index("ix_orders_created_at", "created_at", "order_id"),
+    )
     
     # Columnas de la tabla
     order_id = Column(String, primary_key=True, index=True)
-    customer_id = Column(String, nullable=False, index=True)
+    customer_id = Column(String, nullable=False)
     total_amount = Column(Numeric(10, 2), nullable=False, default=0.00)
     currency = Column(String(3), nullable=False, default="EUR")
     items_count = Column(Integer, nullable=False, default=0)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # Control de concurrencia optimista: cada escritura la incrementa
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    # Se fija al insertar (no con el now() del motor, que en SQLite solo tiene
+    # segundos) para que el created_at que viaja en el cursor se compare igual
+    created_at = Column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), server_default=func.now()
+    )
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relación con items (para el futuro)
-    items = relationship("OrderItemModel", back_populates="order")
+    items = relationship("OrderItemModel", back_populates="order", order_by="OrderItemModel.id")
 
 
 class OrderItemModel(Base):
@@ -35,7 +57,8 @@ class OrderItemModel(Base):
     
     # Columnas de la tabla
     id = Column(Integer, primary_key=True, autoincrement=True)
-    order_id = Column(String, ForeignKey("orders.order_id"), nullable=False)
+    # Indexada: get, save y delete filtran siempre por order_id
+    order_id = Column(String, ForeignKey("orders.order_id"), nullable=False, index=True)
     sku = Column(String, nullable=False)
     quantity = Column(Integer, nullable=False)
     price = Column(Numeric(10, 2), nullable=False)
@@ -0,0 +1,130 @@
+"""
+Particionado opcional de order_items en PostgreSQL (usado por la migración 0004).
+
+- hash:N   PARTITION BY HASH (order_id) en N particiones. Los items de una
+           orden caen siempre en la misma partición: las lecturas por
+           order_id solo recorren una.
+- range:N  PARTITION BY RANGE (created_at), una partición por mes desde el
+           mes del item más antiguo hasta N meses después de hoy, más una
+           partición DEFAULT. Permite archivar o borrar meses enteros con
+           DETACH/DROP PARTITION.
+
+PostgreSQL exige que la clave primaria incluya la clave de particionado:
+la PK pasa a ser (id, order_id) o (id, created_at). Los ids siguen saliendo
+de la secuencia order_items_id_seq.
+
+La conversión copia la tabla completa: debe ejecutarse sin escrituras sobre
+order_items (ventana de mantenimiento).
+"""
+from datetime import date
+from typing import List, Optional, Tuple
+
+STRATEGIES = ("hash", "range")
+DEFAULT_HASH_PARTITIONS = 8
+DEFAULT_RANGE_MONTHS_AHEAD = 12
+
+_COLUMNS = "id, order_id, sku, quantity, price, subtotal, created_at"
+
+_CREATE_TABLE = """CREATE TABLE {table} (
+    id INTEGER NOT NULL DEFAULT nextval('order_items_id_seq'),
+    order_id VARCHAR NOT NULL REFERENCES orders (order_id),
+    sku VARCHAR NOT NULL,
+    quantity INTEGER NOT NULL,
+    price NUMERIC(10, 2) NOT NULL,
+    subtotal NUMERIC(10, 2) NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE {created_at_null} DEFAULT now(),
+    CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})
+){partition_by}"""
+
+
+def parse_partitioning(spec: Optional[str]) -> Optional[Tuple[str, int]]:
+    """
+    Interpreta "hash", "hash:16", "range" o "range:24". Vacío o None: sin particionar.
+
+    :raises ValueError: Si la estrategia o el número no son válidos.
+    """
+    if not spec:
+        return None
+    strategy, _, count = spec.partition(":")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown partitioning strategy {strategy!r} (expected one of {STRATEGIES})")
+    default = DEFAULT_HASH_PARTITIONS if strategy == "hash" else DEFAULT_RANGE_MONTHS_AHEAD
+    count = int(count) if count else default
+    if count < 1:
+        raise ValueError("Partition count must be at least 1")
+    return strategy, count
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _partitions(strategy: str, count: int, first_month: date, today: date) -> List[str]:
+    if strategy == "hash":
+        return [
+            f"CREATE TABLE order_items_p{i} PARTITION OF order_items_partitioned "
+            f"FOR VALUES WITH (MODULUS {count}, REMAINDER {i})"
+            for i in range(count)
+        ]
+
+    month = date(first_month.year, first_month.month, 1)
+    last = _add_months(date(today.year, today.month, 1), count)
+    statements = []
+    while month <= last:
+        following = _add_months(month, 1)
+        statements.append(
+            f"CREATE TABLE order_items_y{month.year}m{month.month:02d} PARTITION OF order_items_partitioned "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+        )
+        month = following
+    statements.append("CREATE TABLE order_items_default PARTITION OF order_items_partitioned DEFAULT")
+    return statements
+
+
+def _swap(new_table: str, primary_key_name: str) -> List[str]:
+    """Sustituye order_items por new_table conservando secuencia y nombres"""
+    return [
+        f"CREATE INDEX ix_{new_table}_order_id ON {new_table} (order_id)",
+        f"ALTER SEQUENCE order_items_id_seq OWNED BY {new_table}.id",
+        "DROP TABLE order_items",
+        f"ALTER TABLE {new_table} RENAME TO order_items",
+        f"ALTER TABLE order_items RENAME CONSTRAINT {primary_key_name} TO order_items_pkey",
+        f"ALTER INDEX ix_{new_table}_order_id RENAME TO ix_order_items_order_id",
+    ]
+
+
+def partition_order_items_ddl(strategy: str, count: int, first_month: date = None, today: date = None) -> List[str]:
+    """
+    Sentencias que convierten order_items en una tabla particionada.
+
+    :param first_month: Mes del item más antiguo (solo range; por defecto, hoy).
+    """
+    today = today or date.today()
+    key = "order_id" if strategy == "hash" else "created_at"
+    create = _CREATE_TABLE.format(
+        table="order_items_partitioned",
+        created_at_null="NOT NULL" if strategy == "range" else "NULL",
+        primary_key=f"id, {key}",
+        partition_by=f" PARTITION BY {strategy.upper()} ({key})",
+    )
+    return (
+        [create]
+        + _partitions(strategy, count, first_month or today, today)
+        + [
+            f"INSERT INTO order_items_partitioned ({_COLUMNS}) "
+            f"SELECT id, order_id, sku, quantity, price, subtotal, COALESCE(created_at, now()) FROM order_items"
+        ]
+        + _swap("order_items_partitioned", "order_items_partitioned_pkey")
+    )
+
+
+def unpartition_order_items_ddl() -> List[str]:
+    """Sentencias que devuelven order_items a una tabla normal (PK id)"""
+    create = _CREATE_TABLE.format(
+        table="order_items_plain", created_at_null="NULL", primary_key="id", partition_by=""
+    )
+    return (
+        [create, f"INSERT INTO order_items_plain ({_COLUMNS}) SELECT {_COLUMNS} FROM order_items"]
+        + _swap("order_items_plain", "order_items_plain_pkey")
+    )
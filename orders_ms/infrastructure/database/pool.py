@@ -0,0 +1,159 @@
+"""
+Pool de conexiones configurable e instrumentado
+"""
+import bisect
+import contextvars
+import os
+import threading
+import time
+from typing import Mapping, Optional
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+def pool_settings_from_env(environ: Mapping[str, str] = None) -> dict:
+    """
+    Lee la configuración del pool desde variables de entorno.
+
+    Variables:
+        DB_POOL_SIZE: Conexiones persistentes por proceso (defecto 5)
+        DB_MAX_OVERFLOW: Conexiones extra temporales (defecto 10)
+        DB_POOL_TIMEOUT: Segundos de espera máxima por una conexión (defecto 30)
+        DB_POOL_RECYCLE: Segundos antes de reciclar una conexión, -1 desactiva (defecto 1800)
+        DB_POOL_PRE_PING: Comprobar la conexión antes de usarla (defecto true)
+
+    :return: kwargs listos para create_engine / create_async_engine.
+    """
+    environ = os.environ if environ is None else environ
+    return {
+        "pool_size": int(environ.get("DB_POOL_SIZE", "5")),
+        "max_overflow": int(environ.get("DB_MAX_OVERFLOW", "10")),
+        "pool_timeout": float(environ.get("DB_POOL_TIMEOUT", "30")),
+        "pool_recycle": int(environ.get("DB_POOL_RECYCLE", "1800")),
+        "pool_pre_ping": environ.get("DB_POOL_PRE_PING", "true").lower() == "true",
+    }
+
+
+class PoolMetrics:
+    """
+    Métricas del pool: histograma de espera en checkout, overflows y timeouts
+    """
+
+    # Límites superiores (segundos) de los buckets del histograma
+    WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._bucket_counts = [0] * len(self.WAIT_BUCKETS)
+        self._wait_sum = 0.0
+        self._checkouts = 0
+        self._overflow_events = 0
+        self._timeouts = 0
+        self._max_checked_out = 0
+
+    def observe_checkout(self, wait_seconds: float, checked_out: int) -> None:
+        with self._lock:
+            self._bucket_counts[bisect.bisect_left(self.WAIT_BUCKETS, wait_seconds)] += 1
+            self._wait_sum += wait_seconds
+            self._checkouts += 1
+            self._max_checked_out = max(self._max_checked_out, checked_out)
+
+    def record_overflow(self) -> None:
+        with self._lock:
+            self._overflow_events += 1
+
+    def record_timeout(self) -> None:
+        with self._lock:
+            self._timeouts += 1
+
+    def snapshot(self) -> dict:
+        """Copia de las métricas (histograma acumulado, como Prometheus)"""
+        with self._lock:
+            cumulative, histogram = 0, {}
+            for bound, bucket_count in zip(self.WAIT_BUCKETS, self._bucket_counts):
+                cumulative += bucket_count
+                histogram["+Inf" if bound == float("inf") else str(bound)] = cumulative
+            return {
+                "checkouts": self._checkouts,
+                "checkout_wait_seconds_sum": round(self._wait_sum, 6),
+                "checkout_wait_seconds_histogram": histogram,
+                "overflow_events": self._overflow_events,
+                "timeouts": self._timeouts,
+                "max_checked_out": self._max_checked_out,
+            }
+
+
+# Si el checkout en curso abrió una conexión nueva. ContextVar y no
+# threading.local: en el pool asyncio varios checkouts comparten hilo.
+_opened_connection = contextvars.ContextVar("opened_connection", default=False)
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool que mide el tiempo de espera de cada checkout y cuenta
+    overflows y timeouts en un PoolMetrics (self.metrics).
+
+    Solo usa la API pública del pool: el evento connect indica que el
+    checkout abrió una conexión nueva y, si overflow() es positivo, esa
+    conexión es de overflow.
+    """
+
+    def __init__(self, creator, pool_size: int = 5, max_overflow: int = 10, **kwargs):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kwargs)
+        self.max_overflow = max_overflow
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        _opened_connection.set(False)
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+        finally:
+            self.metrics.observe_checkout(time.perf_counter() - start, self.checkedout())
+        if _opened_connection.get() and self.overflow() > 0:
+            self.metrics.record_overflow()
+        return connection
+
+    def recreate(self):
+        # engine.dispose() recrea el pool: conservar las métricas acumuladas
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedAsyncAdaptedQueuePool(InstrumentedQueuePool, AsyncAdaptedQueuePool):
+    """Variante para motores asyncio (create_async_engine)"""
+    pass
+
+
+@event.listens_for(InstrumentedQueuePool, "connect")
+def _mark_opened_connection(dbapi_connection, connection_record) -> None:
+    _opened_connection.set(True)
+
+
+def pool_status(engine: Engine) -> Optional[dict]:
+    """
+    Estado actual del pool de un motor, junto con sus métricas si está instrumentado.
+
+    :return: Diccionario serializable a JSON, o None si el pool no es un QueuePool.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return None
+
+    status = {
+        "pool_size": pool.size(),
+        "checked_out": pool.checkedout(),
+        "checked_in": pool.checkedin(),
+        "overflow": max(pool.overflow(), 0),
+        "max_overflow": getattr(pool, "max_overflow", None),
+        "timeout": pool.timeout(),
+    }
+    metrics = getattr(pool, "metrics", None)
+    if metrics is not None:
+        status["metrics"] = metrics.snapshot()
+    return status
@@ -0,0 +1,148 @@
+"""
+Enrutado de lecturas a una réplica con consistencia read-your-writes.
+
+Las escrituras van siempre al primario y devuelven un token de consistencia:
+la posición de WAL (LSN) del primario tras el COMMIT. Una lectura sin token
+va a la réplica. Una lectura con token va a la réplica solo si ésta ya ha
+reproducido esa posición; si no, va al primario.
+"""
+import os
+from typing import Mapping, Optional
+from sqlalchemy import text
+
+# Posición tras la última escritura en el primario
+_PRIMARY_POSITION_SQL = text("SELECT pg_current_wal_lsn()::text")
+# En una réplica, última posición reproducida (NULL si no está en recuperación)
+_REPLICA_POSITION_SQL = text("SELECT COALESCE(pg_last_wal_replay_lsn(), pg_current_wal_lsn())::text")
+
+
+def read_settings_from_env(environ: Mapping[str, str] = None) -> dict:
+    """
+    Configuración de las transacciones de solo lectura.
+
+    DB_READ_ISOLATION_LEVEL: nivel de aislamiento (p.ej. "REPEATABLE READ").
+        Vacío: el del motor.
+    DB_READ_DEFERRABLE: "true" para transacciones DEFERRABLE. En PostgreSQL
+        solo tiene efecto con SERIALIZABLE: la transacción espera a una
+        instantánea segura y después no puede abortar por serialización.
+    DB_CORE_READS: "false" para leer órdenes con el ORM en lugar de la ruta
+        rápida de SQLAlchemy Core (order_core_reader). Por defecto "true".
+    """
+    environ = os.environ if environ is None else environ
+    return {
+        "isolation_level": environ.get("DB_READ_ISOLATION_LEVEL") or None,
+        "deferrable": environ.get("DB_READ_DEFERRABLE", "false").lower() == "true",
+        "core_reads": environ.get("DB_CORE_READS", "true").lower() == "true",
+    }
+
+
+def read_only_execution_options(isolation_level: Optional[str] = None, deferrable: bool = False) -> dict:
+    """
+    Opciones de conexión para una transacción de solo lectura.
+
+    Los dialectos que no son PostgreSQL ignoran las opciones postgresql_*.
+    """
+    options = {"postgresql_readonly": True}
+    if isolation_level:
+        options["isolation_level"] = isolation_level
+    if deferrable:
+        options["postgresql_deferrable"] = True
+    return options
+
+
+def parse_lsn(lsn: str) -> int:
+    """
+    Convierte un LSN de PostgreSQL ("16/B374D848") en un entero comparable.
+
+    :raises ValueError: Si el texto no es un LSN válido.
+    """
+    high, separator, low = lsn.partition("/")
+    if not separator:
+        raise ValueError(f"Invalid LSN: {lsn!r}")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+def format_lsn(position: int) -> str:
+    """Inversa de parse_lsn"""
+    return f"{position >> 32:X}/{position & 0xFFFFFFFF:X}"
+
+
+class ReplicationPositions:
+    """
+    Lee las posiciones de replicación con una sesión síncrona (PostgreSQL).
+
+    Sustituible para motores sin WAL (p.ej. SQLite en tests).
+    """
+
+    def primary(self, session) -> int:
+        return parse_lsn(session.execute(_PRIMARY_POSITION_SQL).scalar())
+
+    def replica(self, session) -> int:
+        return parse_lsn(session.execute(_REPLICA_POSITION_SQL).scalar())
+
+
+class ReplicaRouter:
+    """
+    Elige la fábrica de sesiones (primario o réplica) de cada lectura.
+
+    Recuerda la última posición vista en la réplica: mientras el token pedido
+    no la supere no hace falta volver a consultarla.
+    """
+
+    def __init__(self, primary_session_factory, replica_session_factory, positions: ReplicationPositions = None):
+        self.primary_session_factory = primary_session_factory
+        self.replica_session_factory = replica_session_factory
+        self._positions = positions or ReplicationPositions()
+        self._replica_position = -1
+
+    def consistency_token(self) -> str:
+        """Token de la última escritura confirmada en el primario"""
+        session = self.primary_session_factory()
+        try:
+            return format_lsn(self._positions.primary(session))
+        finally:
+            session.close()
+
+    def read_session_factory(self, consistency_token: Optional[str] = None):
+        """
+        Fábrica de sesiones para una lectura.
+
+        Un token inválido se trata como desconocido: la lectura va al primario.
+        """
+        required = self._required_position(consistency_token)
+        if required is None or required <= self._replica_position:
+            return self.replica_session_factory
+
+        session = self.replica_session_factory()
+        try:
+            self._replica_position = max(self._replica_position, self._positions.replica(session))
+        finally:
+            session.close()
+        return self.replica_session_factory if required <= self._replica_position else self.primary_session_factory
+
+    @staticmethod
+    def _required_position(consistency_token: Optional[str]) -> Optional[float]:
+        if consistency_token is None:
+            return None
+        try:
+            return parse_lsn(consistency_token)
+        except ValueError:
+            return float("inf")
+
+
+class AsyncReplicaRouter(ReplicaRouter):
+    """Variante de ReplicaRouter con fábricas de AsyncSession"""
+
+    async def consistency_token(self) -> str:
+        async with self.primary_session_factory() as session:
+            return format_lsn(await session.run_sync(self._positions.primary))
+
+    async def read_session_factory(self, consistency_token: Optional[str] = None):
+        required = self._required_position(consistency_token)
+        if required is None or required <= self._replica_position:
+            return self.replica_session_factory
+
+        async with self.replica_session_factory() as session:
+            position = await session.run_sync(self._positions.replica)
+        self._replica_position = max(self._replica_position, position)
+        return self.replica_session_factory if required <= self._replica_position else self.primary_session_factory
@@ -0,0 +1,163 @@
+"""
+Herramienta offline de resharding: mueve cada orden al shard que le
+corresponde con una nueva lista de shards.
+
+Uso (desde orders_ms/, con las escrituras detenidas):
+    python -m infrastructure.database.reshard \\
+        --from postgresql://.../shard0,postgresql://.../shard1 \\
+        --to postgresql://.../shard0,postgresql://.../shard1,postgresql://.../shard2 \\
+        [--batch-size 500] [--dry-run]
+
+Se mueven las órdenes calientes (orders y order_items), las archivadas
+(orders_archive) y las del almacén de eventos (order_snapshots y
+order_events). Las filas se copian tal cual con SQLAlchemy Core (conservan
+version y created_at) por lotes keyset de order_id. Para cada lote primero se escribe
+en el destino (borrando antes lo que hubiera de esas órdenes) y después se
+borra del origen: si el proceso se interrumpe, volver a ejecutarlo termina
+el trabajo sin duplicar items. Los shards se identifican por URL: una URL
+presente en ambas listas es el mismo shard.
+"""
+import argparse
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple
+from sqlalchemy import Table, create_engine, delete, insert, select
+from infrastructure.database.models.order_archive_model import OrderArchiveModel
+from infrastructure.database.models.order_event_model import OrderEventModel, OrderSnapshotModel
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.sharding import shard_index
+
+DEFAULT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class _Store:
+    """Tablas de un almacén de órdenes: la raíz (una fila por orden) y sus dependientes"""
+    root: Table
+    children: Tuple[Table, ...] = ()
+
+
+# Almacenes que se redistribuyen: órdenes calientes, archivadas y event-sourced
+# (cada orden del almacén de eventos tiene su fila en order_snapshots desde el primer guardado)
+_STORES = (
+    _Store(OrderModel.__table__, (OrderItemModel.__table__,)),
+    _Store(OrderArchiveModel.__table__),
+    _Store(OrderSnapshotModel.__table__, (OrderEventModel.__table__,)),
+)
+
+
+def _columns(table: Table) -> list:
+    # Sin ids autoincrementales (como el de order_items): el destino asigna los suyos
+    return [column for column in table.c if column.autoincrement is not True]
+
+
+@dataclass
+class ReshardReport:
+    """Órdenes revisadas y movidas por (origen, destino)"""
+    scanned: int = 0
+    moved: Dict[tuple, int] = field(default_factory=lambda: defaultdict(int))
+
+    @property
+    def total_moved(self) -> int:
+        return sum(self.moved.values())
+
+
+def _copy_orders(source, target, store: _Store, order_ids: List[str]) -> None:
+    """Copia las filas de las órdenes (raíz y dependientes) al destino, sustituyendo lo que ya hubiera"""
+    tables = (store.root, *store.children)
+    with source.connect() as connection:
+        rows = [[dict(row._mapping) for row in connection.execute(
+            select(*_columns(table)).where(table.c.order_id.in_(order_ids)).order_by(*table.primary_key.columns)
+        )] for table in tables]
+
+    with target.begin() as connection:
+        _delete_rows(connection, store, order_ids)
+        for table, table_rows in zip(tables, rows):
+            if table_rows:
+                connection.execute(insert(table), table_rows)
+
+
+def _delete_orders(engine, store: _Store, order_ids: List[str]) -> None:
+    with engine.begin() as connection:
+        _delete_rows(connection, store, order_ids)
+
+
+def _delete_rows(connection, store: _Store, order_ids: List[str]) -> None:
+    # Primero las dependientes (order_items referencia a orders)
+    for table in (*store.children, store.root):
+        connection.execute(delete(table).where(table.c.order_id.in_(order_ids)))
+
+
+def _reshard_store(engines: dict, source_url: str, target_urls: Sequence[str], store: _Store,
+                   batch_size: int, dry_run: bool, report: ReshardReport) -> None:
+    """Recorre por lotes las órdenes de un almacén del shard origen y mueve las que cambian de shard"""
+    source = engines[source_url]
+    root = store.root
+    after = None
+    while True:
+        statement = select(root.c.order_id).order_by(root.c.order_id).limit(batch_size)
+        if after is not None:
+            statement = statement.where(root.c.order_id > after)
+        with source.connect() as connection:
+            order_ids = list(connection.execute(statement).scalars())
+        if not order_ids:
+            break
+        after = order_ids[-1]
+        report.scanned += len(order_ids)
+
+        moves = defaultdict(list)
+        for order_id in order_ids:
+            target_url = target_urls[shard_index(order_id, len(target_urls))]
+            if target_url != source_url:
+                moves[target_url].append(order_id)
+
+        for target_url, moving in moves.items():
+            if not dry_run:
+                _copy_orders(source, engines[target_url], store, moving)
+                _delete_orders(source, store, moving)
+            report.moved[(source_url, target_url)] += len(moving)
+
+
+def reshard(source_urls: Sequence[str], target_urls: Sequence[str],
+            batch_size: int = DEFAULT_BATCH_SIZE, dry_run: bool = False) -> ReshardReport:
+    """
+    Redistribuye las órdenes de los shards `source_urls` entre `target_urls`.
+
+    Los shards de destino deben tener ya el esquema (alembic upgrade head).
+    """
+    engines = {url: create_engine(url) for url in dict.fromkeys([*source_urls, *target_urls])}
+    report = ReshardReport()
+    try:
+        for source_url in source_urls:
+            for store in _STORES:
+                _reshard_store(engines, source_url, target_urls, store, batch_size, dry_run, report)
+    finally:
+        for engine in engines.values():
+            engine.dispose()
+    return report
+
+
+def _split_urls(urls: str) -> List[str]:
+    return [url.strip() for url in urls.split(",") if url.strip()]
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Redistribuye las órdenes entre shards")
+    parser.add_argument("--from", dest="source", required=True, help="URLs actuales, separadas por comas")
+    parser.add_argument("--to", dest="target", required=True, help="URLs nuevas, separadas por comas")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="Solo contar las órdenes que se moverían")
+    args = parser.parse_args(argv)
+
+    report = reshard(_split_urls(args.source), _split_urls(args.target), args.batch_size, args.dry_run)
+
+    print(f"Órdenes revisadas: {report.scanned}")
+    for (source_url, target_url), count in sorted(report.moved.items()):
+        print(f"  {source_url} -> {target_url}: {count}")
+    print(f"{'Se moverían' if args.dry_run else 'Movidas'}: {report.total_moved}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""
+Unit of Work asíncrono sobre varios shards
+"""
+from typing import List
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from infrastructure.repositories.sharded_async_order_repository import AsyncShardedOrderRepository
+from infrastructure.repositories.sharded_async_order_summary_reader import AsyncShardedOrderSummaryReader
+
+
+class AsyncShardedUnitOfWork(AsyncUnitOfWork):
+    """
+    Variante asíncrona de ShardedUnitOfWork (mismas garantías: atómico por
+    shard, sin commit en dos fases entre shards).
+    """
+
+    def __init__(self, shards: List[AsyncUnitOfWork]):
+        self.shards = shards
+        self.orders: AsyncShardedOrderRepository = None
+        self.summaries: AsyncShardedOrderSummaryReader = None
+
+    async def __aenter__(self):
+        entered = []
+        try:
+            for uow in self.shards:
+                entered.append(await uow.__aenter__())
+        except BaseException:
+            for uow in entered:
+                await uow.close()
+            raise
+        self.orders = AsyncShardedOrderRepository([uow.orders for uow in entered])
+        self.summaries = AsyncShardedOrderSummaryReader([uow.summaries for uow in entered])
+        return await super().__aenter__()
+
+    async def commit(self):
+        for uow in self.shards:
+            await uow.commit()
+
+    async def rollback(self):
+        for uow in self.shards:
+            await uow.rollback()
+
+    async def close(self):
+        for uow in self.shards:
+            await uow.close()
@@ -0,0 +1,57 @@
+"""
+Unit of Work sobre varios shards
+"""
+from concurrent.futures import Executor
+from typing import List
+from application.ports.unit_of_work import UnitOfWork
+from infrastructure.repositories.sharded_order_repository import ShardedOrderRepository
+from infrastructure.repositories.sharded_order_summary_reader import ShardedOrderSummaryReader
+
+
+class ShardedUnitOfWork(UnitOfWork):
+    """
+    Agrupa un Unit of Work por shard y expone repositorios que encaminan
+    cada orden a su shard.
+
+    Cada orden vive en un único shard, así que los casos de uso de una orden
+    siguen siendo atómicos. Un lote que abarca varios shards se confirma
+    shard a shard, sin commit en dos fases: si falla el COMMIT de un shard,
+    los anteriores ya están confirmados. Los shards sin cambios no emiten
+    COMMIT (sus sesiones no llegan a abrir transacción).
+    """
+
+    def __init__(self, shards: List[UnitOfWork], executor: Executor = None):
+        """
+        Args:
+            shards: Un Unit of Work por shard, en orden de índice
+            executor: Executor para consultar los shards en paralelo (None: en serie)
+        """
+        self.shards = shards
+        self._executor = executor
+        self.orders: ShardedOrderRepository = None
+        self.summaries: ShardedOrderSummaryReader = None
+
+    def __enter__(self):
+        entered = []
+        try:
+            for uow in self.shards:
+                entered.append(uow.__enter__())
+        except BaseException:
+            for uow in entered:
+                uow.close()
+            raise
+        self.orders = ShardedOrderRepository([uow.orders for uow in entered], self._executor)
+        self.summaries = ShardedOrderSummaryReader([uow.summaries for uow in entered], self._executor)
+        return super().__enter__()
+
+    def commit(self):
+        for uow in self.shards:
+            uow.commit()
+
+    def rollback(self):
+        for uow in self.shards:
+            uow.rollback()
+
+    def close(self):
+        for uow in self.shards:
+            uow.close()
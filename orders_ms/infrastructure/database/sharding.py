@@ -0,0 +1,58 @@
+"""
+Reparto de órdenes entre varias bases de datos (shards) por hash de OrderId.code.
+
+Se usa jump consistent hash (Lamping y Veach) sobre un hash estable del
+código: no depende de PYTHONHASHSEED ni de la plataforma y, al pasar de N a
+N+1 shards, solo cambia de shard ~1/(N+1) de las órdenes (todas hacia el
+nuevo), lo que acota el trabajo de reshard.py.
+"""
+import hashlib
+import os
+from typing import List, Mapping
+
+_JUMP_MULTIPLIER = 2862933555777941757
+_MASK_64 = (1 << 64) - 1
+
+
+def jump_consistent_hash(key: int, buckets: int) -> int:
+    """Asigna una clave de 64 bits a uno de `buckets` cubos"""
+    if buckets < 1:
+        raise ValueError("Shard count must be at least 1")
+    bucket, candidate = -1, 0
+    while candidate < buckets:
+        bucket = candidate
+        key = (key * _JUMP_MULTIPLIER + 1) & _MASK_64
+        candidate = int((bucket + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return bucket
+
+
+def shard_index(order_id: str, shard_count: int) -> int:
+    """Índice del shard de una orden (estable entre procesos y versiones)"""
+    key = int.from_bytes(hashlib.blake2b(order_id.encode("utf-8"), digest_size=8).digest(), "big")
+    return jump_consistent_hash(key, shard_count)
+
+
+def shard_urls_from_env(environ: Mapping[str, str] = None, name: str = "DATABASE_SHARD_URLS") -> List[str]:
+    """
+    URLs de los shards, separadas por comas, en su orden de índice.
+
+    El orden importa: cambiarlo reasigna órdenes. Para añadir shards se
+    añaden al final y se ejecuta reshard.py.
+    """
+    environ = os.environ if environ is None else environ
+    return [url.strip() for url in environ.get(name, "").split(",") if url.strip()]
+
+
+def shard_workers_from_env(shard_count: int, environ: Mapping[str, str] = None) -> int:
+    """
+    Hilos del executor de scatter-gather entre shards.
+
+    Cada petición ocupa un hilo por shard, así que el executor se dimensiona
+    para SHARD_SCATTER_CONCURRENCY peticiones simultáneas (por defecto 8): con
+    solo un hilo por shard los listados concurrentes se harían cola.
+    """
+    environ = os.environ if environ is None else environ
+    concurrency = int(environ.get("SHARD_SCATTER_CONCURRENCY", "8"))
+    if concurrency < 1:
+        raise ValueError("SHARD_SCATTER_CONCURRENCY must be at least 1")
+    return shard_count * concurrency
@@ -0,0 +1,99 @@
+"""
+Unit of Work asíncrono para producción - SQLAlchemy asyncio
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from infrastructure.database.read_routing import read_only_execution_options
+from infrastructure.database.group_commit import GroupTransaction, current_async_group
+from infrastructure.repositories.postgresql_async_order_repository import AsyncPostgreSQLOrderRepository
+from infrastructure.repositories.postgresql_async_order_summary_reader import AsyncPostgreSQLOrderSummaryReader
+
+
+class SQLAlchemyAsyncUnitOfWork(AsyncUnitOfWork):
+    """
+    Implementación SQLAlchemy asyncio del Unit of Work.
+    
+    Mientras se espera a PostgreSQL el event loop atiende otras peticiones,
+    sin ocupar un hilo del threadpool. Igual que la versión síncrona, es el
+    único que confirma la transacción y se une a async_group_commit().
+    """
+    
+    # Repositorio de órdenes que se crea sobre la sesión (AsyncEventSourcedUnitOfWork lo cambia)
+    order_repository_class = AsyncPostgreSQLOrderRepository
+
+    def __init__(self, session_factory, read_only: bool = False,
+                 isolation_level: str = None, deferrable: bool = False,
+                 core_reads: bool = False,
+                 route_session_factory=None):
+        """
+        Inicializa con una factory de sesiones asíncronas.
+        
+        Args:
+            session_factory: async_sessionmaker que crea AsyncSession
+            read_only: Transacción de solo lectura, sin COMMIT al salir
+            isolation_level: Nivel de aislamiento de la lectura (None: el del motor)
+            deferrable: Transacción DEFERRABLE (PostgreSQL, con SERIALIZABLE)
+            core_reads: orders.get por la ruta rápida de SQLAlchemy Core
+            route_session_factory: Corrutina opcional que elige la factory al
+                entrar (p.ej. AsyncReplicaRouter.read_session_factory)
+        """
+        self._session_factory = session_factory
+        self._read_only = read_only
+        self._core_reads = core_reads
+        self._route_session_factory = route_session_factory
+        self._read_options = read_only_execution_options(isolation_level, deferrable)
+        self._session: AsyncSession = None
+        self._group: GroupTransaction = None
+        self.orders: AsyncPostgreSQLOrderRepository = None
+        self.summaries: AsyncPostgreSQLOrderSummaryReader = None
+    
+    async def __aenter__(self):
+        """
+        Inicia la sesión y crea los repositorios.
+        """
+        if self._route_session_factory:
+            self._session_factory = await self._route_session_factory()
+        self._group = current_async_group(self._session_factory)
+        if self._group:
+            self._group.ensure_active()
+        self._session = self._group.session if self._group else self._session_factory()
+        if self._read_only and not self._group:
+            # SET TRANSACTION READ ONLY (+ aislamiento) al abrir la transacción; la
+            # conexión se sigue pidiendo al pool solo cuando hace falta
+            self._session.sync_session.bind = self._session.sync_session.get_bind().execution_options(**self._read_options)
+        self.orders = self.order_repository_class(
+            self._session, core_reads=self._core_reads, archive_reads=self._read_only
+        )
+        self.summaries = AsyncPostgreSQLOrderSummaryReader(self._session)
+        return await super().__aenter__()
+    
+    async def commit(self):
+        """
+        Confirma la transacción en PostgreSQL (dentro de un grupo solo hace flush).
+        """
+        if self._read_only:
+            # Nada que confirmar: al cerrar, el pool hace ROLLBACK de la conexión
+            return
+        if self._group:
+            self._group.ensure_active()
+            await self._session.flush()
+        elif self._session:
+            await self._session.commit()
+    
+    async def rollback(self):
+        """
+        Deshace la transacción en PostgreSQL (dentro de un grupo, el grupo entero).
+        """
+        if self._group:
+            self._group.rollback_only = True
+        if self._session:
+            await self._session.rollback()
+    
+    async def close(self):
+        """
+        Cierra la sesión y devuelve la conexión al pool.
+        """
+        if self._session and not self._group:
+            await self._session.close()
+        self._session = None
+        self._group = None
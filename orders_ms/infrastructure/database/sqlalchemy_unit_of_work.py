@@ -3,7 +3,10 @@ Unit of Work implementation para producción - SQLAlchemy
 """
 from sqlalchemy.orm import Session
 from application.ports.unit_of_work import UnitOfWork
+from infrastructure.database.read_routing import read_only_execution_options
+from infrastructure.database.group_commit import GroupTransaction, current_group
 from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+from infrastructure.repositories.postgresql_order_summary_reader import PostgreSQLOrderSummaryReader
 
 
 class SQLAlchemyUnitOfWork(UnitOfWork):
@@ -12,39 +15,79 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
     
     Gestiona transacciones reales de PostgreSQL y cierra sesiones correctamente.
     Soluciona el memory leak de sesiones.
+    
+    Es el único límite transaccional: los repositorios solo hacen flush y aquí
+    se emite un COMMIT por unidad de trabajo. Dentro de group_commit() la
+    sesión del grupo se reutiliza y el COMMIT se pospone al final del grupo.
+
+    Con read_only=True la transacción se abre en modo solo lectura y no se
+    emite COMMIT: es la que usan los casos de uso de consulta. Solo estas
+    lecturas ven también las órdenes archivadas (orders_archive).
     """
     
-    def __init__(self, session_factory):
+    # Repositorio de órdenes que se crea sobre la sesión (SQLiteUnitOfWork lo cambia)
+    order_repository_class = PostgreSQLOrderRepository
+
+    def __init__(self, session_factory, read_only: bool = False,
+                 isolation_level: str = None, deferrable: bool = False,
+                 core_reads: bool = False):
         """
         Inicializa con una factory de sesiones SQLAlchemy.
         
         Args:
             session_factory: Callable que crea sesiones SQLAlchemy
+            read_only: Transacción de solo lectura, sin COMMIT al salir
+            isolation_level: Nivel de aislamiento de la lectura (None: el del motor)
+            deferrable: Transacción DEFERRABLE (PostgreSQL, con SERIALIZABLE)
+            core_reads: orders.get por la ruta rápida de SQLAlchemy Core
         """
         self._session_factory = session_factory
+        self._read_only = read_only
+        self._core_reads = core_reads
+        self._read_options = read_only_execution_options(isolation_level, deferrable)
         self._session: Session = None
+        self._group: GroupTransaction = None
         self.orders: PostgreSQLOrderRepository = None
+        self.summaries: PostgreSQLOrderSummaryReader = None
     
     def __enter__(self):
         """
         Inicia la sesión y crea los repositorios.
         Se ejecuta al entrar al 'with' statement.
         """
-        self._session = self._session_factory()
-        self.orders = PostgreSQLOrderRepository(self._session)
+        self._group = current_group(self._session_factory)
+        if self._group:
+            self._group.ensure_active()
+        self._session = self._group.session if self._group else self._session_factory()
+        if self._read_only and not self._group:
+            # SET TRANSACTION READ ONLY (+ aislamiento) al abrir la transacción; la
+            # conexión se sigue pidiendo al pool solo cuando hace falta
+            self._session.bind = self._session.get_bind().execution_options(**self._read_options)
+        self.orders = self.order_repository_class(
+            self._session, core_reads=self._core_reads, archive_reads=self._read_only
+        )
+        self.summaries = PostgreSQLOrderSummaryReader(self._session)
         return super().__enter__()
     
     def commit(self):
         """
-        Confirma la transacción en PostgreSQL.
+        Confirma la transacción en PostgreSQL (dentro de un grupo solo hace flush).
         """
-        if self._session:
+        if self._read_only:
+            # Nada que confirmar: al cerrar, el pool hace ROLLBACK de la conexión
+            return
+        if self._group:
+            self._group.ensure_active()
+            self._session.flush()
+        elif self._session:
             self._session.commit()
     
     def rollback(self):
         """
-        Deshace la transacción en PostgreSQL.
+        Deshace la transacción en PostgreSQL (dentro de un grupo, el grupo entero).
         """
+        if self._group:
+            self._group.rollback_only = True
         if self._session:
             self._session.rollback()
     
@@ -53,6 +96,7 @@ class SQLAlchemyUnitOfWork(UnitOfWork):
         Cierra la sesión SQLAlchemy.
         ¡CRÍTICO! Esto soluciona el memory leak.
         """
-        if self._session:
+        if self._session and not self._group:
             self._session.close()
-            self._session = None
\ No newline at end of file
+        self._session = None
+        self._group = None
\ No newline at end of file
@@ -0,0 +1,93 @@
+"""
+Configuración de conexión a SQLite embebido (modo WAL)
+
+Backend sin servidor para despliegues de un solo nodo y para ejecutar los
+tests de repositorio y los benchmarks sin PostgreSQL. Usa el mismo esquema
+(OrderModel, migraciones Alembic) y los mismos repositorios SQLAlchemy.
+"""
+
+import os
+from typing import Mapping
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import SingletonThreadPool
+from infrastructure.database.statement_counter import instrument_engine
+
+DEFAULT_SQLITE_PATH = "orders.db"
+
+# Hilos con conexión propia (el threadpool de FastAPI/anyio usa 40 por defecto)
+DEFAULT_SQLITE_THREADS = 40
+
+# PRAGMAs por conexión, pensados para throughput:
+# - WAL: los lectores no bloquean al escritor ni al revés.
+# - synchronous=NORMAL: en WAL solo sincroniza en los checkpoints; un corte
+#   de luz puede perder las últimas transacciones, pero nunca corrompe.
+# - busy_timeout: esperar al escritor en curso en lugar de fallar con SQLITE_BUSY.
+# - cache_size negativo = KiB (64 MiB); temp_store y mmap evitan E/S extra.
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": "5000",
+    "cache_size": "-65536",
+    "temp_store": "MEMORY",
+    "mmap_size": "268435456",
+}
+
+
+def sqlite_settings_from_env(environ: Mapping[str, str] = None) -> dict:
+    """Ruta del fichero (SQLITE_PATH) y nº de hilos con conexión (SQLITE_THREADS)"""
+    environ = os.environ if environ is None else environ
+    return {
+        "path": environ.get("SQLITE_PATH", DEFAULT_SQLITE_PATH),
+        "threads": int(environ.get("SQLITE_THREADS", DEFAULT_SQLITE_THREADS)),
+    }
+
+
+def configure_sqlite_engine(engine: Engine) -> Engine:
+    """
+    Aplica los PRAGMAs a cada conexión nueva y toma el control de BEGIN.
+
+    El driver sqlite3 abre las transacciones de forma implícita y diferida:
+    una transacción que lee y luego escribe puede fallar con SQLITE_BUSY al
+    intentar subir de nivel su bloqueo. Aquí las escrituras empiezan con
+    BEGIN IMMEDIATE (toman el bloqueo de escritor al empezar y los demás
+    esperan busy_timeout) y las lecturas de solo lectura con un BEGIN normal.
+    """
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        # Desactivar la gestión de transacciones del driver: BEGIN lo emite _on_begin
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    @event.listens_for(engine, "begin")
+    def _on_begin(conn):
+        # Los Unit of Work de solo lectura marcan la conexión con postgresql_readonly
+        read_only = conn.get_execution_options().get("postgresql_readonly", False)
+        conn.exec_driver_sql("BEGIN" if read_only else "BEGIN IMMEDIATE")
+
+    return engine
+
+
+def create_sqlite_engine(path: str = DEFAULT_SQLITE_PATH, threads: int = DEFAULT_SQLITE_THREADS) -> Engine:
+    """
+    Motor síncrono con una conexión compartida por hilo (SingletonThreadPool):
+    cada hilo reutiliza su conexión, con su caché de páginas y sus PRAGMAs
+    ya aplicados, sin checkout ni reapertura del fichero por petición.
+    """
+    engine = create_engine(f"sqlite:///{path}", poolclass=SingletonThreadPool, pool_size=threads)
+    instrument_engine(engine)
+    return configure_sqlite_engine(engine)
+
+
+def create_async_sqlite_engine(path: str = DEFAULT_SQLITE_PATH) -> AsyncEngine:
+    """Motor asíncrono (aiosqlite) sobre el mismo fichero y con la misma configuración"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    instrument_engine(engine.sync_engine)
+    configure_sqlite_engine(engine.sync_engine)
+    return engine
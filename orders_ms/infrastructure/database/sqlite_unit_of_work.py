@@ -0,0 +1,18 @@
+"""
+Unit of Work para SQLite embebido
+"""
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
+
+
+class SQLiteUnitOfWork(SQLAlchemyUnitOfWork):
+    """
+    Unit of Work sobre un motor de sqlite_connection.
+
+    Mismas reglas que SQLAlchemyUnitOfWork (un COMMIT por unidad de trabajo,
+    group_commit para agrupar varias). La transacción de escritura empieza
+    con BEGIN IMMEDIATE y la de solo lectura con BEGIN, sin bloquear al
+    escritor gracias a WAL.
+    """
+
+    order_repository_class = SQLiteOrderRepository
@@ -0,0 +1,66 @@
+"""
+Contador de sentencias SQL (y COMMITs) por petición
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class StatementStats:
+    """
+    Sentencias SQL ejecutadas dentro de un bloque track_statements()
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.statements: List[str] = []
+        self.commits = 0
+
+
+# Contador activo en el contexto actual (petición HTTP, test, benchmark...)
+_current_stats: ContextVar[Optional[StatementStats]] = ContextVar("sql_statement_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.statements.append(statement)
+
+
+def _commit(conn):
+    stats = _current_stats.get()
+    if stats is not None:
+        stats.commits += 1
+
+
+def instrument_engine(engine: Engine) -> Engine:
+    """
+    Registra los listeners que cuentan sentencias y COMMITs en el motor indicado.
+
+    :param engine: Motor SQLAlchemy a instrumentar.
+    :return: El mismo motor, para poder encadenar.
+    """
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    if not event.contains(engine, "commit", _commit):
+        event.listen(engine, "commit", _commit)
+    return engine
+
+
+@contextmanager
+def track_statements() -> Iterator[StatementStats]:
+    """
+    Cuenta las sentencias ejecutadas en el contexto actual mientras dure el bloque.
+
+    El contador viaja en una ContextVar, por lo que cada petición (o hilo del
+    threadpool que la atiende) tiene el suyo propio.
+    """
+    stats = StatementStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
@@ -0,0 +1,360 @@
+"""
+Write-behind de órdenes: los guardados se acumulan en memoria y se escriben
+en lotes desde un hilo propio.
+
+Pensado para ráfagas de construcción de carrito, en las que la misma orden
+se guarda muchas veces por segundo: los guardados de una orden se fusionan
+(los items añadidos se acumulan; un vaciado o una escritura completa
+sustituye a lo anterior) y cada lote se escribe con un único Unit of Work.
+
+Modos (ORDER_WRITE_BEHIND):
+- sync: el commit espera a que el lote que contiene sus cambios esté
+  confirmado en la base de datos. Nunca se pierde una escritura confirmada
+  al cliente; se gana porque los commits concurrentes comparten lote.
+- async: el commit vuelve en cuanto los cambios están en el buffer; el lote
+  se escribe al cumplirse el intervalo o al llegar a max_batch órdenes. Un
+  fallo del proceso puede perder lo pendiente (no un cierre ordenado: close()
+  escribe lo que queda).
+"""
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Mapping, Optional
+from application.ports.order_repository import ConcurrencyConflictError
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+
+SYNC = "sync"
+ASYNC = "async"
+
+DEFAULT_FLUSH_INTERVAL = 0.05  # segundos
+DEFAULT_MAX_BATCH = 500
+
+# Reintentos de un lote si otra escritura cambió sus órdenes entre la lectura y el UPDATE
+FLUSH_ATTEMPTS = 3
+
+logger = logging.getLogger(__name__)
+
+
+def write_behind_settings_from_env(environ: Mapping[str, str] = None) -> Optional[dict]:
+    """
+    ORDER_WRITE_BEHIND (off, sync o async), ORDER_WRITE_BEHIND_INTERVAL_MS y
+    ORDER_WRITE_BEHIND_MAX_BATCH. None si está desactivado.
+    """
+    environ = os.environ if environ is None else environ
+    mode = environ.get("ORDER_WRITE_BEHIND", "off").lower()
+    if mode not in (SYNC, ASYNC):
+        return None
+    return {
+        "mode": mode,
+        "interval": int(environ.get("ORDER_WRITE_BEHIND_INTERVAL_MS", DEFAULT_FLUSH_INTERVAL * 1000)) / 1000,
+        "max_batch": int(environ.get("ORDER_WRITE_BEHIND_MAX_BATCH", DEFAULT_MAX_BATCH)),
+    }
+
+
+class PendingChange:
+    """
+    Cambios de una orden aún no escritos.
+
+    Con replace=True `items` es el contenido completo del carrito (vaciado y
+    rellenado, o escritura completa de una orden no cargada si además
+    overwrite=True); si no, son los items añadidos.
+    """
+
+    __slots__ = ("customer_id", "items", "replace", "overwrite")
+
+    def __init__(self, customer_id: str, items: list, replace: bool, overwrite: bool = False):
+        self.customer_id = customer_id
+        self.items = items
+        self.replace = replace
+        self.overwrite = overwrite
+
+    @classmethod
+    def from_order(cls, order: Order) -> 'PendingChange':
+        """Cambios pendientes de la orden según su estado de cambios"""
+        if not order.is_persisted:
+            return cls(order.customer_id, order.items, replace=True, overwrite=True)
+        if order.items_cleared:
+            return cls(order.customer_id, order.items, replace=True)
+        return cls(order.customer_id, order.new_items, replace=False)
+
+    def merge(self, later: 'PendingChange') -> 'PendingChange':
+        """Fusiona un cambio posterior de la misma orden"""
+        if later.replace:
+            # Un reemplazo tras una escritura completa sigue siendo escritura
+            # completa: la orden puede no estar escrita todavía
+            return PendingChange(later.customer_id, later.items, True, self.overwrite or later.overwrite)
+        return PendingChange(self.customer_id, self.items + later.items, self.replace, self.overwrite)
+
+    def to_write(self, current: Optional[Order], order_id: str) -> Optional[Order]:
+        """
+        Orden a guardar con el repositorio real: el cambio aplicado sobre el
+        estado escrito `current`. None si la orden se borró mientras tanto.
+        """
+        if self.overwrite:
+            order = Order(OrderId(order_id), self.customer_id)
+        elif current is None:
+            return None
+        else:
+            order = current
+            if self.replace:
+                order.clear_items()
+        for sku, quantity, price in self.items:
+            order.add_item(sku, quantity, price)
+        return order
+
+
+def merge_changes(changes: Dict[str, PendingChange], later: Dict[str, PendingChange]) -> None:
+    """Fusiona `later` en `changes` (por order_id)"""
+    for order_id, change in later.items():
+        current = changes.get(order_id)
+        changes[order_id] = current.merge(change) if current is not None else change
+
+
+class WriteBehindBuffer:
+    """
+    Buffer de órdenes modificadas compartido por los WriteBehindUnitOfWork
+    (síncronos y asíncronos) y escrito por un hilo en segundo plano.
+
+    Las lecturas ven lo pendiente aplicado sobre lo escrito (view), así que
+    un get después de un commit devuelve la orden actualizada aunque no se
+    haya escrito todavía. Los listados (get_page) solo incluyen las órdenes
+    nuevas una vez escritas.
+
+    Solo coordina a los escritores de este proceso: con varias instancias de
+    la aplicación, las escrituras a la misma orden pueden intercalarse (los
+    items añadidos nunca se pierden; entre dos reemplazos gana el último).
+    """
+
+    def __init__(self, unit_of_work_factory, mode: str = ASYNC,
+                 interval: float = DEFAULT_FLUSH_INTERVAL, max_batch: int = DEFAULT_MAX_BATCH):
+        """
+        Args:
+            unit_of_work_factory: Crea el Unit of Work (real) con que se escribe cada lote
+            mode: SYNC o ASYNC (ver el docstring del módulo)
+            interval: Segundos máximos que un cambio espera en el buffer (modo async)
+            max_batch: Órdenes pendientes a partir de las cuales se escribe sin esperar
+        """
+        if mode not in (SYNC, ASYNC):
+            raise ValueError(f"Unknown write-behind mode: {mode}")
+        self._unit_of_work_factory = unit_of_work_factory
+        self.mode = mode
+        self.interval = interval
+        self.max_batch = max_batch
+        self._condition = threading.Condition()
+        self._pending: Dict[str, PendingChange] = {}
+        self._in_flight: Dict[str, PendingChange] = {}
+        # Se resuelve cuando se escribe el lote que contendrá lo pendiente (modo sync)
+        self._pending_future = Future()
+        self._pending_since: Optional[float] = None
+        self._flush_requested = False
+        self._closed = False
+        # Métricas
+        self.saves = 0
+        self.coalesced = 0
+        self.flushes = 0
+        self.orders_written = 0
+        self.failures = 0
+        self._thread = threading.Thread(target=self._run, name="order-write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(self, changes: Dict[str, PendingChange]) -> Optional[Future]:
+        """
+        Añade los cambios confirmados de un Unit of Work.
+
+        :return: En modo sync, Future que se resuelve (o falla) al escribir el
+            lote que los contiene; en modo async, None.
+        """
+        if not changes:
+            return None
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Write-behind buffer is closed")
+            self.saves += len(changes)
+            self.coalesced += sum(1 for order_id in changes if order_id in self._pending)
+            merge_changes(self._pending, changes)
+            if self._pending_since is None:
+                self._pending_since = time.monotonic()
+            future = self._pending_future
+            self._condition.notify_all()
+        return future if self.mode == SYNC else None
+
+    def commit(self, changes: Dict[str, PendingChange]) -> None:
+        """submit y, en modo sync, espera a que los cambios estén escritos"""
+        future = self.submit(changes)
+        if future is not None:
+            future.result()
+
+    def discard(self, order_id: str) -> None:
+        """
+        Olvida los cambios pendientes de una orden (se va a borrar). Si la
+        orden está en el lote que se escribe ahora, espera a que termine: si
+        no, el lote la volvería a escribir (o, si falla en modo async, a
+        encolar) después del borrado.
+        """
+        with self._condition:
+            while order_id in self._in_flight:
+                self._condition.wait()
+            self._pending.pop(order_id, None)
+
+    def has_changes(self, order_id: str) -> bool:
+        """Si la orden tiene cambios sin escribir (su versión escrita no es la que se ve)"""
+        with self._condition:
+            return order_id in self._pending or order_id in self._in_flight
+
+    def view(self, order_id: str, order: Optional[Order], staged: PendingChange = None) -> Optional[Order]:
+        """
+        La orden tal y como quedará al escribir lo pendiente (y lo preparado
+        en el Unit of Work actual, `staged`), sobre su estado escrito `order`.
+
+        Siempre devuelve una copia: los cambios no deben tocar la orden escrita.
+        """
+        with self._condition:
+            changes = [change for change in (self._in_flight.get(order_id), self._pending.get(order_id)) if change]
+        if staged is not None:
+            changes.append(staged)
+        if order is None and not changes:
+            return None
+
+        customer_id, items, version = (order.customer_id, order.items, order.version) if order else (None, [], 0)
+        for change in changes:
+            if change.replace:
+                customer_id, items = change.customer_id, list(change.items)
+            elif customer_id is not None:
+                items = items + change.items
+            version += 1
+        if customer_id is None:
+            return None
+        return Order.restore(OrderId(order_id), customer_id, items, version)
+
+    def view_many(self, orders: Iterable[Order]) -> List[Order]:
+        """view de varias órdenes ya escritas (listados)"""
+        return [self.view(order.order_id.code, order) for order in orders]
+
+    def flush(self, timeout: float = None) -> bool:
+        """
+        Escribe ya todo lo pendiente y espera a que termine.
+
+        :return: False si no terminó dentro de `timeout`.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            while self._pending or self._in_flight:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self, timeout: float = None) -> None:
+        """
+        Hook de apagado: escribe lo pendiente, no admite más cambios y para
+        el hilo. Idempotente.
+        """
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+
+    def status(self) -> dict:
+        """Métricas del buffer"""
+        with self._condition:
+            return {
+                "mode": self.mode,
+                "pending": len(self._pending),
+                "saves": self.saves,
+                "coalesced": self.coalesced,
+                "flushes": self.flushes,
+                "orders_written": self.orders_written,
+                "failures": self.failures,
+            }
+
+    def _ready(self) -> bool:
+        if not self._pending:
+            return False
+        return (
+            self._closed or self._flush_requested or self.mode == SYNC
+            or len(self._pending) >= self.max_batch
+            or time.monotonic() - self._pending_since >= self.interval
+        )
+
+    def _take_batch(self) -> tuple:
+        """Saca del buffer el siguiente lote (todo en modo sync; hasta max_batch en async)"""
+        if self.mode == SYNC or len(self._pending) <= self.max_batch:
+            batch, self._pending = self._pending, {}
+            future, self._pending_future = self._pending_future, Future()
+            self._pending_since = None
+        else:
+            order_ids = list(self._pending)[:self.max_batch]
+            batch = {order_id: self._pending.pop(order_id) for order_id in order_ids}
+            future = None
+        if not self._pending:
+            self._flush_requested = False
+        self._in_flight = batch
+        return batch, future
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._ready():
+                    if self._closed and not self._pending:
+                        return
+                    timeout = None
+                    if self._pending:
+                        timeout = max(0.0, self.interval - (time.monotonic() - self._pending_since))
+                    self._condition.wait(timeout)
+                batch, future = self._take_batch()
+
+            error = None
+            try:
+                self._write(batch)
+            except Exception as e:
+                error = e
+
+            with self._condition:
+                self._in_flight = {}
+                if error is None:
+                    self.flushes += 1
+                    self.orders_written += len(batch)
+                else:
+                    self.failures += 1
+                    if self.mode == ASYNC and not self._closed:
+                        # Ya confirmados al cliente: se reintentan en el siguiente lote
+                        logger.error("Write-behind flush failed, retrying: %s", error)
+                        retry = dict(batch)
+                        merge_changes(retry, self._pending)
+                        self._pending = retry
+                        # Esperar un intervalo antes de reintentar (sin bucle activo si la base de datos cae)
+                        self._pending_since = time.monotonic()
+                        self._flush_requested = False
+                    else:
+                        logger.error("Write-behind flush failed, %d orders not written: %s", len(batch), error)
+                self._condition.notify_all()
+
+            if future is not None:
+                if error is None or self.mode == ASYNC:
+                    future.set_result(None)
+                else:
+                    future.set_exception(error)
+
+    def _write(self, batch: Dict[str, PendingChange]) -> None:
+        """
+        Escribe un lote con un Unit of Work: lee el estado escrito de cada
+        orden, aplica sus cambios y guarda todo con save_many (una transacción).
+        """
+        for attempt in range(FLUSH_ATTEMPTS):
+            try:
+                with self._unit_of_work_factory() as uow:
+                    orders = [
+                        change.to_write(None if change.overwrite else uow.orders.get(order_id), order_id)
+                        for order_id, change in batch.items()
+                    ]
+                    uow.orders.save_many([order for order in orders if order is not None])
+                return
+            except ConcurrencyConflictError:
+                if attempt == FLUSH_ATTEMPTS - 1:
+                    raise
@@ -0,0 +1,40 @@
+"""
+Unit of Work asíncrono write-behind
+"""
+import asyncio
+from application.ports.async_unit_of_work import AsyncUnitOfWork
+from infrastructure.database.write_behind import WriteBehindBuffer
+from infrastructure.repositories.write_behind_async_order_repository import AsyncWriteBehindOrderRepository
+
+
+class AsyncWriteBehindUnitOfWork(AsyncUnitOfWork):
+    """
+    Variante asíncrona de WriteBehindUnitOfWork. En modo sync el commit
+    espera al lote sin bloquear el event loop.
+    """
+
+    def __init__(self, unit_of_work: AsyncUnitOfWork, buffer: WriteBehindBuffer):
+        self._unit_of_work = unit_of_work
+        self._buffer = buffer
+        self.orders: AsyncWriteBehindOrderRepository = None
+        self.summaries = None
+
+    async def __aenter__(self):
+        await self._unit_of_work.__aenter__()
+        self.orders = AsyncWriteBehindOrderRepository(self._unit_of_work.orders, self._buffer)
+        self.summaries = self._unit_of_work.summaries
+        return await super().__aenter__()
+
+    async def commit(self):
+        staged = self.orders.take_staged()
+        await self._unit_of_work.commit()
+        future = self._buffer.submit(staged)
+        if future is not None:
+            await asyncio.wrap_future(future)
+
+    async def rollback(self):
+        self.orders.take_staged()
+        await self._unit_of_work.rollback()
+
+    async def close(self):
+        await self._unit_of_work.close()
@@ -0,0 +1,38 @@
+"""
+Unit of Work write-behind: los guardados de órdenes se difieren al WriteBehindBuffer
+"""
+from application.ports.unit_of_work import UnitOfWork
+from infrastructure.database.write_behind import WriteBehindBuffer
+from infrastructure.repositories.write_behind_order_repository import WriteBehindOrderRepository
+
+
+class WriteBehindUnitOfWork(UnitOfWork):
+    """
+    Envuelve el Unit of Work real. Las lecturas usan su transacción; los
+    cambios de órdenes se entregan al buffer en commit() (en modo sync,
+    commit espera a que estén escritos) y se descartan en rollback().
+    """
+
+    def __init__(self, unit_of_work: UnitOfWork, buffer: WriteBehindBuffer):
+        self._unit_of_work = unit_of_work
+        self._buffer = buffer
+        self.orders: WriteBehindOrderRepository = None
+        self.summaries = None
+
+    def __enter__(self):
+        self._unit_of_work.__enter__()
+        self.orders = WriteBehindOrderRepository(self._unit_of_work.orders, self._buffer)
+        self.summaries = self._unit_of_work.summaries
+        return super().__enter__()
+
+    def commit(self):
+        staged = self.orders.take_staged()
+        self._unit_of_work.commit()
+        self._buffer.commit(staged)
+
+    def rollback(self):
+        self.orders.take_staged()
+        self._unit_of_work.rollback()
+
+    def close(self):
+        self._unit_of_work.close()
@@ -0,0 +1,37 @@
+"""
+Bus de eventos que respeta group_commit: publica tras el COMMIT del grupo.
+"""
+from typing import Callable, List, Type
+from application.ports.event_bus import EventBus
+from domain.events.domain_event import DomainEvent
+from infrastructure.database.group_commit import active_group
+
+
+class GroupCommitEventBus(EventBus):
+    """
+    Decorador de un EventBus para casos de uso que se ejecutan dentro de un
+    group_commit().
+
+    Cada caso de uso publica sus eventos al salir de su Unit of Work, pero
+    dentro de un grupo el COMMIT se aplaza hasta el final del bloque. Este bus
+    deja los eventos en el grupo (GroupTransaction.defer_publish) y el grupo
+    los publica solo si su COMMIT sale bien: los suscriptores (proyección,
+    cachés) no reaccionan a escrituras que se han deshecho. Fuera de un grupo
+    publica en el momento.
+    """
+
+    def __init__(self, event_bus: EventBus):
+        self._event_bus = event_bus
+
+    def publish(self, event: DomainEvent) -> None:
+        self.publish_many([event])
+
+    def publish_many(self, events: List[DomainEvent]) -> None:
+        group = active_group()
+        if group is None:
+            self._event_bus.publish_many(events)
+        else:
+            group.defer_publish(self._event_bus, events)
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: Callable[[DomainEvent], None]) -> None:
+        self._event_bus.subscribe(event_type, handler)
@@ -1,7 +1,7 @@
 """
 Bus de eventos en memoria para el microservicio de pedidos.
 """
-from typing import List
+from typing import Callable, List, Tuple, Type
 from application.ports.event_bus import EventBus
 from domain.events.domain_event import DomainEvent
 
@@ -17,11 +17,20 @@ class InMemoryEventBus(EventBus):
         self._logger = get_logger('orders_ms.infrastructure.events.in_memory_event_bus')
         # Lista para almacenar eventos publicados
         self._published_events: List[DomainEvent] = []
+        # Manejadores suscritos (tipo de evento, manejador), se llaman en orden de alta
+        self._handlers: List[Tuple[Type[DomainEvent], Callable[[DomainEvent], None]]] = []
 
     def publish(self, event: DomainEvent) -> None:
         # Emitir evento (aquí solo lo registramos y almacenamos)
         self._logger.info(f"📢 Event published: {event}")
         self._published_events.append(event)
+        for event_type, handler in self._handlers:
+            if isinstance(event, event_type):
+                handler(event)
+
+    def subscribe(self, event_type: Type[DomainEvent], handler: Callable[[DomainEvent], None]) -> None:
+        # Suscribir un manejador a un tipo de evento (se llama de forma síncrona al publicar)
+        self._handlers.append((event_type, handler))
 
     def publish_many(self, events: List[DomainEvent]) -> None:
         # Emitir varios eventos
@@ -0,0 +1,52 @@
+"""
+Decorador read-through de AsyncOrderRepository con OrderCache
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from application.ports.async_order_repository import AsyncOrderRepository
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.repositories.order_cache import OrderCache
+
+
+class AsyncCachingOrderRepository(AsyncOrderRepository):
+    """Variante asíncrona de CachingOrderRepository (misma caché, mismo `fill`)"""
+
+    def __init__(self, repository: AsyncOrderRepository, cache: OrderCache, fill: bool = True):
+        self._repository = repository
+        self._cache = cache
+        self._fill = fill
+
+    async def get(self, order_id: OrderId) -> Optional[Order]:
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        order = self._cache.get(order_id_str)
+        if order is not None:
+            return order
+        generation = self._cache.generation(order_id_str)
+        order = await self._repository.get(order_id_str)
+        if order is not None and self._fill:
+            self._cache.put(order, generation)
+        return order
+
+    async def get_version(self, order_id: OrderId) -> Optional[int]:
+        return await self._repository.get_version(order_id)
+
+    async def save(self, order: Order) -> None:
+        await self._repository.save(order)
+        self._cache.invalidate(order.order_id.code)
+
+    async def save_many(self, orders: List[Order]) -> None:
+        await self._repository.save_many(orders)
+        for order in orders:
+            self._cache.invalidate(order.order_id.code)
+
+    async def delete(self, order_id: OrderId) -> None:
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        await self._repository.delete(order_id_str)
+        self._cache.invalidate(order_id_str)
+
+    async def get_all(self) -> List[Order]:
+        return await self._repository.get_all()
+
+    async def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        return await self._repository.get_page(after, limit, sort)
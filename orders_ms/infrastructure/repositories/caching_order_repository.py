@@ -0,0 +1,64 @@
+"""
+Decorador read-through de OrderRepository con OrderCache
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from application.ports.order_repository import OrderRepository
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.repositories.order_cache import OrderCache
+
+
+class CachingOrderRepository(OrderRepository):
+    """
+    get consulta primero la caché y, si falla, lee del repositorio real y
+    guarda el resultado. Solo para Unit of Work de lectura: las escrituras
+    cargan siempre la versión actual (control optimista) y no pasan por aquí.
+    El resto de operaciones se delegan sin caché.
+
+    Con fill=False los aciertos se sirven pero lo leído no se guarda: es el
+    caso de una lectura de réplica sin token de consistencia. Una réplica que
+    va por detrás devolvería el estado anterior justo después de la
+    invalidación, y la comprobación de generación no lo detecta (solo ve las
+    invalidaciones de este proceso).
+    """
+
+    def __init__(self, repository: OrderRepository, cache: OrderCache, fill: bool = True):
+        self._repository = repository
+        self._cache = cache
+        self._fill = fill
+
+    def get(self, order_id: OrderId) -> Optional[Order]:
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        order = self._cache.get(order_id_str)
+        if order is not None:
+            return order
+        generation = self._cache.generation(order_id_str)
+        order = self._repository.get(order_id_str)
+        if order is not None and self._fill:
+            self._cache.put(order, generation)
+        return order
+
+    def get_version(self, order_id: OrderId) -> Optional[int]:
+        # Sin caché: la versión es la que valida lo cacheado, debe venir del repositorio
+        return self._repository.get_version(order_id)
+
+    def save(self, order: Order) -> None:
+        self._repository.save(order)
+        self._cache.invalidate(order.order_id.code)
+
+    def save_many(self, orders: List[Order]) -> None:
+        self._repository.save_many(orders)
+        for order in orders:
+            self._cache.invalidate(order.order_id.code)
+
+    def delete(self, order_id: OrderId) -> None:
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        self._repository.delete(order_id_str)
+        self._cache.invalidate(order_id_str)
+
+    def get_all(self) -> List[Order]:
+        return self._repository.get_all()
+
+    def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        return self._repository.get_page(after, limit, sort)
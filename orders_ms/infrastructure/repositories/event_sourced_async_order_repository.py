@@ -0,0 +1,125 @@
+"""
+Implementación event-sourced asíncrona de OrderRepository (SQLAlchemy asyncio)
+"""
+from typing import Dict, List, Optional
+from application.pagination import PagePosition
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from application.ports.async_order_repository import AsyncOrderRepository
+from application.ports.order_repository import ConcurrencyConflictError
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.database.models.order_event_model import OrderEventModel, OrderSnapshotModel
+from infrastructure.repositories.order_event_store import (
+    SnapshotWrites,
+    event_rows,
+    events_after_snapshots_statement,
+    events_after_statement,
+    pending_events,
+    replay,
+    replay_many,
+    snapshot_every_from_env,
+    snapshot_statement,
+    stream_versions_statement,
+)
+
+
+class AsyncEventSourcedOrderRepository(AsyncOrderRepository):
+    """
+    Variante asíncrona de EventSourcedOrderRepository (mismas tablas, mismas
+    sentencias y misma reconstrucción desde order_event_store).
+    """
+
+    def __init__(self, db_session: AsyncSession, snapshot_every: int = None,
+                 core_reads: bool = False, archive_reads: bool = False):
+        # core_reads y archive_reads llegan del Unit of Work y no aplican: las
+        # lecturas ya van por Core y las órdenes de eventos no se archivan
+        self.db_session = db_session
+        self.snapshot_every = snapshot_every or snapshot_every_from_env()
+
+    async def save(self, order: Order) -> None:
+        """
+        Añade los eventos de los cambios de la orden.
+
+        :raises ConcurrencyConflictError: Si otra transacción guardó antes la
+            misma versión de la orden.
+        """
+        await self.save_many([order])
+
+    async def save_many(self, orders: List[Order]) -> None:
+        """Guarda varias órdenes con un INSERT de eventos y las escrituras de sus snapshots"""
+        unloaded = [order.order_id.code for order in orders if not order.is_persisted]
+        stream_versions = await self._stream_versions(unloaded) if unloaded else {}
+
+        versions, written, rows = {}, [], []
+        snapshots = SnapshotWrites(self.snapshot_every)
+        for order in orders:
+            order_id = order.order_id.code
+            events = pending_events(order)
+            if not events:
+                versions[order_id] = order.version
+                continue
+            current = order.version if order.is_persisted else stream_versions.get(order_id, 0)
+            version = versions[order_id] = current + 1
+            written.append((order_id, current))
+            rows.extend(event_rows(order_id, version, events))
+            snapshots.add(order, version)
+
+        if rows:
+            try:
+                await self.db_session.execute(insert(OrderEventModel), rows)
+            except IntegrityError:
+                raise ConcurrencyConflictError(*written[0])
+        for statement, snapshot_rows in snapshots.statements():
+            await self.db_session.execute(statement, snapshot_rows)
+
+        for order in orders:
+            order.mark_persisted(versions[order.order_id.code])
+
+    async def _stream_versions(self, order_ids: List[str]) -> Dict[str, int]:
+        result = await self.db_session.execute(stream_versions_statement(order_ids))
+        return dict(result.all())
+
+    async def get(self, order_id: OrderId) -> Optional[Order]:
+        """Reconstruye la orden desde su snapshot y los eventos posteriores"""
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        snapshot = (await self.db_session.execute(snapshot_statement(order_id_str))).first()
+        if snapshot is None:
+            return None
+        events = (await self.db_session.execute(events_after_statement(order_id_str, snapshot.version))).all()
+        return replay(snapshot, events)
+
+    async def get_version(self, order_id: OrderId) -> Optional[int]:
+        """Última versión del flujo de eventos"""
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        return (await self._stream_versions([order_id_str])).get(order_id_str)
+
+    async def delete(self, order_id: OrderId) -> None:
+        """Elimina el flujo de eventos y el snapshot de la orden"""
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        await self.db_session.execute(delete(OrderEventModel).where(OrderEventModel.order_id == order_id_str))
+        await self.db_session.execute(delete(OrderSnapshotModel).where(OrderSnapshotModel.order_id == order_id_str))
+
+    async def get_all(self) -> List[Order]:
+        """Todas las órdenes, con dos consultas (snapshots y eventos posteriores)"""
+        snapshots = (await self.db_session.execute(select(OrderSnapshotModel.__table__))).all()
+        events = (await self.db_session.execute(events_after_snapshots_statement())).all()
+        orders = replay_many(snapshots, events)
+        return [orders[snapshot.order_id] for snapshot in snapshots if snapshot.order_id in orders]
+
+    async def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        """Página keyset sobre order_snapshots más los eventos posteriores de esas órdenes"""
+        statement = apply_keyset(select(OrderSnapshotModel.__table__), after, sort, model=OrderSnapshotModel)
+        return await self._replay_page(statement.limit(limit))
+
+    async def _replay_page(self, statement) -> List[Order]:
+        snapshots = (await self.db_session.execute(statement)).all()
+        if not snapshots:
+            return []
+        events = (await self.db_session.execute(
+            events_after_snapshots_statement([snapshot.order_id for snapshot in snapshots])
+        )).all()
+        orders = replay_many(snapshots, events)
+        return [orders[snapshot.order_id] for snapshot in snapshots]
@@ -0,0 +1,27 @@
+"""
+Lector asíncrono de resúmenes de órdenes sobre el almacén de eventos.
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from sqlalchemy.ext.asyncio import AsyncSession
+from application.ports.async_order_summary_reader import AsyncOrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.repositories.event_sourced_order_summary_reader import summaries_statement
+from infrastructure.repositories.postgresql_order_summary_reader import summary_from_row
+
+
+class AsyncEventSourcedOrderSummaryReader(AsyncOrderSummaryReader):
+    """Variante asíncrona de EventSourcedOrderSummaryReader"""
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def list_summaries(self, after: Optional[PagePosition], limit: int,
+                             sort: str = "order_id") -> List[OrderSummaryDTO]:
+        result = await self.db_session.execute(summaries_statement(after, limit, sort))
+        return [summary_from_row(row) for row in result]
+
+    async def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                      sort: str = "order_id") -> List[OrderSummaryDTO]:
+        result = await self.db_session.execute(summaries_statement(after, limit, sort, customer_id))
+        return [summary_from_row(row) for row in result]
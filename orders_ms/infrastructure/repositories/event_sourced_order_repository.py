@@ -0,0 +1,142 @@
+"""
+Implementación event-sourced de OrderRepository (SQLAlchemy)
+"""
+from typing import Dict, List, Optional
+from application.pagination import PagePosition
+from sqlalchemy import delete, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from application.ports.order_repository import ConcurrencyConflictError, OrderRepository
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.database.models.order_event_model import OrderEventModel, OrderSnapshotModel
+from infrastructure.repositories.order_event_store import (
+    SnapshotWrites,
+    event_rows,
+    events_after_snapshots_statement,
+    events_after_statement,
+    pending_events,
+    replay,
+    replay_many,
+    snapshot_every_from_env,
+    snapshot_statement,
+    stream_versions_statement,
+)
+
+
+class EventSourcedOrderRepository(OrderRepository):
+    """
+    OrderRepository que guarda eventos en lugar de reescribir filas.
+
+    Un guardado es un INSERT (multi-fila) en order_events más el UPDATE del
+    resumen (items_count, total_amount) de su snapshot, sin DELETE de items.
+    El primer guardado crea el snapshot de la orden y cada `snapshot_every`
+    versiones se reescribe entero, de modo que get reproduce como mucho
+    snapshot_every - 1 guardados (dos consultas).
+
+    El control optimista lo da la clave primaria de order_events: dos
+    guardados sobre la misma versión chocan y el segundo falla con
+    ConcurrencyConflictError. No confirma: el commit es del Unit of Work.
+    """
+
+    def __init__(self, db_session: Session, snapshot_every: int = None,
+                 core_reads: bool = False, archive_reads: bool = False):
+        # core_reads y archive_reads llegan del Unit of Work y no aplican: las
+        # lecturas ya van por Core y las órdenes de eventos no se archivan
+        self.db_session = db_session
+        self.snapshot_every = snapshot_every or snapshot_every_from_env()
+
+    def save(self, order: Order) -> None:
+        """
+        Añade los eventos de los cambios de la orden.
+
+        :raises ConcurrencyConflictError: Si otra transacción guardó antes la
+            misma versión de la orden.
+        """
+        self.save_many([order])
+
+    def save_many(self, orders: List[Order]) -> None:
+        """
+        Guarda varias órdenes con un INSERT de eventos, uno de snapshots para
+        las órdenes nuevas y un UPDATE (executemany) por tipo de cambio de
+        snapshot, sea cual sea el tamaño del lote.
+        """
+        unloaded = [order.order_id.code for order in orders if not order.is_persisted]
+        stream_versions = self._stream_versions(unloaded) if unloaded else {}
+
+        versions, written, rows = {}, [], []
+        snapshots = SnapshotWrites(self.snapshot_every)
+        for order in orders:
+            order_id = order.order_id.code
+            events = pending_events(order)
+            if not events:
+                versions[order_id] = order.version
+                continue
+            current = order.version if order.is_persisted else stream_versions.get(order_id, 0)
+            version = versions[order_id] = current + 1
+            written.append((order_id, current))
+            rows.extend(event_rows(order_id, version, events))
+            snapshots.add(order, version)
+
+        if rows:
+            self._append(written, rows)
+        for statement, snapshot_rows in snapshots.statements():
+            self.db_session.execute(statement, snapshot_rows)
+
+        for order in orders:
+            order.mark_persisted(versions[order.order_id.code])
+
+    def _append(self, written: List[tuple], rows: List[dict]) -> None:
+        """
+        INSERT de los eventos. Un choque de clave primaria es un guardado
+        concurrente de la misma versión (en un lote se indica su primera orden).
+        """
+        try:
+            self.db_session.execute(insert(OrderEventModel), rows)
+        except IntegrityError:
+            raise ConcurrencyConflictError(*written[0])
+
+    def _stream_versions(self, order_ids: List[str]) -> Dict[str, int]:
+        return dict(self.db_session.execute(stream_versions_statement(order_ids)).all())
+
+    def get(self, order_id: OrderId) -> Optional[Order]:
+        """Reconstruye la orden desde su snapshot y los eventos posteriores"""
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        snapshot = self.db_session.execute(snapshot_statement(order_id_str)).first()
+        if snapshot is None:
+            return None
+        events = self.db_session.execute(events_after_statement(order_id_str, snapshot.version)).all()
+        return replay(snapshot, events)
+
+    def get_version(self, order_id: OrderId) -> Optional[int]:
+        """Última versión del flujo de eventos (una consulta sobre la clave primaria)"""
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        return self._stream_versions([order_id_str]).get(order_id_str)
+
+    def delete(self, order_id: OrderId) -> None:
+        """Elimina el flujo de eventos y el snapshot de la orden"""
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        self.db_session.execute(delete(OrderEventModel).where(OrderEventModel.order_id == order_id_str))
+        self.db_session.execute(delete(OrderSnapshotModel).where(OrderSnapshotModel.order_id == order_id_str))
+
+    def get_all(self) -> List[Order]:
+        """Todas las órdenes, con dos consultas (snapshots y eventos posteriores)"""
+        snapshots = self.db_session.execute(select(OrderSnapshotModel.__table__)).all()
+        orders = replay_many(snapshots, self.db_session.execute(events_after_snapshots_statement()).all())
+        return [orders[snapshot.order_id] for snapshot in snapshots if snapshot.order_id in orders]
+
+    def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        """Página keyset sobre order_snapshots más los eventos posteriores de esas órdenes"""
+        statement = apply_keyset(select(OrderSnapshotModel.__table__), after, sort, model=OrderSnapshotModel)
+        return self._replay_page(statement.limit(limit))
+
+    def _replay_page(self, statement) -> List[Order]:
+        snapshots = self.db_session.execute(statement).all()
+        if not snapshots:
+            return []
+        events = self.db_session.execute(
+            events_after_snapshots_statement([snapshot.order_id for snapshot in snapshots])
+        ).all()
+        orders = replay_many(snapshots, events)
+        return [orders[snapshot.order_id] for snapshot in snapshots]
@@ -0,0 +1,48 @@
+"""
+Lector de resúmenes de órdenes sobre el almacén de eventos.
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from application.ports.order_summary_reader import OrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.database.models.order_event_model import OrderSnapshotModel
+from infrastructure.repositories.postgresql_order_summary_reader import summary_columns, summary_from_row
+
+# Columnas del resumen en order_snapshots (el repositorio las mantiene en cada guardado)
+SNAPSHOT_SUMMARY_COLUMNS = select(
+    OrderSnapshotModel.order_id,
+    OrderSnapshotModel.customer_id,
+    OrderSnapshotModel.items_count,
+    OrderSnapshotModel.total_amount
+)
+
+
+def summaries_statement(after: Optional[PagePosition], limit: int, sort: str, customer_id: Optional[str] = None):
+    """Página keyset de resúmenes sobre order_snapshots (de todas las órdenes o de un cliente)"""
+    statement = summary_columns(sort, SNAPSHOT_SUMMARY_COLUMNS, OrderSnapshotModel)
+    if customer_id is not None:
+        statement = statement.where(OrderSnapshotModel.customer_id == customer_id)
+    return apply_keyset(statement, after, sort, model=OrderSnapshotModel).limit(limit)
+
+
+class EventSourcedOrderSummaryReader(OrderSummaryReader):
+    """
+    Lee los resúmenes de las columnas items_count y total_amount de
+    order_snapshots con una consulta de rango: los listados no cargan
+    eventos ni reproducen items.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def list_summaries(self, after: Optional[PagePosition], limit: int,
+                       sort: str = "order_id") -> List[OrderSummaryDTO]:
+        return [summary_from_row(row) for row in self.db_session.execute(summaries_statement(after, limit, sort))]
+
+    def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                sort: str = "order_id") -> List[OrderSummaryDTO]:
+        statement = summaries_statement(after, limit, sort, customer_id)
+        return [summary_from_row(row) for row in self.db_session.execute(statement)]
@@ -0,0 +1,37 @@
+"""
+Repositorio asíncrono en memoria para la entidad Order.
+"""
+from typing import Optional
+from application.pagination import PagePosition
+from domain.entities.order import Order
+from application.ports.async_order_repository import AsyncOrderRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+
+class InMemoryAsyncOrderRepository(AsyncOrderRepository):
+    """
+    Adaptador asíncrono sobre InMemoryOrderRepository.
+    Comparte el almacenamiento con la ruta síncrona (útil en tests y benchmarks).
+    """
+    def __init__(self, repository: InMemoryOrderRepository):
+        self._repository = repository
+
+    async def save(self, order: 'Order') -> Order:
+        return self._repository.save(order)
+
+    async def save_many(self, orders: list['Order']) -> None:
+        self._repository.save_many(orders)
+
+    async def get(self, order_id: str) -> Optional['Order']:
+        return self._repository.get(order_id)
+
+    async def get_version(self, order_id: str) -> Optional[int]:
+        return self._repository.get_version(order_id)
+
+    async def delete(self, order_id: str) -> None:
+        self._repository.delete(order_id)
+
+    async def get_all(self) -> list['Order']:
+        return self._repository.get_all()
+
+    async def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> list['Order']:
+        return self._repository.get_page(after, limit, sort)
@@ -0,0 +1,24 @@
+"""
+Lector asíncrono de resúmenes de órdenes en memoria.
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from application.ports.async_order_summary_reader import AsyncOrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_order_summary_reader import InMemoryOrderSummaryReader
+
+class InMemoryAsyncOrderSummaryReader(AsyncOrderSummaryReader):
+    """
+    Adaptador asíncrono sobre InMemoryOrderSummaryReader.
+    """
+    def __init__(self, repository: InMemoryOrderRepository):
+        self._reader = InMemoryOrderSummaryReader(repository)
+
+    async def list_summaries(self, after: Optional[PagePosition], limit: int,
+                             sort: str = "order_id") -> List[OrderSummaryDTO]:
+        return self._reader.list_summaries(after, limit, sort)
+
+    async def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                      sort: str = "order_id") -> List[OrderSummaryDTO]:
+        return self._reader.list_customer_summaries(customer_id, after, limit, sort)
@@ -1,27 +1,147 @@
 """
 Repositorio en memoria para la entidad Order.
 """
-from typing import Dict, Optional
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional
+from application.pagination import PagePosition
 from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
 from application.ports.order_repository import OrderRepository
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+
+def next_created_at(previous: Optional[datetime]) -> datetime:
+    """Fecha de alta estrictamente creciente (UTC): dos altas seguidas nunca empatan"""
+    now = datetime.now(timezone.utc)
+    if previous is not None and now <= previous:
+        return previous + timedelta(microseconds=1)
+    return now
+
 
 class InMemoryOrderRepository(OrderRepository):
     def __init__(self):
         super().__init__()
         self.orders: Dict[str, Order] = {}
+        # Resúmenes (total, nº de líneas) actualizados incrementalmente en cada save
+        self.summaries: Dict[str, OrderSummaryDTO] = {}
+        # Índices ordenados para paginar sin reordenar en cada consulta.
+        # "created_at" usa la fecha de alta con el ID como desempate, como en SQL.
+        self._last_created_at: Optional[datetime] = None
+        self._created_at: Dict[str, datetime] = {}
+        self._indexes: Dict[str, List[tuple]] = {"order_id": [], "created_at": []}
+        # Índice secundario por cliente: customer_id -> mismos índices ordenados con solo sus órdenes
+        self._customer_indexes: Dict[str, Dict[str, List[tuple]]] = {}
 
     def save(self, order: 'Order') -> Order:
-        self.orders[order.order_id.code] = order
+        order_code = order.order_id.code
+        previous = self.orders.get(order_code)
+        previous_summary = self.summaries.get(order_code)
+        if previous is None:
+            self._last_created_at = self._created_at[order_code] = next_created_at(self._last_created_at)
+            for sort, index in self._indexes.items():
+                insort(index, self._sort_key(sort, order_code))
+            self._index_customer(order.customer_id, order_code)
+        elif previous_summary.customer_id != order.customer_id:
+            # Se sobrescribe con otro cliente: cambia de índice de cliente
+            self._unindex_customer(previous_summary.customer_id, order_code)
+            self._index_customer(order.customer_id, order_code)
+        self._update_summary(order)
+        self.orders[order_code] = order
+        # Como el upsert de PostgreSQL: sobrescribir una orden existente incrementa su versión
+        order.mark_persisted((previous.version if previous is not None else 0) + 1)
         return order
-    
+
+    def save_many(self, orders: list['Order']) -> None:
+        for order in orders:
+            self.save(order)
+
     def get(self, order_id: str) -> Optional['Order']:
         return self.orders.get(order_id)
-    
+
+    def get_version(self, order_id: str) -> Optional[int]:
+        order = self.orders.get(order_id)
+        return order.version if order is not None else None
+
     def delete(self, order_id: str) -> None:
         if order_id in self.orders:
             del self.orders[order_id]
-    
+            self._unindex_customer(self.summaries.pop(order_id).customer_id, order_id)
+            for sort, index in self._indexes.items():
+                del index[bisect_left(index, self._sort_key(sort, order_id))]
+            # Los cursores que apuntan aquí siguen valiendo: llevan su (created_at, order_id)
+            del self._created_at[order_id]
+
     def get_all(self) -> list['Order']:
         """Obtiene todas las órdenes almacenadas"""
-        return list(self.orders.values())
\ No newline at end of file
+        return list(self.orders.values())
+
+    def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> list['Order']:
+        """Obtiene una página de órdenes usando búsqueda binaria sobre el índice ordenado"""
+        return [self.orders[order_id] for order_id in self.get_page_ids(after, limit, sort)]
+
+    def get_page_ids(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[str]:
+        """Obtiene los IDs de una página a partir del índice ordenado"""
+        return self._page_ids(self._indexes[sort], after, limit, sort)
+
+    def get_customer_page_ids(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                              sort: str = "order_id") -> List[str]:
+        """
+        Obtiene los IDs de una página de las órdenes de un cliente a partir de
+        su índice secundario (O(log n + limit), con n las órdenes del cliente)
+        """
+        return self._page_ids(self._customer_indexes.get(customer_id, {}).get(sort, []), after, limit, sort)
+
+    def clear(self) -> None:
+        """Elimina todas las órdenes y sus índices"""
+        self.orders.clear()
+        self.summaries.clear()
+        self._created_at.clear()
+        for index in self._indexes.values():
+            index.clear()
+        self._customer_indexes.clear()
+
+    def _page_ids(self, index: List[tuple], after: Optional[PagePosition], limit: int, sort: str) -> List[str]:
+        if after is None:
+            start = 0
+        elif sort == "created_at":
+            start = bisect_right(index, tuple(after))
+        else:
+            start = bisect_right(index, (after,))
+        return [key[-1] for key in index[start:start + limit]]
+
+    def _sort_key(self, sort: str, order_id: str) -> tuple:
+        if sort == "created_at":
+            return (self._created_at[order_id], order_id)
+        return (order_id,)
+
+    def _index_customer(self, customer_id: str, order_id: str) -> None:
+        indexes = self._customer_indexes.setdefault(customer_id, {sort: [] for sort in self._indexes})
+        for sort, index in indexes.items():
+            insort(index, self._sort_key(sort, order_id))
+
+    def _unindex_customer(self, customer_id: str, order_id: str) -> None:
+        indexes = self._customer_indexes[customer_id]
+        for sort, index in indexes.items():
+            del index[bisect_left(index, self._sort_key(sort, order_id))]
+        if not indexes["order_id"]:
+            del self._customer_indexes[customer_id]
+
+    def _update_summary(self, order: Order) -> None:
+        # Si la orden ya estaba guardada solo se suman los items nuevos (O(items nuevos))
+        order_code = order.order_id.code
+        previous = self.summaries.get(order_code)
+        if previous is not None and order.is_persisted and not order.items_cleared:
+            items, total_amount, items_count = order.new_items, previous.total_amount, previous.items_count
+        else:
+            items, total_amount, items_count = order.items, Decimal('0'), 0
+
+        for sku, quantity, price in items:
+            total_amount += price.amount * quantity.amount
+        self.summaries[order_code] = OrderSummaryDTO(
+            order_id=order_code,
+            customer_id=order.customer_id,
+            items_count=items_count + len(items),
+            total_amount=total_amount,
+            created_at=self._created_at[order_code]
+        )
@@ -0,0 +1,29 @@
+"""
+Lector de resúmenes de órdenes en memoria.
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from application.ports.order_summary_reader import OrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+
+class InMemoryOrderSummaryReader(OrderSummaryReader):
+    """
+    Lee los totales que InMemoryOrderRepository mantiene de forma incremental
+    en cada save, usando su índice ordenado para paginar.
+    """
+    def __init__(self, repository: InMemoryOrderRepository):
+        self._repository = repository
+
+    def list_summaries(self, after: Optional[PagePosition], limit: int,
+                       sort: str = "order_id") -> List[OrderSummaryDTO]:
+        summaries = self._repository.summaries
+        return [summaries[order_id] for order_id in self._repository.get_page_ids(after, limit, sort)]
+
+    def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                sort: str = "order_id") -> List[OrderSummaryDTO]:
+        summaries = self._repository.summaries
+        return [
+            summaries[order_id]
+            for order_id in self._repository.get_customer_page_ids(customer_id, after, limit, sort)
+        ]
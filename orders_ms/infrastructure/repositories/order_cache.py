@@ -0,0 +1,127 @@
+"""
+Caché de órdenes para lecturas (LRU acotada con TTL), invalidada por eventos
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Mapping, Optional
+from application.ports.event_bus import EventBus
+from domain.entities.order import Order
+from domain.events.domain_event import DomainEvent
+from domain.events.item_added import ItemAdded
+from domain.events.items_cleared import ItemsCleared
+from domain.events.order_created import OrderCreated
+from domain.value_objects.order_id import OrderId
+
+DEFAULT_CACHE_TTL = 300.0  # segundos
+
+# Eventos que cambian una orden: cada uno invalida su entrada
+INVALIDATING_EVENTS = (OrderCreated, ItemAdded, ItemsCleared)
+
+# Contadores de invalidación por franjas de claves (ver OrderCache.generation)
+_STRIPES = 64
+
+
+def cache_settings_from_env(environ: Mapping[str, str] = None) -> Optional[dict]:
+    """
+    ORDER_CACHE_SIZE (órdenes; 0 o ausente = sin caché) y
+    ORDER_CACHE_TTL_SECONDS. None si la caché está desactivada.
+    """
+    environ = os.environ if environ is None else environ
+    max_size = int(environ.get("ORDER_CACHE_SIZE", 0))
+    if max_size <= 0:
+        return None
+    return {"max_size": max_size, "ttl": float(environ.get("ORDER_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL))}
+
+
+class OrderCache:
+    """
+    Órdenes hidratadas, guardadas en forma inmutable (cliente, items,
+    versión) y restauradas como un Order nuevo en cada acierto: quien la
+    lee puede modificarla sin tocar la caché.
+
+    Las entradas se invalidan al publicarse OrderCreated/ItemAdded/ItemsCleared
+    (los casos de uso publican tras el commit). Para que una lectura que
+    empezó antes de la invalidación no deje en la caché el estado anterior,
+    put solo guarda si no hubo invalidaciones en la franja de la clave
+    desde `generation()`. El TTL acota lo que no pasa por este bus (otras
+    instancias, cambios hechos directamente en la base de datos).
+
+    Segura entre hilos: la comparten las rutas síncrona y asíncrona.
+    """
+
+    def __init__(self, max_size: int, ttl: float = DEFAULT_CACHE_TTL, clock: Callable[[], float] = time.monotonic):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._generations = [0] * _STRIPES
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def generation(self, order_id: str) -> int:
+        """Contador de invalidaciones de la franja de order_id (tomarlo antes de leer)"""
+        return self._generations[hash(order_id) % _STRIPES]
+
+    def get(self, order_id: str) -> Optional[Order]:
+        with self._lock:
+            entry = self._entries.get(order_id)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, customer_id, items, version = entry
+            if self._clock() >= expires_at:
+                del self._entries[order_id]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(order_id)
+            self.hits += 1
+        return Order.restore(OrderId(order_id), customer_id, list(items), version)
+
+    def put(self, order: Order, generation: int) -> None:
+        """Guarda la orden leída si su franja no se invalidó desde `generation`"""
+        order_id = order.order_id.code
+        entry = (self._clock() + self.ttl, order.customer_id, tuple(order.items), order.version)
+        with self._lock:
+            if self.generation(order_id) != generation:
+                return
+            self._entries[order_id] = entry
+            self._entries.move_to_end(order_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, order_id: str) -> None:
+        with self._lock:
+            self._generations[hash(order_id) % _STRIPES] += 1
+            if self._entries.pop(order_id, None) is not None:
+                self.invalidations += 1
+
+    def on_event(self, event: DomainEvent) -> None:
+        """Manejador para el EventBus: invalida la orden del evento"""
+        self.invalidate(event.order_id)
+
+    def subscribe_to(self, event_bus: EventBus) -> None:
+        """Suscribe la invalidación a los eventos que modifican órdenes"""
+        for event_type in INVALIDATING_EVENTS:
+            event_bus.subscribe(event_type, self.on_event)
+
+    def status(self) -> dict:
+        """Métricas de la caché"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
@@ -0,0 +1,64 @@
+"""
+Lectura de una orden con SQLAlchemy Core: ruta rápida de GET /orders/{id}.
+
+Compartido por los repositorios síncrono y asíncrono. Cabecera e items
+llegan en una única consulta (LEFT JOIN) y la entidad se construye
+directamente desde las tuplas, sin query builder del ORM, identity map
+ni modelos intermedios.
+"""
+from typing import Optional, Sequence
+from sqlalchemy import bindparam, select
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+
+_orders = OrderModel.__table__
+_items = OrderItemModel.__table__
+
+# Se construye una sola vez: SQLAlchemy reutiliza su forma compilada desde la
+# caché del motor y en cada petición solo cambia el parámetro order_id
+ORDER_WITH_ITEMS = (
+    select(
+        _orders.c.order_id,
+        _orders.c.customer_id,
+        _orders.c.currency,
+        _orders.c.version,
+        _items.c.sku,
+        _items.c.quantity,
+        _items.c.price,
+    )
+    .select_from(_orders.outerjoin(_items, _items.c.order_id == _orders.c.order_id))
+    .where(_orders.c.order_id == bindparam("order_id"))
+    .order_by(_items.c.id)
+)
+
+
+def rows_to_entity(rows: Sequence[tuple]) -> Optional[Order]:
+    """
+    Reconstruye la orden a partir de las filas de ORDER_WITH_ITEMS
+    (una por item, o una con columnas de item a NULL si no tiene items)
+    """
+    if not rows:
+        return None
+
+    order_id, customer_id, currency, version = rows[0][:4]
+    items = [
+        (SKU(sku), Quantity(quantity), Price(amount=float(price), currency=currency))
+        for _, _, _, _, sku, quantity, price in rows
+        if sku is not None
+    ]
+    return Order.restore(order_id=OrderId(order_id), customer_id=customer_id, items=items, version=version)
+
+
+def fetch_order(connection, order_id: str) -> Optional[Order]:
+    """Obtiene una orden con una consulta sobre una Connection síncrona"""
+    return rows_to_entity(connection.execute(ORDER_WITH_ITEMS, {"order_id": order_id}).all())
+
+
+async def async_fetch_order(connection, order_id: str) -> Optional[Order]:
+    """Variante de fetch_order sobre una AsyncConnection"""
+    result = await connection.execute(ORDER_WITH_ITEMS, {"order_id": order_id})
+    return rows_to_entity(result.all())
@@ -0,0 +1,240 @@
+"""
+Almacén de eventos de órdenes: serialización, sentencias y reconstrucción.
+
+Compartido por los repositorios event-sourced síncrono y asíncrono. Cada
+guardado añade a order_events los eventos de dominio de los cambios de la
+orden (OrderCreated, ItemAdded, ItemsCleared), todos con la nueva versión.
+Una orden se reconstruye desde su snapshot más los eventos posteriores.
+"""
+import json
+import os
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+from sqlalchemy import and_, bindparam, func, insert, select, update
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from infrastructure.database.models.order_event_model import OrderEventModel, OrderSnapshotModel
+
+DEFAULT_SNAPSHOT_EVERY = 20
+
+ORDER_CREATED = "OrderCreated"
+ITEM_ADDED = "ItemAdded"
+ITEMS_CLEARED = "ItemsCleared"
+
+_events = OrderEventModel.__table__
+_snapshots = OrderSnapshotModel.__table__
+
+
+def snapshot_every_from_env(environ: Mapping[str, str] = None) -> int:
+    """Cada cuántas versiones se reescribe el snapshot (ORDER_SNAPSHOT_EVERY)"""
+    environ = os.environ if environ is None else environ
+    return max(1, int(environ.get("ORDER_SNAPSHOT_EVERY", DEFAULT_SNAPSHOT_EVERY)))
+
+
+def _item_data(item: tuple) -> list:
+    sku, quantity, price = item
+    return [sku.code, quantity.amount, str(price.amount), price.currency]
+
+
+def _item_from_data(data: list) -> tuple:
+    sku, quantity, price, currency = data
+    return SKU(sku), Quantity(quantity), Price(amount=Decimal(price), currency=currency)
+
+
+def pending_events(order: Order) -> List[tuple]:
+    """
+    Eventos (tipo, datos) que describen los cambios pendientes de la orden.
+
+    Se obtienen de su estado de cambios (como hacen los demás repositorios)
+    y no de pull_domain_events: los eventos de dominio siguen siendo del
+    caso de uso, que los publica tras el commit.
+    """
+    if not order.is_persisted:
+        # Escritura completa: OrderCreated reinicia el estado al reproducir
+        events = [(ORDER_CREATED, {"customer_id": order.customer_id})]
+        items = order.items
+    elif order.items_cleared:
+        events = [(ITEMS_CLEARED, {})]
+        items = order.items
+    else:
+        events = []
+        items = order.new_items
+    events.extend((ITEM_ADDED, {"item": _item_data(item)}) for item in items)
+    return events
+
+
+def event_rows(order_id: str, version: int, events: Sequence[tuple]) -> List[dict]:
+    """Filas de order_events para los eventos de un guardado"""
+    return [
+        {
+            "order_id": order_id,
+            "version": version,
+            "seq": seq,
+            "event_type": event_type,
+            "data": json.dumps(data, separators=(",", ":")),
+        }
+        for seq, (event_type, data) in enumerate(events)
+    ]
+
+
+def _totals(items: Iterable[tuple]) -> tuple:
+    items = list(items)
+    return len(items), sum((price.amount * quantity.amount for _, quantity, price in items), Decimal('0'))
+
+
+def snapshot_row(order: Order, version: int) -> dict:
+    """Fila de order_snapshots con el estado completo de la orden y su resumen"""
+    items_count, total_amount = _totals(order.items)
+    return {
+        "order_id": order.order_id.code,
+        "customer_id": order.customer_id,
+        "version": version,
+        "state": json.dumps({"items": [_item_data(item) for item in order.items]}, separators=(",", ":")),
+        "items_count": items_count,
+        "total_amount": total_amount,
+    }
+
+
+# UPDATE (executemany) de un snapshot: las claves de cada fila, salvo b_order_id, son las columnas del SET
+UPDATE_SNAPSHOT = update(_snapshots).where(_snapshots.c.order_id == bindparam("b_order_id"))
+# Suma las líneas nuevas de un guardado al resumen del snapshot (executemany)
+ADD_SNAPSHOT_TOTALS = UPDATE_SNAPSHOT.values(
+    items_count=_snapshots.c.items_count + bindparam("b_items_count"),
+    total_amount=_snapshots.c.total_amount + bindparam("b_total_amount"),
+)
+
+
+class SnapshotWrites:
+    """
+    Escrituras de order_snapshots de un save_many: filas nuevas, snapshots
+    reescritos y resúmenes (items_count, total_amount) de los demás guardados,
+    en absoluto (escritura completa o carrito vaciado) o sumando las líneas nuevas.
+
+    Los resúmenes en absoluto escriben también customer_id: una escritura
+    completa de una orden existente puede cambiar de cliente, y los listados
+    (también los de un cliente) leen el customer_id del snapshot.
+    """
+
+    def __init__(self, snapshot_every: int):
+        self.snapshot_every = snapshot_every
+        self.new, self.rewritten, self.set_totals, self.added_totals = [], [], [], []
+
+    def add(self, order: Order, version: int) -> None:
+        order_id = order.order_id.code
+        if version == 1:
+            self.new.append(snapshot_row(order, version))
+        elif needs_snapshot(version, self.snapshot_every):
+            row = snapshot_row(order, version)
+            row["b_order_id"] = row.pop("order_id")
+            self.rewritten.append(row)
+        elif order.is_persisted and not order.items_cleared:
+            items_count, total_amount = _totals(order.new_items)
+            self.added_totals.append(
+                {"b_order_id": order_id, "b_items_count": items_count, "b_total_amount": total_amount}
+            )
+        else:
+            items_count, total_amount = _totals(order.items)
+            self.set_totals.append({
+                "b_order_id": order_id,
+                "customer_id": order.customer_id,
+                "items_count": items_count,
+                "total_amount": total_amount,
+            })
+
+    def statements(self) -> List[tuple]:
+        """(sentencia, filas) a ejecutar, una sentencia (executemany) por tipo de escritura"""
+        return [
+            (statement, rows)
+            for statement, rows in (
+                (insert(_snapshots), self.new),
+                (UPDATE_SNAPSHOT, self.rewritten),
+                (UPDATE_SNAPSHOT, self.set_totals),
+                (ADD_SNAPSHOT_TOTALS, self.added_totals),
+            )
+            if rows
+        ]
+
+
+def needs_snapshot(version: int, snapshot_every: int) -> bool:
+    """Se reescribe el snapshot cada snapshot_every versiones"""
+    return version % snapshot_every == 0
+
+
+def replay(snapshot, events: Iterable) -> Optional[Order]:
+    """
+    Reconstruye una orden desde su snapshot (o None) y los eventos
+    posteriores, en orden de (version, seq).
+    """
+    customer_id, items, version = None, [], 0
+    if snapshot is not None:
+        customer_id, version = snapshot.customer_id, snapshot.version
+        items = [_item_from_data(data) for data in json.loads(snapshot.state)["items"]]
+
+    order_id = snapshot.order_id if snapshot is not None else None
+    for event in events:
+        order_id, version = event.order_id, event.version
+        data = json.loads(event.data)
+        if event.event_type == ORDER_CREATED:
+            customer_id, items = data["customer_id"], []
+        elif event.event_type == ITEMS_CLEARED:
+            items = []
+        elif event.event_type == ITEM_ADDED:
+            items.append(_item_from_data(data["item"]))
+
+    if customer_id is None:
+        return None
+    return Order.restore(order_id=OrderId(order_id), customer_id=customer_id, items=items, version=version)
+
+
+def replay_many(snapshots: Iterable, events: Iterable) -> Dict[str, Order]:
+    """replay de varias órdenes a la vez, por order_id"""
+    events_by_order = defaultdict(list)
+    for event in events:
+        events_by_order[event.order_id].append(event)
+    orders = {}
+    for snapshot in snapshots:
+        order = replay(snapshot, events_by_order.get(snapshot.order_id, []))
+        if order is not None:
+            orders[snapshot.order_id] = order
+    return orders
+
+
+def snapshot_statement(order_id: str):
+    return select(_snapshots).where(_snapshots.c.order_id == order_id)
+
+
+def events_after_statement(order_id: str, version: int):
+    """Eventos de una orden posteriores a la versión de su snapshot"""
+    return (
+        select(_events)
+        .where(_events.c.order_id == order_id, _events.c.version > version)
+        .order_by(_events.c.version, _events.c.seq)
+    )
+
+
+def events_after_snapshots_statement(order_ids: Optional[List[str]] = None):
+    """Eventos posteriores al snapshot de cada orden (de todas, o de order_ids)"""
+    statement = (
+        select(_events)
+        .join(_snapshots, and_(
+            _snapshots.c.order_id == _events.c.order_id,
+            _events.c.version > _snapshots.c.version
+        ))
+        .order_by(_events.c.order_id, _events.c.version, _events.c.seq)
+    )
+    if order_ids is not None:
+        statement = statement.where(_events.c.order_id.in_(order_ids))
+    return statement
+
+
+def stream_versions_statement(order_ids: List[str]):
+    """Última versión de cada orden (para escrituras completas de órdenes no cargadas)"""
+    return (
+        select(_events.c.order_id, func.max(_events.c.version))
+        .where(_events.c.order_id.in_(order_ids))
+        .group_by(_events.c.order_id)
+    )
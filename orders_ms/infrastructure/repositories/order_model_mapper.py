@@ -0,0 +1,71 @@
+"""
+Conversión entre modelos SQLAlchemy y la entidad Order.
+
+Compartido por los repositorios síncrono y asíncrono.
+"""
+from typing import List
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+
+
+def model_to_entity(order_model, item_models: List) -> Order:
+    """
+    Reconstruye una entidad Order a partir de su cabecera y sus items,
+    sin emitir eventos ni marcar items como nuevos
+    """
+    items = [
+        (
+            SKU(item_model.sku),
+            Quantity(item_model.quantity),
+            Price(amount=float(item_model.price), currency=order_model.currency)
+        )
+        for item_model in item_models
+    ]
+
+    return Order.restore(
+        order_id=OrderId(order_model.order_id),
+        customer_id=order_model.customer_id,
+        items=items,
+        version=order_model.version
+    )
+
+
+def order_to_row(order: Order) -> dict:
+    """
+    Convierte la cabecera de una orden en una fila de orders
+    """
+    items = order.items
+    total, lines = order_totals(items)
+    return {
+        "order_id": order.order_id.code,
+        "customer_id": order.customer_id,
+        "total_amount": float(total),
+        "currency": items[0][2].currency if items else "EUR",
+        "items_count": lines,
+        "version": 1,
+    }
+
+
+def item_to_row(order_id: str, item: tuple) -> dict:
+    """
+    Convierte un item (sku, quantity, price) en una fila de order_items
+    """
+    sku, quantity, price = item
+    return {
+        "order_id": order_id,
+        "sku": sku.code,
+        "quantity": quantity.amount,
+        "price": float(price.amount),
+        "subtotal": float(price.amount * quantity.amount),
+    }
+
+
+def order_totals(items: list) -> tuple:
+    """
+    Calcula (total, nº de líneas) de una lista de items
+    """
+    total = sum(item[2].amount * item[1].amount for item in items)
+    return total, len(items)
@@ -0,0 +1,312 @@
+"""
+Proyección de resúmenes de órdenes mantenida con los eventos de dominio
+"""
+import threading
+from bisect import bisect_right, insort
+from dataclasses import replace
+from datetime import datetime, timezone
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+from application.pagination import PagePosition, page_position
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from application.dtos.order_summary_dtos import CustomerSummaryDTO, OrdersOverviewDTO, SummaryConsistencyReportDTO
+from application.ports.event_bus import EventBus
+from application.ports.order_summary_reader import OrderSummaryReader
+from application.ports.unit_of_work import UnitOfWork
+from domain.events.domain_event import DomainEvent
+from domain.events.item_added import ItemAdded
+from domain.events.items_cleared import ItemsCleared
+from domain.events.order_created import OrderCreated
+from infrastructure.repositories.in_memory_order_repository import next_created_at
+
+DEFAULT_REBUILD_PAGE_SIZE = 500
+
+
+class _State:
+    """Resúmenes, agregados por cliente y globales, e índices para paginar"""
+
+    def __init__(self):
+        self.summaries: Dict[str, OrderSummaryDTO] = {}
+        self.customers: Dict[str, CustomerSummaryDTO] = {}
+        self.items_count = 0
+        self.total_amount = Decimal("0")
+        # Índices ordenados: por order_id y por fecha de alta (created_at, order_id)
+        self.by_order_id: List[str] = []
+        self.last_created_at: Optional[datetime] = None
+        self.by_created: List[tuple] = []
+        # Los mismos índices por cliente: customer_id -> (order_ids, [(created_at, order_id)])
+        self.by_customer: Dict[str, Tuple[List[str], List[tuple]]] = {}
+
+    def add(self, summary: OrderSummaryDTO, keep_sorted: bool = True) -> None:
+        """
+        Alta de una orden (evento OrderCreated o reconstrucción). Con
+        keep_sorted=False los índices se ordenan después (sort_index).
+
+        La fecha de alta es la del resumen guardado (en UTC) o, si no la trae
+        (evento o lectura por order_id), la hora actual.
+        """
+        order_id = summary.order_id
+        summary.created_at = self._created_at(summary.created_at)
+        self.summaries[order_id] = summary
+        key = (summary.created_at, order_id)
+        by_order_id, by_created = self.by_customer.setdefault(summary.customer_id, ([], []))
+        for order_ids, created in ((self.by_order_id, self.by_created), (by_order_id, by_created)):
+            if keep_sorted:
+                insort(order_ids, order_id)
+                insort(created, key)
+            else:
+                order_ids.append(order_id)
+                created.append(key)
+        customer = self.customers.get(summary.customer_id)
+        if customer is None:
+            customer = self.customers[summary.customer_id] = CustomerSummaryDTO(summary.customer_id)
+        customer.orders_count += 1
+        self.change(summary, summary.items_count, summary.total_amount, include_order=False)
+
+    def _created_at(self, created_at: Optional[datetime]) -> datetime:
+        created_at = next_created_at(self.last_created_at) if created_at is None else _utc(created_at)
+        self.last_created_at = max(created_at, self.last_created_at or created_at)
+        return created_at
+
+    def sort_index(self) -> None:
+        self.by_order_id.sort()
+        self.by_created.sort()
+        for by_order_id, by_created in self.by_customer.values():
+            by_order_id.sort()
+            by_created.sort()
+
+    def page(self, by_order_id: List[str], by_created: List[tuple], after: Optional[PagePosition], limit: int,
+             sort: str) -> List[OrderSummaryDTO]:
+        """Página por búsqueda binaria sobre un par de índices (global o de un cliente)"""
+        if sort == "created_at":
+            start = 0 if after is None else bisect_right(by_created, _utc_position(after))
+            order_ids = [order_id for _, order_id in by_created[start:start + limit]]
+        else:
+            start = 0 if after is None else bisect_right(by_order_id, after)
+            order_ids = by_order_id[start:start + limit]
+        return [replace(self.summaries[order_id]) for order_id in order_ids]
+
+    def change(self, summary: OrderSummaryDTO, items: int, amount: Decimal, include_order: bool = True) -> None:
+        """Suma (o resta) líneas e importe a la orden, a su cliente y al total"""
+        if include_order:
+            summary.items_count += items
+            summary.total_amount += amount
+        customer = self.customers[summary.customer_id]
+        customer.items_count += items
+        customer.total_amount += amount
+        self.items_count += items
+        self.total_amount += amount
+
+
+def _utc(created_at: datetime) -> datetime:
+    # SQLite devuelve las fechas sin zona: se interpretan en UTC
+    return created_at if created_at.tzinfo is not None else created_at.replace(tzinfo=timezone.utc)
+
+
+def _utc_position(after: PagePosition) -> tuple:
+    created_at, order_id = after
+    return (_utc(created_at), order_id)
+
+
+class OrderSummaryProjection(OrderSummaryReader):
+    """
+    Modelo de lectura de resúmenes (total y nº de líneas por orden, totales
+    por cliente y globales) actualizado con OrderCreated, ItemAdded e
+    ItemsCleared en O(1) por evento: ni los listados ni el panel recorren
+    items.
+
+    Es un OrderSummaryReader, así que ListOrdersUseCase puede leer de ella.
+    Al ser de proceso solo ve los eventos publicados en esta instancia:
+    `rebuild` la carga desde los resúmenes guardados (al arrancar o tras una
+    deriva) y `check` la compara con las órdenes guardadas. Los eventos que
+    llegan mientras se reconstruye se guardan y se incorporan al estado
+    nuevo antes de sustituir el actual, así que no se pierden.
+
+    Segura entre hilos.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = _State()
+        # Eventos recibidos durante la reconstrucción en curso (None si no hay ninguna)
+        self._rebuild_lock = threading.Lock()
+        self._buffered: Optional[List[DomainEvent]] = None
+        # Métricas
+        self.events_applied = 0
+        self.events_ignored = 0
+        self.rebuilds = 0
+
+    # --- Eventos ---
+
+    def on_event(self, event: DomainEvent) -> None:
+        """Manejador para el EventBus"""
+        with self._lock:
+            if self._buffered is not None:
+                self._buffered.append(event)
+            state = self._state
+            if isinstance(event, OrderCreated):
+                if event.order_id in state.summaries:
+                    # Ya incluida (p. ej. por una reconstrucción posterior al alta)
+                    self.events_ignored += 1
+                    return
+                state.add(OrderSummaryDTO(event.order_id, event.customer_id, 0, Decimal("0")))
+                self.events_applied += 1
+                return
+
+            summary = state.summaries.get(event.order_id)
+            if summary is None:
+                # Orden anterior a la proyección: la recupera rebuild
+                self.events_ignored += 1
+                return
+            if isinstance(event, ItemAdded):
+                state.change(summary, 1, Decimal(str(event.price)) * event.quantity)
+            elif isinstance(event, ItemsCleared):
+                state.change(summary, -summary.items_count, -summary.total_amount)
+            self.events_applied += 1
+
+    def subscribe_to(self, event_bus: EventBus) -> None:
+        """Suscribe la proyección a los eventos que cambian totales"""
+        for event_type in (OrderCreated, ItemAdded, ItemsCleared):
+            event_bus.subscribe(event_type, self.on_event)
+
+    # --- Lecturas ---
+
+    def list_summaries(self, after: Optional[PagePosition], limit: int,
+                       sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """Página de resúmenes por búsqueda binaria sobre el índice ordenado"""
+        with self._lock:
+            state = self._state
+            return state.page(state.by_order_id, state.by_created, after, limit, sort)
+
+    def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """Página de las órdenes de un cliente sobre sus propios índices"""
+        with self._lock:
+            state = self._state
+            by_order_id, by_created = state.by_customer.get(customer_id, ([], []))
+            return state.page(by_order_id, by_created, after, limit, sort)
+
+    def get_summary(self, order_id: str) -> Optional[OrderSummaryDTO]:
+        with self._lock:
+            summary = self._state.summaries.get(order_id)
+            return replace(summary) if summary is not None else None
+
+    def get_customer_summary(self, customer_id: str) -> Optional[CustomerSummaryDTO]:
+        with self._lock:
+            customer = self._state.customers.get(customer_id)
+            return replace(customer) if customer is not None else None
+
+    def overview(self) -> OrdersOverviewDTO:
+        """Totales globales (O(1))"""
+        with self._lock:
+            state = self._state
+            return OrdersOverviewDTO(
+                orders_count=len(state.summaries),
+                items_count=state.items_count,
+                total_amount=state.total_amount,
+                customers_count=len(state.customers),
+            )
+
+    # --- Mantenimiento ---
+
+    def rebuild(self, uow: UnitOfWork, sort: str = "created_at", page_size: int = DEFAULT_REBUILD_PAGE_SIZE) -> int:
+        """
+        Reconstruye la proyección desde los resúmenes guardados (uow.summaries,
+        por páginas y sin leer items) y la sustituye de una vez.
+
+        Mientras se leen las páginas los eventos siguen actualizando el estado
+        actual y además se guardan. Antes de la sustitución, y con el cerrojo
+        tomado para que no lleguen más, las órdenes de esos eventos se releen
+        (uow.orders) y se llevan al estado nuevo. No se reproducen sus deltas:
+        una página leída después del commit ya incluiría el cambio y se
+        contaría dos veces. Como el evento se publica tras el commit, la
+        relectura incluye todos los cambios guardados.
+
+        :param sort: Orden de lectura; determina el orden de alta de la
+            proyección ("order_id" si el almacén no pagina por created_at).
+        :return: Número de órdenes cargadas.
+        """
+        with self._rebuild_lock:
+            with self._lock:
+                self._buffered = []
+            try:
+                state = _State()
+                after = None
+                with uow:
+                    while True:
+                        page = uow.summaries.list_summaries(after, page_size, sort)
+                        for summary in page:
+                            summary = replace(summary, total_amount=Decimal(str(summary.total_amount)))
+                            state.add(summary, keep_sorted=False)
+                        if len(page) < page_size:
+                            break
+                        after = page_position(sort, page[-1])
+                state.sort_index()
+
+                with self._lock:
+                    touched = list(dict.fromkeys(event.order_id for event in self._buffered))
+                    if touched:
+                        with uow:
+                            for order_id in touched:
+                                self._refresh(state, order_id, uow.orders.get(order_id))
+                    self._state = state
+                    self.rebuilds += 1
+                    return len(state.summaries)
+            finally:
+                with self._lock:
+                    self._buffered = None
+
+    @staticmethod
+    def _refresh(state: _State, order_id: str, order) -> None:
+        """Lleva al estado los totales actuales de una orden guardada"""
+        if order is None:
+            return
+        items_count = len(order.items)
+        total_amount = sum((price.amount * quantity.amount for _, quantity, price in order.items), Decimal("0"))
+        summary = state.summaries.get(order_id)
+        if summary is None:
+            state.add(OrderSummaryDTO(order_id, order.customer_id, items_count, total_amount))
+        else:
+            state.change(summary, items_count - summary.items_count, total_amount - summary.total_amount)
+
+    def check(self, uow: UnitOfWork, page_size: int = DEFAULT_REBUILD_PAGE_SIZE) -> SummaryConsistencyReportDTO:
+        """
+        Compara la proyección con los totales recalculados desde los items de
+        las órdenes guardadas (uow.orders, por páginas). No modifica nada.
+        """
+        report = SummaryConsistencyReportDTO()
+        seen = set()
+        after = None
+        with uow:
+            while True:
+                orders = uow.orders.get_page(after, page_size, "order_id")
+                for order in orders:
+                    order_id = order.order_id.code
+                    seen.add(order_id)
+                    report.checked += 1
+                    projected = self.get_summary(order_id)
+                    if projected is None:
+                        report.missing.append(order_id)
+                        continue
+                    total = sum((price.amount * quantity.amount for _, quantity, price in order.items), Decimal("0"))
+                    if (projected.customer_id, projected.items_count, projected.total_amount) != \
+                            (order.customer_id, len(order.items), total):
+                        report.mismatched.append(order_id)
+                if len(orders) < page_size:
+                    break
+                after = orders[-1].order_id.code
+
+        with self._lock:
+            report.unexpected = [order_id for order_id in self._state.by_order_id if order_id not in seen]
+        return report
+
+    def status(self) -> dict:
+        """Métricas de la proyección"""
+        with self._lock:
+            return {
+                "orders": len(self._state.summaries),
+                "customers": len(self._state.customers),
+                "events_applied": self.events_applied,
+                "events_ignored": self.events_ignored,
+                "rebuilds": self.rebuilds,
+            }
@@ -0,0 +1,59 @@
+"""
+Upsert de cabeceras de órdenes: INSERT ... ON CONFLICT (order_id) DO UPDATE.
+
+Compartido por los repositorios síncrono y asíncrono. PostgreSQL y SQLite
+(>= 3.35, usado en tests) admiten la misma sintaxis, incluido RETURNING.
+"""
+from typing import List
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects import postgresql, sqlite
+from domain.entities.order import Order
+from infrastructure.database.models.order_model import OrderModel
+
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Expresión de RETURNING que indica si la fila se insertó (y no se sobrescribió).
+# En PostgreSQL una fila recién insertada tiene xmax = 0. SQLite no tiene xmax,
+# pero el DO UPDATE siempre deja version >= 2, así que version 1 es un INSERT.
+_INSERTED_BY_DIALECT = {
+    "postgresql": literal_column("xmax") == 0,
+    "sqlite": OrderModel.version == 1,
+}
+
+
+def unique_orders(orders: List[Order]) -> List[Order]:
+    """
+    Quita del lote las órdenes con order_id repetido: gana la última.
+
+    Un mismo INSERT ... ON CONFLICT no puede tocar dos veces la misma fila
+    (PostgreSQL falla con "command cannot affect row a second time").
+    """
+    return list({order.order_id.code: order for order in orders}.values())
+
+
+def upsert_orders_statement(dialect_name: str):
+    """
+    Construye el upsert de cabeceras para el dialecto indicado.
+
+    Si la orden ya existe se sobrescriben sus columnas y se incrementa su
+    versión. Devuelve (order_id, version, inserted) por fila: inserted es
+    falso si se sobrescribió una orden existente. Las filas del lote deben
+    tener order_id distintos (ver unique_orders).
+    """
+    insert = _INSERT_BY_DIALECT.get(dialect_name, postgresql.insert)
+    inserted = _INSERTED_BY_DIALECT.get(dialect_name, _INSERTED_BY_DIALECT["postgresql"])
+    statement = insert(OrderModel)
+    return statement.on_conflict_do_update(
+        index_elements=[OrderModel.order_id],
+        set_={
+            "customer_id": statement.excluded.customer_id,
+            "total_amount": statement.excluded.total_amount,
+            "currency": statement.excluded.currency,
+            "items_count": statement.excluded.items_count,
+            "version": OrderModel.version + 1,
+            "updated_at": func.now(),
+        }
+    ).returning(OrderModel.order_id, OrderModel.version, inserted.label("inserted"))
@@ -0,0 +1,274 @@
+"""
+Implementación asíncrona de OrderRepository usando PostgreSQL (SQLAlchemy asyncio)
+"""
+
+from collections import defaultdict
+from typing import Dict, Optional, List
+from application.pagination import PagePosition
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from application.ports.async_order_repository import AsyncOrderRepository
+from application.ports.order_repository import ConcurrencyConflictError
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.repositories.order_model_mapper import model_to_entity, order_to_row, item_to_row, order_totals
+from infrastructure.repositories.order_upsert import unique_orders, upsert_orders_statement
+from infrastructure.repositories.order_core_reader import async_fetch_order
+from infrastructure.database.archive import async_fetch_archived_order
+
+
+class AsyncPostgreSQLOrderRepository(AsyncOrderRepository):
+    """
+    Implementación asíncrona de OrderRepository con AsyncSession.
+
+    Mismo modelo de datos que PostgreSQLOrderRepository. Los items se cargan
+    siempre con consultas explícitas: en asyncio no hay lazy loading.
+    Solo hace flush: la transacción la confirma el Unit of Work.
+    Con core_reads=True, get usa la ruta rápida de order_core_reader y con
+    archive_reads=True recurre a orders_archive si la orden no está.
+    """
+    
+    def __init__(self, db_session: AsyncSession, core_reads: bool = False, archive_reads: bool = False):
+        self.db_session = db_session
+        self.core_reads = core_reads
+        self.archive_reads = archive_reads
+    
+    async def save(self, order: Order) -> None:
+        """
+        Guarda una orden. Las órdenes cargadas desde la base de datos solo
+        insertan sus items nuevos y actualizan los totales con un UPDATE
+        condicional a su versión.
+
+        :raises ConcurrencyConflictError: Si otra transacción modificó la orden.
+        """
+        order_id_str = order.order_id.code
+
+        if order.is_persisted:
+            item_rows, version = await self._write_changes(order)
+            if item_rows:
+                await self.db_session.execute(insert(OrderItemModel), item_rows)
+        else:
+            # Escritura completa sin consultar antes si la orden existe
+            version = (await self._upsert_orders([order]))[order_id_str]
+
+        # Enviar cambios a la transacción; el commit es cosa del Unit of Work
+        await self.db_session.flush()
+        order.mark_persisted(version)
+    
+    async def save_many(self, orders: List[Order]) -> None:
+        """
+        Guarda varias órdenes en una sola transacción: las nuevas con un
+        upsert multi-fila de cabeceras y un INSERT multi-fila de items, las
+        persistidas con su INSERT de items nuevos y el UPDATE de totales
+        """
+        versions = {}
+        new_orders, item_rows = [], []
+        for order in orders:
+            if order.is_persisted:
+                rows, versions[order.order_id.code] = await self._write_changes(order)
+                item_rows.extend(rows)
+            else:
+                new_orders.append(order)
+        versions.update(await self._upsert_orders(new_orders))
+        if item_rows:
+            await self.db_session.execute(insert(OrderItemModel), item_rows)
+
+        await self.db_session.flush()
+        for order in orders:
+            order.mark_persisted(versions[order.order_id.code])
+
+    async def _upsert_orders(self, orders: List[Order]) -> Dict[str, int]:
+        """
+        Escribe órdenes completas (cabecera e items) con un upsert multi-fila
+        de cabeceras, el borrado de items de las que ya existían y un INSERT
+        multi-fila de items. Igual que en PostgreSQLOrderRepository.
+
+        :return: Versión de cada orden tras guardar, por order_id.
+        """
+        if not orders:
+            return {}
+
+        orders = unique_orders(orders)
+        result = await self.db_session.execute(
+            upsert_orders_statement(self.db_session.get_bind().dialect.name),
+            [order_to_row(order) for order in orders]
+        )
+        versions, overwritten = {}, []
+        for order_id, version, inserted in result.all():
+            versions[order_id] = version
+            if not inserted:
+                overwritten.append(order_id)
+        if overwritten:
+            await self.db_session.execute(
+                delete(OrderItemModel).where(OrderItemModel.order_id.in_(overwritten))
+            )
+
+        item_rows = [item_to_row(order.order_id.code, item) for order in orders for item in order.items]
+        if item_rows:
+            await self.db_session.execute(insert(OrderItemModel), item_rows)
+        return versions
+
+    async def _write_changes(self, order: Order) -> tuple:
+        """
+        Aplica los cambios de una orden cargada desde la base de datos salvo
+        el INSERT de items, cuyas filas devuelve para poder agruparlas.
+
+        La cabecera se actualiza con un UPDATE condicional a la versión
+        cargada. Si el carrito se vació se borran los items guardados y los
+        totales se recalculan; si no, se incrementan con los items nuevos.
+
+        :return: (filas de items a insertar, versión tras guardar)
+        :raises ConcurrencyConflictError: Si la versión ya no coincide.
+        """
+        order_id_str = order.order_id.code
+        if order.items_cleared:
+            items = order.items
+            total, lines = order_totals(items)
+            values = {"total_amount": float(total), "items_count": lines}
+        else:
+            items = order.new_items
+            if not items:
+                return [], order.version
+            delta, added_lines = order_totals(items)
+            values = {
+                "total_amount": OrderModel.total_amount + float(delta),
+                "items_count": OrderModel.items_count + added_lines,
+            }
+
+        result = await self.db_session.execute(
+            update(OrderModel)
+            .where(OrderModel.order_id == order_id_str, OrderModel.version == order.version)
+            .values(version=OrderModel.version + 1, **values)
+            .execution_options(synchronize_session="fetch")
+        )
+        if result.rowcount != 1:
+            raise ConcurrencyConflictError(order_id_str, order.version)
+
+        if order.items_cleared:
+            await self.db_session.execute(
+                delete(OrderItemModel).where(OrderItemModel.order_id == order_id_str)
+            )
+        return [item_to_row(order_id_str, item) for item in items], order.version + 1
+
+    async def get(self, order_id: OrderId) -> Optional[Order]:
+        """
+        Obtiene una orden por ID
+        """
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        if self.core_reads:
+            order = await async_fetch_order(await self.db_session.connection(), order_id_str)
+        else:
+            order = await self._get_model(order_id_str)
+
+        if order is None and self.archive_reads:
+            # No está en la tabla caliente: puede estar archivada
+            return await async_fetch_archived_order(await self.db_session.connection(), order_id_str)
+        return order
+
+    async def _get_model(self, order_id_str: str) -> Optional[Order]:
+        """get por la ruta ORM: cabecera y una consulta para sus items"""
+        result = await self.db_session.execute(
+            select(OrderModel).where(OrderModel.order_id == order_id_str)
+        )
+        order_model = result.scalar_one_or_none()
+        if not order_model:
+            return None
+
+        items_by_order = await self._load_items_by_order([order_id_str])
+        return model_to_entity(order_model, items_by_order.get(order_id_str, []))
+    
+    async def get_version(self, order_id: OrderId) -> Optional[int]:
+        """
+        Versión de la orden con una consulta por clave primaria, sin leer sus items
+        """
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        result = await self.db_session.execute(
+            select(OrderModel.version).where(OrderModel.order_id == order_id_str)
+        )
+        version = result.scalar()
+
+        if version is None and self.archive_reads:
+            archived = await async_fetch_archived_order(await self.db_session.connection(), order_id_str)
+            return archived.version if archived is not None else None
+        return version
+
+    async def get_for_update(self, order_id: OrderId) -> Optional[Order]:
+        """
+        Obtiene una orden bloqueando su fila hasta el final de la transacción
+        (SELECT ... FOR UPDATE), alternativa pesimista al control de versión
+        """
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+
+        result = await self.db_session.execute(
+            select(OrderModel).where(OrderModel.order_id == order_id_str).with_for_update()
+        )
+        order_model = result.scalar_one_or_none()
+        if not order_model:
+            return None
+
+        items_by_order = await self._load_items_by_order([order_id_str])
+        return model_to_entity(order_model, items_by_order.get(order_id_str, []))
+
+    async def get_all(self) -> List[Order]:
+        """
+        Obtiene todas las órdenes (dos consultas en total)
+        """
+        result = await self.db_session.execute(select(OrderModel))
+        order_models = result.scalars().all()
+        items_by_order = await self._load_items_by_order()
+
+        return [
+            model_to_entity(model, items_by_order.get(model.order_id, []))
+            for model in order_models
+        ]
+
+    async def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        """
+        Obtiene una página de órdenes con paginación keyset
+        """
+        result = await self.db_session.execute(
+            apply_keyset(select(OrderModel), after, sort).limit(limit)
+        )
+        order_models = result.scalars().all()
+        if not order_models:
+            return []
+
+        items_by_order = await self._load_items_by_order([model.order_id for model in order_models])
+        return [
+            model_to_entity(model, items_by_order.get(model.order_id, []))
+            for model in order_models
+        ]
+    
+    async def delete(self, order_id: OrderId) -> bool:
+        """
+        Elimina una orden por ID junto con sus items
+        """
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+
+        await self.db_session.execute(
+            delete(OrderItemModel).where(OrderItemModel.order_id == order_id_str)
+        )
+        result = await self.db_session.execute(
+            delete(OrderModel).where(OrderModel.order_id == order_id_str)
+        )
+
+        await self.db_session.flush()
+        return result.rowcount > 0
+
+    async def _load_items_by_order(self, order_ids: Optional[List[str]] = None) -> dict:
+        """
+        Carga los items agrupados por order_id con una sola consulta
+        """
+        statement = select(OrderItemModel)
+        if order_ids is not None:
+            statement = statement.where(OrderItemModel.order_id.in_(order_ids))
+
+        result = await self.db_session.execute(
+            statement.order_by(OrderItemModel.order_id, OrderItemModel.id)
+        )
+        items_by_order = defaultdict(list)
+        for item_model in result.scalars():
+            items_by_order[item_model.order_id].append(item_model)
+        return items_by_order
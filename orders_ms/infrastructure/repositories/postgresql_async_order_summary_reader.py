@@ -0,0 +1,39 @@
+"""
+Implementación asíncrona de OrderSummaryReader usando PostgreSQL
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from sqlalchemy.ext.asyncio import AsyncSession
+from application.ports.async_order_summary_reader import AsyncOrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.database.models.order_model import OrderModel
+from infrastructure.repositories.postgresql_order_summary_reader import summary_columns, summary_from_row
+
+
+class AsyncPostgreSQLOrderSummaryReader(AsyncOrderSummaryReader):
+    """
+    Lee los resúmenes desde las columnas denormalizadas de `orders`
+    sin tocar `order_items`.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def list_summaries(self, after: Optional[PagePosition], limit: int,
+                             sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """
+        Obtiene una página de resúmenes con una única consulta de rango
+        """
+        result = await self.db_session.execute(apply_keyset(summary_columns(sort), after, sort).limit(limit))
+        return [summary_from_row(row) for row in result]
+
+    async def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                      sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """
+        Obtiene una página de las órdenes de un cliente (recorrido de rango
+        sobre los índices de cliente)
+        """
+        statement = summary_columns(sort).where(OrderModel.customer_id == customer_id)
+        result = await self.db_session.execute(apply_keyset(statement, after, sort).limit(limit))
+        return [summary_from_row(row) for row in result]
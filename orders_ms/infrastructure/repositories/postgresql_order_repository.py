@@ -2,79 +2,184 @@
 Implementación de OrderRepository usando PostgreSQL
 """
 
-from typing import Optional, List
+from collections import defaultdict
+from typing import Dict, Optional, List
+from application.pagination import PagePosition
+from sqlalchemy import delete, insert, select, update
 from sqlalchemy.orm import Session
-from application.ports.order_repository import OrderRepository
+from application.ports.order_repository import ConcurrencyConflictError, OrderRepository
 from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
-from domain.value_objects.sku import SKU
-from domain.value_objects.price import Price
-from domain.value_objects.quantity import Quantity
 from infrastructure.database.models.order_model import OrderModel, OrderItemModel
 from infrastructure.database.connection import get_db
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.repositories.order_model_mapper import model_to_entity, order_to_row, item_to_row, order_totals
+from infrastructure.repositories.order_upsert import unique_orders, upsert_orders_statement
+from infrastructure.repositories.order_core_reader import fetch_order
+from infrastructure.database.archive import fetch_archived_order
 
 
 class PostgreSQLOrderRepository(OrderRepository):
     """
-    Implementación de OrderRepository usando PostgreSQL con SQLAlchemy
+    Implementación de OrderRepository usando PostgreSQL con SQLAlchemy.
+
+    Solo hace flush: la transacción la confirma el Unit of Work. Las órdenes
+    cargadas se guardan con control optimista sobre la columna version.
+
+    Con core_reads=True, get usa la ruta rápida de order_core_reader (Core,
+    una consulta). Pensado para lecturas de solo lectura: no pasa por el
+    identity map ni hace autoflush.
+
+    Con archive_reads=True, get busca en orders_archive las órdenes que no
+    están en la tabla caliente (ver archive.py). Solo para lecturas: las
+    órdenes archivadas no se pueden modificar.
     """
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: Session, core_reads: bool = False, archive_reads: bool = False):
         self.db_session = db_session
+        self.core_reads = core_reads
+        self.archive_reads = archive_reads
     
     def save(self, order: Order) -> None:
         """
-        Guarda una orden en PostgreSQL
+        Guarda una orden en PostgreSQL.
+
+        Si la orden se cargó desde la base de datos solo se insertan los items
+        nuevos y se actualizan los totales con un único UPDATE, de modo que el
+        número de sentencias no depende del tamaño del carrito.
+
+        :raises ConcurrencyConflictError: Si otra transacción modificó la orden
+            desde que se cargó (su versión ya no coincide).
+        """
+        if order.is_persisted:
+            version = self._write_changes(order)
+        else:
+            version = self._save_full(order)
+
+        # Enviar cambios a la transacción; el commit es cosa del Unit of Work
+        self.db_session.flush()
+        order.mark_persisted(version)
+
+    def save_many(self, orders: List[Order]) -> None:
         """
-        # Buscar si ya existe
-        existing_order = self.db_session.query(OrderModel).filter(
-            OrderModel.order_id == order.order_id.code
-        ).first()
-        
-        if existing_order:
-            # Actualizar orden existente
-            # Calcular total usando la misma lógica que GetOrderUseCase
-            total = sum(item[2].amount * item[1].amount for item in order.items)
-            existing_order.total_amount = float(total)
-            existing_order.items_count = len(order.items)
-            
-            # Eliminar items existentes y agregar los nuevos
-            self.db_session.query(OrderItemModel).filter(
-                OrderItemModel.order_id == order.order_id.code
-            ).delete()
-            
+        Guarda varias órdenes en una sola transacción.
+
+        Las órdenes nuevas se escriben con un upsert multi-fila de cabeceras y
+        un INSERT multi-fila de items, sea cual sea el tamaño del lote. Las ya
+        persistidas solo añaden sus items nuevos, como en save.
+        """
+        versions = {}
+        new_orders = []
+        for order in orders:
+            if order.is_persisted:
+                versions[order.order_id.code] = self._write_changes(order)
+            else:
+                new_orders.append(order)
+        versions.update(self._upsert_orders(new_orders))
+
+        # Todo el lote en la transacción del Unit of Work
+        self.db_session.flush()
+        for order in orders:
+            order.mark_persisted(versions[order.order_id.code])
+
+    def _upsert_orders(self, orders: List[Order]) -> Dict[str, int]:
+        """
+        Escribe órdenes completas (cabecera e items) sin consultar antes si existen.
+
+        Las cabeceras se escriben con un único INSERT ... ON CONFLICT DO UPDATE
+        (multi-fila). Solo si alguna ya existía (RETURNING lo indica) se borran
+        sus items anteriores, y después se insertan todos los items con un
+        INSERT multi-fila. Si el lote repite un order_id se guarda la última.
+
+        :return: Versión de cada orden tras guardar, por order_id.
+        """
+        if not orders:
+            return {}
+
+        orders = unique_orders(orders)
+        result = self.db_session.execute(
+            upsert_orders_statement(self.db_session.get_bind().dialect.name),
+            [order_to_row(order) for order in orders]
+        )
+        versions, overwritten = {}, []
+        for order_id, version, inserted in result.all():
+            versions[order_id] = version
+            if not inserted:
+                overwritten.append(order_id)
+        if overwritten:
+            self.db_session.execute(
+                delete(OrderItemModel).where(OrderItemModel.order_id.in_(overwritten))
+            )
+
+        item_rows = [item_to_row(order.order_id.code, item) for order in orders for item in order.items]
+        if item_rows:
+            self.db_session.execute(insert(OrderItemModel), item_rows)
+        return versions
+
+    def _write_changes(self, order: Order) -> int:
+        """
+        Persiste los cambios de una orden cargada desde la base de datos.
+
+        Primero se actualiza la cabecera con un UPDATE condicional a la versión
+        cargada (que además bloquea la fila hasta el commit) y después se
+        escriben los items. Si no hay cambios no se emite ninguna sentencia.
+
+        :return: La versión de la orden tras guardar.
+        """
+        order_id_str = order.order_id.code
+        if order.items_cleared:
+            # Carrito vaciado y rellenado: totales absolutos y reemplazo de items
+            items = order.items
+            total, lines = order_totals(items)
+            self._update_header(order, total_amount=float(total), items_count=lines)
+            self.db_session.execute(
+                delete(OrderItemModel).where(OrderItemModel.order_id == order_id_str)
+            )
         else:
-            # Crear nueva orden
-            # Calcular total y obtener currency de los items
-            total = sum(item[2].amount * item[1].amount for item in order.items) if order.items else 0.0
-            currency = order.items[0][2].currency if order.items else "EUR"
-            
-            existing_order = OrderModel(
-                order_id=order.order_id.code,
-                customer_id=order.customer_id,
-                total_amount=float(total),
-                currency=currency,
-                items_count=len(order.items)
+            # Solo items nuevos: totales incrementales
+            items = order.new_items
+            if not items:
+                return order.version
+            delta, added_lines = order_totals(items)
+            self._update_header(
+                order,
+                total_amount=OrderModel.total_amount + float(delta),
+                items_count=OrderModel.items_count + added_lines
             )
-            self.db_session.add(existing_order)
-        
-        # Agregar items
-        for item in order.items:
-            # item es una tupla (sku, quantity, price)
-            sku, quantity, price = item
-            subtotal = price.amount * quantity.amount
-            
-            item_model = OrderItemModel(
-                order_id=order.order_id.code,
-                sku=sku.code,
-                quantity=quantity.amount,
-                price=float(price.amount),
-                subtotal=float(subtotal)
+
+        if items:
+            self.db_session.execute(
+                insert(OrderItemModel),
+                [item_to_row(order_id_str, item) for item in items]
             )
-            self.db_session.add(item_model)
-        
-        # Confirmar cambios
-        self.db_session.commit()
+        return order.version + 1
+
+    def _update_header(self, order: Order, **values) -> None:
+        """
+        UPDATE ... WHERE version = <versión cargada> que incrementa la versión.
+
+        synchronize_session="fetch" refresca (vía RETURNING) la cabecera si ya
+        está en la sesión, para que un get posterior vea la versión nueva.
+
+        :raises ConcurrencyConflictError: Si no se actualizó ninguna fila.
+        """
+        result = self.db_session.execute(
+            update(OrderModel)
+            .where(OrderModel.order_id == order.order_id.code, OrderModel.version == order.version)
+            .values(version=OrderModel.version + 1, **values)
+            .execution_options(synchronize_session="fetch")
+        )
+        if result.rowcount != 1:
+            raise ConcurrencyConflictError(order.order_id.code, order.version)
+
+    def _save_full(self, order: Order) -> int:
+        """
+        Escribe la orden completa (cabecera e items). Se usa para órdenes que
+        no se cargaron desde el repositorio, así que no hay versión que comprobar.
+
+        :return: La versión de la orden tras guardar.
+        """
+        return self._upsert_orders([order])[order.order_id.code]
     
     def get(self, order_id: OrderId) -> Optional[Order]:
         """
@@ -82,23 +187,84 @@ class PostgreSQLOrderRepository(OrderRepository):
         """
         # Determinar si order_id es string o OrderId
         order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
-        
+        if self.core_reads:
+            order = fetch_order(self.db_session.connection(), order_id_str)
+        else:
+            order_model = self.db_session.query(OrderModel).filter(
+                OrderModel.order_id == order_id_str
+            ).first()
+            # Convertir modelo a entidad de dominio
+            order = self._model_to_entity(order_model) if order_model else None
+
+        if order is None and self.archive_reads:
+            # No está en la tabla caliente: puede estar archivada
+            return fetch_archived_order(self.db_session.connection(), order_id_str)
+        return order
+
+    def get_version(self, order_id: OrderId) -> Optional[int]:
+        """
+        Versión de la orden con una consulta por clave primaria, sin leer sus items
+        """
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        version = self.db_session.execute(
+            select(OrderModel.version).where(OrderModel.order_id == order_id_str)
+        ).scalar()
+
+        if version is None and self.archive_reads:
+            # Las órdenes archivadas no cambian: su versión es la del documento
+            archived = fetch_archived_order(self.db_session.connection(), order_id_str)
+            return archived.version if archived is not None else None
+        return version
+
+    def get_for_update(self, order_id: OrderId) -> Optional[Order]:
+        """
+        Obtiene una orden bloqueando su fila hasta el final de la transacción
+        (SELECT ... FOR UPDATE). Alternativa pesimista al control de versión:
+        las escrituras concurrentes sobre la misma orden esperan en lugar de
+        fallar con ConcurrencyConflictError.
+        """
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+
         order_model = self.db_session.query(OrderModel).filter(
             OrderModel.order_id == order_id_str
-        ).first()
-        
+        ).with_for_update().first()
+
         if not order_model:
             return None
-        
-        # Convertir modelo a entidad de dominio
         return self._model_to_entity(order_model)
     
     def get_all(self) -> List[Order]:
         """
-        Obtiene todas las órdenes desde PostgreSQL
+        Obtiene todas las órdenes desde PostgreSQL.
+
+        Carga cabeceras e items con dos consultas en total (sin lazy loading
+        por orden), independientemente del número de órdenes.
         """
         order_models = self.db_session.query(OrderModel).all()
-        return [self._model_to_entity(model) for model in order_models]
+        items_by_order = self._load_items_by_order()
+
+        return [
+            self._model_to_entity(model, items_by_order.get(model.order_id, []))
+            for model in order_models
+        ]
+
+    def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        """
+        Obtiene una página de órdenes con paginación keyset.
+
+        Cada página es un rango sobre el índice de order_id (o de
+        (created_at, order_id)), sin OFFSET, más una consulta IN para los items.
+        """
+        query = apply_keyset(self.db_session.query(OrderModel), after, sort)
+        order_models = query.limit(limit).all()
+        if not order_models:
+            return []
+
+        items_by_order = self._load_items_by_order([model.order_id for model in order_models])
+        return [
+            self._model_to_entity(model, items_by_order.get(model.order_id, []))
+            for model in order_models
+        ]
     
     def delete(self, order_id: OrderId) -> bool:
         """
@@ -116,28 +282,31 @@ class PostgreSQLOrderRepository(OrderRepository):
             OrderItemModel.order_id == order_id_str
         ).delete()
         
-        self.db_session.commit()
+        self.db_session.flush()
         return deleted_count > 0
     
-    def _model_to_entity(self, order_model: OrderModel) -> Order:
+    def _load_items_by_order(self, order_ids: Optional[List[str]] = None) -> dict:
         """
-        Convierte un OrderModel a una entidad Order de dominio
+        Carga los items agrupados por order_id con una sola consulta.
+
+        :param order_ids: Limitar a estas órdenes; None para cargar todos los items.
         """
-        # Crear la orden sin items primero
-        order = Order(
-            order_id=OrderId(order_model.order_id),
-            customer_id=order_model.customer_id
-        )
-        
-        # Agregar items
-        for item_model in order_model.items:
-            order.add_item(
-                sku=SKU(item_model.sku),
-                quantity=Quantity(item_model.quantity),
-                price=Price(
-                    amount=float(item_model.price),
-                    currency=order_model.currency
-                )
-            )
-        
-        return order
\ No newline at end of file
+        query = self.db_session.query(OrderItemModel)
+        if order_ids is not None:
+            query = query.filter(OrderItemModel.order_id.in_(order_ids))
+
+        items_by_order = defaultdict(list)
+        for item_model in query.order_by(OrderItemModel.order_id, OrderItemModel.id):
+            items_by_order[item_model.order_id].append(item_model)
+        return items_by_order
+
+    def _model_to_entity(self, order_model: OrderModel, item_models: Optional[List[OrderItemModel]] = None) -> Order:
+        """
+        Convierte un OrderModel a una entidad Order de dominio.
+
+        Si no se pasan item_models se usa la relación order_model.items.
+        """
+        if item_models is None:
+            item_models = order_model.items
+
+        return model_to_entity(order_model, item_models)
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Implementación de OrderSummaryReader usando PostgreSQL
+"""
+from typing import List, Optional
+from application.pagination import PagePosition
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from application.ports.order_summary_reader import OrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.database.keyset import apply_keyset
+from infrastructure.database.models.order_model import OrderModel
+
+# Columnas del resumen: las que incluyen los índices por cliente
+SUMMARY_COLUMNS = select(
+    OrderModel.order_id,
+    OrderModel.customer_id,
+    OrderModel.items_count,
+    OrderModel.total_amount
+)
+
+
+def summary_columns(sort: str, columns=SUMMARY_COLUMNS, model=OrderModel):
+    """
+    Columnas del resumen para una página: con sort="created_at" se añade
+    created_at, que el cursor necesita (por order_id no se lee y el índice
+    por cliente sigue cubriendo la consulta)
+    """
+    return columns.add_columns(model.created_at) if sort == "created_at" else columns
+
+
+def summary_from_row(row) -> OrderSummaryDTO:
+    return OrderSummaryDTO(
+        order_id=row.order_id,
+        customer_id=row.customer_id,
+        items_count=row.items_count,
+        total_amount=row.total_amount,
+        created_at=row._mapping.get("created_at")
+    )
+
+
+class PostgreSQLOrderSummaryReader(OrderSummaryReader):
+    """
+    Lee los resúmenes desde las columnas denormalizadas de `orders`
+    (total_amount, items_count) sin tocar `order_items`.
+    """
+
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def list_summaries(self, after: Optional[PagePosition], limit: int,
+                       sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """
+        Obtiene una página de resúmenes con una única consulta de rango
+        """
+        statement = apply_keyset(summary_columns(sort), after, sort).limit(limit)
+        return [summary_from_row(row) for row in self.db_session.execute(statement)]
+
+    def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """
+        Obtiene una página de las órdenes de un cliente con un recorrido de
+        rango sobre los índices de cliente, que incluyen las columnas del
+        resumen (index-only scan en PostgreSQL)
+        """
+        statement = summary_columns(sort).where(OrderModel.customer_id == customer_id)
+        statement = apply_keyset(statement, after, sort).limit(limit)
+        return [summary_from_row(row) for row in self.db_session.execute(statement)]
@@ -0,0 +1,53 @@
+"""
+Repositorio asíncrono de órdenes repartido entre varios shards.
+"""
+import asyncio
+import heapq
+from collections import defaultdict
+from itertools import islice
+from typing import List, Optional
+from application.pagination import PagePosition
+from domain.entities.order import Order
+from application.ports.async_order_repository import AsyncOrderRepository
+from infrastructure.database.sharding import shard_index
+from infrastructure.repositories.sharded_order_repository import order_code, require_order_id_sort
+
+
+class AsyncShardedOrderRepository(AsyncOrderRepository):
+    """
+    Variante asíncrona de ShardedOrderRepository: el scatter-gather se hace
+    con asyncio.gather (una AsyncSession por shard).
+    """
+
+    def __init__(self, shards: List[AsyncOrderRepository]):
+        self.shards = shards
+
+    def shard_for(self, order_id) -> AsyncOrderRepository:
+        return self.shards[shard_index(order_code(order_id), len(self.shards))]
+
+    async def save(self, order: Order) -> Order:
+        return await self.shard_for(order.order_id).save(order)
+
+    async def save_many(self, orders: List[Order]) -> None:
+        by_shard = defaultdict(list)
+        for order in orders:
+            by_shard[shard_index(order.order_id.code, len(self.shards))].append(order)
+        await asyncio.gather(*(self.shards[index].save_many(batch) for index, batch in by_shard.items()))
+
+    async def get(self, order_id) -> Optional[Order]:
+        return await self.shard_for(order_id).get(order_id)
+
+    async def get_version(self, order_id) -> Optional[int]:
+        return await self.shard_for(order_id).get_version(order_id)
+
+    async def delete(self, order_id) -> None:
+        return await self.shard_for(order_id).delete(order_id)
+
+    async def get_all(self) -> List[Order]:
+        results = await asyncio.gather(*(shard.get_all() for shard in self.shards))
+        return sorted((order for orders in results for order in orders), key=lambda order: order.order_id.code)
+
+    async def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        require_order_id_sort(sort)
+        pages = await asyncio.gather(*(shard.get_page(after, limit, sort) for shard in self.shards))
+        return list(islice(heapq.merge(*pages, key=lambda order: order.order_id.code), limit))
@@ -0,0 +1,32 @@
+"""
+Lector asíncrono de resúmenes de órdenes repartido entre varios shards.
+"""
+import asyncio
+import heapq
+from itertools import islice
+from typing import List, Optional
+from application.pagination import PagePosition
+from application.ports.async_order_summary_reader import AsyncOrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.repositories.sharded_order_repository import require_order_id_sort
+
+
+class AsyncShardedOrderSummaryReader(AsyncOrderSummaryReader):
+    """Variante asíncrona de ShardedOrderSummaryReader (asyncio.gather)"""
+
+    def __init__(self, shards: List[AsyncOrderSummaryReader]):
+        self.shards = shards
+
+    async def list_summaries(self, after: Optional[PagePosition], limit: int,
+                             sort: str = "order_id") -> List[OrderSummaryDTO]:
+        require_order_id_sort(sort)
+        pages = await asyncio.gather(*(shard.list_summaries(after, limit, sort) for shard in self.shards))
+        return list(islice(heapq.merge(*pages, key=lambda summary: summary.order_id), limit))
+
+    async def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                      sort: str = "order_id") -> List[OrderSummaryDTO]:
+        require_order_id_sort(sort)
+        pages = await asyncio.gather(
+            *(shard.list_customer_summaries(customer_id, after, limit, sort) for shard in self.shards)
+        )
+        return list(islice(heapq.merge(*pages, key=lambda summary: summary.order_id), limit))
@@ -0,0 +1,101 @@
+"""
+Repositorio de órdenes repartido entre varios shards.
+"""
+import contextvars
+import heapq
+from collections import defaultdict
+from concurrent.futures import Executor
+from itertools import islice
+from typing import Callable, List, Optional
+from application.pagination import PagePosition
+from domain.entities.order import Order
+from application.ports.order_repository import OrderRepository
+from infrastructure.database.sharding import shard_index
+
+
+def order_code(order_id) -> str:
+    """Código de una orden a partir de un OrderId o de un str"""
+    return order_id.code if hasattr(order_id, 'code') else str(order_id)
+
+
+def require_order_id_sort(sort: str) -> None:
+    """
+    Solo el orden por order_id se puede fusionar entre shards: la fusión
+    ordena por la clave de cada fila y los agregados Order no llevan
+    created_at.
+
+    :raises ValueError: Si sort no es "order_id".
+    """
+    if sort != "order_id":
+        raise ValueError("Sorting by created_at is not supported across shards")
+
+
+def scatter(shards: list, call: Callable, executor: Optional[Executor]) -> list:
+    """
+    Ejecuta `call` sobre cada shard, en paralelo si hay executor.
+
+    Cada llamada corre en una copia del contexto del que llama, de modo que
+    los hilos del executor ven sus ContextVar (token de consistencia de
+    lecturas, group commit en curso...).
+    """
+    if executor is None or len(shards) < 2:
+        return [call(shard) for shard in shards]
+    contexts = [contextvars.copy_context() for _ in shards]
+    return list(executor.map(lambda context, shard: context.run(call, shard), contexts, shards))
+
+
+class ShardedOrderRepository(OrderRepository):
+    """
+    Encamina cada orden al repositorio de su shard (shard_index de su código).
+
+    get_all y get_page consultan todos los shards a la vez (scatter-gather,
+    en el executor si se proporciona) y fusionan los resultados por order_id.
+    Cada repositorio de shard tiene su propia sesión, de modo que cada hilo
+    usa una sesión distinta.
+    """
+
+    def __init__(self, shards: List[OrderRepository], executor: Executor = None):
+        self.shards = shards
+        self._executor = executor
+
+    def shard_for(self, order_id) -> OrderRepository:
+        return self.shards[shard_index(order_code(order_id), len(self.shards))]
+
+    def save(self, order: Order) -> Order:
+        return self.shard_for(order.order_id).save(order)
+
+    def save_many(self, orders: List[Order]) -> None:
+        """Agrupa el lote por shard: un save_many por shard implicado"""
+        by_shard = defaultdict(list)
+        for order in orders:
+            by_shard[shard_index(order.order_id.code, len(self.shards))].append(order)
+        scatter(
+            list(by_shard.items()),
+            lambda entry: self.shards[entry[0]].save_many(entry[1]),
+            self._executor
+        )
+
+    def get(self, order_id) -> Optional[Order]:
+        return self.shard_for(order_id).get(order_id)
+
+    def get_version(self, order_id) -> Optional[int]:
+        return self.shard_for(order_id).get_version(order_id)
+
+    def delete(self, order_id) -> None:
+        return self.shard_for(order_id).delete(order_id)
+
+    def get_all(self) -> List[Order]:
+        """Todas las órdenes de todos los shards, ordenadas por order_id"""
+        orders = [order for shard_orders in scatter(self.shards, lambda shard: shard.get_all(), self._executor)
+                  for order in shard_orders]
+        return sorted(orders, key=lambda order: order.order_id.code)
+
+    def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        """
+        Pide `limit` órdenes a cada shard y fusiona las páginas ya ordenadas
+
+        :raises ValueError: Si sort no es "order_id".
+        """
+        require_order_id_sort(sort)
+        pages = scatter(self.shards, lambda shard: shard.get_page(after, limit, sort), self._executor)
+        return list(islice(heapq.merge(*pages, key=lambda order: order.order_id.code), limit))
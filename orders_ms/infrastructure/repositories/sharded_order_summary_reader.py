@@ -0,0 +1,45 @@
+"""
+Lector de resúmenes de órdenes repartido entre varios shards.
+"""
+import heapq
+from concurrent.futures import Executor
+from itertools import islice
+from typing import List, Optional
+from application.pagination import PagePosition
+from application.ports.order_summary_reader import OrderSummaryReader
+from application.dtos.list_orders_dtos import OrderSummaryDTO
+from infrastructure.repositories.sharded_order_repository import require_order_id_sort, scatter
+
+
+class ShardedOrderSummaryReader(OrderSummaryReader):
+    """
+    Pide la misma página a todos los shards a la vez y fusiona los
+    resúmenes, ya ordenados en cada shard, por order_id.
+    """
+
+    def __init__(self, shards: List[OrderSummaryReader], executor: Executor = None):
+        self.shards = shards
+        self._executor = executor
+
+    def list_summaries(self, after: Optional[PagePosition], limit: int,
+                       sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """
+        :raises ValueError: Si sort no es "order_id".
+        """
+        require_order_id_sort(sort)
+        pages = scatter(self.shards, lambda shard: shard.list_summaries(after, limit, sort), self._executor)
+        return list(islice(heapq.merge(*pages, key=lambda summary: summary.order_id), limit))
+
+    def list_customer_summaries(self, customer_id: str, after: Optional[PagePosition], limit: int,
+                                sort: str = "order_id") -> List[OrderSummaryDTO]:
+        """
+        Las órdenes de un cliente se reparten por order_id entre los shards:
+        cada shard resuelve su parte con su índice por cliente.
+
+        :raises ValueError: Si sort no es "order_id".
+        """
+        require_order_id_sort(sort)
+        pages = scatter(
+            self.shards, lambda shard: shard.list_customer_summaries(customer_id, after, limit, sort), self._executor
+        )
+        return list(islice(heapq.merge(*pages, key=lambda summary: summary.order_id), limit))
@@ -0,0 +1,26 @@
+"""
+Implementación de OrderRepository sobre SQLite embebido
+"""
+
+from typing import Optional
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+
+class SQLiteOrderRepository(PostgreSQLOrderRepository):
+    """
+    OrderRepository sobre SQLite (ver sqlite_connection).
+
+    Comparte el SQL con PostgreSQLOrderRepository: el upsert de cabeceras
+    usa INSERT ... ON CONFLICT del dialecto SQLite y las escrituras siguen
+    siendo multi-fila (save_many: un upsert y un INSERT de items por lote).
+    """
+
+    def get_for_update(self, order_id: OrderId) -> Optional[Order]:
+        """
+        SQLite no tiene bloqueos de fila: la transacción de escritura ya
+        empezó con BEGIN IMMEDIATE y tiene el bloqueo de escritor de toda
+        la base de datos, así que basta con leer la orden.
+        """
+        return self.get(order_id)
@@ -0,0 +1,57 @@
+"""
+Decorador write-behind de AsyncOrderRepository
+"""
+import asyncio
+from typing import Dict, List, Optional
+from application.pagination import PagePosition
+from application.ports.async_order_repository import AsyncOrderRepository
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.database.write_behind import PendingChange, WriteBehindBuffer, merge_changes
+
+
+class AsyncWriteBehindOrderRepository(AsyncOrderRepository):
+    """Variante asíncrona de WriteBehindOrderRepository (mismo buffer)"""
+
+    def __init__(self, repository: AsyncOrderRepository, buffer: WriteBehindBuffer):
+        self._repository = repository
+        self._buffer = buffer
+        self._staged: Dict[str, PendingChange] = {}
+
+    async def save(self, order: Order) -> None:
+        await self.save_many([order])
+
+    async def save_many(self, orders: List[Order]) -> None:
+        merge_changes(self._staged, {order.order_id.code: PendingChange.from_order(order) for order in orders})
+        for order in orders:
+            order.mark_persisted(order.version + 1)
+
+    def take_staged(self) -> Dict[str, PendingChange]:
+        """Cambios preparados en este Unit of Work (y los olvida)"""
+        staged, self._staged = self._staged, {}
+        return staged
+
+    async def get(self, order_id: OrderId) -> Optional[Order]:
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        order = await self._repository.get(order_id_str)
+        return self._buffer.view(order_id_str, order, self._staged.get(order_id_str))
+
+    async def get_version(self, order_id: OrderId) -> Optional[int]:
+        # Con cambios pendientes la versión escrita no identifica lo que se lee
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        if order_id_str in self._staged or self._buffer.has_changes(order_id_str):
+            return None
+        return await self._repository.get_version(order_id_str)
+
+    async def delete(self, order_id: OrderId) -> None:
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        self._staged.pop(order_id_str, None)
+        # discard puede esperar al lote en curso: fuera del bucle de eventos
+        await asyncio.get_running_loop().run_in_executor(None, self._buffer.discard, order_id_str)
+        await self._repository.delete(order_id_str)
+
+    async def get_all(self) -> List[Order]:
+        return self._buffer.view_many(await self._repository.get_all())
+
+    async def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        return self._buffer.view_many(await self._repository.get_page(after, limit, sort))
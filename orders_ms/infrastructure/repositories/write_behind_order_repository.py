@@ -0,0 +1,60 @@
+"""
+Decorador write-behind de OrderRepository
+"""
+from typing import Dict, List, Optional
+from application.pagination import PagePosition
+from application.ports.order_repository import OrderRepository
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.database.write_behind import PendingChange, WriteBehindBuffer, merge_changes
+
+
+class WriteBehindOrderRepository(OrderRepository):
+    """
+    OrderRepository que no escribe al guardar: prepara los cambios de la
+    orden y el WriteBehindUnitOfWork los pasa al WriteBehindBuffer en el
+    commit. Las lecturas van al repositorio real y se les aplican los
+    cambios pendientes del buffer y los preparados en este Unit of Work.
+    """
+
+    def __init__(self, repository: OrderRepository, buffer: WriteBehindBuffer):
+        self._repository = repository
+        self._buffer = buffer
+        self._staged: Dict[str, PendingChange] = {}
+
+    def save(self, order: Order) -> None:
+        self.save_many([order])
+
+    def save_many(self, orders: List[Order]) -> None:
+        merge_changes(self._staged, {order.order_id.code: PendingChange.from_order(order) for order in orders})
+        for order in orders:
+            order.mark_persisted(order.version + 1)
+
+    def take_staged(self) -> Dict[str, PendingChange]:
+        """Cambios preparados en este Unit of Work (y los olvida)"""
+        staged, self._staged = self._staged, {}
+        return staged
+
+    def get(self, order_id: OrderId) -> Optional[Order]:
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        return self._buffer.view(order_id_str, self._repository.get(order_id_str), self._staged.get(order_id_str))
+
+    def get_version(self, order_id: OrderId) -> Optional[int]:
+        # Con cambios pendientes la versión escrita no identifica lo que se lee
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        if order_id_str in self._staged or self._buffer.has_changes(order_id_str):
+            return None
+        return self._repository.get_version(order_id_str)
+
+    def delete(self, order_id: OrderId) -> None:
+        """El borrado no se difiere: descarta lo pendiente y borra en la transacción del Unit of Work"""
+        order_id_str = order_id.code if hasattr(order_id, 'code') else str(order_id)
+        self._staged.pop(order_id_str, None)
+        self._buffer.discard(order_id_str)
+        self._repository.delete(order_id_str)
+
+    def get_all(self) -> List[Order]:
+        return self._buffer.view_many(self._repository.get_all())
+
+    def get_page(self, after: Optional[PagePosition], limit: int, sort: str = "order_id") -> List[Order]:
+        return self._buffer.view_many(self._repository.get_page(after, limit, sort))
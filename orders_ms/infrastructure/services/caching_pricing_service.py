@@ -0,0 +1,199 @@
+"""
+Decorador de PricingService con caché (LRU acotada con TTL y caché negativa)
+"""
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, List, Mapping, Optional
+from application.ports.pricing_service import PricingService
+from application.ports.async_pricing_service import AsyncPricingService
+from domain.value_objects.price import Price
+from domain.value_objects.sku import SKU
+
+DEFAULT_PRICE_TTL = 300.0  # segundos
+DEFAULT_NEGATIVE_TTL = 30.0  # segundos, SKUs que el catálogo no conoce
+
+
+def pricing_cache_settings_from_env(environ: Mapping[str, str] = None) -> Optional[dict]:
+    """
+    PRICING_CACHE_SIZE (SKUs; 0 o ausente = sin caché), PRICING_CACHE_TTL_SECONDS
+    y PRICING_NEGATIVE_TTL_SECONDS. None si la caché está desactivada.
+    """
+    environ = os.environ if environ is None else environ
+    max_size = int(environ.get("PRICING_CACHE_SIZE", 0))
+    if max_size <= 0:
+        return None
+    return {
+        "max_size": max_size,
+        "ttl": float(environ.get("PRICING_CACHE_TTL_SECONDS", DEFAULT_PRICE_TTL)),
+        "negative_ttl": float(environ.get("PRICING_NEGATIVE_TTL_SECONDS", DEFAULT_NEGATIVE_TTL)),
+    }
+
+
+def _known(found: Dict[str, Optional[Price]]) -> Dict[str, Price]:
+    """Quita los SKUs inexistentes (entradas negativas) del resultado"""
+    return {code: price for code, price in found.items() if price is not None}
+
+
+class CachingPricingService(PricingService):
+    """
+    PricingService que guarda los precios del servicio real durante `ttl`
+    segundos. Los SKUs inexistentes también se guardan (caché negativa,
+    `negative_ttl`) para que un SKU desconocido repetido no llegue al
+    catálogo en cada petición.
+
+    get_prices pide al servicio real solo los SKUs que faltan, con una
+    llamada. Si varios hilos piden a la vez el mismo SKU que falta, solo uno
+    lo consulta y el resto espera su resultado (sin estampida sobre el
+    catálogo cuando caduca un SKU muy pedido). get_price y product_exists
+    son get_prices de un SKU.
+
+    Segura entre hilos.
+    """
+
+    def __init__(self, pricing_service: PricingService, max_size: int,
+                 ttl: float = DEFAULT_PRICE_TTL, negative_ttl: float = DEFAULT_NEGATIVE_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        self._pricing_service = pricing_service
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # SKU -> (caduca en, Price o None si el producto no existe)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # SKU -> Future con el precio, mientras algún hilo lo está consultando
+        self._loading: Dict[str, Future] = {}
+        # Métricas
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.loads = 0
+        self.evictions = 0
+
+    def get_price(self, sku: SKU) -> Optional[Price]:
+        return self.get_prices([sku]).get(sku.code)
+
+    def product_exists(self, sku: SKU) -> bool:
+        return self.get_price(sku) is not None
+
+    def get_prices(self, skus: List[SKU]) -> Dict[str, Price]:
+        found, owned, waiting = self._claim(skus)
+        if owned:
+            found.update(self._load(owned))
+        for code, future in waiting.items():
+            found[code] = future.result()
+        return _known(found)
+
+    def _claim(self, skus: List[SKU]) -> tuple:
+        """
+        Reparte los SKUs pedidos entre aciertos, SKUs que este llamador debe
+        consultar (se registran en _loading) y SKUs que ya está consultando
+        otro, cuyo Future hay que esperar. Solo retiene el lock para leer la
+        caché: nunca espera al catálogo.
+
+        :return: (precios encontrados, SKUs a consultar, Futures a esperar), por código
+        """
+        found: Dict[str, Optional[Price]] = {}
+        owned: Dict[str, SKU] = {}
+        waiting: Dict[str, Future] = {}
+        with self._lock:
+            now = self._clock()
+            for sku in skus:
+                code = sku.code
+                if code in found or code in owned or code in waiting:
+                    continue
+                entry = self._entries.get(code)
+                if entry is not None and now < entry[0]:
+                    self._entries.move_to_end(code)
+                    found[code] = entry[1]
+                    if entry[1] is None:
+                        self.negative_hits += 1
+                    else:
+                        self.hits += 1
+                    continue
+                self.misses += 1
+                if code in self._loading:
+                    waiting[code] = self._loading[code]
+                    self.coalesced += 1
+                else:
+                    owned[code] = sku
+                    self._loading[code] = Future()
+        return found, owned, waiting
+
+    def _load(self, owned: Dict[str, SKU]) -> Dict[str, Optional[Price]]:
+        """Consulta los SKUs que faltan con una llamada y despierta a quien los espera"""
+        try:
+            prices = self._pricing_service.get_prices(list(owned.values()))
+        except BaseException as error:
+            with self._lock:
+                futures = [self._loading.pop(code) for code in owned]
+            for future in futures:
+                future.set_exception(error)
+            raise
+
+        loaded = {code: prices.get(code) for code in owned}
+        with self._lock:
+            self.loads += 1
+            now = self._clock()
+            for code, price in loaded.items():
+                ttl = self.ttl if price is not None else self.negative_ttl
+                self._entries[code] = (now + ttl, price)
+                self._entries.move_to_end(code)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            futures = [(self._loading.pop(code), price) for code, price in loaded.items()]
+        for future, price in futures:
+            future.set_result(price)
+        return loaded
+
+    def status(self) -> dict:
+        """Métricas de la caché"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "negative_hits": self.negative_hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "loads": self.loads,
+                "evictions": self.evictions,
+            }
+
+
+class AsyncCachingPricingService(AsyncPricingService):
+    """
+    Variante asíncrona de CachingPricingService que comparte su caché (y
+    sus métricas) con la síncrona.
+
+    Los aciertos se sirven sin salir del event loop. Los SKUs que faltan se
+    piden al catálogo en el executor (el por defecto del loop si no se
+    indica) y los que ya está consultando otra petición se esperan con
+    await, de modo que ni la consulta ni la espera bloquean el loop.
+    """
+
+    def __init__(self, cache: CachingPricingService, executor: Executor = None):
+        self._cache = cache
+        self._executor = executor
+
+    async def get_price(self, sku: SKU) -> Optional[Price]:
+        return (await self.get_prices([sku])).get(sku.code)
+
+    async def product_exists(self, sku: SKU) -> bool:
+        return await self.get_price(sku) is not None
+
+    async def get_prices(self, skus: List[SKU]) -> Dict[str, Price]:
+        found, owned, waiting = self._cache._claim(skus)
+        if owned:
+            # Aunque se cancele la petición, el hilo termina la carga y despierta a quien espera
+            loaded = await asyncio.get_running_loop().run_in_executor(self._executor, self._cache._load, owned)
+            found.update(loaded)
+        for code, future in waiting.items():
+            found[code] = await asyncio.wrap_future(future)
+        return _known(found)
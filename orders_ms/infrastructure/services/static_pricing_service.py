@@ -2,11 +2,12 @@
 Servicio de precios estáticos para el microservicio de pedidos.
 """
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from decimal import Decimal
 from domain.value_objects.sku import SKU
 from domain.value_objects.price import Price
 from application.ports.pricing_service import PricingService
+from application.ports.async_pricing_service import AsyncPricingService
 
 class StaticPricingService(PricingService):
     def __init__(self):
@@ -39,4 +40,30 @@ class StaticPricingService(PricingService):
         return None
 
     def product_exists(self, sku: SKU) -> bool:
-        return sku.code in self.prices
\ No newline at end of file
+        return sku.code in self.prices
+
+    def get_prices(self, skus: List[SKU]) -> Dict[str, Price]:
+        return {
+            sku.code: Price(self.prices[sku.code])
+            for sku in skus
+            if sku.code in self.prices
+        }
+
+
+class AsyncStaticPricingService(AsyncPricingService):
+    """
+    Variante asíncrona de StaticPricingService. Los precios están en memoria,
+    así que responde sin salir del event loop.
+    """
+
+    def __init__(self, pricing_service: StaticPricingService = None):
+        self._pricing_service = pricing_service or StaticPricingService()
+
+    async def get_price(self, sku: SKU) -> Optional[Price]:
+        return self._pricing_service.get_price(sku)
+
+    async def product_exists(self, sku: SKU) -> bool:
+        return self._pricing_service.product_exists(sku)
+
+    async def get_prices(self, skus: List[SKU]) -> Dict[str, Price]:
+        return self._pricing_service.get_prices(skus)
@@ -0,0 +1,120 @@
+"""
+Respuestas HTTP de órdenes ya serializadas, con ETag, y su caché por versión
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Mapping, NamedTuple, Optional
+from fastapi.encoders import jsonable_encoder
+from application.ports.event_bus import EventBus
+from domain.events.order_created import OrderCreated
+
+DEFAULT_RESPONSE_CACHE_SIZE = 1024  # órdenes
+
+
+def response_cache_settings_from_env(environ: Mapping[str, str] = None) -> Optional[dict]:
+    """
+    ORDER_RESPONSE_CACHE_SIZE (órdenes, por defecto 1024; 0 = sin caché).
+    None si la caché está desactivada.
+    """
+    environ = os.environ if environ is None else environ
+    max_size = int(environ.get("ORDER_RESPONSE_CACHE_SIZE", DEFAULT_RESPONSE_CACHE_SIZE))
+    if max_size <= 0:
+        return None
+    return {"max_size": max_size}
+
+
+class EncodedResponse(NamedTuple):
+    """Cuerpo JSON ya codificado y su ETag fuerte"""
+    etag: str
+    body: bytes
+
+
+def encode_response(content: Any) -> EncodedResponse:
+    """
+    Serializa como lo haría JSONResponse de FastAPI y calcula el ETag a
+    partir de los bytes: mismo cuerpo, mismo ETag, en cualquier instancia.
+    """
+    body = json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+    return EncodedResponse(f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"', body)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Si la cabecera If-None-Match incluye el ETag (comparación débil, como
+    pide RFC 9110 para If-None-Match) o es "*".
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class OrderResponseCache:
+    """
+    Respuestas de GET /orders/{order_id} ya codificadas, por (order_id,
+    versión). La versión identifica el estado de la orden, así que no hace
+    falta invalidar: una entrada de una versión anterior simplemente deja de
+    coincidir. Se guarda solo la última versión de cada orden, en una LRU
+    acotada. La excepción es un ID que se vuelve a crear (su versión empieza
+    de nuevo en 1): OrderCreated borra la entrada de esa orden.
+
+    Segura entre hilos.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_RESPONSE_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        # Métricas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, order_id: str, version: int) -> Optional[EncodedResponse]:
+        with self._lock:
+            entry = self._entries.get(order_id)
+            if entry is None or entry[0] != version:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(order_id)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, order_id: str, version: int, response: EncodedResponse) -> None:
+        with self._lock:
+            current = self._entries.get(order_id)
+            if current is not None and current[0] > version:
+                # Una lectura más lenta no sustituye a una versión posterior
+                return
+            self._entries[order_id] = (version, response)
+            self._entries.move_to_end(order_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, order_id: str) -> None:
+        with self._lock:
+            self._entries.pop(order_id, None)
+
+    def subscribe_to(self, event_bus: EventBus) -> None:
+        """Suscribe la invalidación a OrderCreated"""
+        event_bus.subscribe(OrderCreated, lambda event: self.invalidate(event.order_id))
+
+    def status(self) -> dict:
+        """Métricas de la caché"""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -4,14 +4,22 @@ Mi primer endpoint para entender FastAPI
 """
 import uvicorn
 import logging
-from fastapi import FastAPI, HTTPException, status
+from contextlib import asynccontextmanager
+from typing import List, Optional
+from fastapi import FastAPI, Header, HTTPException, Query, Request, Response, status
 from config.logging_config import setup_dev_logging
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.concurrency import run_in_threadpool
 from container import Container
 from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.create_orders_batch_dtos import BatchOrderDTO, BatchOrderItemDTO, CreateOrdersBatchRequestDTO
 from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from application.dtos.order_items_dtos import OrderLineDTO, OrderItemsRequestDTO
 from application.dtos.get_order_dtos import GetOrderRequestDTO
 from application.dtos.list_orders_dtos import ListOrdersRequestDTO
+from application.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from infrastructure.database.statement_counter import track_statements
+from infrastructure.web.response_cache import EncodedResponse, encode_response, etag_matches
 from pydantic import BaseModel
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
@@ -19,8 +27,14 @@ from fastapi.responses import FileResponse
 # Inicializar sistema de logging
 setup_dev_logging()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Al apagar: escribir lo que quede en el buffer write-behind (si está activo)
+    container.shutdown()
+
 # Crear la aplicación FastAPI
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 # Configurar CORS (Cross-Origin Resource Sharing)
 app.add_middleware(
@@ -31,6 +45,34 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Contar sentencias SQL y COMMITs por petición (cabeceras X-SQL-Statements y X-SQL-Commits)
+@app.middleware("http")
+async def count_sql_statements(request: Request, call_next):
+    with track_statements() as stats:
+        response = await call_next(request)
+    response.headers["X-SQL-Statements"] = str(stats.count)
+    response.headers["X-SQL-Commits"] = str(stats.commits)
+    return response
+
+# Read-your-writes: las escrituras devuelven este token y las lecturas que lo
+# reenvían no van a una réplica que aún no haya reproducido esa escritura
+CONSISTENCY_TOKEN_HEADER = "X-Consistency-Token"
+
+async def _set_consistency_token(response: Response) -> None:
+    """Añade el token de consistencia a la respuesta de una escritura (solo si hay réplica)"""
+    token = await container.async_consistency_token()
+    if token is not None:
+        response.headers[CONSISTENCY_TOKEN_HEADER] = token
+
+# GET condicional: las lecturas llevan ETag (hash del cuerpo) y, si el cliente
+# envía If-None-Match con ese ETag, se responde 304 sin cuerpo. "no-cache"
+# hace que el navegador revalide en cada petición en lugar de usar su copia.
+def _conditional_response(encoded: EncodedResponse, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": encoded.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, encoded.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=encoded.body, media_type="application/json", headers=headers)
+
 # Servir archivos estáticos (HTML, CSS, JS)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -41,7 +83,7 @@ async def serve_frontend():
 
 # Definir un endpoint simple
 @app.get("/favicon.ico")
-def favicon():
+async def favicon():
     return {"message": "No favicon"}
 
 # Modelos para HTTP requests (diferentes a los DTOs de aplicación)
@@ -52,19 +94,30 @@ class AddItemRequest(BaseModel):
     sku: str
     quantity: int
 
+class OrderItemsRequest(BaseModel):
+    items: List[AddItemRequest]
+
+class BatchOrderRequest(BaseModel):
+    customer_id: str
+    items: List[AddItemRequest] = []
+
+class CreateOrdersBatchRequest(BaseModel):
+    orders: List[BatchOrderRequest]
+
 # Crear el Container (Dependency Injection)
 container = Container()
 app.container = container # Adjuntar para acceso en tests
 
 # Endpoint para crear órdenes
 @app.post("/orders")
-def create_order(request: CreateOrderRequest):
+async def create_order(request: CreateOrderRequest, response: Response):
     # 1. Convertir HTTP request a DTO de aplicación
     dto = CreateOrderRequestDTO(customer_id=request.customer_id)
     
     # 2. Usar el caso de uso
-    use_case = container.create_order_use_case()
-    response_dto = use_case.execute(dto)
+    use_case = container.async_create_order_use_case()
+    response_dto = await use_case.execute(dto)
+    await _set_consistency_token(response)
     
     # 3. Devolver respuesta HTTP
     return {
@@ -72,9 +125,46 @@ def create_order(request: CreateOrderRequest):
         "message": "Order created successfully"
     }
 
+# Endpoint para crear órdenes en lote (una transacción para todo el lote)
+@app.post("/orders:batch")
+async def create_orders_batch(request: CreateOrdersBatchRequest, response: Response):
+    """
+    Crea varias órdenes, con items iniciales opcionales, en una sola transacción
+    
+    Returns:
+        200: IDs de las órdenes creadas, en el orden de la petición
+        400: Lote vacío, demasiado grande o con items inválidos (se rechaza entero)
+    """
+    # 1. Convertir HTTP request a DTO de aplicación
+    dto = CreateOrdersBatchRequestDTO(orders=[
+        BatchOrderDTO(
+            customer_id=order.customer_id,
+            items=[BatchOrderItemDTO(sku=item.sku, quantity=item.quantity) for item in order.items]
+        )
+        for order in request.orders
+    ])
+    
+    # 2. Usar el caso de uso
+    try:
+        use_case = container.async_create_orders_batch_use_case()
+        response_dto = await use_case.execute(dto)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    await _set_consistency_token(response)
+    
+    # 3. Devolver respuesta HTTP
+    return {
+        "order_ids": response_dto.order_ids,
+        "orders_created": len(response_dto.order_ids),
+        "message": "Orders created successfully"
+    }
+
 # Endpoint para añadir items
 @app.post("/orders/{order_id}/items")
-def add_item_to_order(order_id: str, request: AddItemRequest):
+async def add_item_to_order(order_id: str, request: AddItemRequest, response: Response):
     print(f"🔍 DEBUG: Añadiendo item - Order ID: {order_id}, SKU: {request.sku}, Quantity: {request.quantity}")
     
     try:
@@ -86,10 +176,12 @@ def add_item_to_order(order_id: str, request: AddItemRequest):
         )
         
         # 2. Usar el caso de uso
-        use_case = container.add_item_use_case()
-        response_dto = use_case.execute(dto)
+        use_case = container.async_add_item_use_case()
+        response_dto = await use_case.execute(dto)
         
         print(f"🔍 DEBUG: Respuesta del use case - Success: {response_dto.success}")
+        if response_dto.success:
+            await _set_consistency_token(response)
         
         # 3. Devolver respuesta HTTP
         return {
@@ -103,14 +195,94 @@ def add_item_to_order(order_id: str, request: AddItemRequest):
             "message": f"Error: {str(e)}"
         }
 
+def _order_items_response(order_id: str, response_dto, message: str) -> dict:
+    """Traduce la respuesta de los casos de uso de varias líneas a HTTP (404/422/200)"""
+    if not response_dto.order_found:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Order with ID '{order_id}' not found"
+        )
+    if response_dto.errors:
+        # Errores por línea: no se ha aplicado ningún cambio
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=[
+                {"index": error.index, "sku": error.sku, "message": error.message}
+                for error in response_dto.errors
+            ]
+        )
+    return {"success": True, "message": message}
+
+# Endpoint para añadir varios items en una sola transacción
+@app.post("/orders/{order_id}/items:batch")
+async def add_items_to_order(order_id: str, request: OrderItemsRequest, response: Response):
+    """
+    Añade varias líneas (sku, quantity) a una orden
+    
+    Returns:
+        200: Todas las líneas añadidas
+        404: Orden no encontrada
+        422: Errores de validación por línea (no se añade ninguna)
+    """
+    # 1. Convertir HTTP request a DTO de aplicación
+    dto = OrderItemsRequestDTO(
+        order_id=order_id,
+        lines=[OrderLineDTO(sku=item.sku, quantity=item.quantity) for item in request.items]
+    )
+    
+    # 2. Usar el caso de uso
+    use_case = container.async_add_items_use_case()
+    response_dto = await use_case.execute(dto)
+    
+    # 3. Devolver respuesta HTTP
+    body = _order_items_response(order_id, response_dto, "Items added successfully")
+    await _set_consistency_token(response)
+    return body
+
+# Endpoint para reemplazar el carrito completo de una orden
+@app.put("/orders/{order_id}/items")
+async def replace_order_items(order_id: str, request: OrderItemsRequest, response: Response):
+    """
+    Reemplaza todas las líneas de una orden por las recibidas
+    
+    Returns:
+        200: Carrito reemplazado (una lista vacía lo vacía)
+        404: Orden no encontrada
+        422: Errores de validación por línea (la orden no cambia)
+    """
+    dto = OrderItemsRequestDTO(
+        order_id=order_id,
+        lines=[OrderLineDTO(sku=item.sku, quantity=item.quantity) for item in request.items]
+    )
+    
+    use_case = container.async_replace_items_use_case()
+    response_dto = await use_case.execute(dto)
+    
+    body = _order_items_response(order_id, response_dto, "Items replaced successfully")
+    await _set_consistency_token(response)
+    return body
+
 # Endpoint para obtener detalles de una orden
 @app.get("/orders/{order_id}", status_code=200)
-def get_order(order_id: str):
+async def get_order(
+    order_id: str,
+    x_consistency_token: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Obtiene los detalles de una orden específica
     
+    Si la respuesta de la versión actual de la orden ya está serializada en
+    la caché de respuestas, se sirve (o se responde 304) consultando solo la
+    versión, sin reconstruir la orden.
+    
+    Headers:
+        X-Consistency-Token: Token de una escritura previa (read-your-writes)
+        If-None-Match: ETag de una respuesta anterior
+    
     Returns:
-        200: Orden encontrada exitosamente
+        200: Orden encontrada exitosamente (con ETag)
+        304: La orden no ha cambiado desde el ETag enviado
         404: Orden no encontrada
         500: Error interno del servidor
     """
@@ -121,11 +293,20 @@ def get_order(order_id: str):
         # 1. Convertir a DTO de aplicación
         dto = GetOrderRequestDTO(order_id=order_id)
         
-        # 2. Usar el caso de uso (lógica de dominio)
-        use_case = container.get_order_use_case()
-        response_dto = use_case.execute(dto)
+        # 2. Respuesta ya serializada para la versión actual (sin hidratar la orden)
+        response_cache = container.get_response_cache()
+        version = None
+        if response_cache is not None:
+            version = await container.async_get_order_version_use_case(x_consistency_token).execute(dto)
+            cached = response_cache.get(order_id, version) if version is not None else None
+            if cached is not None:
+                return _conditional_response(cached, if_none_match)
         
-        # 3. Validar resultado del dominio
+        # 3. Usar el caso de uso (lógica de dominio)
+        use_case = container.async_get_order_use_case(x_consistency_token)
+        response_dto = await use_case.execute(dto)
+        
+        # 4. Validar resultado del dominio
         if not response_dto:
             logger.warning(f"Order not found: {order_id}")
             raise HTTPException(
@@ -135,14 +316,18 @@ def get_order(order_id: str):
         
         logger.info(f"Order {order_id} retrieved successfully with {response_dto.items_count} items")
         
-        # 4. Devolver respuesta HTTP (capa de presentación)
-        return {
+        # 5. Devolver respuesta HTTP (capa de presentación)
+        encoded = encode_response({
             "order_id": response_dto.order_id,
             "customer_id": response_dto.customer_id,
             "items": response_dto.items,
             "total_amount": response_dto.total_amount,
             "items_count": response_dto.items_count
-        }
+        })
+        # Solo se cachea si lo leído es la versión consultada (si no, cambió entre medias)
+        if version is not None and response_dto.version == version:
+            response_cache.put(order_id, version, encoded)
+        return _conditional_response(encoded, if_none_match)
         
     except HTTPException:
         # Re-lanzar HTTPException (mantener códigos específicos)
@@ -155,26 +340,79 @@ def get_order(order_id: str):
             detail="Internal server error"
         )
 
-# Endpoint para listar todas las órdenes
+# Endpoint para listar órdenes (paginado por cursor)
 @app.get("/orders", status_code=200)
-def list_orders():
+async def list_orders(
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    sort: str = "order_id",
+    x_consistency_token: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
     """
-    Lista todas las órdenes del sistema
+    Lista una página de órdenes del sistema
+    
+    Query params:
+        cursor: Cursor opaco devuelto como next_cursor en la página anterior
+        limit: Tamaño de página
+        sort: Campo de ordenación (order_id o created_at)
+    
+    Headers:
+        X-Consistency-Token: Token de una escritura previa (read-your-writes)
+        If-None-Match: ETag de una respuesta anterior
+    
+    Returns:
+        200: Página de órdenes obtenida exitosamente (con ETag)
+        304: La página no ha cambiado desde el ETag enviado
+        400: Parámetros de paginación inválidos
+        500: Error interno del servidor
+    """
+    logger = logging.getLogger(__name__)
+    logger.info(f"Listing orders (cursor={cursor}, limit={limit}, sort={sort})")
+    
+    # 1. Crear DTO de petición
+    dto = ListOrdersRequestDTO(cursor=cursor, limit=limit, sort=sort)
+    return await _list_orders_page(dto, x_consistency_token, if_none_match)
+
+# Endpoint para listar las órdenes de un cliente (paginado por cursor)
+@app.get("/customers/{customer_id}/orders", status_code=200)
+async def list_customer_orders(
+    customer_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    sort: str = "order_id",
+    x_consistency_token: Optional[str] = Header(None),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Lista una página de las órdenes de un cliente (índice por cliente: el
+    coste depende de sus órdenes, no del total)
+    
+    Path params:
+        customer_id: ID del cliente
+    
+    Query params y headers: como GET /orders
     
     Returns:
-        200: Lista de órdenes obtenida exitosamente
+        200: Página de órdenes del cliente (vacía si no tiene ninguna)
+        304: La página no ha cambiado desde el ETag enviado
+        400: Parámetros de paginación inválidos
         500: Error interno del servidor
     """
     logger = logging.getLogger(__name__)
-    logger.info("Listing all orders")
+    logger.info(f"Listing orders of customer {customer_id} (cursor={cursor}, limit={limit}, sort={sort})")
     
+    dto = ListOrdersRequestDTO(cursor=cursor, limit=limit, sort=sort, customer_id=customer_id)
+    return await _list_orders_page(dto, x_consistency_token, if_none_match)
+
+async def _list_orders_page(dto: ListOrdersRequestDTO, x_consistency_token: Optional[str],
+                            if_none_match: Optional[str]):
+    """Ejecuta el caso de uso de listado y construye la respuesta HTTP (compartido por los listados)"""
+    logger = logging.getLogger(__name__)
     try:
-        # 1. Crear DTO de petición
-        dto = ListOrdersRequestDTO()
-        
         # 2. Usar el caso de uso (lógica de dominio)
-        use_case = container.list_orders_use_case()
-        response_dto = use_case.execute(dto)
+        use_case = container.async_list_orders_use_case(x_consistency_token)
+        response_dto = await use_case.execute(dto)
         
         logger.info(f"Retrieved {response_dto.total_orders} orders successfully")
         
@@ -188,11 +426,20 @@ def list_orders():
                 "total_amount": float(order_summary.total_amount)  # Convertir Decimal a float para JSON
             })
         
-        return {
+        # Los resúmenes no tienen versión: el ETag es el hash del cuerpo
+        return _conditional_response(encode_response({
             "orders": orders_data,
-            "total_orders": response_dto.total_orders
-        }
+            "total_orders": response_dto.total_orders,
+            "next_cursor": response_dto.next_cursor
+        }), if_none_match)
         
+    except ValueError as e:
+        # Cursor o parámetros de paginación inválidos
+        logger.warning(f"Invalid pagination parameters: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         # Error interno: no exponer detalles al cliente
         logger.error(f"Internal error listing orders: {e}", exc_info=True)
@@ -201,8 +448,111 @@ def list_orders():
             detail="Internal server error"
         )
 
+# Endpoint de administración: estado del pool de conexiones
+@app.get("/admin/db/pool", status_code=200)
+async def database_pool_status():
+    """
+    Estado en vivo del pool de conexiones a base de datos
+    
+    Returns:
+        200: Tamaño, conexiones en uso/libres, overflow y métricas
+             (histograma de espera en checkout, overflows, timeouts)
+    """
+    return container.get_database_pool_status()
+
+# Endpoint de administración: métricas de la caché de órdenes y del write-behind
+@app.get("/admin/cache", status_code=200)
+async def cache_status():
+    """
+    Returns:
+        200: Aciertos, fallos, expulsiones e invalidaciones de la caché de
+             órdenes, de la caché de respuestas, de la caché de precios,
+             lecturas coalescidas y estado del buffer write-behind (null si
+             no están activos)
+    """
+    return {
+        "pricing": container.get_pricing_cache_status(),
+        "order_cache": container.get_order_cache_status(),
+        "order_responses": container.get_response_cache_status(),
+        "read_coalescing": container.get_read_coalescing_status(),
+        "write_behind": container.get_write_behind_status(),
+    }
+
+def _require_summary_projection():
+    """La proyección de resúmenes o 404 si no está activa (ORDER_SUMMARY_PROJECTION)"""
+    projection = container.get_summary_projection()
+    if projection is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Order summary projection is disabled"
+        )
+    return projection
+
+# Endpoint de administración: panel de totales (proyección de resúmenes)
+@app.get("/admin/orders/summary", status_code=200)
+async def orders_summary(customer_id: Optional[str] = None):
+    """
+    Totales de todas las órdenes o, con customer_id, de las de un cliente.
+    Se leen de la proyección en O(1), sin recorrer órdenes ni items.
+    
+    Returns:
+        200: Nº de órdenes, de líneas e importe total (y nº de clientes)
+        404: Cliente sin órdenes o proyección desactivada
+    """
+    projection = _require_summary_projection()
+    if customer_id is None:
+        overview = projection.overview()
+        return {
+            "orders_count": overview.orders_count,
+            "items_count": overview.items_count,
+            "total_amount": float(overview.total_amount),
+            "customers_count": overview.customers_count,
+        }
+
+    customer = projection.get_customer_summary(customer_id)
+    if customer is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Customer {customer_id} has no orders"
+        )
+    return {
+        "customer_id": customer.customer_id,
+        "orders_count": customer.orders_count,
+        "items_count": customer.items_count,
+        "total_amount": float(customer.total_amount),
+    }
+
+# Endpoint de administración: reconstruir la proyección desde la base de datos
+@app.post("/admin/orders/summary/rebuild", status_code=200)
+async def rebuild_orders_summary():
+    """
+    Returns:
+        200: Número de órdenes cargadas en la proyección
+        404: Proyección desactivada
+    """
+    _require_summary_projection()
+    return {"orders_count": await run_in_threadpool(container.rebuild_summary_projection)}
+
+# Endpoint de administración: comprobar la proyección contra las órdenes guardadas
+@app.get("/admin/orders/summary/check", status_code=200)
+async def check_orders_summary():
+    """
+    Returns:
+        200: Órdenes comprobadas y las que difieren, faltan o sobran
+        404: Proyección desactivada
+    """
+    _require_summary_projection()
+    report = await run_in_threadpool(container.check_summary_projection)
+    return {
+        "consistent": report.consistent,
+        "checked": report.checked,
+        "mismatched": report.mismatched,
+        "missing": report.missing,
+        "unexpected": report.unexpected,
+    }
+
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Orders Microservice - Clean Architecture", "status": "running"}
 
 # Ejecutar la aplicación
@@ -399,6 +399,26 @@ function clearHistory() {
     }
 }
 
+// Obtener todas las órdenes recorriendo las páginas de /orders (next_cursor hasta null)
+async function fetchAllOrders() {
+    const orders = [];
+    let cursor = null;
+    do {
+        const params = new URLSearchParams({ limit: '500' });
+        if (cursor) {
+            params.set('cursor', cursor);
+        }
+        const response = await fetch(`/orders?${params}`);
+        const data = await response.json();
+        if (data.error || data.detail) {
+            return { error: data.error || data.detail };
+        }
+        orders.push(...data.orders);
+        cursor = data.next_cursor;
+    } while (cursor);
+    return { orders };
+}
+
 // Cargar todas las órdenes
 async function loadAllOrders() {
     const resultDiv = document.getElementById('allOrdersResult');
@@ -407,8 +427,7 @@ async function loadAllOrders() {
     try {
         showResult(resultDiv, 'Loading orders...', 'loading');
         
-        const response = await fetch('/orders');
-        const data = await response.json();
+        const data = await fetchAllOrders();
         
         if (data.error) {
             showResult(resultDiv, `Error: ${data.error}`, 'error');
@@ -437,7 +456,7 @@ async function loadAllOrders() {
             // Mostrar mensaje de éxito y lista de órdenes
             resultDiv.innerHTML = `
                 <div style="background: #f0fdf4; color: #166534; border: 1px solid #bbf7d0; padding: 12px 16px; border-radius: 6px; font-size: 14px; margin-bottom: 20px;">
-                    ✅ Found ${data.total_orders} orders
+                    ✅ Found ${data.orders.length} orders
                 </div>
                 <div class="orders-list">${ordersHtml}</div>
             `;
@@ -446,7 +465,7 @@ async function loadAllOrders() {
             addToHistory(
                 'Load Orders',
                 'Retrieved all orders',
-                `${data.total_orders} orders found`
+                `${data.orders.length} orders found`
             );
         } else {
             resultDiv.innerHTML = `
@@ -472,8 +491,7 @@ async function loadOrdersForSelect() {
         refreshBtn.disabled = true;
         refreshBtn.textContent = '🔄 Loading...';
         
-        const response = await fetch('/orders');
-        const data = await response.json();
+        const data = await fetchAllOrders();
         
         // Limpiar opciones existentes
         orderSelect.innerHTML = '<option value="">Select an order</option>';
@@ -521,8 +539,7 @@ async function loadOrdersForViewSelect() {
         refreshBtn.disabled = true;
         refreshBtn.textContent = '🔄 Loading...';
         
-        const response = await fetch('/orders');
-        const data = await response.json();
+        const data = await fetchAllOrders();
         
         // Limpiar opciones existentes
         viewOrderSelect.innerHTML = '<option value="">Select an order</option>';
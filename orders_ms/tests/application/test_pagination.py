@@ -0,0 +1,62 @@
+"""
+Tests para la codificación de cursores de paginación
+"""
+import base64
+import unittest
+from datetime import datetime, timezone
+
+from application.pagination import (
+    InvalidCursorError,
+    decode_cursor,
+    encode_cursor,
+    validate_page_params,
+    MAX_PAGE_SIZE,
+)
+
+
+class TestPagination(unittest.TestCase):
+
+    def test_cursor_round_trip(self):
+        """Test: Un cursor codificado se decodifica al mismo ID"""
+        cursor = encode_cursor("order_id", "ORDER-123")
+        self.assertEqual(decode_cursor(cursor, "order_id"), "ORDER-123")
+
+    def test_cursor_is_opaque(self):
+        """Test: El cursor no expone el ID en claro"""
+        cursor = encode_cursor("order_id", "ORDER-123")
+        self.assertNotIn("ORDER-123", cursor)
+
+    def test_decode_malformed_cursor(self):
+        """Test: Un cursor mal formado lanza InvalidCursorError"""
+        non_string_anchor = encode_cursor("order_id", 123)
+        for cursor in ["", "###", "bm90LWpzb24", non_string_anchor]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursorError):
+                    decode_cursor(cursor, "order_id")
+
+    def test_created_at_cursor_carries_the_date(self):
+        """Test: El cursor por created_at devuelve el par (created_at, order_id)"""
+        position = (datetime(2026, 10, 18, 9, 30, 0, 123456, tzinfo=timezone.utc), "ORDER-123")
+        self.assertEqual(decode_cursor(encode_cursor("created_at", position), "created_at"), position)
+        # Un cursor por created_at sin fecha (formato anterior) no es válido
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor(base64.urlsafe_b64encode(b'{"s":"created_at","a":"ORDER-123"}').decode(), "created_at")
+
+    def test_decode_cursor_with_other_sort(self):
+        """Test: Un cursor de otro orden no es válido"""
+        cursor = encode_cursor("created_at", (datetime(2026, 10, 18, tzinfo=timezone.utc), "ORDER-123"))
+        with self.assertRaises(InvalidCursorError):
+            decode_cursor(cursor, "order_id")
+
+    def test_validate_page_params(self):
+        """Test: Límites y campos de ordenación permitidos"""
+        validate_page_params(1, "order_id")
+        validate_page_params(MAX_PAGE_SIZE, "created_at")
+        with self.assertRaises(ValueError):
+            validate_page_params(MAX_PAGE_SIZE + 1, "order_id")
+        with self.assertRaises(ValueError):
+            validate_page_params(10, "customer_id")
+
+
+if __name__ == '__main__':
+    unittest.main()
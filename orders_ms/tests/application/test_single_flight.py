@@ -0,0 +1,127 @@
+"""
+Tests para single-flight: ejecuciones compartidas entre hilos y entre corrutinas
+"""
+import asyncio
+import threading
+import time
+import unittest
+
+from application.single_flight import AsyncSingleFlight, SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.flight = SingleFlight()
+        self.calls = 0
+
+    def _slow_load(self, result="value", error=None):
+        def load():
+            self.calls += 1
+            time.sleep(0.05)
+            if error is not None:
+                raise error
+            return result
+        return load
+
+    def _run_threads(self, count, target):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(target())) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_calls_share_one_execution(self):
+        """Test: Varios hilos con la misma clave ejecutan la carga una sola vez"""
+        results = self._run_threads(8, lambda: self.flight.do("ORDER-1", self._slow_load()))
+
+        self.assertEqual(results, ["value"] * 8)
+        self.assertEqual(self.calls, 1)
+        status = self.flight.status()
+        self.assertEqual((status["loads"], status["coalesced"], status["in_flight"]), (1, 7, 0))
+
+    def test_sequential_calls_are_not_cached(self):
+        """Test: Al terminar la carga la clave se libera y la siguiente vuelve a ejecutar"""
+        self.flight.do("ORDER-1", self._slow_load())
+        self.flight.do("ORDER-1", self._slow_load())
+        self.flight.do("ORDER-2", self._slow_load())
+        self.assertEqual(self.calls, 3)
+
+    def test_errors_reach_every_waiter(self):
+        """Test: La excepción de la carga llega a todos los que la esperaban"""
+        def call():
+            try:
+                return self.flight.do("ORDER-1", self._slow_load(error=RuntimeError("db down")))
+            except RuntimeError as error:
+                return str(error)
+
+        self.assertEqual(self._run_threads(4, call), ["db down"] * 4)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(self.flight.do("ORDER-1", lambda: "recovered"), "recovered")
+
+    def test_forget_starts_a_new_execution_for_later_callers(self):
+        """Test: Tras forget las peticiones nuevas no se unen a la carga en curso"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def first_load():
+            started.set()
+            release.wait()
+            return "old"
+
+        leader = threading.Thread(target=lambda: self.flight.do("ORDER-1", first_load))
+        leader.start()
+        started.wait()
+        self.flight.forget("ORDER-1")
+        self.assertEqual(self.flight.do("ORDER-1", lambda: "new"), "new")
+        release.set()
+        leader.join()
+
+        status = self.flight.status()
+        self.assertEqual((status["loads"], status["forgotten"], status["in_flight"]), (2, 1, 0))
+
+
+class TestAsyncSingleFlight(unittest.TestCase):
+
+    def test_concurrent_coroutines_share_one_execution(self):
+        """Test: Varias corrutinas con la misma clave esperan una sola carga"""
+        flight = AsyncSingleFlight()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "value"
+
+        async def scenario():
+            return await asyncio.gather(*(flight.do("ORDER-1", load) for _ in range(6)))
+
+        self.assertEqual(asyncio.run(scenario()), ["value"] * 6)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(flight.status()["coalesced"], 5)
+
+    def test_cancelling_the_leader_does_not_cancel_followers(self):
+        """Test: Si se cancela la primera petición, las que se unieron reciben el resultado"""
+        flight = AsyncSingleFlight()
+
+        async def load():
+            await asyncio.sleep(0.05)
+            return "value"
+
+        async def scenario():
+            leader = asyncio.ensure_future(flight.do("ORDER-1", load))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flight.do("ORDER-1", load))
+            await asyncio.sleep(0)
+            leader.cancel()
+            return await follower, leader.cancelled()
+
+        self.assertEqual(asyncio.run(scenario()), ("value", True))
+        self.assertEqual(flight.status()["loads"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
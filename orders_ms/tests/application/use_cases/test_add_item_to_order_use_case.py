@@ -2,9 +2,10 @@
 Pruebas para el caso de uso: Agregar Item a Pedido
 """
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
+from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase, AsyncAddItemToOrderUseCase, MAX_ATTEMPTS
+from application.ports.order_repository import ConcurrencyConflictError
 from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO, AddItemToOrderResponseDTO
 from domain.value_objects.order_id import OrderId
 from domain.value_objects.sku import SKU
@@ -41,8 +42,7 @@ class TestAddItemToOrderUseCase(unittest.TestCase):
 
         order = Order.create(order_id, "customer_123")
         self.mock_orders_repo.get.return_value = order
-        self.mock_pricing_service.product_exists.return_value = True
-        self.mock_pricing_service.get_price.return_value = price
+        self.mock_pricing_service.get_prices.return_value = {sku.code: price}
 
         # Ejecutar caso de uso
         request_dto = AddItemToOrderRequestDTO(
@@ -56,8 +56,10 @@ class TestAddItemToOrderUseCase(unittest.TestCase):
         self.assertTrue(response_dto.success)
         self.mock_orders_repo.save.assert_called_once_with(order)
         self.mock_event_bus.publish_many.assert_called_once()
-        self.mock_pricing_service.product_exists.assert_called_once_with(sku)
-        self.mock_pricing_service.get_price.assert_called_once_with(sku)
+        # Una sola llamada al servicio de precios
+        self.mock_pricing_service.get_prices.assert_called_once_with([sku])
+        self.mock_pricing_service.product_exists.assert_not_called()
+        self.mock_pricing_service.get_price.assert_not_called()
 
     def test_add_item_order_not_found(self):
         # Configurar mocks
@@ -82,7 +84,7 @@ class TestAddItemToOrderUseCase(unittest.TestCase):
         sku = SKU("NONEXISTSKU")
         order = Order.create(order_id, "customer_123")
         self.mock_orders_repo.get.return_value = order
-        self.mock_pricing_service.product_exists.return_value = False
+        self.mock_pricing_service.get_prices.return_value = {}
 
         # Ejecutar caso de uso
         request_dto = AddItemToOrderRequestDTO(
@@ -97,5 +99,82 @@ class TestAddItemToOrderUseCase(unittest.TestCase):
         self.mock_orders_repo.save.assert_not_called()
         self.mock_event_bus.publish_many.assert_not_called()
 
+    @patch('application.use_cases.add_item_to_order_use_case.time.sleep')
+    def test_add_item_retries_on_concurrency_conflict(self, mock_sleep):
+        # Configurar mocks: el primer save choca con otra escritura
+        order_id = OrderId()
+        self.mock_orders_repo.get.side_effect = lambda _: Order.restore(order_id, "customer_123", [])
+        self.mock_orders_repo.save.side_effect = [ConcurrencyConflictError(order_id.code, 1), None]
+        self.mock_pricing_service.get_prices.return_value = {"TESTSKU1": Price(100.0)}
+
+        # Ejecutar caso de uso
+        response_dto = self.use_case.execute(
+            AddItemToOrderRequestDTO(order_id=order_id.code, sku="TESTSKU1", quantity=1)
+        )
+
+        # Verificar: se recarga la orden y se reintenta tras una espera
+        self.assertTrue(response_dto.success)
+        self.assertEqual(self.mock_orders_repo.get.call_count, 2)
+        self.assertEqual(self.mock_orders_repo.save.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(len(self.mock_event_bus.publish_many.call_args[0][0]), 1)
+
+    @patch('application.use_cases.add_item_to_order_use_case.time.sleep')
+    def test_add_item_gives_up_after_max_attempts(self, mock_sleep):
+        # Configurar mocks: todos los intentos chocan
+        order_id = OrderId()
+        self.mock_orders_repo.get.side_effect = lambda _: Order.restore(order_id, "customer_123", [])
+        self.mock_orders_repo.save.side_effect = ConcurrencyConflictError(order_id.code, 1)
+
+        # Ejecutar y verificar: el error tipado llega al llamador
+        with self.assertRaises(ConcurrencyConflictError):
+            self.use_case.execute(AddItemToOrderRequestDTO(order_id=order_id.code, sku="TESTSKU1", quantity=1))
+        self.assertEqual(self.mock_orders_repo.save.call_count, MAX_ATTEMPTS)
+        self.assertEqual(mock_sleep.call_count, MAX_ATTEMPTS - 1)
+        self.mock_event_bus.publish_many.assert_not_called()
+
+class TestAsyncAddItemToOrderUseCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Mock del AsyncUnitOfWork (async with + repositorio awaitable)
+        self.mock_uow = MagicMock()
+        self.mock_uow.__aenter__ = AsyncMock(return_value=self.mock_uow)
+        self.mock_uow.__aexit__ = AsyncMock(return_value=False)
+        self.mock_uow.orders.get = AsyncMock()
+        self.mock_uow.orders.save = AsyncMock()
+        self.mock_pricing_service = MagicMock()
+        self.mock_pricing_service.get_prices = AsyncMock()
+        self.mock_event_bus = MagicMock()
+
+        self.use_case = AsyncAddItemToOrderUseCase(
+            uow=self.mock_uow,
+            pricing_service=self.mock_pricing_service,
+            event_bus=self.mock_event_bus
+        )
+
+    async def test_add_item_successful(self):
+        order = Order.create(OrderId(), "customer_123")
+        self.mock_uow.orders.get.return_value = order
+        self.mock_pricing_service.get_prices.return_value = {"TESTSKU1": Price(100.0)}
+
+        response_dto = await self.use_case.execute(
+            AddItemToOrderRequestDTO(order_id=str(order.order_id), sku="TESTSKU1", quantity=2)
+        )
+
+        self.assertTrue(response_dto.success)
+        self.mock_uow.orders.save.assert_awaited_once_with(order)
+        self.mock_event_bus.publish_many.assert_called_once()
+
+    async def test_add_item_order_not_found(self):
+        self.mock_uow.orders.get.return_value = None
+        self.mock_pricing_service.get_prices.return_value = {"TESTSKU1": Price(100.0)}
+
+        response_dto = await self.use_case.execute(
+            AddItemToOrderRequestDTO(order_id=str(OrderId()), sku="TESTSKU1", quantity=1)
+        )
+
+        self.assertFalse(response_dto.success)
+        self.mock_uow.orders.save.assert_not_awaited()
+        self.mock_event_bus.publish_many.assert_not_called()
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,211 @@
+"""
+Pruebas para los casos de uso de varias líneas: añadir y reemplazar items
+"""
+import unittest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from application.ports.order_repository import ConcurrencyConflictError
+from application.use_cases.add_item_to_order_use_case import MAX_ATTEMPTS
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase, AsyncAddItemsToOrderUseCase
+from application.use_cases.replace_order_items_use_case import AsyncReplaceOrderItemsUseCase, ReplaceOrderItemsUseCase
+from application.dtos.order_items_dtos import OrderLineDTO, OrderItemsRequestDTO
+from domain.entities.order import Order
+from domain.events.items_cleared import ItemsCleared
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.services.static_pricing_service import AsyncStaticPricingService, StaticPricingService
+
+
+class TestAddItemsToOrderUseCase(unittest.TestCase):
+    def setUp(self):
+        self.mock_uow = MagicMock()
+        self.mock_orders_repo = MagicMock()
+        self.mock_uow.orders = self.mock_orders_repo
+        self.pricing_service = MagicMock(wraps=StaticPricingService())
+        self.mock_event_bus = MagicMock()
+        self.order = Order.restore(OrderId("ORDER-1"), "customer_123", [])
+        self.mock_orders_repo.get.return_value = self.order
+
+        self.use_case = AddItemsToOrderUseCase(
+            uow=self.mock_uow,
+            pricing_service=self.pricing_service,
+            event_bus=self.mock_event_bus
+        )
+
+    def test_adds_all_lines_with_one_pricing_call_and_one_save(self):
+        # Arrange
+        request_dto = OrderItemsRequestDTO(order_id="ORDER-1", lines=[
+            OrderLineDTO(sku="LAPTOP123", quantity=1),
+            OrderLineDTO(sku="MOUSE456", quantity=2),
+            OrderLineDTO(sku="LAPTOP123", quantity=1),
+        ])
+
+        # Act
+        response_dto = self.use_case.execute(request_dto)
+
+        # Assert
+        self.assertTrue(response_dto.success)
+        self.assertEqual(len(self.order.items), 3)
+        self.pricing_service.get_prices.assert_called_once()
+        self.pricing_service.get_price.assert_not_called()
+        self.pricing_service.product_exists.assert_not_called()
+        self.mock_orders_repo.save.assert_called_once_with(self.order)
+        self.assertEqual(len(self.mock_event_bus.publish_many.call_args[0][0]), 3)
+
+    def test_reports_errors_per_line_and_applies_nothing(self):
+        # Arrange: línea 1 con SKU desconocido, línea 2 con cantidad inválida
+        request_dto = OrderItemsRequestDTO(order_id="ORDER-1", lines=[
+            OrderLineDTO(sku="LAPTOP123", quantity=1),
+            OrderLineDTO(sku="UNKNOWN999", quantity=1),
+            OrderLineDTO(sku="MOUSE456", quantity=0),
+        ])
+
+        # Act
+        response_dto = self.use_case.execute(request_dto)
+
+        # Assert
+        self.assertFalse(response_dto.success)
+        self.assertEqual([(e.index, e.sku) for e in response_dto.errors], [(1, "UNKNOWN999"), (2, "MOUSE456")])
+        self.assertEqual(response_dto.errors[0].message, "Product not found")
+        self.assertEqual(self.order.items, [])
+        self.mock_orders_repo.save.assert_not_called()
+        self.mock_event_bus.publish_many.assert_not_called()
+
+    def test_order_not_found(self):
+        self.mock_orders_repo.get.return_value = None
+
+        response_dto = self.use_case.execute(OrderItemsRequestDTO(
+            order_id="ORDER-X", lines=[OrderLineDTO(sku="LAPTOP123", quantity=1)]
+        ))
+
+        self.assertFalse(response_dto.success)
+        self.assertFalse(response_dto.order_found)
+        self.mock_event_bus.publish_many.assert_not_called()
+
+    @patch('application.use_cases.add_item_to_order_use_case.time.sleep')
+    def test_retries_on_concurrency_conflict(self, mock_sleep):
+        # Arrange: el primer save choca con otra escritura; cada intento recarga la orden
+        self.mock_orders_repo.get.side_effect = lambda _: Order.restore(OrderId("ORDER-1"), "customer_123", [])
+        self.mock_orders_repo.save.side_effect = [ConcurrencyConflictError("ORDER-1", 1), None]
+
+        # Act
+        response_dto = self.use_case.execute(OrderItemsRequestDTO(order_id="ORDER-1", lines=[
+            OrderLineDTO(sku="LAPTOP123", quantity=1),
+            OrderLineDTO(sku="MOUSE456", quantity=2),
+        ]))
+
+        # Assert: las líneas se aplican una sola vez sobre la orden recargada
+        self.assertTrue(response_dto.success)
+        self.assertEqual(self.mock_orders_repo.get.call_count, 2)
+        mock_sleep.assert_called_once()
+        self.assertEqual(len(self.mock_orders_repo.save.call_args[0][0].items), 2)
+        self.assertEqual(len(self.mock_event_bus.publish_many.call_args[0][0]), 2)
+
+    @patch('application.use_cases.add_item_to_order_use_case.time.sleep')
+    def test_gives_up_after_max_attempts(self, mock_sleep):
+        self.mock_orders_repo.save.side_effect = ConcurrencyConflictError("ORDER-1", 1)
+
+        with self.assertRaises(ConcurrencyConflictError):
+            self.use_case.execute(OrderItemsRequestDTO(
+                order_id="ORDER-1", lines=[OrderLineDTO(sku="LAPTOP123", quantity=1)]
+            ))
+        self.assertEqual(self.mock_orders_repo.save.call_count, MAX_ATTEMPTS)
+        self.mock_event_bus.publish_many.assert_not_called()
+
+
+class TestReplaceOrderItemsUseCase(unittest.TestCase):
+    def setUp(self):
+        self.mock_uow = MagicMock()
+        self.order = Order.restore(OrderId("ORDER-1"), "customer_123", [
+            (SKU("KEYBOARD789"), Quantity(1), Price(39.99))
+        ])
+        self.mock_uow.orders.get.return_value = self.order
+        self.mock_event_bus = MagicMock()
+
+        self.use_case = ReplaceOrderItemsUseCase(
+            uow=self.mock_uow,
+            pricing_service=StaticPricingService(),
+            event_bus=self.mock_event_bus
+        )
+
+    def test_replaces_cart(self):
+        response_dto = self.use_case.execute(OrderItemsRequestDTO(
+            order_id="ORDER-1", lines=[OrderLineDTO(sku="MOUSE456", quantity=3)]
+        ))
+
+        self.assertTrue(response_dto.success)
+        self.assertEqual([(i[0].code, i[1].amount) for i in self.order.items], [("MOUSE456", 3)])
+        self.mock_uow.orders.save.assert_called_once_with(self.order)
+        events = self.mock_event_bus.publish_many.call_args[0][0]
+        self.assertIsInstance(events[0], ItemsCleared)
+
+    @patch('application.use_cases.add_item_to_order_use_case.time.sleep')
+    def test_retries_on_concurrency_conflict(self, mock_sleep):
+        # Arrange: el primer save choca; el reintento vuelve a vaciar y rellenar la orden recargada
+        self.mock_uow.orders.get.side_effect = lambda _: Order.restore(OrderId("ORDER-1"), "customer_123", [
+            (SKU("KEYBOARD789"), Quantity(1), Price(39.99))
+        ])
+        self.mock_uow.orders.save.side_effect = [ConcurrencyConflictError("ORDER-1", 1), None]
+
+        # Act
+        response_dto = self.use_case.execute(OrderItemsRequestDTO(
+            order_id="ORDER-1", lines=[OrderLineDTO(sku="MOUSE456", quantity=3)]
+        ))
+
+        # Assert
+        self.assertTrue(response_dto.success)
+        self.assertEqual(self.mock_uow.orders.save.call_count, 2)
+        mock_sleep.assert_called_once()
+        saved = self.mock_uow.orders.save.call_args[0][0]
+        self.assertEqual([(i[0].code, i[1].amount) for i in saved.items], [("MOUSE456", 3)])
+
+
+class TestAsyncAddItemsToOrderUseCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_uow = MagicMock()
+        self.mock_uow.__aenter__ = AsyncMock(return_value=self.mock_uow)
+        self.mock_uow.__aexit__ = AsyncMock(return_value=False)
+        self.order = Order.restore(OrderId("ORDER-1"), "customer_123", [])
+        self.mock_uow.orders.get = AsyncMock(return_value=self.order)
+        self.mock_uow.orders.save = AsyncMock()
+        self.mock_event_bus = MagicMock()
+
+        self.use_case = AsyncAddItemsToOrderUseCase(
+            uow=self.mock_uow,
+            pricing_service=AsyncStaticPricingService(),
+            event_bus=self.mock_event_bus
+        )
+
+    async def test_adds_all_lines(self):
+        response_dto = await self.use_case.execute(OrderItemsRequestDTO(order_id="ORDER-1", lines=[
+            OrderLineDTO(sku="LAPTOP123", quantity=1),
+            OrderLineDTO(sku="MOUSE456", quantity=2),
+        ]))
+
+        self.assertTrue(response_dto.success)
+        self.assertEqual(len(self.order.items), 2)
+        self.mock_uow.orders.save.assert_awaited_once_with(self.order)
+
+    @patch('application.use_cases.add_item_to_order_use_case.asyncio.sleep', new_callable=AsyncMock)
+    async def test_replace_retries_on_concurrency_conflict(self, mock_sleep):
+        self.mock_uow.orders.get = AsyncMock(
+            side_effect=lambda _: Order.restore(OrderId("ORDER-1"), "customer_123", [])
+        )
+        self.mock_uow.orders.save = AsyncMock(side_effect=[ConcurrencyConflictError("ORDER-1", 1), None])
+        use_case = AsyncReplaceOrderItemsUseCase(
+            uow=self.mock_uow, pricing_service=AsyncStaticPricingService(), event_bus=self.mock_event_bus
+        )
+
+        response_dto = await use_case.execute(OrderItemsRequestDTO(
+            order_id="ORDER-1", lines=[OrderLineDTO(sku="MOUSE456", quantity=3)]
+        ))
+
+        self.assertTrue(response_dto.success)
+        self.assertEqual(self.mock_uow.orders.save.await_count, 2)
+        mock_sleep.assert_awaited_once()
+
+
+if __name__ == '__main__':
+    unittest.main()
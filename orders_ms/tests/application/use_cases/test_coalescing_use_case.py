@@ -0,0 +1,104 @@
+"""
+Tests para la coalescencia de lecturas de GetOrder y ListOrders en el Container
+"""
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.dtos.list_orders_dtos import ListOrdersRequestDTO
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderLineDTO
+from application.use_cases.coalescing_use_case import page_key
+from container import Container
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_order_summary_reader import InMemoryOrderSummaryReader
+
+
+def _slow(method, calls):
+    """Envuelve un método para que cuente sus llamadas y tarde en responder"""
+    def wrapper(*args, **kwargs):
+        calls.append(1)
+        time.sleep(0.05)
+        return method(*args, **kwargs)
+    return wrapper
+
+
+class TestCoalescingUseCases(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        with patch.dict(os.environ, {"ORDER_READ_COALESCING": "on"}):
+            self.container = Container()
+        self.order_id = self.container.create_order_use_case().execute(
+            CreateOrderRequestDTO(customer_id="customer-1")
+        ).order_id
+        self.reads = []
+
+    def _concurrently(self, count, call):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(call())) for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_get_order_requests_share_one_load(self):
+        """Test: Peticiones concurrentes de la misma orden hacen una sola lectura del repositorio"""
+        with patch.object(InMemoryOrderRepository, "get", _slow(InMemoryOrderRepository.get, self.reads)):
+            results = self._concurrently(6, lambda: self.container.get_order_use_case().execute(
+                GetOrderRequestDTO(order_id=self.order_id)
+            ))
+
+        self.assertEqual(len(self.reads), 1)
+        self.assertEqual({result.order_id for result in results}, {self.order_id})
+        self.assertEqual(self.container.get_read_coalescing_status()["get_order"]["coalesced"], 5)
+
+    def test_async_list_requests_share_one_page_read(self):
+        """Test: Corrutinas que piden la misma página comparten una lectura; otra página no"""
+        async def scenario():
+            same = [
+                self.container.async_list_orders_use_case().execute(ListOrdersRequestDTO(limit=10))
+                for _ in range(4)
+            ]
+            other = self.container.async_list_orders_use_case().execute(ListOrdersRequestDTO(limit=5))
+            return await asyncio.gather(*same, other)
+
+        list_summaries = _slow(InMemoryOrderSummaryReader.list_summaries, self.reads)
+        with patch.object(InMemoryOrderSummaryReader, "list_summaries", list_summaries):
+            pages = asyncio.run(scenario())
+
+        self.assertEqual(len(self.reads), 2)
+        self.assertEqual([len(page.orders) for page in pages], [1] * 5)
+        status = self.container.get_read_coalescing_status()["async_list_orders"]
+        self.assertEqual((status["loads"], status["coalesced"]), (2, 3))
+
+    def test_writes_release_in_flight_reads(self):
+        """Test: Un evento de la orden libera su clave y todos los listados en curso"""
+        coalescer = self.container._read_coalescer
+        coalescer.orders._in_flight[self.order_id] = object()
+        coalescer.pages._in_flight[page_key(ListOrdersRequestDTO())] = object()
+
+        self.container.add_items_use_case().execute(
+            OrderItemsRequestDTO(order_id=self.order_id, lines=[OrderLineDTO("LAPTOP123", 1)])
+        )
+
+        status = self.container.get_read_coalescing_status()
+        self.assertEqual((status["get_order"]["in_flight"], status["list_orders"]["in_flight"]), (0, 0))
+        self.assertEqual(
+            self.container.get_order_use_case().execute(GetOrderRequestDTO(order_id=self.order_id)).items_count, 1
+        )
+
+    def test_disabled_by_default_and_bypassed_with_consistency_token(self):
+        """Test: Sin ORDER_READ_COALESCING o con token de consistencia no se coalesce"""
+        self.container.get_order_use_case("token").execute(GetOrderRequestDTO(order_id=self.order_id))
+        self.assertEqual(self.container.get_read_coalescing_status()["get_order"]["loads"], 0)
+        self.assertIsNone(Container().get_read_coalescing_status())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,9 +2,9 @@
 Tests para CreateOrderUseCase
 """
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
-from application.use_cases.create_order_use_case import CreateOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase, AsyncCreateOrderUseCase
 from application.dtos.create_order_dtos import CreateOrderRequestDTO, CreateOrderResponseDTO
 from domain.entities.order import Order
 
@@ -43,5 +43,28 @@ class TestCreateOrderUseCase(unittest.TestCase):
         self.assertIsInstance(response_dto, CreateOrderResponseDTO)
         self.assertIsNotNone(response_dto.order_id)
 
+class TestAsyncCreateOrderUseCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        # Mock del AsyncUnitOfWork (async with + save awaitable)
+        self.mock_uow = MagicMock()
+        self.mock_uow.__aenter__ = AsyncMock(return_value=self.mock_uow)
+        self.mock_uow.__aexit__ = AsyncMock(return_value=False)
+        self.mock_uow.orders.save = AsyncMock()
+        self.mock_event_bus = MagicMock()
+
+        self.use_case = AsyncCreateOrderUseCase(uow=self.mock_uow, event_bus=self.mock_event_bus)
+
+    async def test_execute_creates_order_and_publishes_events(self):
+        # Act
+        response_dto = await self.use_case.execute(CreateOrderRequestDTO(customer_id="customer-123"))
+
+        # Assert
+        self.mock_uow.orders.save.assert_awaited_once()
+        saved_order = self.mock_uow.orders.save.call_args[0][0]
+        self.assertEqual(saved_order.customer_id, "customer-123")
+        self.mock_uow.__aexit__.assert_awaited_once()
+        self.mock_event_bus.publish_many.assert_called_once()
+        self.assertEqual(response_dto.order_id, saved_order.order_id.code)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Tests para CreateOrdersBatchUseCase
+"""
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+from application.use_cases.create_orders_batch_use_case import (
+    CreateOrdersBatchUseCase,
+    AsyncCreateOrdersBatchUseCase,
+    MAX_BATCH_SIZE,
+)
+from application.dtos.create_orders_batch_dtos import (
+    BatchOrderDTO,
+    BatchOrderItemDTO,
+    CreateOrdersBatchRequestDTO,
+)
+from domain.events.order_created import OrderCreated
+from domain.events.item_added import ItemAdded
+from infrastructure.services.static_pricing_service import AsyncStaticPricingService, StaticPricingService
+
+
+class TestCreateOrdersBatchUseCase(unittest.TestCase):
+    def setUp(self):
+        self.mock_uow = MagicMock()
+        self.mock_orders_repo = MagicMock()
+        self.mock_uow.orders = self.mock_orders_repo
+        self.pricing_service = MagicMock(wraps=StaticPricingService())
+        self.mock_event_bus = MagicMock()
+
+        self.use_case = CreateOrdersBatchUseCase(
+            uow=self.mock_uow,
+            pricing_service=self.pricing_service,
+            event_bus=self.mock_event_bus
+        )
+
+    def test_execute_saves_batch_once_and_publishes_events_once(self):
+        # Arrange
+        request_dto = CreateOrdersBatchRequestDTO(orders=[
+            BatchOrderDTO(customer_id="customer-1", items=[
+                BatchOrderItemDTO(sku="LAPTOP123", quantity=1),
+                BatchOrderItemDTO(sku="MOUSE456", quantity=2),
+            ]),
+            BatchOrderDTO(customer_id="customer-2"),
+        ])
+
+        # Act
+        response_dto = self.use_case.execute(request_dto)
+
+        # Assert: una sola escritura con todas las órdenes
+        self.mock_orders_repo.save_many.assert_called_once()
+        saved_orders = self.mock_orders_repo.save_many.call_args[0][0]
+        self.assertEqual([o.customer_id for o in saved_orders], ["customer-1", "customer-2"])
+        self.assertEqual(len(saved_orders[0].items), 2)
+        self.assertEqual(response_dto.order_ids, [o.order_id.code for o in saved_orders])
+
+        # Assert: una sola publicación con los eventos de todo el lote
+        self.mock_event_bus.publish_many.assert_called_once()
+        events = self.mock_event_bus.publish_many.call_args[0][0]
+        self.assertEqual(sum(isinstance(e, OrderCreated) for e in events), 2)
+        self.assertEqual(sum(isinstance(e, ItemAdded) for e in events), 2)
+
+    def test_prices_are_looked_up_with_one_call(self):
+        """Test: Una sola llamada a get_prices para todo el lote, con cada SKU una vez"""
+        request_dto = CreateOrdersBatchRequestDTO(orders=[
+            BatchOrderDTO(customer_id=f"customer-{i}", items=[BatchOrderItemDTO(sku="LAPTOP123", quantity=1)])
+            for i in range(10)
+        ] + [BatchOrderDTO(customer_id="customer-10", items=[BatchOrderItemDTO(sku="MOUSE456", quantity=1)])])
+
+        self.use_case.execute(request_dto)
+
+        self.pricing_service.get_prices.assert_called_once()
+        self.assertEqual(
+            sorted(sku.code for sku in self.pricing_service.get_prices.call_args[0][0]), ["LAPTOP123", "MOUSE456"]
+        )
+        self.pricing_service.get_price.assert_not_called()
+        self.pricing_service.product_exists.assert_not_called()
+
+    def test_invalid_item_rejects_whole_batch(self):
+        """Test: Un SKU desconocido rechaza el lote sin escribir nada"""
+        request_dto = CreateOrdersBatchRequestDTO(orders=[
+            BatchOrderDTO(customer_id="customer-1"),
+            BatchOrderDTO(customer_id="customer-2", items=[BatchOrderItemDTO(sku="UNKNOWN999", quantity=1)]),
+        ])
+
+        with self.assertRaises(ValueError) as ctx:
+            self.use_case.execute(request_dto)
+
+        self.assertIn("orders[1].items[0]", str(ctx.exception))
+        self.mock_orders_repo.save_many.assert_not_called()
+        self.mock_event_bus.publish_many.assert_not_called()
+
+    def test_batch_size_limits(self):
+        """Test: Lotes vacíos o demasiado grandes son inválidos"""
+        with self.assertRaises(ValueError):
+            self.use_case.execute(CreateOrdersBatchRequestDTO(orders=[]))
+
+        too_big = [BatchOrderDTO(customer_id="c") for _ in range(MAX_BATCH_SIZE + 1)]
+        with self.assertRaises(ValueError):
+            self.use_case.execute(CreateOrdersBatchRequestDTO(orders=too_big))
+
+
+class TestAsyncCreateOrdersBatchUseCase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.mock_uow = MagicMock()
+        self.mock_uow.__aenter__ = AsyncMock(return_value=self.mock_uow)
+        self.mock_uow.__aexit__ = AsyncMock(return_value=False)
+        self.mock_uow.orders.save_many = AsyncMock()
+        self.mock_event_bus = MagicMock()
+
+        self.use_case = AsyncCreateOrdersBatchUseCase(
+            uow=self.mock_uow,
+            pricing_service=AsyncStaticPricingService(),
+            event_bus=self.mock_event_bus
+        )
+
+    async def test_execute_saves_batch_once_and_publishes_events_once(self):
+        request_dto = CreateOrdersBatchRequestDTO(orders=[
+            BatchOrderDTO(customer_id="customer-1", items=[BatchOrderItemDTO(sku="LAPTOP123", quantity=1)]),
+            BatchOrderDTO(customer_id="customer-2"),
+        ])
+
+        response_dto = await self.use_case.execute(request_dto)
+
+        self.mock_uow.orders.save_many.assert_awaited_once()
+        self.assertEqual(len(response_dto.order_ids), 2)
+        self.mock_event_bus.publish_many.assert_called_once()
+        self.assertEqual(len(self.mock_event_bus.publish_many.call_args[0][0]), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,7 +4,7 @@ Tests para el caso de uso GetOrderUseCase
 import unittest
 from decimal import Decimal
 
-from application.use_cases.get_order_use_case import GetOrderUseCase  
+from application.use_cases.get_order_use_case import GetOrderUseCase, AsyncGetOrderUseCase
 from application.dtos.get_order_dtos import GetOrderRequestDTO
 from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
@@ -13,6 +13,7 @@ from domain.value_objects.price import Price
 from domain.value_objects.quantity import Quantity
 from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
 from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.database.in_memory_async_unit_of_work import InMemoryAsyncUnitOfWork
 
 
 class TestGetOrderUseCase(unittest.TestCase):
@@ -111,5 +112,30 @@ class TestGetOrderUseCase(unittest.TestCase):
         self.assertIsNone(response_dto)
 
 
+class TestAsyncGetOrderUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Configurar el entorno de testing"""
+        self.repository = InMemoryOrderRepository()
+        self.use_case = AsyncGetOrderUseCase(InMemoryAsyncUnitOfWork(self.repository))
+
+    async def test_get_existing_order_with_items(self):
+        """Test: La variante asíncrona devuelve el mismo DTO que la síncrona"""
+        order = Order(OrderId("ORDER-123"), "customer-456")
+        order.add_item(SKU("LAPTOP123"), Quantity(2), Price(Decimal("999.99")))
+        self.repository.save(order)
+
+        response_dto = await self.use_case.execute(GetOrderRequestDTO(order_id="ORDER-123"))
+
+        self.assertEqual(response_dto.order_id, "ORDER-123")
+        self.assertEqual(response_dto.items_count, 1)
+        self.assertEqual(response_dto.total_amount, Decimal("999.99") * 2)
+
+    async def test_get_nonexistent_order(self):
+        """Test: Orden inexistente devuelve None"""
+        response_dto = await self.use_case.execute(GetOrderRequestDTO(order_id="ORDER-NONEXISTENT"))
+        self.assertIsNone(response_dto)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -4,8 +4,9 @@ Tests para el caso de uso ListOrdersUseCase
 import unittest
 from decimal import Decimal
 
-from application.use_cases.list_orders_use_case import ListOrdersUseCase
+from application.use_cases.list_orders_use_case import ListOrdersUseCase, AsyncListOrdersUseCase
 from application.dtos.list_orders_dtos import ListOrdersRequestDTO
+from application.pagination import InvalidCursorError
 from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
 from domain.value_objects.sku import SKU
@@ -13,6 +14,7 @@ from domain.value_objects.price import Price
 from domain.value_objects.quantity import Quantity
 from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
 from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.database.in_memory_async_unit_of_work import InMemoryAsyncUnitOfWork
 
 
 class TestListOrdersUseCase(unittest.TestCase):
@@ -96,7 +98,7 @@ class TestListOrdersUseCase(unittest.TestCase):
         
         self.assertEqual(order_summary.order_id, "ORDER-MULTI")
         self.assertEqual(order_summary.customer_id, "customer-multi")
-        self.assertEqual(order_summary.items_count, 5)  # 2 laptops + 3 mice
+        self.assertEqual(order_summary.items_count, 2)  # Líneas de items (como GET /orders/{id})
         
         # Total: (999.99 * 2) + (29.99 * 3) = 1999.98 + 89.97 = 2089.95
         expected_total = Decimal("999.99") * 2 + Decimal("29.99") * 3
@@ -121,6 +123,97 @@ class TestListOrdersUseCase(unittest.TestCase):
         self.assertEqual(order_summary.items_count, 0)
         self.assertEqual(order_summary.total_amount, Decimal('0'))
 
+    
+    def test_list_orders_paginates_with_cursor(self):
+        """Test: Recorrer todas las órdenes página a página con el cursor"""
+        # Arrange: 5 órdenes guardadas en orden no alfabético
+        for code in ["ORDER-003", "ORDER-001", "ORDER-005", "ORDER-002", "ORDER-004"]:
+            self.repository.save(Order(OrderId(code), "customer"))
+        
+        # Act: Pedir páginas de 2 hasta agotar el cursor
+        pages = []
+        cursor = None
+        while True:
+            response_dto = self.use_case.execute(ListOrdersRequestDTO(cursor=cursor, limit=2))
+            pages.append([order.order_id for order in response_dto.orders])
+            cursor = response_dto.next_cursor
+            if cursor is None:
+                break
+        
+        # Assert: Páginas ordenadas, sin huecos ni duplicados
+        self.assertEqual(pages, [["ORDER-001", "ORDER-002"], ["ORDER-003", "ORDER-004"], ["ORDER-005"]])
+    
+    def test_list_orders_exact_page_has_no_next_cursor(self):
+        """Test: Si no quedan más órdenes no se devuelve cursor"""
+        self.repository.save(Order(OrderId("ORDER-001"), "customer"))
+        self.repository.save(Order(OrderId("ORDER-002"), "customer"))
+        
+        response_dto = self.use_case.execute(ListOrdersRequestDTO(limit=2))
+        
+        self.assertEqual(response_dto.total_orders, 2)
+        self.assertIsNone(response_dto.next_cursor)
+    
+    def test_list_orders_sorted_by_created_at(self):
+        """Test: Ordenar por fecha de creación respeta el orden de alta"""
+        for code in ["ORDER-B", "ORDER-C", "ORDER-A"]:
+            self.repository.save(Order(OrderId(code), "customer"))
+        
+        first = self.use_case.execute(ListOrdersRequestDTO(limit=2, sort="created_at"))
+        second = self.use_case.execute(ListOrdersRequestDTO(cursor=first.next_cursor, limit=2, sort="created_at"))
+        
+        self.assertEqual([o.order_id for o in first.orders], ["ORDER-B", "ORDER-C"])
+        self.assertEqual([o.order_id for o in second.orders], ["ORDER-A"])
+    
+    def test_list_orders_rejects_invalid_parameters(self):
+        """Test: Cursor, límite u orden inválidos lanzan ValueError"""
+        self.repository.save(Order(OrderId("ORDER-001"), "customer"))
+        self.repository.save(Order(OrderId("ORDER-002"), "customer"))
+        cursor = self.use_case.execute(ListOrdersRequestDTO(limit=1)).next_cursor
+        
+        with self.assertRaises(InvalidCursorError):
+            self.use_case.execute(ListOrdersRequestDTO(cursor="not-a-cursor"))
+        with self.assertRaises(InvalidCursorError):
+            self.use_case.execute(ListOrdersRequestDTO(cursor=cursor, sort="created_at"))
+        with self.assertRaises(ValueError):
+            self.use_case.execute(ListOrdersRequestDTO(limit=0))
+        with self.assertRaises(ValueError):
+            self.use_case.execute(ListOrdersRequestDTO(sort="total_amount"))
+
+    
+    def test_list_orders_reflects_items_added_after_save(self):
+        """Test: Los totales se actualizan al guardar items nuevos"""
+        order = Order(OrderId("ORDER-INC"), "customer")
+        order.add_item(SKU("LAPTOP123"), Quantity(1), Price(Decimal("999.99")))
+        self.repository.save(order)
+        
+        stored = self.repository.get("ORDER-INC")
+        stored.add_item(SKU("MOUSE456"), Quantity(2), Price(Decimal("29.99")))
+        self.repository.save(stored)
+        
+        order_summary = self.use_case.execute(ListOrdersRequestDTO()).orders[0]
+        self.assertEqual(order_summary.items_count, 2)
+        self.assertEqual(order_summary.total_amount, Decimal("999.99") + Decimal("29.99") * 2)
+
+
+class TestAsyncListOrdersUseCase(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Configurar el entorno de testing"""
+        self.repository = InMemoryOrderRepository()
+        self.use_case = AsyncListOrdersUseCase(InMemoryAsyncUnitOfWork(self.repository))
+
+    async def test_list_orders_paginates_with_cursor(self):
+        """Test: La variante asíncrona pagina igual que la síncrona"""
+        for code in ["ORDER-002", "ORDER-001", "ORDER-003"]:
+            self.repository.save(Order(OrderId(code), "customer"))
+
+        first = await self.use_case.execute(ListOrdersRequestDTO(limit=2))
+        second = await self.use_case.execute(ListOrdersRequestDTO(cursor=first.next_cursor, limit=2))
+
+        self.assertEqual([o.order_id for o in first.orders], ["ORDER-001", "ORDER-002"])
+        self.assertEqual([o.order_id for o in second.orders], ["ORDER-003"])
+        self.assertIsNone(second.next_cursor)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
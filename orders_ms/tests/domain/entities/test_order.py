@@ -3,6 +3,7 @@ from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
 from domain.events.order_created import OrderCreated
 from domain.events.item_added import ItemAdded
+from domain.events.items_cleared import ItemsCleared
 from domain.value_objects.sku import SKU
 from domain.value_objects.quantity import Quantity
 from domain.value_objects.price import Price
@@ -39,5 +40,46 @@ class TestOrder(unittest.TestCase):
         self.assertEqual(len(events), 2)  # OrderCreated + ItemAdded
         self.assertIsInstance(events[1], ItemAdded)
 
+    def test_restore_does_not_emit_events_nor_track_items(self):
+        # Reconstruir desde persistencia no genera cambios pendientes
+        items = [(SKU("ITEM1234"), Quantity(1), Price(10.00))]
+        order = Order.restore(OrderId("ORDER-1"), "123456789", items)
+        self.assertTrue(order.is_persisted)
+        self.assertEqual(len(order.items), 1)
+        self.assertEqual(order.new_items, [])
+        self.assertEqual(order.pull_domain_events(), [])
+
+    def test_new_items_tracks_lines_added_since_load(self):
+        # Solo los items añadidos tras la carga quedan pendientes
+        order = Order.restore(OrderId("ORDER-1"), "123456789", [(SKU("ITEM1234"), Quantity(1), Price(10.00))])
+        order.add_item(SKU("ITEM5678"), Quantity(2), Price(5.00))
+        self.assertEqual(len(order.items), 2)
+        self.assertEqual([item[0].code for item in order.new_items], ["ITEM5678"])
+
+        order.mark_persisted()
+        self.assertEqual(order.new_items, [])
+        self.assertEqual(len(order.items), 2)
+
+    def test_clear_items_empties_cart_and_emits_event(self):
+        # Vaciar el carrito marca la orden para reemplazar sus items guardados
+        order = Order.restore(OrderId("ORDER-1"), "123456789", [(SKU("ITEM1234"), Quantity(1), Price(10.00))])
+        order.clear_items()
+        order.add_item(SKU("ITEM5678"), Quantity(2), Price(5.00))
+        self.assertTrue(order.items_cleared)
+        self.assertEqual([item[0].code for item in order.items], ["ITEM5678"])
+        self.assertIsInstance(order.pull_domain_events()[0], ItemsCleared)
+
+        order.mark_persisted()
+        self.assertFalse(order.items_cleared)
+
+    def test_version_is_restored_and_advanced_on_persist(self):
+        # La versión viaja con la orden para el control de concurrencia optimista
+        self.assertEqual(Order(OrderId("ORDER-1"), "123456789").version, 0)
+        order = Order.restore(OrderId("ORDER-1"), "123456789", [], version=3)
+        self.assertEqual(order.version, 3)
+
+        order.mark_persisted(4)
+        self.assertEqual(order.version, 4)
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
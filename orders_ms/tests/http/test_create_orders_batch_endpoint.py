@@ -0,0 +1,55 @@
+"""
+Tests para el endpoint HTTP POST /orders:batch
+"""
+import unittest
+from fastapi.testclient import TestClient
+
+from main import app
+
+
+class TestCreateOrdersBatchEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        """Configurar el cliente de testing"""
+        self.client = TestClient(app)
+        self.repository = app.container.get_repository()
+
+    def tearDown(self):
+        """Limpiar datos después de cada test"""
+        self.repository.clear()
+
+    def test_create_orders_batch(self):
+        """Test: POST /orders:batch crea todas las órdenes con sus items"""
+        # Act
+        response = self.client.post("/orders:batch", json={"orders": [
+            {"customer_id": "customer-1", "items": [{"sku": "LAPTOP123", "quantity": 2}]},
+            {"customer_id": "customer-2"},
+        ]})
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["orders_created"], 2)
+
+        first = self.client.get(f"/orders/{data['order_ids'][0]}").json()
+        self.assertEqual(first["customer_id"], "customer-1")
+        self.assertEqual(first["items_count"], 1)
+        second = self.client.get(f"/orders/{data['order_ids'][1]}").json()
+        self.assertEqual(second["items_count"], 0)
+
+    def test_invalid_item_rejects_batch(self):
+        """Test: Un item inválido devuelve 400 y no crea ninguna orden"""
+        # Act
+        response = self.client.post("/orders:batch", json={"orders": [
+            {"customer_id": "customer-1"},
+            {"customer_id": "customer-2", "items": [{"sku": "UNKNOWN999", "quantity": 1}]},
+        ]})
+
+        # Assert
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("orders[1].items[0]", response.json()["detail"])
+        self.assertEqual(self.repository.get_all(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ Tests para el endpoint HTTP GET /orders/{order_id}
 """
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 from fastapi.testclient import TestClient
 
 # Importar la aplicación FastAPI
@@ -27,7 +28,7 @@ class TestGetOrderEndpoint(unittest.TestCase):
     def tearDown(self):
         """Limpiar datos después de cada test"""
         # Limpiar el repositorio
-        self.repository.orders.clear()
+        self.repository.clear()
     
     def test_get_existing_order_success(self):
         """Test: GET /orders/{order_id} - Orden existente con items"""
@@ -136,6 +137,50 @@ class TestGetOrderEndpoint(unittest.TestCase):
         self.assertEqual(data["items_count"], 1)
         self.assertEqual(data["total_amount"], 59.99 * 3)
 
+    def test_response_exposes_sql_statement_count(self):
+        """Test: Cada respuesta incluye el número de sentencias SQL de la petición"""
+        # Act: Cualquier petición pasa por el middleware
+        response = self.client.get("/orders/ORDER-NOTFOUND")
+        
+        # Assert: InMemory no ejecuta SQL
+        self.assertEqual(response.headers["X-SQL-Statements"], "0")
+        self.assertEqual(response.headers["X-SQL-Commits"], "0")
+
+    def test_if_none_match_returns_304_until_the_order_changes(self):
+        """Test: Con el ETag de la respuesta anterior se devuelve 304 hasta que la orden cambia"""
+        order_id = self.client.post("/orders", json={"customer_id": "customer-etag"}).json()["order_id"]
+        first = self.client.get(f"/orders/{order_id}")
+        etag = first.headers["ETag"]
+
+        not_modified = self.client.get(f"/orders/{order_id}", headers={"If-None-Match": etag})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+        self.assertEqual(not_modified.headers["ETag"], etag)
+
+        self.client.post(f"/orders/{order_id}/items", json={"sku": "LAPTOP123", "quantity": 1})
+        changed = self.client.get(f"/orders/{order_id}", headers={"If-None-Match": etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed.headers["ETag"], etag)
+        self.assertEqual(changed.json()["items_count"], 1)
+
+    def test_unchanged_order_is_served_without_hydrating(self):
+        """Test: Para una versión ya servida solo se consulta la versión, no la orden"""
+        order = Order(OrderId("ORDER-ETAG-CACHED"), "customer-123")
+        order.add_item(SKU("LAPTOP456"), Quantity(1), Price(Decimal("1299.99")))
+        self.repository.save(order)
+        first = self.client.get("/orders/ORDER-ETAG-CACHED")
+
+        with patch.object(self.repository, "get", wraps=self.repository.get) as get:
+            cached = self.client.get("/orders/ORDER-ETAG-CACHED")
+            not_modified = self.client.get(
+                "/orders/ORDER-ETAG-CACHED", headers={"If-None-Match": first.headers["ETag"]}
+            )
+
+        get.assert_not_called()
+        self.assertEqual(cached.content, first.content)
+        self.assertEqual(cached.headers["ETag"], first.headers["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
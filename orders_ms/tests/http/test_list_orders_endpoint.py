@@ -0,0 +1,85 @@
+"""
+Tests para el endpoint HTTP GET /orders (paginado por cursor)
+"""
+import unittest
+from fastapi.testclient import TestClient
+
+from main import app
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+
+
+class TestListOrdersEndpoint(unittest.TestCase):
+
+    def setUp(self):
+        """Configurar el cliente de testing"""
+        self.client = TestClient(app)
+        self.repository = app.container.get_repository()
+        for i in range(5):
+            self.repository.save(Order(OrderId(f"ORDER-{i:03d}"), f"customer-{i}"))
+
+    def tearDown(self):
+        """Limpiar datos después de cada test"""
+        self.repository.clear()
+
+    def test_list_orders_returns_pages_with_next_cursor(self):
+        """Test: GET /orders?limit=N devuelve páginas enlazadas por next_cursor"""
+        # Act: Primera página
+        response = self.client.get("/orders", params={"limit": 3})
+        
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual([o["order_id"] for o in data["orders"]], ["ORDER-000", "ORDER-001", "ORDER-002"])
+        self.assertEqual(data["total_orders"], 3)
+        self.assertIsNotNone(data["next_cursor"])
+        
+        # Act: Segunda página con el cursor
+        response = self.client.get("/orders", params={"limit": 3, "cursor": data["next_cursor"]})
+        
+        # Assert: Última página sin cursor
+        data = response.json()
+        self.assertEqual([o["order_id"] for o in data["orders"]], ["ORDER-003", "ORDER-004"])
+        self.assertIsNone(data["next_cursor"])
+
+    def test_list_orders_invalid_cursor_400(self):
+        """Test: Un cursor inválido devuelve 400"""
+        response = self.client.get("/orders", params={"cursor": "garbage"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_orders_if_none_match_returns_304(self):
+        """Test: La página lleva ETag y con If-None-Match se devuelve 304 si no cambió"""
+        etag = self.client.get("/orders", params={"limit": 3}).headers["ETag"]
+
+        response = self.client.get("/orders", params={"limit": 3}, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        self.repository.save(Order(OrderId("ORDER-0000"), "customer-new"))
+        response = self.client.get("/orders", params={"limit": 3}, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_orders_limit_out_of_range_422(self):
+        """Test: Un límite fuera de rango lo rechaza la validación de FastAPI"""
+        response = self.client.get("/orders", params={"limit": 0})
+        self.assertEqual(response.status_code, 422)
+
+    def test_list_customer_orders(self):
+        """Test: GET /customers/{id}/orders devuelve solo las órdenes de ese cliente, paginadas"""
+        for code in ("ORDER-101", "ORDER-102", "ORDER-103"):
+            self.repository.save(Order(OrderId(code), "customer-1"))
+
+        data = self.client.get("/customers/customer-1/orders", params={"limit": 3}).json()
+        self.assertEqual([o["order_id"] for o in data["orders"]], ["ORDER-001", "ORDER-101", "ORDER-102"])
+        response = self.client.get(
+            "/customers/customer-1/orders", params={"limit": 3, "cursor": data["next_cursor"]}
+        )
+        self.assertEqual([o["order_id"] for o in response.json()["orders"]], ["ORDER-103"])
+
+        response = self.client.get("/customers/nobody/orders")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["orders"], [])
+        self.assertEqual(self.client.get("/customers/customer-1/orders", params={"sort": "price"}).status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Tests para los endpoints HTTP de varias líneas:
+POST /orders/{order_id}/items:batch y PUT /orders/{order_id}/items
+"""
+import unittest
+from fastapi.testclient import TestClient
+
+from main import app
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+
+
+class TestOrderItemsEndpoints(unittest.TestCase):
+
+    def setUp(self):
+        """Configurar el cliente de testing"""
+        self.client = TestClient(app)
+        self.repository = app.container.get_repository()
+        self.repository.save(Order(OrderId("ORDER-ITEMS"), "customer-1"))
+
+    def tearDown(self):
+        """Limpiar datos después de cada test"""
+        self.repository.clear()
+
+    def test_add_items_batch(self):
+        """Test: POST items:batch añade todas las líneas"""
+        response = self.client.post("/orders/ORDER-ITEMS/items:batch", json={"items": [
+            {"sku": "LAPTOP123", "quantity": 1},
+            {"sku": "MOUSE456", "quantity": 2},
+        ]})
+
+        self.assertEqual(response.status_code, 200)
+        order = self.client.get("/orders/ORDER-ITEMS").json()
+        self.assertEqual(order["items_count"], 2)
+
+    def test_add_items_batch_reports_line_errors(self):
+        """Test: Errores por línea devuelven 422 y no se añade nada"""
+        response = self.client.post("/orders/ORDER-ITEMS/items:batch", json={"items": [
+            {"sku": "LAPTOP123", "quantity": 1},
+            {"sku": "UNKNOWN999", "quantity": 1},
+        ]})
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(response.json()["detail"], [
+            {"index": 1, "sku": "UNKNOWN999", "message": "Product not found"}
+        ])
+        self.assertEqual(self.client.get("/orders/ORDER-ITEMS").json()["items_count"], 0)
+
+    def test_replace_items(self):
+        """Test: PUT items reemplaza el carrito completo"""
+        self.client.post("/orders/ORDER-ITEMS/items:batch", json={"items": [
+            {"sku": "LAPTOP123", "quantity": 1},
+        ]})
+
+        response = self.client.put("/orders/ORDER-ITEMS/items", json={"items": [
+            {"sku": "MOUSE456", "quantity": 3},
+        ]})
+
+        self.assertEqual(response.status_code, 200)
+        order = self.client.get("/orders/ORDER-ITEMS").json()
+        self.assertEqual([item["sku"] for item in order["items"]], ["MOUSE456"])
+        listed = self.client.get("/orders").json()["orders"][0]
+        self.assertAlmostEqual(listed["total_amount"], 89.97)
+
+    def test_unknown_order_returns_404(self):
+        """Test: Orden inexistente devuelve 404"""
+        response = self.client.put("/orders/ORDER-MISSING/items", json={"items": []})
+
+        self.assertEqual(response.status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
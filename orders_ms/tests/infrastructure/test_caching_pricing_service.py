@@ -0,0 +1,180 @@
+"""
+Tests para el decorador de precios con caché (TTL, tamaño, caché negativa y sin estampida)
+"""
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from container import Container
+from domain.value_objects.sku import SKU
+from infrastructure.services.caching_pricing_service import (
+    AsyncCachingPricingService,
+    CachingPricingService,
+    pricing_cache_settings_from_env,
+)
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+
+class CountingPricingService(StaticPricingService):
+    """Catálogo estático que cuenta las llamadas y puede tardar en responder"""
+
+    def __init__(self, delay: float = 0):
+        super().__init__()
+        self.delay = delay
+        self.calls = []
+
+    def get_prices(self, skus):
+        self.calls.append(sorted(sku.code for sku in skus))
+        time.sleep(self.delay)
+        return super().get_prices(skus)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachingPricingService(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.clock = FakeClock()
+        self.backend = CountingPricingService()
+        self.pricing = CachingPricingService(self.backend, max_size=3, ttl=60, negative_ttl=5, clock=self.clock)
+
+    def test_only_missing_skus_reach_the_backend_in_one_call(self):
+        """Test: get_prices consulta de una vez solo los SKUs que no están en caché"""
+        self.pricing.get_prices([SKU("LAPTOP123")])
+        prices = self.pricing.get_prices([SKU("LAPTOP123"), SKU("MOUSE456"), SKU("MOUSE456")])
+
+        self.assertEqual(set(prices), {"LAPTOP123", "MOUSE456"})
+        self.assertEqual(self.backend.calls, [["LAPTOP123"], ["MOUSE456"]])
+        self.assertEqual(self.pricing.get_price(SKU("MOUSE456")), self.backend.get_price(SKU("MOUSE456")))
+        self.assertEqual(len(self.backend.calls), 2)
+
+    def test_unknown_skus_are_cached_negatively_for_a_shorter_ttl(self):
+        """Test: Un SKU desconocido no vuelve al catálogo hasta que caduca su entrada negativa"""
+        self.pricing.get_price(SKU("LAPTOP123"))
+        self.assertFalse(self.pricing.product_exists(SKU("UNKNOWN999")))
+        self.assertFalse(self.pricing.product_exists(SKU("UNKNOWN999")))
+        self.assertEqual(len(self.backend.calls), 2)
+        self.assertEqual(self.pricing.status()["negative_hits"], 1)
+
+        self.clock.now = 6  # caduca la entrada negativa, no el precio
+        self.pricing.product_exists(SKU("UNKNOWN999"))
+        self.pricing.get_price(SKU("LAPTOP123"))
+        self.assertEqual(len(self.backend.calls), 3)
+        self.clock.now = 61
+        self.pricing.get_price(SKU("LAPTOP123"))
+        self.assertEqual(len(self.backend.calls), 4)
+
+    def test_size_is_bounded(self):
+        """Test: Al superar max_size se expulsan los SKUs menos usados"""
+        self.pricing.get_prices([SKU(code) for code in ("LAPTOP123", "MOUSE456", "KEYBOARD789", "MONITOR147")])
+        status = self.pricing.status()
+        self.assertEqual((status["size"], status["evictions"]), (3, 1))
+
+    def test_concurrent_misses_share_one_backend_call(self):
+        """Test: Varios hilos que piden el mismo SKU caducado generan una sola consulta"""
+        backend = CountingPricingService(delay=0.05)
+        pricing = CachingPricingService(backend, max_size=10)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(pricing.get_price(SKU("LAPTOP123"))))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(backend.calls), 1)
+        self.assertEqual(len(set(price.amount for price in results)), 1)
+        self.assertEqual(pricing.status()["coalesced"], 7)
+
+    def test_backend_errors_are_not_cached(self):
+        """Test: Si el catálogo falla el error llega al llamador y la siguiente petición reintenta"""
+        with patch.object(self.backend, "get_prices", side_effect=RuntimeError("catalog unavailable")):
+            with self.assertRaises(RuntimeError):
+                self.pricing.get_price(SKU("LAPTOP123"))
+        self.assertIsNotNone(self.pricing.get_price(SKU("LAPTOP123")))
+
+
+class TestAsyncCachingPricingService(unittest.IsolatedAsyncioTestCase):
+
+    async def test_misses_do_not_block_the_event_loop(self):
+        """Test: Mientras se consulta el catálogo el loop sigue atendiendo otras tareas"""
+        backend = CountingPricingService(delay=0.2)
+        cache = CachingPricingService(backend, max_size=10)
+        pricing = AsyncCachingPricingService(cache)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.01)
+
+        ticking = asyncio.ensure_future(ticker())
+        prices = await asyncio.gather(*[pricing.get_price(SKU("LAPTOP123")) for _ in range(5)])
+        ticking.cancel()
+
+        self.assertGreater(ticks, 5)
+        self.assertEqual(len(backend.calls), 1)
+        self.assertEqual(len(set(price.amount for price in prices)), 1)
+        self.assertEqual(cache.status()["coalesced"], 4)
+
+    async def test_shares_the_cache_with_the_sync_variant(self):
+        """Test: Lo que carga una variante lo sirve la otra sin volver al catálogo"""
+        backend = CountingPricingService()
+        cache = CachingPricingService(backend, max_size=10)
+        pricing = AsyncCachingPricingService(cache)
+
+        self.assertTrue(await pricing.product_exists(SKU("MOUSE456")))
+        cache.get_price(SKU("MOUSE456"))
+        cache.get_price(SKU("LAPTOP123"))
+        self.assertIsNotNone(await pricing.get_price(SKU("LAPTOP123")))
+        self.assertFalse(await pricing.product_exists(SKU("UNKNOWN999")))
+
+        self.assertEqual(backend.calls, [["MOUSE456"], ["LAPTOP123"], ["UNKNOWN999"]])
+
+
+class TestCachingPricingServiceContainer(unittest.TestCase):
+
+    def test_settings_from_env(self):
+        """Test: Desactivada por defecto; tamaño y TTLs configurables"""
+        self.assertIsNone(pricing_cache_settings_from_env({}))
+        self.assertEqual(
+            pricing_cache_settings_from_env({
+                "PRICING_CACHE_SIZE": "500", "PRICING_CACHE_TTL_SECONDS": "60", "PRICING_NEGATIVE_TTL_SECONDS": "2"
+            }),
+            {"max_size": 500, "ttl": 60.0, "negative_ttl": 2.0}
+        )
+
+    def test_container_wraps_the_pricing_service(self):
+        """Test: Con PRICING_CACHE_SIZE los casos de uso valoran a través de la caché"""
+        with patch.dict(os.environ, {"PRICING_CACHE_SIZE": "100"}):
+            container = Container()
+        order_id = container.create_order_use_case().execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+        for _ in range(3):
+            container.add_item_use_case().execute(AddItemToOrderRequestDTO(order_id=order_id, sku="LAPTOP123", quantity=1))
+
+        asyncio.run(container.async_add_item_use_case().execute(
+            AddItemToOrderRequestDTO(order_id=order_id, sku="LAPTOP123", quantity=1)
+        ))
+
+        status = container.get_pricing_cache_status()
+        self.assertEqual((status["loads"], status["hits"]), (1, 3))
+        self.assertIsNone(Container().get_pricing_cache_status())
+
+
+if __name__ == '__main__':
+    unittest.main()
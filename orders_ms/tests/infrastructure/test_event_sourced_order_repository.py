@@ -0,0 +1,336 @@
+"""
+Tests para el repositorio event-sourced (order_events + order_snapshots):
+guardado por INSERT de eventos, reconstrucción, snapshots y concurrencia
+"""
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.dtos.list_orders_dtos import ListOrdersRequestDTO
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderLineDTO
+from application.ports.order_repository import ConcurrencyConflictError
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase
+from application.use_cases.replace_order_items_use_case import ReplaceOrderItemsUseCase
+from container import Container
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.connection import Base
+from infrastructure.database.event_sourced_async_unit_of_work import AsyncEventSourcedUnitOfWork
+from infrastructure.database.event_sourced_unit_of_work import EventSourcedUnitOfWork
+from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.database.models.order_event_model import OrderEventModel, OrderSnapshotModel
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.repositories.event_sourced_order_repository import EventSourcedOrderRepository
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.order_event_store import snapshot_every_from_env
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+
+def _snapshot(order: Order) -> tuple:
+    return (
+        order.order_id.code,
+        order.customer_id,
+        order.version,
+        [(sku.code, quantity.amount, price.amount, price.currency) for sku, quantity, price in order.items],
+    )
+
+
+def _apply_scenario(uow_factory) -> str:
+    """Crear, añadir dos veces y reemplazar los items con los casos de uso"""
+    pricing, bus = StaticPricingService(), InMemoryEventBus()
+    order_id = CreateOrderUseCase(uow_factory(), bus).execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+    add_items = AddItemsToOrderUseCase(uow_factory(), pricing, bus)
+    add_items.execute(OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("LAPTOP123", 1)]))
+    add_items.execute(OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("MOUSE456", 2)]))
+    ReplaceOrderItemsUseCase(uow_factory(), pricing, bus).execute(
+        OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("MOUSE456", 3), OrderLineDTO("LAPTOP123", 1)])
+    )
+    add_items.execute(OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("LAPTOP123", 4)]))
+    return order_id
+
+
+class TestEventSourcedOrderRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = instrument_engine(create_engine("sqlite://", poolclass=StaticPool))
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _uow(self, **options):
+        return EventSourcedUnitOfWork(self.session_factory, **options)
+
+    def _events(self, order_id: str) -> int:
+        with self.engine.connect() as connection:
+            return connection.execute(
+                select(func.count()).select_from(OrderEventModel).where(OrderEventModel.order_id == order_id)
+            ).scalar()
+
+    def test_save_appends_events_and_updates_the_snapshot_summary(self):
+        """Test: Un guardado es un INSERT en order_events y un UPDATE del resumen del snapshot, sin DELETE"""
+        order_id = _apply_scenario(self._uow)
+        with self._uow() as uow:
+            order = uow.orders.get(order_id)
+            order.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+            with track_statements() as stats:
+                uow.orders.save(order)
+            uow.commit()
+
+        self.assertEqual(stats.count, 2)
+        self.assertTrue(stats.statements[0].startswith("INSERT INTO order_events"))
+        self.assertTrue(stats.statements[1].startswith("UPDATE order_snapshots"))
+        self.assertFalse(any(s.startswith("DELETE") for s in stats.statements))
+
+    def test_replay_matches_in_memory_repository(self):
+        """Test: Reconstruir desde los eventos da la misma orden que el repositorio en memoria"""
+        in_memory = InMemoryOrderRepository()
+        expected_id = _apply_scenario(lambda: InMemoryUnitOfWork(in_memory))
+        order_id = _apply_scenario(self._uow)
+
+        with self._uow(read_only=True) as uow:
+            rebuilt = uow.orders.get(order_id)
+        expected = in_memory.get(expected_id)
+        self.assertEqual(_snapshot(rebuilt)[1:], _snapshot(expected)[1:])
+        self.assertEqual(rebuilt.version, 5)
+
+    def test_get_version_without_replaying(self):
+        """Test: get_version lee la última versión del flujo con una consulta"""
+        order_id = _apply_scenario(self._uow)
+        with self._uow(read_only=True) as uow:
+            with track_statements() as stats:
+                version = uow.orders.get_version(order_id)
+            self.assertIsNone(uow.orders.get_version("ORDER-NONE"))
+        self.assertEqual((version, stats.count), (5, 1))
+
+    def test_snapshot_bounds_replayed_events(self):
+        """Test: Con snapshot cada N versiones get solo lee los eventos posteriores al snapshot"""
+        with self._uow(snapshot_every=3) as uow:
+            order = Order.create(OrderId("ORDER-SNAP"), "customer-1")
+            uow.orders.save(order)
+            uow.commit()
+        for _ in range(7):
+            with self._uow(snapshot_every=3) as uow:
+                order = uow.orders.get("ORDER-SNAP")
+                order.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+                uow.orders.save(order)
+                uow.commit()
+
+        session = self.session_factory()
+        repository = EventSourcedOrderRepository(session, snapshot_every=3)
+        with track_statements() as stats:
+            order = repository.get("ORDER-SNAP")
+        snapshot_version = session.execute(
+            select(OrderSnapshotModel.version).where(OrderSnapshotModel.order_id == "ORDER-SNAP")
+        ).scalar()
+        session.close()
+
+        self.assertEqual(stats.count, 2)
+        self.assertEqual((order.version, len(order.items)), (8, 7))
+        # Snapshot en la versión 6: get solo reproduce los eventos de las versiones 7 y 8
+        self.assertEqual(snapshot_version, 6)
+        self.assertEqual(self._events("ORDER-SNAP"), 8)
+
+    def test_concurrent_save_of_same_version_conflicts(self):
+        """Test: Dos guardados sobre la misma versión: el segundo falla con ConcurrencyConflictError"""
+        with self._uow() as uow:
+            uow.orders.save(Order.create(OrderId("ORDER-RACE"), "customer-1"))
+            uow.commit()
+
+        first, second = self._uow(), self._uow()
+        with first, second:
+            a = first.orders.get("ORDER-RACE")
+            b = second.orders.get("ORDER-RACE")
+            a.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+            b.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+            first.orders.save(a)
+            first.commit()
+            with self.assertRaises(ConcurrencyConflictError) as raised:
+                second.orders.save(b)
+
+        self.assertEqual(raised.exception.expected_version, 1)
+        with self._uow(read_only=True) as uow:
+            self.assertEqual([sku.code for sku, _, _ in uow.orders.get("ORDER-RACE").items], ["LAPTOP123"])
+
+    def test_overwrite_of_unloaded_order_continues_the_stream(self):
+        """Test: Guardar una orden no cargada con el mismo id continúa el flujo y reinicia su estado y su resumen"""
+        with self._uow() as uow:
+            order = Order.create(OrderId("ORDER-1"), "customer-1")
+            order.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+            uow.orders.save(order)
+            uow.commit()
+        with self._uow() as uow:
+            uow.orders.save(Order.create(OrderId("ORDER-1"), "customer-2"))
+            uow.commit()
+
+        with self._uow(read_only=True) as uow:
+            order = uow.orders.get("ORDER-1")
+            summaries = uow.summaries.list_summaries(None, 10)
+            previous_customer = uow.summaries.list_customer_summaries("customer-1", None, 10)
+            new_customer = uow.summaries.list_customer_summaries("customer-2", None, 10)
+        self.assertEqual((order.customer_id, order.items, order.version), ("customer-2", [], 2))
+        self.assertEqual([(s.customer_id, s.items_count) for s in summaries], [("customer-2", 0)])
+        self.assertEqual(previous_customer, [])
+        self.assertEqual([s.order_id for s in new_customer], ["ORDER-1"])
+
+    def test_list_pages_and_summaries(self):
+        """Test: get_all, páginas keyset y resúmenes sobre los snapshots"""
+        with self._uow() as uow:
+            orders = []
+            for i in range(5):
+                order = Order.create(OrderId(f"ORDER-{i}"), "customer-1")
+                order.add_item(SKU("MOUSE456"), Quantity(i + 1), Price(29.99))
+                orders.append(order)
+            uow.orders.save_many(orders)
+            uow.commit()
+
+        with self._uow(read_only=True) as uow:
+            everything = uow.orders.get_all()
+            first = uow.orders.get_page(None, 2)
+            second = uow.orders.get_page(first[-1].order_id.code, 2)
+            by_date = uow.orders.get_page(None, 10, sort="created_at")
+            summaries = uow.summaries.list_summaries(None, 10)
+
+        self.assertEqual(len(everything), 5)
+        self.assertEqual([o.order_id.code for o in first + second], ["ORDER-0", "ORDER-1", "ORDER-2", "ORDER-3"])
+        self.assertEqual(len(by_date), 5)
+        self.assertEqual([s.items_count for s in summaries], [1] * 5)
+        self.assertEqual(str(summaries[4].total_amount), "149.95")
+
+        with self._uow() as uow:
+            uow.orders.save(Order.create(OrderId("ORDER-9"), "customer-2"))
+            uow.commit()
+        with self._uow(read_only=True) as uow:
+            mine = uow.summaries.list_customer_summaries("customer-1", "ORDER-2", 10)
+            theirs = uow.summaries.list_customer_summaries("customer-2", None, 10, sort="created_at")
+        self.assertEqual([s.order_id for s in mine], ["ORDER-3", "ORDER-4"])
+        self.assertEqual([s.order_id for s in theirs], ["ORDER-9"])
+
+    def test_summaries_follow_every_save_without_reading_events(self):
+        """Test: El resumen del snapshot sigue a altas, líneas nuevas, reemplazos y reescrituras, y listar no lee eventos"""
+        for snapshot_every in (1, 2, 20):
+            with self.subTest(snapshot_every=snapshot_every):
+                order_id = _apply_scenario(lambda: self._uow(snapshot_every=snapshot_every))
+                with self._uow() as uow:
+                    overwritten = Order.create(OrderId("ORDER-OVERWRITTEN"), "customer-1")
+                    uow.orders.save(overwritten)
+                    uow.commit()
+                with self._uow() as uow:
+                    overwritten = Order.create(OrderId("ORDER-OVERWRITTEN"), "customer-1")
+                    overwritten.add_item(SKU("MOUSE456"), Quantity(2), Price(29.99))
+                    uow.orders.save(overwritten)
+                    uow.commit()
+
+                with self._uow(read_only=True) as uow:
+                    expected = {
+                        code: (len(order.items), sum(p.amount * q.amount for _, q, p in order.items))
+                        for code, order in ((o.order_id.code, o) for o in uow.orders.get_all())
+                    }
+                    with track_statements() as stats:
+                        summaries = uow.summaries.list_summaries(None, 10)
+                self.assertEqual({s.order_id: (s.items_count, s.total_amount) for s in summaries}, expected)
+                self.assertEqual(expected[order_id][0], 3)
+                self.assertEqual(stats.count, 1)
+                self.assertNotIn("order_events", stats.statements[0])
+                Base.metadata.drop_all(self.engine)
+                Base.metadata.create_all(self.engine)
+
+    def test_snapshot_every_from_env(self):
+        """Test: ORDER_SNAPSHOT_EVERY configura la frecuencia (mínimo 1)"""
+        self.assertEqual(snapshot_every_from_env({}), 20)
+        self.assertEqual(snapshot_every_from_env({"ORDER_SNAPSHOT_EVERY": "5"}), 5)
+        self.assertEqual(snapshot_every_from_env({"ORDER_SNAPSHOT_EVERY": "0"}), 1)
+
+
+class TestAsyncEventSourcedOrderRepository(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "orders.db")
+        sync_engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(sync_engine)
+        sync_engine.dispose()
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+        self.tmp.cleanup()
+
+    async def test_async_round_trip_with_snapshots(self):
+        """Test: La variante asíncrona guarda, reconstruye y detecta conflictos igual"""
+        async with AsyncEventSourcedUnitOfWork(self.session_factory, snapshot_every=2) as uow:
+            await uow.orders.save(Order.create(OrderId("ORDER-A"), "customer-1"))
+            await uow.commit()
+        for sku in ("LAPTOP123", "MOUSE456", "LAPTOP123"):
+            async with AsyncEventSourcedUnitOfWork(self.session_factory, snapshot_every=2) as uow:
+                order = await uow.orders.get("ORDER-A")
+                order.add_item(SKU(sku), Quantity(1), Price(10))
+                await uow.orders.save(order)
+                await uow.commit()
+
+        async with AsyncEventSourcedUnitOfWork(self.session_factory) as uow:
+            stale = await uow.orders.get("ORDER-A")
+            stale.mark_persisted(3)
+            stale.add_item(SKU("MOUSE456"), Quantity(1), Price(10))
+            with self.assertRaises(ConcurrencyConflictError):
+                await uow.orders.save(stale)
+
+        async with AsyncEventSourcedUnitOfWork(self.session_factory, read_only=True) as uow:
+            order = await uow.orders.get("ORDER-A")
+            page = await uow.summaries.list_summaries(None, 10)
+        self.assertEqual(order.version, 4)
+        self.assertEqual([sku.code for sku, _, _ in order.items], ["LAPTOP123", "MOUSE456", "LAPTOP123"])
+        self.assertEqual(page[0].items_count, 3)
+
+
+class TestEventStoreContainer(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {
+            "ORDERS_BACKEND": "sqlite",
+            "SQLITE_PATH": os.path.join(self.tmp.name, "orders.db"),
+            "ORDER_STORE": "events",
+        })
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def test_container_uses_event_store(self):
+        """Test: ORDER_STORE=events conecta los casos de uso al almacén de eventos"""
+        container = Container()
+        created = container.create_order_use_case().execute(CreateOrderRequestDTO(customer_id="customer-1"))
+        found = container.get_order_use_case().execute(GetOrderRequestDTO(order_id=created.order_id))
+        async_listed = asyncio.run(container.async_list_orders_use_case().execute(ListOrdersRequestDTO()))
+        with container._sqlite_engine.connect() as connection:
+            events = connection.execute(select(func.count()).select_from(OrderEventModel)).scalar()
+        container._sqlite_engine.dispose()
+        asyncio.run(container._async_sqlite_engine.dispose())
+
+        self.assertEqual(found.order_id, created.order_id)
+        self.assertEqual([o.order_id for o in async_listed.orders], [created.order_id])
+        self.assertEqual(events, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
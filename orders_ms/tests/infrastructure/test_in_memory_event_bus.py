@@ -50,6 +50,14 @@ class TestInMemoryEventBus(unittest.TestCase):
         self.assertEqual(self.event_bus.get_events_count(), 1)
         self.assertIn(event, self.event_bus.get_published_events())
 
+    def test_subscribers_receive_events_of_their_type(self):
+        """Test: Los suscriptores reciben solo los eventos del tipo al que se suscribieron"""
+        received = []
+        self.event_bus.subscribe(ItemAdded, received.append)
+        item_added = ItemAdded(order_id="ORDER123", sku="SKU123", quantity=1, price=10.0)
+        self.event_bus.publish_many([OrderCreated(order_id="ORDER123", customer_id="customer456"), item_added])
+        self.assertEqual(received, [item_added])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
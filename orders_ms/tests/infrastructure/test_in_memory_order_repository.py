@@ -3,6 +3,7 @@ Tests para el repositorio de órdenes en memoria.
 """
 
 import unittest
+from application.pagination import page_position
 from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
 from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
@@ -86,5 +87,52 @@ class TestInMemoryOrderRepository(unittest.TestCase):
         self.assertIn("ORDER-002", order_codes)
         self.assertIn("ORDER-003", order_codes)
 
+    def test_get_page_returns_sorted_orders_after_cursor(self):
+        """Test: get_page devuelve las órdenes ordenadas a partir de `after`"""
+        for code in ["ORDER-003", "ORDER-001", "ORDER-002"]:
+            self.repository.save(Order.create(OrderId(code), "customer"))
+        
+        first_page = self.repository.get_page(after=None, limit=2)
+        second_page = self.repository.get_page(after="ORDER-002", limit=2)
+        
+        self.assertEqual([o.order_id.code for o in first_page], ["ORDER-001", "ORDER-002"])
+        self.assertEqual([o.order_id.code for o in second_page], ["ORDER-003"])
+
+    def test_get_page_index_follows_saves_and_deletes(self):
+        """Test: El índice ordenado se mantiene al volver a guardar y al eliminar"""
+        order1 = Order.create(OrderId("ORDER-001"), "customer-1")
+        order2 = Order.create(OrderId("ORDER-002"), "customer-2")
+        order3 = Order.create(OrderId("ORDER-003"), "customer-1")
+        self.repository.save(order1)
+        self.repository.save(order2)
+        self.repository.save(order3)
+        self.repository.save(order1)  # Guardar de nuevo no duplica
+        position = page_position("created_at", self.repository.summaries["ORDER-002"])
+        self.repository.delete("ORDER-002")
+        
+        self.assertEqual([o.order_id.code for o in self.repository.get_page(None, 10)], ["ORDER-001", "ORDER-003"])
+        self.assertEqual([o.order_id.code for o in self.repository.get_page(None, 10, sort="created_at")],
+                         ["ORDER-001", "ORDER-003"])
+        # Un cursor que apunta a una orden eliminada sigue continuando tras ella
+        self.assertEqual([o.order_id.code for o in self.repository.get_page(position, 10, sort="created_at")],
+                         ["ORDER-003"])
+        self.assertEqual(self.repository.get_customer_page_ids("customer-1", position, 10, sort="created_at"),
+                         ["ORDER-003"])
+
+    def test_customer_index_follows_saves_and_deletes(self):
+        """Test: El índice por cliente pagina solo sus órdenes y se mantiene al guardar y eliminar"""
+        for code, customer in [("ORDER-003", "customer-1"), ("ORDER-001", "customer-2"),
+                               ("ORDER-002", "customer-1"), ("ORDER-004", "customer-1")]:
+            self.repository.save(Order.create(OrderId(code), customer))
+        self.repository.delete("ORDER-004")
+        self.repository.save(Order.create(OrderId("ORDER-001"), "customer-1"))  # Sobrescrita con otro cliente
+
+        self.assertEqual(self.repository.get_customer_page_ids("customer-1", None, 10),
+                         ["ORDER-001", "ORDER-002", "ORDER-003"])
+        self.assertEqual(self.repository.get_customer_page_ids("customer-1", "ORDER-001", 1), ["ORDER-002"])
+        self.assertEqual(self.repository.get_customer_page_ids("customer-1", None, 10, sort="created_at"),
+                         ["ORDER-003", "ORDER-001", "ORDER-002"])
+        self.assertEqual(self.repository.get_customer_page_ids("customer-2", None, 10), [])
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file
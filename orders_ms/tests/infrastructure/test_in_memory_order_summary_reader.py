@@ -0,0 +1,57 @@
+"""
+Tests para el lector de resúmenes en memoria.
+"""
+import unittest
+from decimal import Decimal
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_order_summary_reader import InMemoryOrderSummaryReader
+
+class TestInMemoryOrderSummaryReader(unittest.TestCase):
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.repository = InMemoryOrderRepository()
+        self.reader = InMemoryOrderSummaryReader(self.repository)
+
+    def test_summaries_are_maintained_incrementally(self):
+        """Test: Cada save suma solo los items nuevos al resumen"""
+        order = Order.create(OrderId("ORDER-001"), "customer-1")
+        order.add_item(SKU("LAPTOP123"), Quantity(2), Price(Decimal("999.99")))
+        self.repository.save(order)
+
+        order.add_item(SKU("MOUSE456"), Quantity(1), Price(Decimal("29.99")))
+        self.repository.save(order)
+        self.repository.save(order)  # Sin items nuevos: no cambia nada
+
+        summary = self.reader.list_summaries(after=None, limit=10)[0]
+        self.assertEqual(summary.items_count, 2)
+        self.assertEqual(summary.total_amount, Decimal("999.99") * 2 + Decimal("29.99"))
+
+    def test_unsaved_items_are_not_visible(self):
+        """Test: Los items añadidos sin guardar no aparecen en el resumen"""
+        order = Order.create(OrderId("ORDER-001"), "customer-1")
+        self.repository.save(order)
+        order.add_item(SKU("LAPTOP123"), Quantity(1), Price(Decimal("999.99")))
+
+        summary = self.reader.list_summaries(after=None, limit=10)[0]
+        self.assertEqual(summary.items_count, 0)
+        self.assertEqual(summary.total_amount, Decimal("0"))
+
+    def test_list_summaries_is_paginated_and_follows_deletes(self):
+        """Test: Paginación ordenada y resúmenes eliminados con la orden"""
+        for code in ["ORDER-003", "ORDER-001", "ORDER-002"]:
+            self.repository.save(Order.create(OrderId(code), "customer"))
+        self.repository.delete("ORDER-002")
+
+        first_page = self.reader.list_summaries(after=None, limit=1)
+        second_page = self.reader.list_summaries(after="ORDER-001", limit=10)
+
+        self.assertEqual([s.order_id for s in first_page], ["ORDER-001"])
+        self.assertEqual([s.order_id for s in second_page], ["ORDER-003"])
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,172 @@
+"""
+Tests para las migraciones Alembic, el particionado de order_items y la
+comprobación de índices con EXPLAIN (contra ficheros SQLite)
+"""
+import os
+import tempfile
+import unittest
+from datetime import date
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.runtime.migration import MigrationContext
+from sqlalchemy import create_engine, inspect, text
+
+from infrastructure.database.connection import Base
+from infrastructure.database.index_check import check_indexes
+from infrastructure.database.init_db import alembic_config, migrate
+from infrastructure.database.partitioning import (
+    parse_partitioning,
+    partition_order_items_ddl,
+    unpartition_order_items_ddl,
+)
+
+
+class TestMigrations(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.url = f"sqlite:///{os.path.join(self.tmp.name, 'orders.db')}"
+        self.engine = create_engine(self.url)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def _revision(self):
+        with self.engine.connect() as connection:
+            return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+
+    def test_upgrade_head_matches_models(self):
+        """Test: Tras upgrade head el esquema coincide con los modelos (autogenerate no ve diferencias)"""
+        migrate(self.url)
+
+        with self.engine.connect() as connection:
+            diff = compare_metadata(MigrationContext.configure(connection), Base.metadata)
+        self.assertEqual(diff, [])
+        self.assertEqual(self._revision(), "0008")
+
+    def test_downgrade_to_base_and_back(self):
+        """Test: Las migraciones se pueden deshacer y volver a aplicar"""
+        config = alembic_config(self.url)
+        command.upgrade(config, "head")
+        command.downgrade(config, "0002")
+        indexes = {index["name"] for index in inspect(self.engine).get_indexes("orders")}
+        self.assertIn("ix_orders_customer_id", indexes)
+        self.assertNotIn("ix_orders_created_at", indexes)
+
+        command.downgrade(config, "base")
+        self.assertFalse(inspect(self.engine).has_table("orders"))
+        command.upgrade(config, "head")
+        self.assertTrue(inspect(self.engine).has_table("order_items"))
+
+    def test_existing_create_all_database_is_stamped_before_upgrading(self):
+        """Test: Una base de datos creada con create_all se marca y se migra sin recrear tablas"""
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "CREATE TABLE orders (order_id VARCHAR PRIMARY KEY, customer_id VARCHAR NOT NULL, "
+                "total_amount NUMERIC(10, 2) NOT NULL, currency VARCHAR(3) NOT NULL, "
+                "items_count INTEGER NOT NULL, created_at DATETIME, updated_at DATETIME)"
+            ))
+            connection.execute(text(
+                "CREATE TABLE order_items (id INTEGER PRIMARY KEY, order_id VARCHAR NOT NULL "
+                "REFERENCES orders (order_id), sku VARCHAR NOT NULL, quantity INTEGER NOT NULL, "
+                "price NUMERIC(10, 2) NOT NULL, subtotal NUMERIC(10, 2) NOT NULL, created_at DATETIME)"
+            ))
+            connection.execute(text(
+                "INSERT INTO orders VALUES ('ORDER-1', 'customer-1', 0, 'EUR', 0, NULL, NULL)"
+            ))
+
+        migrate(self.url)
+
+        self.assertEqual(self._revision(), "0008")
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.execute(text("SELECT version FROM orders")).scalar(), 1)
+        self.assertIn("ix_order_items_order_id", {i["name"] for i in inspect(self.engine).get_indexes("order_items")})
+
+    def test_snapshot_summaries_are_backfilled_from_events(self):
+        """Test: 0008 rellena items_count y total_amount de los snapshots reproduciendo sus eventos"""
+        config = alembic_config(self.url)
+        command.upgrade(config, "0007")
+        with self.engine.begin() as connection:
+            connection.execute(text(
+                "INSERT INTO order_snapshots (order_id, customer_id, version, state) "
+                "VALUES ('ORDER-1', 'customer-1', 1, '{\"items\":[[\"LAPTOP123\",1,\"999.99\",\"EUR\"]]}')"
+            ))
+            connection.execute(text(
+                "INSERT INTO order_events (order_id, version, seq, event_type, data) VALUES "
+                "('ORDER-1', 2, 0, 'ItemAdded', '{\"item\":[\"MOUSE456\",2,\"29.99\",\"EUR\"]}')"
+            ))
+
+        command.upgrade(config, "head")
+
+        with self.engine.connect() as connection:
+            row = connection.execute(text("SELECT items_count, total_amount FROM order_snapshots")).one()
+        self.assertEqual((row.items_count, str(row.total_amount)), (2, "1059.97"))
+
+    def test_hot_queries_use_their_indexes(self):
+        """Test: EXPLAIN confirma que las consultas calientes usan los índices previstos"""
+        migrate(self.url)
+
+        results = check_indexes(self.engine)
+
+        self.assertEqual(len(results), 5)
+        for result in results:
+            self.assertTrue(result.uses_index, f"{result.name}: {result.plan}")
+
+    def test_index_check_detects_missing_index(self):
+        """Test: Sin el índice de order_items.order_id la comprobación falla"""
+        migrate(self.url)
+        with self.engine.begin() as connection:
+            connection.execute(text("DROP INDEX ix_order_items_order_id"))
+
+        failed = {result.name for result in check_indexes(self.engine) if not result.uses_index}
+        self.assertIn("order_items_by_order", failed)
+
+
+class TestOrderItemsPartitioning(unittest.TestCase):
+
+    def test_parse_partitioning(self):
+        """Test: Estrategia y número de particiones desde la opción de la migración"""
+        self.assertIsNone(parse_partitioning(None))
+        self.assertEqual(parse_partitioning("hash"), ("hash", 8))
+        self.assertEqual(parse_partitioning("range:3"), ("range", 3))
+        with self.assertRaises(ValueError):
+            parse_partitioning("list:4")
+
+    def test_hash_partitioning_ddl(self):
+        """Test: HASH por order_id con la clave de particionado en la PK"""
+        ddl = partition_order_items_ddl("hash", 4)
+
+        self.assertIn("PARTITION BY HASH (order_id)", ddl[0])
+        self.assertIn("PRIMARY KEY (id, order_id)", ddl[0])
+        partitions = [s for s in ddl if "PARTITION OF" in s]
+        self.assertEqual(len(partitions), 4)
+        self.assertIn("MODULUS 4, REMAINDER 3", partitions[-1])
+        self.assertEqual(ddl[-1], "ALTER INDEX ix_order_items_partitioned_order_id RENAME TO ix_order_items_order_id")
+
+    def test_range_partitioning_ddl(self):
+        """Test: RANGE mensual por created_at desde el item más antiguo, con partición DEFAULT"""
+        ddl = partition_order_items_ddl("range", 2, first_month=date(2026, 8, 17), today=date(2026, 10, 18))
+
+        self.assertIn("PARTITION BY RANGE (created_at)", ddl[0])
+        self.assertIn("created_at TIMESTAMP WITH TIME ZONE NOT NULL", ddl[0])
+        partitions = [s for s in ddl if "PARTITION OF" in s]
+        self.assertEqual(
+            [p.split()[2] for p in partitions],
+            ["order_items_y2026m08", "order_items_y2026m09", "order_items_y2026m10",
+             "order_items_y2026m11", "order_items_y2026m12", "order_items_default"]
+        )
+        self.assertIn("FROM ('2026-12-01') TO ('2027-01-01')", partitions[-2])
+
+    def test_unpartition_ddl_restores_plain_table(self):
+        """Test: La vuelta atrás recrea order_items con PK id"""
+        ddl = unpartition_order_items_ddl()
+
+        self.assertIn("PRIMARY KEY (id)", ddl[0])
+        self.assertNotIn("PARTITION BY", ddl[0])
+        self.assertIn("DROP TABLE order_items", ddl)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+"""
+Prueba de estrés: add_item concurrente sobre la misma orden (control optimista)
+"""
+import os
+import tempfile
+import threading
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+THREADS = 4
+ITEMS_PER_THREAD = 10
+
+
+class TestConcurrentAddItem(unittest.TestCase):
+
+    def setUp(self):
+        """SQLite en fichero: cada hilo usa su propia conexión y transacción"""
+        fd, self.db_path = tempfile.mkstemp(suffix=".db")
+        os.close(fd)
+        self.engine = create_engine(
+            f"sqlite:///{self.db_path}",
+            connect_args={"timeout": 30, "check_same_thread": False}
+        )
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+        with SQLAlchemyUnitOfWork(self.session_factory) as uow:
+            uow.orders.save(Order.create(OrderId("ORDER-HOT"), "customer-1"))
+
+    def tearDown(self):
+        self.engine.dispose()
+        os.remove(self.db_path)
+
+    def test_concurrent_add_item_loses_no_items(self):
+        """Test: Con escrituras concurrentes no se pierde ningún item y la versión cuadra"""
+        errors = []
+
+        def worker():
+            use_case_factory = lambda: AddItemToOrderUseCase(
+                SQLAlchemyUnitOfWork(self.session_factory), StaticPricingService(), InMemoryEventBus()
+            )
+            try:
+                for _ in range(ITEMS_PER_THREAD):
+                    response = use_case_factory().execute(
+                        AddItemToOrderRequestDTO(order_id="ORDER-HOT", sku="MOUSE456", quantity=1)
+                    )
+                    assert response.success
+            except Exception as e:  # pragma: no cover - se reporta abajo
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        session = self.session_factory()
+        header = session.get(OrderModel, "ORDER-HOT")
+        self.assertEqual(session.query(OrderItemModel).count(), THREADS * ITEMS_PER_THREAD)
+        self.assertEqual(header.items_count, THREADS * ITEMS_PER_THREAD)
+        self.assertEqual(header.version, 1 + THREADS * ITEMS_PER_THREAD)
+        session.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
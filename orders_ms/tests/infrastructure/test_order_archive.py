@@ -0,0 +1,167 @@
+"""
+Tests para el archivo de órdenes antiguas (orders_archive) y la lectura de
+respaldo de los repositorios
+"""
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.dtos.list_orders_dtos import ListOrdersRequestDTO
+from application.use_cases.get_order_use_case import GetOrderUseCase, AsyncGetOrderUseCase
+from application.use_cases.list_orders_use_case import ListOrdersUseCase
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.archive import archive_orders, archive_settings_from_env
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_archive_model import OrderArchiveModel
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+NOW = datetime(2026, 10, 18, tzinfo=timezone.utc)
+
+
+def _snapshot(order: Order) -> tuple:
+    return (
+        order.order_id.code,
+        order.customer_id,
+        order.version,
+        [(sku.code, quantity.amount, price.amount, price.currency) for sku, quantity, price in order.items],
+    )
+
+
+def _seed(session_factory, ages_in_days: dict) -> dict:
+    """Crea una orden con dos items por entrada y fija su created_at"""
+    session = session_factory()
+    repository = PostgreSQLOrderRepository(session)
+    orders = {}
+    for order_id in ages_in_days:
+        order = Order.create(OrderId(order_id), "customer-1")
+        order.add_item(SKU("LAPTOP123"), Quantity(2), Price(999.99))
+        order.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+        orders[order_id] = order
+    repository.save_many(list(orders.values()))
+    for order_id, days in ages_in_days.items():
+        session.execute(
+            update(OrderModel).where(OrderModel.order_id == order_id).values(created_at=NOW - timedelta(days=days))
+        )
+    session.commit()
+    session.close()
+    return orders
+
+
+class TestOrderArchive(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.orders = _seed(self.session_factory, {
+            "ORDER-OLD-1": 400, "ORDER-OLD-2": 500, "ORDER-OLD-3": 366, "ORDER-NEW": 10
+        })
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _count(self, model) -> int:
+        with self.engine.connect() as connection:
+            return connection.execute(select(func.count()).select_from(model)).scalar()
+
+    def _get(self, order_id: str, read_only: bool = True, core_reads: bool = False):
+        uow = SQLAlchemyUnitOfWork(self.session_factory, read_only=read_only, core_reads=core_reads)
+        with uow:
+            return uow.orders.get(order_id)
+
+    def test_archives_old_orders_in_batches(self):
+        """Test: Las órdenes antiguas pasan al archivo por lotes; las recientes se quedan"""
+        report = archive_orders(self.engine, older_than_days=365, batch_size=2, now=NOW)
+
+        self.assertEqual((report.archived, report.batches), (3, 2))
+        self.assertLess(report.compressed_bytes, report.raw_bytes)
+        self.assertEqual(self._count(OrderModel), 1)
+        self.assertEqual(self._count(OrderItemModel), 2)
+        self.assertEqual(self._count(OrderArchiveModel), 3)
+
+        # Volver a ejecutarlo no encuentra nada más que archivar
+        self.assertEqual(archive_orders(self.engine, older_than_days=365, now=NOW).archived, 0)
+
+    def test_reads_fall_back_to_the_archive(self):
+        """Test: get encuentra las órdenes archivadas, por la ruta ORM y por la ruta Core"""
+        archive_orders(self.engine, older_than_days=365, now=NOW)
+
+        for core_reads in (False, True):
+            archived = self._get("ORDER-OLD-1", core_reads=core_reads)
+            self.assertEqual(_snapshot(archived), _snapshot(self.orders["ORDER-OLD-1"]))
+            self.assertIsNotNone(self._get("ORDER-NEW", core_reads=core_reads))
+            self.assertIsNone(self._get("MISSING", core_reads=core_reads))
+
+        response = GetOrderUseCase(SQLAlchemyUnitOfWork(self.session_factory, read_only=True)).execute(
+            GetOrderRequestDTO(order_id="ORDER-OLD-2")
+        )
+        self.assertEqual(response.items_count, 2)
+
+    def test_archived_orders_are_not_writable_nor_listed(self):
+        """Test: Las escrituras no ven el archivo y los listados solo recorren la tabla caliente"""
+        archive_orders(self.engine, older_than_days=365, now=NOW)
+
+        self.assertIsNone(self._get("ORDER-OLD-1", read_only=False))
+        page = ListOrdersUseCase(SQLAlchemyUnitOfWork(self.session_factory, read_only=True)).execute(
+            ListOrdersRequestDTO()
+        )
+        self.assertEqual([summary.order_id for summary in page.orders], ["ORDER-NEW"])
+
+    def test_archive_settings_from_env(self):
+        """Test: Antigüedad y tamaño de lote configurables por entorno"""
+        self.assertEqual(archive_settings_from_env({}), {"older_than_days": 365, "batch_size": 500})
+        self.assertEqual(
+            archive_settings_from_env({"ORDER_ARCHIVE_AFTER_DAYS": "90", "ORDER_ARCHIVE_BATCH_SIZE": "100"}),
+            {"older_than_days": 90, "batch_size": 100}
+        )
+
+
+class TestAsyncOrderArchive(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "orders.db")
+        self.sync_engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(self.sync_engine)
+        self.orders = _seed(sessionmaker(bind=self.sync_engine), {"ORDER-OLD": 400})
+        archive_orders(self.sync_engine, older_than_days=365, now=NOW)
+
+        self.engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+        self.sync_engine.dispose()
+        self.tmp.cleanup()
+
+    async def test_async_reads_fall_back_to_the_archive(self):
+        """Test: La variante asíncrona también lee las órdenes archivadas"""
+        for core_reads in (False, True):
+            uow = SQLAlchemyAsyncUnitOfWork(self.session_factory, read_only=True, core_reads=core_reads)
+            async with uow:
+                archived = await uow.orders.get("ORDER-OLD")
+            self.assertEqual(_snapshot(archived), _snapshot(self.orders["ORDER-OLD"]))
+
+        response = await AsyncGetOrderUseCase(
+            SQLAlchemyAsyncUnitOfWork(self.session_factory, read_only=True)
+        ).execute(GetOrderRequestDTO(order_id="ORDER-OLD"))
+        self.assertEqual(response.items_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,197 @@
+"""
+Tests para la caché de órdenes (LRU/TTL) y su invalidación por eventos
+"""
+import asyncio
+import os
+import unittest
+from unittest.mock import patch
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderLineDTO
+from application.use_cases.get_order_use_case import GetOrderUseCase
+from container import Container
+from domain.entities.order import Order
+from domain.events.item_added import ItemAdded
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.caching_async_unit_of_work import AsyncCachingUnitOfWork
+from infrastructure.database.caching_unit_of_work import CachingUnitOfWork
+from infrastructure.database.in_memory_async_unit_of_work import InMemoryAsyncUnitOfWork
+from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.order_cache import OrderCache, cache_settings_from_env
+
+
+class CountingRepository(InMemoryOrderRepository):
+    """Repositorio en memoria que cuenta las lecturas que le llegan"""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+
+    def get(self, order_id):
+        self.reads += 1
+        return super().get(order_id)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _order(order_id: str, items: int = 1) -> Order:
+    order = Order.create(OrderId(order_id), "customer-1")
+    for _ in range(items):
+        order.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+    return order
+
+
+class TestOrderCache(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.clock = FakeClock()
+        self.repository = CountingRepository()
+        self.cache = OrderCache(max_size=2, ttl=10, clock=self.clock)
+        self.bus = InMemoryEventBus()
+        self.cache.subscribe_to(self.bus)
+
+    def _get(self, order_id: str):
+        return GetOrderUseCase(CachingUnitOfWork(InMemoryUnitOfWork(self.repository), self.cache)).execute(
+            GetOrderRequestDTO(order_id=order_id)
+        )
+
+    def test_read_through_hits_and_misses(self):
+        """Test: La primera lectura va al repositorio y las siguientes salen de la caché"""
+        self.repository.save(_order("ORDER-1"))
+        for _ in range(3):
+            self._get("ORDER-1")
+        self.assertEqual(self.repository.reads, 1)
+        status = self.cache.status()
+        self.assertEqual((status["hits"], status["misses"]), (2, 1))
+
+    def test_hits_return_independent_copies(self):
+        """Test: Modificar la orden devuelta no cambia la caché"""
+        self.repository.save(_order("ORDER-1"))
+        with CachingUnitOfWork(InMemoryUnitOfWork(self.repository), self.cache) as uow:
+            uow.orders.get("ORDER-1")
+            cached = uow.orders.get("ORDER-1")
+            cached.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+            self.assertEqual(len(uow.orders.get("ORDER-1").items), 1)
+
+    def test_events_invalidate_exactly_their_order(self):
+        """Test: ItemAdded invalida solo la orden del evento"""
+        self.repository.save(_order("ORDER-1"))
+        self.repository.save(_order("ORDER-2"))
+        self._get("ORDER-1")
+        self._get("ORDER-2")
+
+        self.repository.save(_order("ORDER-1", items=3))
+        self.bus.publish(ItemAdded("ORDER-1", "MOUSE456", 1, 29.99))
+
+        self.assertEqual(len(self._get("ORDER-1").items), 3)
+        self._get("ORDER-2")
+        self.assertEqual(self.repository.reads, 3)
+        self.assertEqual(self.cache.status()["invalidations"], 1)
+
+    def test_read_started_before_invalidation_is_not_cached(self):
+        """Test: Una lectura anterior a la invalidación no deja en caché el estado viejo"""
+        order = _order("ORDER-1")
+        generation = self.cache.generation("ORDER-1")
+        self.cache.invalidate("ORDER-1")
+        self.cache.put(order, generation)
+        self.assertIsNone(self.cache.get("ORDER-1"))
+
+    def test_reads_without_fill_serve_hits_but_do_not_cache(self):
+        """Test: Una lectura de réplica sin token (fill=False) no deja en la caché lo que lee"""
+        self.repository.save(_order("ORDER-1"))
+        with CachingUnitOfWork(InMemoryUnitOfWork(self.repository), self.cache, fill=False) as uow:
+            uow.orders.get("ORDER-1")
+        self.assertIsNone(self.cache.get("ORDER-1"))
+
+        self._get("ORDER-1")  # lectura del primario: rellena
+        with CachingUnitOfWork(InMemoryUnitOfWork(self.repository), self.cache, fill=False) as uow:
+            uow.orders.get("ORDER-1")
+        self.assertEqual(self.repository.reads, 2)
+
+    def test_async_reads_without_fill_do_not_cache(self):
+        """Test: La variante asíncrona tampoco rellena la caché con fill=False"""
+        self.repository.save(_order("ORDER-1"))
+
+        async def get():
+            async with AsyncCachingUnitOfWork(InMemoryAsyncUnitOfWork(self.repository), self.cache, fill=False) as uow:
+                return await uow.orders.get("ORDER-1")
+
+        self.assertIsNotNone(asyncio.run(get()))
+        self.assertIsNone(self.cache.get("ORDER-1"))
+
+    def test_lru_eviction_and_ttl_expiration(self):
+        """Test: Se expulsa la menos usada al superar max_size y las entradas caducan con el TTL"""
+        for order_id in ("ORDER-1", "ORDER-2", "ORDER-3"):
+            self.repository.save(_order(order_id))
+        self._get("ORDER-1")
+        self._get("ORDER-2")
+        self._get("ORDER-1")
+        self._get("ORDER-3")  # expulsa ORDER-2
+
+        self.assertEqual(self.cache.status()["evictions"], 1)
+        self.assertIsNone(self.cache.get("ORDER-2"))
+        self.clock.now = 11
+        self.assertIsNone(self.cache.get("ORDER-1"))
+        self.assertEqual(self.cache.status()["expirations"], 1)
+
+
+class TestOrderCacheContainer(unittest.TestCase):
+
+    def test_settings_from_env(self):
+        """Test: Desactivada por defecto; tamaño y TTL configurables"""
+        self.assertIsNone(cache_settings_from_env({}))
+        self.assertEqual(
+            cache_settings_from_env({"ORDER_CACHE_SIZE": "1000", "ORDER_CACHE_TTL_SECONDS": "30"}),
+            {"max_size": 1000, "ttl": 30.0}
+        )
+
+    def test_container_cache_is_invalidated_by_use_cases(self):
+        """Test: Con ORDER_CACHE_SIZE el Container cachea las lecturas y las escrituras las invalidan"""
+        with patch.dict(os.environ, {"ORDER_CACHE_SIZE": "100"}):
+            container = Container()
+        order_id = container.create_order_use_case().execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+        self.assertEqual(container.get_order_use_case().execute(GetOrderRequestDTO(order_id=order_id)).items, [])
+
+        container.add_items_use_case().execute(
+            OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("LAPTOP123", 1)])
+        )
+        found = asyncio.run(container.async_get_order_use_case().execute(GetOrderRequestDTO(order_id=order_id)))
+        again = asyncio.run(container.async_get_order_use_case().execute(GetOrderRequestDTO(order_id=order_id)))
+
+        self.assertEqual(len(found.items), 1)
+        self.assertEqual(len(again.items), 1)
+        status = container.get_order_cache_status()
+        self.assertEqual((status["hits"], status["misses"], status["invalidations"]), (1, 2, 1))
+        self.assertIsNone(Container().get_order_cache_status())
+
+    def test_container_with_replica_caches_only_reads_with_token(self):
+        """Test: Con réplica, solo las lecturas con token de consistencia rellenan la caché"""
+        with patch.dict(os.environ, {"ORDER_CACHE_SIZE": "100"}):
+            container = Container()
+        # En memoria la lectura no se enruta: basta con que haya réplica configurada
+        container._replica_router = container._async_replica_router = object()
+        order_id = container.create_order_use_case().execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+
+        container.get_order_use_case().execute(GetOrderRequestDTO(order_id=order_id))
+        asyncio.run(container.async_get_order_use_case().execute(GetOrderRequestDTO(order_id=order_id)))
+        self.assertEqual(container.get_order_cache_status()["size"], 0)
+
+        container.get_order_use_case("0/1").execute(GetOrderRequestDTO(order_id=order_id))
+        self.assertEqual(container.get_order_cache_status()["size"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
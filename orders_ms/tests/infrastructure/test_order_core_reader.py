@@ -0,0 +1,100 @@
+"""
+Tests para la lectura de órdenes con SQLAlchemy Core (order_core_reader)
+"""
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.database.connection import Base
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+
+def _snapshot(order: Order) -> tuple:
+    return (
+        order.order_id.code,
+        order.customer_id,
+        order.version,
+        order.is_persisted,
+        [(sku.code, quantity.amount, price.amount, price.currency) for sku, quantity, price in order.items],
+    )
+
+
+class TestOrderCoreReader(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = instrument_engine(create_engine("sqlite://", poolclass=StaticPool))
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        order = Order.create(OrderId("ORDER-1"), "customer-1")
+        order.add_item(SKU("LAPTOP123"), Quantity(2), Price(999.99))
+        order.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+        repository.save_many([order, Order.create(OrderId("ORDER-EMPTY"), "customer-2")])
+        session.commit()
+        session.close()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _get(self, order_id: str, core_reads: bool):
+        with SQLAlchemyUnitOfWork(self.session_factory, read_only=True, core_reads=core_reads) as uow:
+            return uow.orders.get(order_id)
+
+    def test_core_path_builds_same_entity_as_orm_path(self):
+        """Test: La ruta Core reconstruye la misma orden que el ORM (con y sin items)"""
+        for order_id in ("ORDER-1", "ORDER-EMPTY"):
+            self.assertEqual(_snapshot(self._get(order_id, True)), _snapshot(self._get(order_id, False)))
+        self.assertIsNone(self._get("MISSING", True))
+
+    def test_core_path_fetches_order_and_items_in_one_query(self):
+        """Test: Cabecera e items llegan en una sola consulta"""
+        with track_statements() as stats:
+            order = self._get("ORDER-1", True)
+
+        self.assertEqual(len(order.items), 2)
+        self.assertEqual(stats.count, 1)
+        self.assertIn("JOIN", stats.statements[0].upper())
+
+
+class TestAsyncOrderCoreReader(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    async def test_core_path_matches_orm_path(self):
+        """Test: La variante asíncrona devuelve la misma orden por ambas rutas"""
+        order = Order.create(OrderId("ORDER-1"), "customer-1")
+        order.add_item(SKU("KEYBOARD789"), Quantity(3), Price(79.99))
+        async with SQLAlchemyAsyncUnitOfWork(self.session_factory) as uow:
+            await uow.orders.save(order)
+
+        loaded = {}
+        for core_reads in (True, False):
+            async with SQLAlchemyAsyncUnitOfWork(self.session_factory, read_only=True, core_reads=core_reads) as uow:
+                loaded[core_reads] = await uow.orders.get("ORDER-1")
+
+        self.assertEqual(_snapshot(loaded[True]), _snapshot(loaded[False]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,212 @@
+"""
+Tests para la proyección de resúmenes mantenida con eventos: totales
+incrementales, paginación, reconstrucción y comprobación de consistencia
+"""
+import os
+import unittest
+from decimal import Decimal
+from unittest.mock import patch
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.list_orders_dtos import ListOrdersRequestDTO
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderLineDTO
+from application.pagination import page_position
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase
+from application.use_cases.replace_order_items_use_case import ReplaceOrderItemsUseCase
+from container import Container
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.in_memory_order_summary_reader import InMemoryOrderSummaryReader
+from infrastructure.repositories.order_summary_projection import OrderSummaryProjection
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+
+class TestOrderSummaryProjection(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.repository = InMemoryOrderRepository()
+        self.bus = InMemoryEventBus()
+        self.projection = OrderSummaryProjection()
+        self.projection.subscribe_to(self.bus)
+
+    def _uow(self):
+        return InMemoryUnitOfWork(self.repository)
+
+    def _create(self, customer_id: str) -> str:
+        return CreateOrderUseCase(self._uow(), self.bus).execute(CreateOrderRequestDTO(customer_id=customer_id)).order_id
+
+    def _add(self, order_id: str, *lines) -> None:
+        AddItemsToOrderUseCase(self._uow(), StaticPricingService(), self.bus).execute(
+            OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO(sku, qty) for sku, qty in lines])
+        )
+
+    def test_events_update_order_customer_and_global_totals(self):
+        """Test: Alta, items y reemplazo actualizan los totales de la orden, del cliente y globales"""
+        first = self._create("customer-1")
+        second = self._create("customer-1")
+        other = self._create("customer-2")
+        self._add(first, ("LAPTOP123", 1), ("MOUSE456", 2))
+        self._add(second, ("MOUSE456", 1))
+        self._add(other, ("LAPTOP123", 2))
+        ReplaceOrderItemsUseCase(self._uow(), StaticPricingService(), self.bus).execute(
+            OrderItemsRequestDTO(order_id=first, lines=[OrderLineDTO("KEYBOARD789", 1)])
+        )
+
+        summary = self.projection.get_summary(first)
+        self.assertEqual((summary.items_count, summary.total_amount), (1, Decimal("39.99")))
+        customer = self.projection.get_customer_summary("customer-1")
+        self.assertEqual(
+            (customer.orders_count, customer.items_count, customer.total_amount), (2, 2, Decimal("69.98"))
+        )
+        overview = self.projection.overview()
+        self.assertEqual(
+            (overview.orders_count, overview.items_count, overview.total_amount, overview.customers_count),
+            (3, 3, Decimal("2069.96"), 2)
+        )
+
+    def test_pages_match_the_repository_reader(self):
+        """Test: Las páginas por order_id y por created_at coinciden con las del repositorio"""
+        order_ids = [self._create(f"customer-{i}") for i in range(7)]
+        self._add(order_ids[3], ("LAPTOP123", 1))
+        reader = InMemoryOrderSummaryReader(self.repository)
+
+        for sort in ("order_id", "created_at"):
+            with self.subTest(sort=sort):
+                after, pages, expected = None, [], []
+                while True:
+                    page = self.projection.list_summaries(after, 3, sort)
+                    pages.extend(page)
+                    expected.extend(reader.list_summaries(after, 3, sort))
+                    if len(page) < 3:
+                        break
+                    after = page_position(sort, page[-1])
+                self.assertEqual(pages, expected)
+                self.assertEqual(len(pages), 7)
+
+    def test_created_at_cursor_survives_deleted_anchor(self):
+        """Test: Un cursor created_at cuya orden ya no existe continúa tras su posición"""
+        order_ids = [self._create("customer-1") for _ in range(3)]
+        self.projection.rebuild(self._uow())
+        position = page_position("created_at", self.projection.list_summaries(None, 2, "created_at")[-1])
+        self.repository.delete(order_ids[1])
+        self.projection.rebuild(self._uow())
+
+        self.assertEqual(
+            [summary.order_id for summary in self.projection.list_summaries(position, 3, "created_at")],
+            [order_ids[2]]
+        )
+
+    def test_customer_pages_match_the_repository_reader(self):
+        """Test: Las páginas de un cliente coinciden con las del índice por cliente del repositorio"""
+        for i in range(6):
+            self._create(f"customer-{i % 2}")
+        self.projection.rebuild(self._uow())
+        self._create("customer-1")
+        reader = InMemoryOrderSummaryReader(self.repository)
+
+        for sort in ("order_id", "created_at"):
+            with self.subTest(sort=sort):
+                page = self.projection.list_customer_summaries("customer-1", None, 3, sort)
+                self.assertEqual(page, reader.list_customer_summaries("customer-1", None, 3, sort))
+                after = page_position(sort, page[-1])
+                self.assertEqual(
+                    self.projection.list_customer_summaries("customer-1", after, 3, sort),
+                    reader.list_customer_summaries("customer-1", after, 3, sort)
+                )
+        self.assertEqual(self.projection.list_customer_summaries("nobody", None, 3), [])
+
+    def test_rebuild_loads_orders_saved_without_events(self):
+        """Test: rebuild carga los resúmenes guardados y la proyección sigue con los eventos"""
+        for i in range(5):
+            order = Order.create(OrderId(f"ORDER-{i}"), "customer-1")
+            order.add_item(SKU("MOUSE456"), Quantity(2), Price(29.99))
+            order.pull_domain_events()  # guardada sin publicar sus eventos
+            self.repository.save(order)
+        self._add("ORDER-0", ("LAPTOP123", 1))  # orden que la proyección aún no conoce
+        self.assertEqual(self.projection.status()["events_ignored"], 1)
+
+        self.assertEqual(self.projection.rebuild(self._uow(), page_size=2), 5)
+        self._add("ORDER-1", ("LAPTOP123", 1))
+
+        self.assertEqual(self.projection.get_summary("ORDER-0").items_count, 2)
+        self.assertEqual(self.projection.get_summary("ORDER-1").total_amount, Decimal("1059.97"))
+        self.assertEqual(self.projection.overview().orders_count, 5)
+
+    def test_rebuild_keeps_events_received_while_reading(self):
+        """Test: Los cambios publicados durante rebuild llegan al estado nuevo, sin perderse ni contarse dos veces"""
+        order_ids = [self._create("customer-1") for _ in range(6)]
+        list_summaries = InMemoryOrderSummaryReader.list_summaries
+        calls = []
+
+        def list_with_concurrent_writes(reader, after, limit, sort="order_id"):
+            page = list_summaries(reader, after, limit, sort)
+            calls.append(after)
+            if len(calls) == 1:
+                self._add(order_ids[0], ("LAPTOP123", 1))  # página ya leída: no la incluye
+                self._add(order_ids[4], ("MOUSE456", 2))   # página aún por leer: ya la incluirá
+            if len(page) < limit:
+                self._add(self._create("customer-2"), ("KEYBOARD789", 1))  # alta tras la última página
+            return page
+
+        with patch.object(InMemoryOrderSummaryReader, "list_summaries", list_with_concurrent_writes):
+            self.assertEqual(self.projection.rebuild(self._uow(), page_size=2), 7)
+
+        self.assertTrue(self.projection.check(self._uow()).consistent)
+        self.assertEqual(self.projection.get_summary(order_ids[0]).items_count, 1)
+        self.assertEqual(self.projection.get_summary(order_ids[4]).total_amount, Decimal("59.98"))
+        overview = self.projection.overview()
+        self.assertEqual((overview.orders_count, overview.items_count, overview.customers_count), (7, 3, 2))
+        self.assertEqual(self.projection.get_customer_summary("customer-2").items_count, 1)
+
+    def test_check_reports_drift_until_rebuilt(self):
+        """Test: check detecta órdenes con totales distintos, sin proyectar o ya borradas"""
+        kept = self._create("customer-1")
+        deleted = self._create("customer-1")
+        changed = self._create("customer-1")
+        self.repository.delete(deleted)
+        order = self.repository.get(changed)
+        order.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+        self.repository.save(order)  # sin publicar ItemAdded
+        self.repository.save(Order.create(OrderId("ORDER-UNSEEN"), "customer-2"))
+
+        report = self.projection.check(self._uow(), page_size=2)
+        self.assertFalse(report.consistent)
+        self.assertEqual(report.checked, 3)
+        self.assertEqual(
+            (report.mismatched, report.missing, report.unexpected), ([changed], ["ORDER-UNSEEN"], [deleted])
+        )
+        self.assertNotIn(kept, report.mismatched)
+
+        self.projection.rebuild(self._uow())
+        self.assertTrue(self.projection.check(self._uow()).consistent)
+
+
+class TestOrderSummaryProjectionContainer(unittest.TestCase):
+
+    def test_container_lists_from_the_projection(self):
+        """Test: Con ORDER_SUMMARY_PROJECTION=on los listados leen de la proyección"""
+        with patch.dict(os.environ, {"ORDER_SUMMARY_PROJECTION": "on"}):
+            container = Container()
+        order_id = container.create_order_use_case().execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+        container.add_items_use_case().execute(
+            OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("LAPTOP123", 1)])
+        )
+
+        with patch.object(InMemoryOrderSummaryReader, "list_summaries") as repository_reader:
+            page = container.list_orders_use_case().execute(ListOrdersRequestDTO())
+        repository_reader.assert_not_called()
+        self.assertEqual([(o.order_id, o.items_count) for o in page.orders], [(order_id, 1)])
+        self.assertTrue(container.check_summary_projection().consistent)
+        self.assertIsNone(Container().get_summary_projection())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+"""
+Tests del guardado con upsert (INSERT ... ON CONFLICT) contra SQLite,
+con el repositorio en memoria como referencia de comportamiento
+"""
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+from infrastructure.database.connection import Base
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+
+
+def _order(order_id: str, *items) -> Order:
+    order = Order.create(OrderId(order_id), "customer-1")
+    for sku, quantity in items:
+        order.add_item(SKU(sku), Quantity(quantity), Price(10.0))
+    return order
+
+
+class TestOrderUpsert(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = instrument_engine(create_engine("sqlite://", poolclass=StaticPool))
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _save(self, *orders):
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        if len(orders) == 1:
+            repository.save(orders[0])
+        else:
+            repository.save_many(list(orders))
+        session.commit()
+        session.close()
+
+    def _get(self, order_id: str) -> Order:
+        session = self.session_factory()
+        order = PostgreSQLOrderRepository(session).get(order_id)
+        session.close()
+        return order
+
+    def test_new_order_is_written_without_select(self):
+        """Test: Una orden nueva se escribe con el upsert de cabecera y el INSERT de items"""
+        with track_statements() as stats:
+            self._save(_order("ORDER-1", ("LAPTOP123", 1), ("MOUSE456", 2)))
+
+        self.assertEqual(stats.count, 2)
+        self.assertIn("ON CONFLICT", stats.statements[0])
+        self.assertFalse(any(s.lstrip().upper().startswith("SELECT") for s in stats.statements))
+        self.assertEqual(self._get("ORDER-1").version, 1)
+
+    def test_overwrite_replaces_items_and_bumps_version(self):
+        """Test: Guardar una orden no cargada con un ID existente la sobrescribe, igual que en memoria"""
+        in_memory = InMemoryOrderRepository()
+        for repository_save in (self._save, in_memory.save):
+            repository_save(_order("ORDER-1", ("LAPTOP123", 1), ("MOUSE456", 2)))
+            replacement = _order("ORDER-1", ("KEYBOARD789", 3))
+            repository_save(replacement)
+            self.assertEqual(replacement.version, 2)
+
+        for loaded in (self._get("ORDER-1"), in_memory.get("ORDER-1")):
+            self.assertEqual(loaded.version, 2)
+            self.assertEqual([(i[0].code, i[1].amount) for i in loaded.items], [("KEYBOARD789", 3)])
+        self.assertEqual(in_memory.summaries["ORDER-1"].items_count, 1)
+
+    def test_save_many_upserts_all_headers_in_one_statement(self):
+        """Test: El lote escribe todas las cabeceras con un único upsert, existan o no"""
+        self._save(_order("ORDER-1", ("LAPTOP123", 1)))
+
+        orders = [_order(f"ORDER-{i}", ("MOUSE456", i)) for i in range(1, 4)]
+        with track_statements() as stats:
+            self._save(*orders)
+
+        upserts = [s for s in stats.statements if "ON CONFLICT" in s]
+        self.assertEqual(len(upserts), 1)
+        self.assertEqual([order.version for order in orders], [2, 1, 1])
+        self.assertEqual([(i[0].code, i[1].amount) for i in self._get("ORDER-1").items], [("MOUSE456", 1)])
+
+    def test_save_many_with_repeated_order_id_keeps_the_last(self):
+        """Test: Si el lote repite un order_id se guarda la última copia, con sus items una sola vez"""
+        self._save(_order("ORDER-1", ("LAPTOP123", 1)))
+
+        with track_statements() as stats:
+            self._save(_order("ORDER-1", ("MOUSE456", 1)), _order("ORDER-2"), _order("ORDER-1", ("KEYBOARD789", 2)))
+
+        loaded = self._get("ORDER-1")
+        self.assertEqual(len([s for s in stats.statements if "ON CONFLICT" in s]), 1)
+        self.assertEqual(loaded.version, 2)
+        self.assertEqual([(i[0].code, i[1].amount) for i in loaded.items], [("KEYBOARD789", 2)])
+
+    def test_new_orders_keep_no_delete(self):
+        """Test: Un lote solo de órdenes nuevas no borra items (RETURNING indica que se insertaron)"""
+        with track_statements() as stats:
+            self._save(_order("ORDER-1", ("LAPTOP123", 1)), _order("ORDER-2", ("MOUSE456", 1)))
+
+        self.assertFalse(any(s.lstrip().upper().startswith("DELETE") for s in stats.statements))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Tests para el pool de conexiones instrumentado
+"""
+import os
+import unittest
+from unittest.mock import patch
+from sqlalchemy import create_engine, exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from infrastructure.database.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+    pool_settings_from_env,
+    pool_status,
+)
+
+
+class TestPoolSettingsFromEnv(unittest.TestCase):
+
+    def test_defaults(self):
+        """Test: Sin variables de entorno se usan los valores por defecto"""
+        settings = pool_settings_from_env({})
+
+        self.assertEqual(settings, {
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_timeout": 30.0,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+        })
+
+    def test_reads_environment(self):
+        """Test: Las variables DB_POOL_* sobrescriben los valores por defecto"""
+        settings = pool_settings_from_env({
+            "DB_POOL_SIZE": "20",
+            "DB_MAX_OVERFLOW": "0",
+            "DB_POOL_TIMEOUT": "2.5",
+            "DB_POOL_RECYCLE": "-1",
+            "DB_POOL_PRE_PING": "false",
+        })
+
+        self.assertEqual(settings["pool_size"], 20)
+        self.assertEqual(settings["max_overflow"], 0)
+        self.assertEqual(settings["pool_timeout"], 2.5)
+        self.assertEqual(settings["pool_recycle"], -1)
+        self.assertFalse(settings["pool_pre_ping"])
+
+    def test_reads_process_environment_at_call_time(self):
+        """Test: Sin argumento se lee os.environ en cada llamada"""
+        with patch.dict(os.environ, {"DB_POOL_SIZE": "7"}):
+            self.assertEqual(pool_settings_from_env()["pool_size"], 7)
+
+
+class TestPoolMetrics(unittest.TestCase):
+
+    def test_histogram_is_cumulative(self):
+        """Test: El histograma de espera es acumulado por bucket"""
+        metrics = PoolMetrics()
+        metrics.observe_checkout(0.0005, 1)
+        metrics.observe_checkout(0.02, 2)
+        metrics.observe_checkout(10, 1)
+
+        snapshot = metrics.snapshot()
+
+        histogram = snapshot["checkout_wait_seconds_histogram"]
+        self.assertEqual(histogram["0.001"], 1)
+        self.assertEqual(histogram["0.01"], 1)
+        self.assertEqual(histogram["0.05"], 2)
+        self.assertEqual(histogram["5.0"], 2)
+        self.assertEqual(histogram["+Inf"], 3)
+        self.assertEqual(snapshot["checkouts"], 3)
+        self.assertEqual(snapshot["max_checked_out"], 2)
+
+
+class TestInstrumentedQueuePool(unittest.TestCase):
+
+    def setUp(self):
+        """Pool diminuto: 1 conexión fija + 1 de overflow"""
+        self.engine = create_engine(
+            "sqlite://",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=1,
+            pool_timeout=0.05,
+        )
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_records_checkouts_and_overflow(self):
+        """Test: Cada checkout se mide y la conexión extra cuenta como overflow"""
+        with self.engine.connect() as first, self.engine.connect() as second:
+            first.execute(text("SELECT 1"))
+            second.execute(text("SELECT 1"))
+            status = pool_status(self.engine)
+            self.assertEqual(status["checked_out"], 2)
+            self.assertEqual((status["overflow"], status["max_overflow"]), (1, 1))
+
+        metrics = pool_status(self.engine)["metrics"]
+        self.assertEqual(metrics["checkouts"], 2)
+        self.assertEqual(metrics["overflow_events"], 1)
+        self.assertEqual(metrics["max_checked_out"], 2)
+        self.assertEqual(metrics["timeouts"], 0)
+
+    def test_records_timeouts(self):
+        """Test: Agotar el pool registra un timeout"""
+        with self.engine.connect(), self.engine.connect():
+            with self.assertRaises(exc.TimeoutError):
+                self.engine.connect()
+
+        self.assertEqual(pool_status(self.engine)["metrics"]["timeouts"], 1)
+
+    def test_metrics_survive_dispose(self):
+        """Test: engine.dispose() recrea el pool sin perder las métricas"""
+        with self.engine.connect():
+            pass
+        self.engine.dispose()
+
+        self.assertEqual(pool_status(self.engine)["metrics"]["checkouts"], 1)
+
+    def test_reused_connections_are_not_overflow(self):
+        """Test: Solo cuenta como overflow abrir una conexión por encima de pool_size"""
+        for _ in range(3):
+            with self.engine.connect():
+                pass
+        with self.engine.connect(), self.engine.connect():
+            pass
+
+        self.assertEqual(pool_status(self.engine)["metrics"]["overflow_events"], 1)
+
+    def test_status_of_non_queue_pool_is_none(self):
+        """Test: Pools sin cola (p. ej. StaticPool) no reportan estado"""
+        from sqlalchemy.pool import StaticPool
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+
+        self.assertIsNone(pool_status(engine))
+
+
+class TestInstrumentedAsyncAdaptedQueuePool(unittest.IsolatedAsyncioTestCase):
+
+    async def test_records_overflow_of_async_engine(self):
+        """Test: El pool asyncio cuenta checkouts y overflow igual que el síncrono"""
+        engine = create_async_engine(
+            "sqlite+aiosqlite://", poolclass=InstrumentedAsyncAdaptedQueuePool, pool_size=1, max_overflow=1
+        )
+        async with engine.connect() as first, engine.connect() as second:
+            await first.execute(text("SELECT 1"))
+            await second.execute(text("SELECT 1"))
+        await engine.dispose()
+
+        metrics = pool_status(engine.sync_engine)["metrics"]
+        self.assertEqual((metrics["checkouts"], metrics["overflow_events"]), (2, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""
+Tests para AsyncPostgreSQLOrderRepository y SQLAlchemyAsyncUnitOfWork (contra aiosqlite)
+"""
+import unittest
+from decimal import Decimal
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+
+# Import condicional: requiere SQLAlchemy asyncio y el driver aiosqlite
+try:
+    import aiosqlite  # noqa: F401
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+    from sqlalchemy.pool import StaticPool
+    from infrastructure.database.connection import Base
+    from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+    ASYNC_SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    ASYNC_SQLALCHEMY_AVAILABLE = False
+
+
+@unittest.skipUnless(ASYNC_SQLALCHEMY_AVAILABLE, "SQLAlchemy asyncio/aiosqlite no disponible en entorno de testing")
+class TestAsyncPostgreSQLOrderRepository(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Se ejecuta antes de cada test"""
+        # StaticPool: todas las sesiones comparten la misma base de datos en memoria
+        self.engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    def _uow(self):
+        return SQLAlchemyAsyncUnitOfWork(self.session_factory)
+
+    async def test_save_and_get_order_with_items(self):
+        """Test: Guardar una orden nueva y recuperarla con sus items"""
+        order = Order.create(OrderId("ORDER-ASYNC"), "customer-1")
+        order.add_item(SKU("LAPTOP123"), Quantity(2), Price(999.99))
+        async with self._uow() as uow:
+            await uow.orders.save(order)
+
+        async with self._uow() as uow:
+            loaded = await uow.orders.get("ORDER-ASYNC")
+
+        self.assertEqual(loaded.customer_id, "customer-1")
+        self.assertEqual([(i[0].code, i[1].amount) for i in loaded.items], [("LAPTOP123", 2)])
+        self.assertEqual(loaded.pull_domain_events(), [])
+
+    async def test_add_item_to_loaded_order_updates_summary(self):
+        """Test: Guardado incremental y resumen leído de las columnas denormalizadas"""
+        async with self._uow() as uow:
+            await uow.orders.save(Order.create(OrderId("ORDER-ASYNC"), "customer-1"))
+
+        async with self._uow() as uow:
+            order = await uow.orders.get("ORDER-ASYNC")
+            order.add_item(SKU("MOUSE456"), Quantity(3), Price(29.99))
+            await uow.orders.save(order)
+
+        async with self._uow() as uow:
+            summaries = await uow.summaries.list_summaries(after=None, limit=10)
+            orders = await uow.orders.get_all()
+
+        self.assertEqual(summaries[0].items_count, 1)
+        self.assertEqual(summaries[0].total_amount, Decimal("89.97"))
+        self.assertEqual(len(orders[0].items), 1)
+
+    async def test_get_page_and_delete(self):
+        """Test: Paginación keyset y eliminación"""
+        async with self._uow() as uow:
+            for code in ["ORDER-002", "ORDER-001", "ORDER-003"]:
+                await uow.orders.save(Order.create(OrderId(code), "customer"))
+
+        async with self._uow() as uow:
+            page = await uow.orders.get_page(after="ORDER-001", limit=1)
+            deleted = await uow.orders.delete("ORDER-002")
+            missing = await uow.orders.get("ORDER-002")
+
+        self.assertEqual([o.order_id.code for o in page], ["ORDER-002"])
+        self.assertTrue(deleted)
+        self.assertIsNone(missing)
+
+    async def test_save_many_writes_batch_in_one_transaction(self):
+        """Test: save_many guarda órdenes nuevas y persistidas del lote"""
+        async with self._uow() as uow:
+            await uow.orders.save(Order.create(OrderId("ORDER-001"), "customer"))
+
+        async with self._uow() as uow:
+            loaded = await uow.orders.get("ORDER-001")
+            loaded.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+            fresh = Order.create(OrderId("ORDER-002"), "customer")
+            fresh.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+            await uow.orders.save_many([loaded, fresh])
+
+        async with self._uow() as uow:
+            orders = {o.order_id.code: o for o in await uow.orders.get_all()}
+
+        self.assertEqual(len(orders["ORDER-001"].items), 1)
+        self.assertEqual(len(orders["ORDER-002"].items), 1)
+        self.assertTrue(fresh.is_persisted)
+
+    async def test_save_replaces_items_of_cleared_order(self):
+        """Test: Reemplazar el carrito borra los items anteriores y recalcula el resumen"""
+        order = Order.create(OrderId("ORDER-001"), "customer")
+        order.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+        async with self._uow() as uow:
+            await uow.orders.save(order)
+
+        async with self._uow() as uow:
+            loaded = await uow.orders.get("ORDER-001")
+            loaded.clear_items()
+            loaded.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+            await uow.orders.save(loaded)
+
+        async with self._uow() as uow:
+            reloaded = await uow.orders.get("ORDER-001")
+            summaries = await uow.summaries.list_summaries(after=None, limit=10)
+
+        self.assertEqual([i[0].code for i in reloaded.items], ["MOUSE456"])
+        self.assertEqual(summaries[0].items_count, 1)
+        self.assertEqual(summaries[0].total_amount, Decimal("29.99"))
+
+    async def test_save_overwrites_existing_order_with_upsert(self):
+        """Test: Guardar una orden no cargada con un ID existente la sobrescribe e incrementa la versión"""
+        original = Order.create(OrderId("ORDER-001"), "customer")
+        original.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+        async with self._uow() as uow:
+            await uow.orders.save(original)
+
+        replacement = Order.create(OrderId("ORDER-001"), "customer")
+        replacement.add_item(SKU("MOUSE456"), Quantity(2), Price(29.99))
+        async with self._uow() as uow:
+            await uow.orders.save(replacement)
+
+        async with self._uow() as uow:
+            reloaded = await uow.orders.get("ORDER-001")
+
+        self.assertEqual(replacement.version, 2)
+        self.assertEqual(reloaded.version, 2)
+        self.assertEqual([(i[0].code, i[1].amount) for i in reloaded.items], [("MOUSE456", 2)])
+
+
+if __name__ == '__main__':
+    unittest.main()
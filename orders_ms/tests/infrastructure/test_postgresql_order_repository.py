@@ -2,6 +2,7 @@
 Tests para PostgreSQLOrderRepository
 """
 import unittest
+from datetime import datetime, timezone
 from unittest.mock import Mock, MagicMock, patch
 from domain.entities.order import Order
 from domain.value_objects.order_id import OrderId
@@ -11,7 +12,14 @@ from domain.value_objects.price import Price
 
 # Import condicional para evitar dependencias de SQLAlchemy en testing
 try:
+    from sqlalchemy import create_engine, event, update
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.orm import sessionmaker
+    from infrastructure.database.connection import Base
+    from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+    from infrastructure.database.statement_counter import instrument_engine, track_statements
     from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+    from application.ports.order_repository import ConcurrencyConflictError
     POSTGRESQL_AVAILABLE = True
 except ImportError:
     # Mock para cuando SQLAlchemy no está disponible
@@ -32,17 +40,26 @@ class TestPostgreSQLOrderRepository(unittest.TestCase):
         self.customer_id = "customer-456"
         self.test_order = Order.create(self.order_id, self.customer_id)
         
+    def _mock_upsert_result(self, version=1):
+        """El upsert devuelve (order_id, version, inserted) de cada cabecera escrita"""
+        self.mock_session.get_bind.return_value.dialect.name = "postgresql"
+        self.mock_session.execute.return_value.all.return_value = [(self.order_id.code, version, version == 1)]
+
     def test_save_new_order_without_items(self):
         """Test: Guardar nueva orden sin items"""
-        # Simular que la orden no existe (nueva orden)
-        self.mock_session.query.return_value.filter.return_value.first.return_value = None
+        self._mock_upsert_result()
         
         # Act
         self.repository.save(self.test_order)
         
         # Assert
-        self.mock_session.add.assert_called_once()  # Nueva orden añadida
-        self.mock_session.commit.assert_called_once()  # Cambios confirmados
+        self.mock_session.query.assert_not_called()  # Sin SELECT previo
+        self.mock_session.execute.assert_called_once()  # Solo el upsert de cabecera
+        upsert_sql = str(self.mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        self.assertIn("ON CONFLICT (order_id) DO UPDATE", upsert_sql)
+        self.mock_session.flush.assert_called_once()  # Cambios enviados a la transacción
+        self.mock_session.commit.assert_not_called()  # El commit es del Unit of Work
+        self.assertEqual(self.test_order.version, 1)
         
     def test_save_new_order_with_items(self):
         """Test: Guardar nueva orden con items"""
@@ -53,15 +70,16 @@ class TestPostgreSQLOrderRepository(unittest.TestCase):
             price=Price(999.99, "EUR")
         )
         
-        # Simular que la orden no existe
-        self.mock_session.query.return_value.filter.return_value.first.return_value = None
+        # Simular que la orden no existía (versión 1 tras el upsert)
+        self._mock_upsert_result()
         
         # Act
         self.repository.save(self.test_order)
         
         # Assert
-        self.mock_session.add.assert_called()  # Orden + Item añadidos
-        self.mock_session.commit.assert_called_once()
+        self.assertEqual(self.mock_session.execute.call_count, 2)  # Upsert cabecera + INSERT items
+        self.mock_session.flush.assert_called_once()
+        self.mock_session.commit.assert_not_called()
         
     def test_get_existing_order(self):
         """Test: Obtener orden existente"""
@@ -94,5 +112,318 @@ class TestPostgreSQLOrderRepository(unittest.TestCase):
         self.assertIsNone(result)
 
 
+@unittest.skipUnless(POSTGRESQL_AVAILABLE, "SQLAlchemy no disponible en entorno de testing")
+class TestPostgreSQLOrderRepositoryIncrementalSave(unittest.TestCase):
+    """
+    Guardado incremental contra un motor SQLite en memoria
+    """
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.statements = []
+        event.listen(self.engine, "before_cursor_execute", self._record_statement)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _record_statement(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    def _create_order_with_lines(self, order_code, lines):
+        session = self.session_factory()
+        order = Order.create(OrderId(order_code), "customer-456")
+        for i in range(lines):
+            order.add_item(SKU(f"SKU{i:08d}"), Quantity(1), Price(10.00))
+        PostgreSQLOrderRepository(session).save(order)
+        session.commit()
+        session.close()
+
+    def _add_one_item_statements(self, order_code):
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        order = repository.get(order_code)
+        order.add_item(SKU("LAPTOP123"), Quantity(2), Price(999.99))
+        self.statements.clear()
+        repository.save(order)
+        session.commit()
+        session.close()
+        return [s for s in self.statements if s.split()[0] in ("INSERT", "UPDATE", "DELETE", "SELECT")]
+
+    def test_save_loaded_order_only_inserts_new_items(self):
+        """Test: Añadir un item a una orden cargada no reescribe los existentes"""
+        self._create_order_with_lines("ORDER-INC", 3)
+
+        statements = self._add_one_item_statements("ORDER-INC")
+
+        self.assertEqual(len(statements), 2)  # UPDATE versionado de totales + INSERT del item
+        self.assertTrue(statements[0].startswith("UPDATE orders"))
+        self.assertTrue(statements[1].startswith("INSERT INTO order_items"))
+
+        session = self.session_factory()
+        order_model = session.get(OrderModel, "ORDER-INC")
+        self.assertEqual(order_model.items_count, 4)
+        self.assertEqual(float(order_model.total_amount), 30.00 + 999.99 * 2)
+        self.assertEqual(session.query(OrderItemModel).count(), 4)
+        session.close()
+
+    def test_save_statement_count_is_independent_of_cart_size(self):
+        """Test: El número de sentencias no crece con el número de líneas"""
+        self._create_order_with_lines("ORDER-SMALL", 1)
+        self._create_order_with_lines("ORDER-LARGE", 200)
+
+        small = self._add_one_item_statements("ORDER-SMALL")
+        large = self._add_one_item_statements("ORDER-LARGE")
+
+        self.assertEqual(len(small), len(large))
+
+    def test_loaded_order_does_not_republish_existing_items(self):
+        """Test: Cargar una orden no genera eventos ItemAdded de items ya guardados"""
+        self._create_order_with_lines("ORDER-EVT", 2)
+
+        session = self.session_factory()
+        order = PostgreSQLOrderRepository(session).get("ORDER-EVT")
+        session.close()
+
+        self.assertEqual(order.pull_domain_events(), [])
+        self.assertEqual(len(order.items), 2)
+
+    def test_get_version_reads_only_the_header(self):
+        """Test: get_version es una consulta a orders, sin tocar order_items"""
+        self._create_order_with_lines("ORDER-VER", 3)
+        self._add_one_item_statements("ORDER-VER")
+
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        self.statements.clear()
+        version = repository.get_version("ORDER-VER")
+        missing = repository.get_version("ORDER-NONE")
+        session.close()
+
+        self.assertEqual((version, missing), (2, None))
+        self.assertEqual(len(self.statements), 2)
+        self.assertFalse(any("order_items" in statement for statement in self.statements))
+
+
+@unittest.skipUnless(POSTGRESQL_AVAILABLE, "SQLAlchemy no disponible en entorno de testing")
+class TestPostgreSQLOrderRepositoryGetAllQueries(unittest.TestCase):
+    """
+    Regresión N+1: get_all debe usar un número fijo de consultas
+    """
+
+    def setUp(self):
+        self.engine = instrument_engine(create_engine("sqlite://"))
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _seed_orders(self, count, start=0):
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        for i in range(start, start + count):
+            order = Order.create(OrderId(f"ORDER-{i:04d}"), f"customer-{i}")
+            order.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+            order.add_item(SKU("MOUSE456"), Quantity(2), Price(29.99))
+            repository.save(order)
+        session.commit()
+        session.close()
+
+    def _count_get_all_statements(self):
+        session = self.session_factory()
+        with track_statements() as stats:
+            orders = PostgreSQLOrderRepository(session).get_all()
+        session.close()
+        return orders, stats.count
+
+    def test_get_all_query_count_is_constant(self):
+        """Test: El número de consultas no crece con el número de órdenes"""
+        self._seed_orders(3)
+        orders_small, statements_small = self._count_get_all_statements()
+
+        self._seed_orders(30, start=3)
+        orders_large, statements_large = self._count_get_all_statements()
+
+        self.assertEqual(len(orders_small), 3)
+        self.assertEqual(len(orders_large), 33)
+        self.assertEqual(statements_small, statements_large)
+        self.assertEqual(statements_large, 2)  # orders + order_items
+
+    def test_get_all_attaches_items_to_their_order(self):
+        """Test: Cada orden recibe sus propios items en orden de inserción"""
+        self._seed_orders(2)
+
+        orders, _ = self._count_get_all_statements()
+
+        for order in orders:
+            self.assertEqual([item[0].code for item in order.items], ["LAPTOP123", "MOUSE456"])
+            self.assertEqual(order.new_items, [])
+
+    def test_get_page_by_order_id(self):
+        """Test: get_page recorre las órdenes por order_id sin solapes"""
+        self._seed_orders(5)
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+
+        first_page = repository.get_page(after=None, limit=2)
+        second_page = repository.get_page(after=first_page[-1].order_id.code, limit=2)
+        last_page = repository.get_page(after="ORDER-0003", limit=2)
+        session.close()
+
+        self.assertEqual([o.order_id.code for o in first_page], ["ORDER-0000", "ORDER-0001"])
+        self.assertEqual([o.order_id.code for o in second_page], ["ORDER-0002", "ORDER-0003"])
+        self.assertEqual([o.order_id.code for o in last_page], ["ORDER-0004"])
+        self.assertEqual(len(last_page[0].items), 2)
+
+    def _created_at_position(self, session, order_id):
+        return (session.get(OrderModel, order_id).created_at, order_id)
+
+    def test_get_page_by_created_at_uses_order_id_as_tiebreaker(self):
+        """Test: Con created_at iguales se desempata por order_id"""
+        self._seed_orders(3)
+        session = self.session_factory()
+        session.execute(update(OrderModel).values(created_at=datetime(2026, 10, 18, tzinfo=timezone.utc)))
+        repository = PostgreSQLOrderRepository(session)
+
+        first_page = repository.get_page(after=None, limit=2, sort="created_at")
+        after = self._created_at_position(session, first_page[-1].order_id.code)
+        second_page = repository.get_page(after=after, limit=2, sort="created_at")
+        session.close()
+
+        self.assertEqual([o.order_id.code for o in first_page + second_page],
+                         ["ORDER-0000", "ORDER-0001", "ORDER-0002"])
+
+    def test_get_page_by_created_at_continues_after_deleted_order(self):
+        """Test: Un cursor created_at cuya orden ya no existe continúa tras su posición, no termina el listado"""
+        self._seed_orders(3)
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        after = self._created_at_position(session, "ORDER-0001")
+        repository.delete("ORDER-0001")
+
+        self.assertEqual([o.order_id.code for o in repository.get_page(after=after, limit=2, sort="created_at")],
+                         ["ORDER-0002"])
+        session.close()
+
+    def test_get_page_query_count_is_constant(self):
+        """Test: Una página cuesta dos consultas sea cual sea su tamaño"""
+        self._seed_orders(20)
+        session = self.session_factory()
+        with track_statements() as stats:
+            PostgreSQLOrderRepository(session).get_page(after="ORDER-0005", limit=10)
+        session.close()
+
+        self.assertEqual(stats.count, 2)
+
+
+    def test_save_many_uses_fixed_number_of_statements(self):
+        """Test: save_many escribe el lote con INSERT multi-fila, sin depender de su tamaño"""
+        def build_batch(count, start):
+            orders = []
+            for i in range(start, start + count):
+                order = Order.create(OrderId(f"ORDER-{i:04d}"), f"customer-{i}")
+                order.add_item(SKU("LAPTOP123"), Quantity(1), Price(999.99))
+                orders.append(order)
+            return orders
+
+        statements = []
+        for count, start in [(2, 0), (50, 100)]:
+            session = self.session_factory()
+            orders = build_batch(count, start)
+            with track_statements() as stats:
+                PostgreSQLOrderRepository(session).save_many(orders)
+            session.commit()
+            session.close()
+            statements.append(stats.count)
+            self.assertTrue(all(order.is_persisted for order in orders))
+
+        self.assertEqual(statements[0], statements[1])
+        orders, _ = self._count_get_all_statements()
+        self.assertEqual(len(orders), 52)
+        self.assertTrue(all(len(order.items) == 1 for order in orders))
+
+    def test_save_many_appends_items_of_persisted_orders(self):
+        """Test: Las órdenes ya persistidas del lote solo añaden sus items nuevos"""
+        self._seed_orders(1)
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        loaded = repository.get("ORDER-0000")
+        loaded.add_item(SKU("KEYBOARD789"), Quantity(1), Price(39.99))
+        fresh = Order.create(OrderId("ORDER-NEW"), "customer-new")
+
+        repository.save_many([loaded, fresh])
+        session.commit()
+        session.close()
+
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        self.assertEqual(len(repository.get("ORDER-0000").items), 3)
+        self.assertIsNotNone(repository.get("ORDER-NEW"))
+        session.close()
+
+    def test_save_replaces_items_of_cleared_order(self):
+        """Test: Un carrito vaciado y rellenado sustituye los items y los totales guardados"""
+        self._seed_orders(1)
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        order = repository.get("ORDER-0000")
+        order.clear_items()
+        order.add_item(SKU("KEYBOARD789"), Quantity(2), Price(39.99))
+
+        with track_statements() as stats:
+            repository.save(order)
+        session.commit()
+        session.close()
+
+        session = self.session_factory()
+        reloaded = PostgreSQLOrderRepository(session).get("ORDER-0000")
+        header = session.query(OrderModel).filter_by(order_id="ORDER-0000").one()
+        session.close()
+        self.assertEqual([(i[0].code, i[1].amount) for i in reloaded.items], [("KEYBOARD789", 2)])
+        self.assertEqual(header.items_count, 1)
+        self.assertAlmostEqual(float(header.total_amount), 79.98)
+        self.assertEqual(stats.count, 3)  # DELETE + INSERT + UPDATE
+
+    def test_stale_order_raises_concurrency_conflict(self):
+        """Test: Guardar una orden cargada antes de otra escritura lanza ConcurrencyConflictError"""
+        self._seed_orders(1)
+        first_session, second_session = self.session_factory(), self.session_factory()
+        first = PostgreSQLOrderRepository(first_session).get("ORDER-0000")
+        second = PostgreSQLOrderRepository(second_session).get("ORDER-0000")
+
+        first.add_item(SKU("KEYBOARD789"), Quantity(1), Price(39.99))
+        PostgreSQLOrderRepository(first_session).save(first)
+        first_session.commit()
+        first_session.close()
+
+        second.add_item(SKU("MONITOR147"), Quantity(1), Price(249.99))
+        with self.assertRaises(ConcurrencyConflictError):
+            PostgreSQLOrderRepository(second_session).save(second)
+        second_session.rollback()
+        second_session.close()
+
+        session = self.session_factory()
+        reloaded = PostgreSQLOrderRepository(session).get("ORDER-0000")
+        session.close()
+        self.assertEqual(first.version, 2)
+        self.assertEqual(reloaded.version, 2)
+        self.assertEqual([i[0].code for i in reloaded.items], ["LAPTOP123", "MOUSE456", "KEYBOARD789"])
+
+    def test_get_after_save_in_same_session_sees_new_version(self):
+        """Test: Dos escrituras seguidas en la misma sesión no generan falsos conflictos"""
+        self._seed_orders(1)
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        for sku in ("KEYBOARD789", "MONITOR147"):
+            order = repository.get("ORDER-0000")
+            order.add_item(SKU(sku), Quantity(1), Price(10.00))
+            repository.save(order)
+        session.commit()
+        session.close()
+
+        self.assertEqual(order.version, 3)
+
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
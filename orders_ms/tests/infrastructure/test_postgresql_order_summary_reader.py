@@ -0,0 +1,105 @@
+"""
+Tests para PostgreSQLOrderSummaryReader (contra SQLite en memoria)
+"""
+import unittest
+from decimal import Decimal
+from application.pagination import decode_cursor, encode_cursor, page_position
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.sku import SKU
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.price import Price
+
+# Import condicional para evitar dependencias de SQLAlchemy en testing
+try:
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+    from infrastructure.database.connection import Base
+    from infrastructure.database.statement_counter import instrument_engine, track_statements
+    from infrastructure.repositories.postgresql_order_repository import PostgreSQLOrderRepository
+    from infrastructure.repositories.postgresql_order_summary_reader import PostgreSQLOrderSummaryReader
+    POSTGRESQL_AVAILABLE = True
+except ImportError:
+    POSTGRESQL_AVAILABLE = False
+
+
+@unittest.skipUnless(POSTGRESQL_AVAILABLE, "SQLAlchemy no disponible en entorno de testing")
+class TestPostgreSQLOrderSummaryReader(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = instrument_engine(create_engine("sqlite://"))
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        for i in range(3):
+            order = Order.create(OrderId(f"ORDER-{i:03d}"), f"customer-{i}")
+            order.add_item(SKU("LAPTOP123"), Quantity(2), Price(999.99))
+            order.add_item(SKU("MOUSE456"), Quantity(1), Price(29.99))
+            repository.save(order)
+        session.commit()
+        session.close()
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_list_summaries_reads_denormalized_columns(self):
+        """Test: Los resúmenes salen de orders en una sola consulta sin tocar order_items"""
+        session = self.session_factory()
+        with track_statements() as stats:
+            summaries = PostgreSQLOrderSummaryReader(session).list_summaries(after=None, limit=10)
+        session.close()
+
+        self.assertEqual(stats.count, 1)
+        self.assertNotIn("order_items", stats.statements[0])
+        self.assertEqual([s.order_id for s in summaries], ["ORDER-000", "ORDER-001", "ORDER-002"])
+        self.assertEqual(summaries[0].customer_id, "customer-0")
+        self.assertEqual(summaries[0].items_count, 2)
+        self.assertEqual(summaries[0].total_amount, Decimal("2029.97"))
+
+    def test_list_summaries_after_cursor(self):
+        """Test: Paginación keyset por order_id"""
+        session = self.session_factory()
+        summaries = PostgreSQLOrderSummaryReader(session).list_summaries(after="ORDER-000", limit=1)
+        session.close()
+
+        self.assertEqual([s.order_id for s in summaries], ["ORDER-001"])
+
+    def test_created_at_cursor_continues_after_deleted_anchor(self):
+        """Test: El cursor por created_at lleva la fecha y sigue valiendo si su orden se borra"""
+        session = self.session_factory()
+        reader = PostgreSQLOrderSummaryReader(session)
+        first = reader.list_summaries(after=None, limit=2, sort="created_at")
+        cursor = encode_cursor("created_at", page_position("created_at", first[-1]))
+        PostgreSQLOrderRepository(session).delete(first[-1].order_id)
+        session.commit()
+
+        second = reader.list_summaries(decode_cursor(cursor, "created_at"), limit=2, sort="created_at")
+        session.close()
+
+        self.assertEqual([s.order_id for s in first + second], ["ORDER-000", "ORDER-001", "ORDER-002"])
+
+    def test_list_customer_summaries_reads_only_that_customer(self):
+        """Test: Las órdenes de un cliente salen de una consulta de rango sobre el índice por cliente"""
+        session = self.session_factory()
+        repository = PostgreSQLOrderRepository(session)
+        for code in ("ORDER-105", "ORDER-101", "ORDER-103"):
+            repository.save(Order.create(OrderId(code), "customer-1"))
+        session.commit()
+
+        reader = PostgreSQLOrderSummaryReader(session)
+        with track_statements() as stats:
+            first = reader.list_customer_summaries("customer-1", after=None, limit=2)
+        second = reader.list_customer_summaries("customer-1", after=first[-1].order_id, limit=2)
+        session.close()
+
+        self.assertEqual(stats.count, 1)
+        self.assertNotIn("order_items", stats.statements[0])
+        self.assertEqual([s.order_id for s in first + second], ["ORDER-001", "ORDER-101", "ORDER-103", "ORDER-105"])
+        self.assertEqual((first[0].items_count, first[1].items_count), (2, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
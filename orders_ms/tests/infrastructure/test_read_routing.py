@@ -0,0 +1,208 @@
+"""
+Tests para el Unit of Work de solo lectura y el enrutado a réplica (read-your-writes).
+
+Primario y réplica son dos ficheros SQLite; la replicación se simula copiando
+el primario sobre la réplica y la posición es el número de COMMITs del primario.
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.use_cases.create_order_use_case import CreateOrderUseCase, AsyncCreateOrderUseCase
+from application.use_cases.get_order_use_case import GetOrderUseCase, AsyncGetOrderUseCase
+from infrastructure.database.connection import Base
+from infrastructure.database.read_routing import (
+    AsyncReplicaRouter,
+    ReplicaRouter,
+    ReplicationPositions,
+    format_lsn,
+    parse_lsn,
+    read_only_execution_options,
+    read_settings_from_env,
+)
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+
+
+class FileCopyReplication(ReplicationPositions):
+    """Replicación simulada entre dos ficheros SQLite"""
+
+    def __init__(self, primary_engine, primary_path, replica_path):
+        self.primary_path = primary_path
+        self.replica_path = replica_path
+        self.commits = 0
+        self.replayed = 0
+        self.probes = 0
+        event.listen(primary_engine, "commit", self._on_commit)
+
+    def _on_commit(self, conn):
+        self.commits += 1
+
+    def replicate(self):
+        source, target = sqlite3.connect(self.primary_path), sqlite3.connect(self.replica_path)
+        source.backup(target)
+        source.close()
+        target.close()
+        self.replayed = self.commits
+
+    def primary(self, session) -> int:
+        return self.commits
+
+    def replica(self, session) -> int:
+        self.probes += 1
+        return self.replayed
+
+
+class TestReadRoutingHelpers(unittest.TestCase):
+
+    def test_lsn_round_trip(self):
+        """Test: Los LSN de PostgreSQL se comparan como enteros"""
+        self.assertEqual(parse_lsn("16/B374D848"), (0x16 << 32) | 0xB374D848)
+        self.assertEqual(format_lsn(parse_lsn("16/B374D848")), "16/B374D848")
+        self.assertLess(parse_lsn("0/FFFFFFFF"), parse_lsn("1/0"))
+        with self.assertRaises(ValueError):
+            parse_lsn("not-a-token")
+
+    def test_read_settings_from_env(self):
+        """Test: Aislamiento y DEFERRABLE configurables por entorno"""
+        self.assertEqual(
+            read_settings_from_env({}),
+            {"isolation_level": None, "deferrable": False, "core_reads": True}
+        )
+        settings = read_settings_from_env({"DB_READ_ISOLATION_LEVEL": "SERIALIZABLE", "DB_READ_DEFERRABLE": "true"})
+        self.assertEqual(read_only_execution_options(settings["isolation_level"], settings["deferrable"]), {
+            "postgresql_readonly": True,
+            "isolation_level": "SERIALIZABLE",
+            "postgresql_deferrable": True,
+        })
+
+
+class TestReplicaRouting(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        primary_path = os.path.join(self.tmp.name, "primary.db")
+        replica_path = os.path.join(self.tmp.name, "replica.db")
+        self.primary_engine = instrument_engine(create_engine(f"sqlite:///{primary_path}"))
+        self.replica_engine = instrument_engine(create_engine(f"sqlite:///{replica_path}"))
+        Base.metadata.create_all(self.primary_engine)
+        Base.metadata.create_all(self.replica_engine)
+        self.replication = FileCopyReplication(self.primary_engine, primary_path, replica_path)
+        self.router = ReplicaRouter(
+            sessionmaker(bind=self.primary_engine), sessionmaker(bind=self.replica_engine), self.replication
+        )
+
+    def tearDown(self):
+        self.primary_engine.dispose()
+        self.replica_engine.dispose()
+        self.tmp.cleanup()
+
+    def _create_order(self) -> str:
+        use_case = CreateOrderUseCase(SQLAlchemyUnitOfWork(self.router.primary_session_factory), InMemoryEventBus())
+        return use_case.execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+
+    def _get_order(self, order_id, token=None):
+        uow = SQLAlchemyUnitOfWork(self.router.read_session_factory(token), read_only=True)
+        return GetOrderUseCase(uow).execute(GetOrderRequestDTO(order_id=order_id))
+
+    def test_read_only_unit_of_work_does_not_commit(self):
+        """Test: Las lecturas en modo solo lectura no emiten COMMIT"""
+        order_id = self._create_order()
+
+        with track_statements() as stats:
+            found = self._get_order(order_id, self.router.consistency_token())
+
+        self.assertIsNotNone(found)
+        self.assertEqual(stats.commits, 0)
+
+    def test_read_with_token_goes_to_primary_until_replica_catches_up(self):
+        """Test: Read-your-writes: sin token se lee la réplica; con token, quien tenga la escritura"""
+        order_id = self._create_order()
+        token = self.router.consistency_token()
+
+        self.assertIsNone(self._get_order(order_id))
+        self.assertIsNotNone(self._get_order(order_id, token))
+        self.assertIs(self.router.read_session_factory(token), self.router.primary_session_factory)
+
+        self.replication.replicate()
+        self.assertIs(self.router.read_session_factory(token), self.router.replica_session_factory)
+        self.assertIsNotNone(self._get_order(order_id))
+
+    def test_replica_position_is_cached(self):
+        """Test: Con la réplica al día no se vuelve a consultar su posición para tokens anteriores"""
+        self._create_order()
+        token = self.router.consistency_token()
+        self.replication.replicate()
+
+        for _ in range(3):
+            self.router.read_session_factory(token)
+        self.router.read_session_factory(None)
+
+        self.assertEqual(self.replication.probes, 1)
+
+    def test_invalid_token_reads_from_primary(self):
+        """Test: Un token que no se puede interpretar no arriesga una lectura obsoleta"""
+        self.assertIs(self.router.read_session_factory("garbage"), self.router.primary_session_factory)
+
+
+class TestAsyncReplicaRouting(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        primary_path = os.path.join(self.tmp.name, "primary.db")
+        replica_path = os.path.join(self.tmp.name, "replica.db")
+        self.primary_engine = create_async_engine(f"sqlite+aiosqlite:///{primary_path}")
+        self.replica_engine = create_async_engine(f"sqlite+aiosqlite:///{replica_path}")
+        instrument_engine(self.replica_engine.sync_engine)
+        for engine in (self.primary_engine, self.replica_engine):
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+        self.replication = FileCopyReplication(self.primary_engine.sync_engine, primary_path, replica_path)
+        self.router = AsyncReplicaRouter(
+            async_sessionmaker(self.primary_engine, expire_on_commit=False),
+            async_sessionmaker(self.replica_engine, expire_on_commit=False),
+            self.replication
+        )
+
+    async def asyncTearDown(self):
+        await self.primary_engine.dispose()
+        await self.replica_engine.dispose()
+        self.tmp.cleanup()
+
+    async def _get_order(self, order_id, token=None):
+        uow = SQLAlchemyAsyncUnitOfWork(
+            self.router.primary_session_factory, read_only=True,
+            route_session_factory=lambda: self.router.read_session_factory(token)
+        )
+        return await AsyncGetOrderUseCase(uow).execute(GetOrderRequestDTO(order_id=order_id))
+
+    async def test_read_your_writes_and_no_commit_on_reads(self):
+        """Test: La variante asíncrona enruta igual y las lecturas no emiten COMMIT"""
+        use_case = AsyncCreateOrderUseCase(
+            SQLAlchemyAsyncUnitOfWork(self.router.primary_session_factory), InMemoryEventBus()
+        )
+        created = await use_case.execute(CreateOrderRequestDTO(customer_id="customer-1"))
+        token = await self.router.consistency_token()
+
+        self.assertIsNone(await self._get_order(created.order_id))
+        self.assertIsNotNone(await self._get_order(created.order_id, token))
+
+        self.replication.replicate()
+        with track_statements() as stats:
+            self.assertIsNotNone(await self._get_order(created.order_id, token))
+        self.assertEqual(stats.commits, 0)
+        self.assertGreater(stats.count, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
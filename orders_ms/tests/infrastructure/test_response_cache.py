@@ -0,0 +1,82 @@
+"""
+Tests para las respuestas serializadas con ETag y su caché por versión
+"""
+import unittest
+from decimal import Decimal
+
+from domain.events.order_created import OrderCreated
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.web.response_cache import (
+    OrderResponseCache,
+    encode_response,
+    etag_matches,
+    response_cache_settings_from_env,
+)
+
+
+class TestEncodeResponse(unittest.TestCase):
+
+    def test_encoding_matches_fastapi_json_and_etag_depends_on_content(self):
+        """Test: Mismo JSON compacto que FastAPI (Decimal como número) y ETag por contenido"""
+        encoded = encode_response({"order_id": "ORDER-1", "total_amount": Decimal("10.50")})
+        self.assertEqual(encoded.body, b'{"order_id":"ORDER-1","total_amount":10.5}')
+        self.assertEqual(encoded.etag, encode_response({"order_id": "ORDER-1", "total_amount": 10.5}).etag)
+        self.assertNotEqual(encoded.etag, encode_response({"order_id": "ORDER-2", "total_amount": 10.5}).etag)
+        self.assertTrue(encoded.etag.startswith('"') and encoded.etag.endswith('"'))
+
+    def test_etag_matches(self):
+        """Test: Lista de ETags, prefijo débil y comodín"""
+        self.assertTrue(etag_matches('"a", "b"', '"b"'))
+        self.assertTrue(etag_matches('W/"b"', '"b"'))
+        self.assertTrue(etag_matches('*', '"b"'))
+        self.assertFalse(etag_matches('"a"', '"b"'))
+        self.assertFalse(etag_matches(None, '"b"'))
+
+
+class TestOrderResponseCache(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.cache = OrderResponseCache(max_size=2)
+        self.v1 = encode_response({"version": 1})
+        self.v2 = encode_response({"version": 2})
+
+    def test_entries_are_keyed_by_version(self):
+        """Test: Una entrada solo sirve para su versión y una versión posterior la sustituye"""
+        self.cache.put("ORDER-1", 1, self.v1)
+        self.assertEqual(self.cache.get("ORDER-1", 1), self.v1)
+        self.assertIsNone(self.cache.get("ORDER-1", 2))
+
+        self.cache.put("ORDER-1", 2, self.v2)
+        self.cache.put("ORDER-1", 1, self.v1)  # lectura lenta de la versión anterior
+        self.assertEqual(self.cache.get("ORDER-1", 2), self.v2)
+        self.assertEqual(self.cache.status()["size"], 1)
+
+    def test_lru_eviction(self):
+        """Test: Al superar max_size se expulsa la orden menos usada"""
+        self.cache.put("ORDER-1", 1, self.v1)
+        self.cache.put("ORDER-2", 1, self.v1)
+        self.cache.get("ORDER-1", 1)
+        self.cache.put("ORDER-3", 1, self.v1)
+
+        self.assertIsNone(self.cache.get("ORDER-2", 1))
+        self.assertIsNotNone(self.cache.get("ORDER-1", 1))
+        self.assertEqual(self.cache.status()["evictions"], 1)
+
+    def test_order_created_invalidates_a_reused_id(self):
+        """Test: Si se vuelve a crear un ID su versión empieza de nuevo: OrderCreated borra la entrada"""
+        bus = InMemoryEventBus()
+        self.cache.subscribe_to(bus)
+        self.cache.put("ORDER-1", 1, self.v1)
+        bus.publish(OrderCreated("ORDER-1", "customer-1"))
+        self.assertIsNone(self.cache.get("ORDER-1", 1))
+
+    def test_settings_from_env(self):
+        """Test: Activada por defecto; 0 la desactiva"""
+        self.assertEqual(response_cache_settings_from_env({}), {"max_size": 1024})
+        self.assertEqual(response_cache_settings_from_env({"ORDER_RESPONSE_CACHE_SIZE": "10"}), {"max_size": 10})
+        self.assertIsNone(response_cache_settings_from_env({"ORDER_RESPONSE_CACHE_SIZE": "0"}))
+
+
+if __name__ == '__main__':
+    unittest.main()
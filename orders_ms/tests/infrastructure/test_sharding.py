@@ -0,0 +1,387 @@
+"""
+Tests para el reparto de órdenes entre shards: hash estable, repositorio y
+Unit of Work con scatter-gather y la herramienta de resharding.
+
+Los shards son repositorios en memoria o ficheros SQLite independientes.
+"""
+import contextvars
+import os
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.dtos.list_orders_dtos import ListOrdersRequestDTO
+from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase, AsyncCreateOrderUseCase
+from application.use_cases.get_order_use_case import GetOrderUseCase
+from application.use_cases.list_orders_use_case import ListOrdersUseCase, AsyncListOrdersUseCase
+from domain.entities.order import Order
+from domain.value_objects.order_id import OrderId
+from domain.value_objects.price import Price
+from domain.value_objects.quantity import Quantity
+from domain.value_objects.sku import SKU
+from infrastructure.database.connection import Base
+from infrastructure.database.event_sourced_unit_of_work import EventSourcedUnitOfWork
+from infrastructure.database.models.order_archive_model import OrderArchiveModel
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.reshard import reshard
+from infrastructure.database.sharded_async_unit_of_work import AsyncShardedUnitOfWork
+from infrastructure.database.sharded_unit_of_work import ShardedUnitOfWork
+from infrastructure.database.sharding import (
+    jump_consistent_hash,
+    shard_index,
+    shard_urls_from_env,
+    shard_workers_from_env,
+)
+from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.repositories.sharded_order_repository import ShardedOrderRepository, scatter
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+
+def _order(code: str, customer_id: str = "customer-1") -> Order:
+    order = Order.create(OrderId(code), customer_id)
+    order.add_item(SKU("LAPTOP123"), Quantity(1), Price(10.0))
+    return order
+
+
+class TestShardIndex(unittest.TestCase):
+
+    def test_shard_index_is_stable_and_in_range(self):
+        """Test: El shard de una orden no depende del proceso y está en [0, N)"""
+        self.assertEqual(shard_index("ORDER-1", 4), shard_index("ORDER-1", 4))
+        self.assertEqual(shard_index("ORDER-1", 1), 0)
+        self.assertTrue(all(0 <= shard_index(f"ORDER-{i}", 5) < 5 for i in range(200)))
+        with self.assertRaises(ValueError):
+            jump_consistent_hash(1, 0)
+
+    def test_keys_spread_evenly(self):
+        """Test: Las órdenes se reparten de forma aproximadamente uniforme"""
+        counts = Counter(shard_index(f"ORDER-{i}", 4) for i in range(4000))
+
+        self.assertEqual(set(counts), {0, 1, 2, 3})
+        self.assertTrue(all(800 < count < 1200 for count in counts.values()), counts)
+
+    def test_adding_a_shard_moves_only_a_fraction_to_the_new_shard(self):
+        """Test: Al pasar de 3 a 4 shards solo se mueve ~1/4 de las órdenes, todas al nuevo"""
+        codes = [f"ORDER-{i}" for i in range(4000)]
+        moved = [code for code in codes if shard_index(code, 3) != shard_index(code, 4)]
+
+        self.assertTrue(800 < len(moved) < 1200, len(moved))
+        self.assertTrue(all(shard_index(code, 4) == 3 for code in moved))
+
+    def test_shard_urls_from_env(self):
+        """Test: URLs separadas por comas, en orden y sin vacíos"""
+        self.assertEqual(shard_urls_from_env({}), [])
+        self.assertEqual(
+            shard_urls_from_env({"DATABASE_SHARD_URLS": "sqlite:///a.db, sqlite:///b.db,"}),
+            ["sqlite:///a.db", "sqlite:///b.db"]
+        )
+
+    def test_shard_workers_cover_concurrent_requests(self):
+        """Test: El executor tiene un hilo por shard y por petición concurrente"""
+        self.assertEqual(shard_workers_from_env(3, {}), 24)
+        self.assertEqual(shard_workers_from_env(3, {"SHARD_SCATTER_CONCURRENCY": "2"}), 6)
+        with self.assertRaises(ValueError):
+            shard_workers_from_env(3, {"SHARD_SCATTER_CONCURRENCY": "0"})
+
+
+class TestShardedOrderRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.shards = [InMemoryOrderRepository() for _ in range(3)]
+        self.executor = ThreadPoolExecutor(max_workers=3)
+        self.repository = ShardedOrderRepository(self.shards, self.executor)
+        self.single = InMemoryOrderRepository()
+        self.codes = [f"ORDER-{i:03d}" for i in range(30)]
+        self.repository.save_many([_order(code) for code in self.codes])
+        self.single.save_many([_order(code) for code in self.codes])
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_each_order_is_stored_in_its_shard_only(self):
+        """Test: Cada orden se guarda únicamente en el shard que le corresponde"""
+        for code in self.codes:
+            index = shard_index(code, 3)
+            self.assertIsNotNone(self.shards[index].get(code))
+            self.assertEqual(sum(shard.get(code) is not None for shard in self.shards), 1)
+        self.assertEqual(self.repository.get("ORDER-007").order_id.code, "ORDER-007")
+
+        self.repository.delete("ORDER-007")
+        self.assertIsNone(self.repository.get("ORDER-007"))
+
+    def test_get_all_merges_every_shard_sorted(self):
+        """Test: get_all reúne todas las órdenes ordenadas por order_id"""
+        self.assertEqual([order.order_id.code for order in self.repository.get_all()], self.codes)
+
+    def test_get_page_matches_a_single_store(self):
+        """Test: Paginar sobre los shards da las mismas páginas que una sola base de datos"""
+        after = None
+        while True:
+            page = self.repository.get_page(after, 7)
+            expected = self.single.get_page(after, 7)
+            self.assertEqual([o.order_id.code for o in page], [o.order_id.code for o in expected])
+            if not page:
+                break
+            after = page[-1].order_id.code
+
+    def test_scatter_runs_each_shard_in_the_caller_context(self):
+        """Test: Los hilos del executor ven las ContextVar de quien hace el scatter"""
+        token = contextvars.ContextVar("token", default=None)
+        token.set("lsn-42")
+
+        self.assertEqual(scatter(self.shards, lambda shard: token.get(), self.executor), ["lsn-42"] * 3)
+
+    def test_created_at_sort_is_rejected(self):
+        """Test: El orden por created_at no se puede fusionar entre shards"""
+        with self.assertRaises(ValueError):
+            self.repository.get_page(None, 10, sort="created_at")
+
+
+class TestShardedUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engines = []
+        for index in range(3):
+            engine = instrument_engine(create_engine(f"sqlite:///{os.path.join(self.tmp.name, f'shard{index}.db')}"))
+            Base.metadata.create_all(engine)
+            self.engines.append(engine)
+        self.factories = [sessionmaker(bind=engine) for engine in self.engines]
+        self.executor = ThreadPoolExecutor(max_workers=3)
+
+    def tearDown(self):
+        self.executor.shutdown()
+        for engine in self.engines:
+            engine.dispose()
+        self.tmp.cleanup()
+
+    def _uow(self, read_only=False):
+        return ShardedUnitOfWork(
+            [SQLAlchemyUnitOfWork(factory, read_only=read_only) for factory in self.factories], self.executor
+        )
+
+    def _count(self, engine) -> int:
+        with engine.connect() as connection:
+            return connection.execute(select(func.count()).select_from(OrderModel)).scalar()
+
+    def test_use_cases_write_to_one_shard_and_list_across_all(self):
+        """Test: Crear y añadir items toca un único shard; listar recorre todos"""
+        order_ids = [
+            CreateOrderUseCase(self._uow(), InMemoryEventBus())
+            .execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+            for _ in range(12)
+        ]
+
+        with track_statements() as stats:
+            AddItemToOrderUseCase(self._uow(), StaticPricingService(), InMemoryEventBus()).execute(
+                AddItemToOrderRequestDTO(order_id=order_ids[0], sku="LAPTOP123", quantity=2)
+            )
+        self.assertEqual(stats.commits, 1)
+
+        self.assertEqual(sum(self._count(engine) for engine in self.engines), 12)
+        self.assertGreater(self._count(self.engines[shard_index(order_ids[0], 3)]), 0)
+
+        found = GetOrderUseCase(self._uow(read_only=True)).execute(GetOrderRequestDTO(order_id=order_ids[0]))
+        self.assertEqual(found.items_count, 1)
+
+        listed, cursor = [], None
+        while True:
+            page = ListOrdersUseCase(self._uow(read_only=True)).execute(ListOrdersRequestDTO(cursor=cursor, limit=5))
+            listed.extend(summary.order_id for summary in page.orders)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(listed, sorted(order_ids))
+
+    def test_customer_orders_are_listed_across_shards(self):
+        """Test: Las órdenes de un cliente, repartidas entre shards, se listan en orden y paginadas"""
+        order_ids = [
+            CreateOrderUseCase(self._uow(), InMemoryEventBus())
+            .execute(CreateOrderRequestDTO(customer_id=f"customer-{i % 2}")).order_id
+            for i in range(10)
+        ]
+
+        listed, cursor = [], None
+        while True:
+            page = ListOrdersUseCase(self._uow(read_only=True)).execute(
+                ListOrdersRequestDTO(cursor=cursor, limit=2, customer_id="customer-1")
+            )
+            listed.extend(summary.order_id for summary in page.orders)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(listed, sorted(order_ids[1::2]))
+
+    def test_reads_do_not_commit(self):
+        """Test: Las lecturas de solo lectura sobre los shards no emiten COMMIT"""
+        with track_statements() as stats:
+            ListOrdersUseCase(self._uow(read_only=True)).execute(ListOrdersRequestDTO())
+
+        self.assertEqual(stats.commits, 0)
+
+
+class TestAsyncShardedUnitOfWork(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engines = []
+        for index in range(2):
+            engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(self.tmp.name, f'shard{index}.db')}")
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            self.engines.append(engine)
+        self.factories = [async_sessionmaker(engine, expire_on_commit=False) for engine in self.engines]
+
+    async def asyncTearDown(self):
+        for engine in self.engines:
+            await engine.dispose()
+        self.tmp.cleanup()
+
+    async def test_create_and_list_across_shards(self):
+        """Test: La variante asíncrona reparte las escrituras y fusiona el listado"""
+        order_ids = []
+        for _ in range(8):
+            uow = AsyncShardedUnitOfWork([SQLAlchemyAsyncUnitOfWork(factory) for factory in self.factories])
+            created = await AsyncCreateOrderUseCase(uow, InMemoryEventBus()).execute(
+                CreateOrderRequestDTO(customer_id="customer-1")
+            )
+            order_ids.append(created.order_id)
+
+        uow = AsyncShardedUnitOfWork(
+            [SQLAlchemyAsyncUnitOfWork(factory, read_only=True) for factory in self.factories]
+        )
+        page = await AsyncListOrdersUseCase(uow).execute(ListOrdersRequestDTO(limit=50))
+
+        self.assertEqual([summary.order_id for summary in page.orders], sorted(order_ids))
+
+
+class TestReshard(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.urls = [f"sqlite:///{os.path.join(self.tmp.name, f'shard{index}.db')}" for index in range(3)]
+        self.engines = [create_engine(url) for url in self.urls]
+        for engine in self.engines:
+            Base.metadata.create_all(engine)
+        self.codes = [f"ORDER-{i:03d}" for i in range(60)]
+
+        # Estado inicial: dos shards, órdenes con versión 2 y un item
+        for code in self.codes:
+            with self.engines[shard_index(code, 2)].begin() as connection:
+                connection.execute(OrderModel.__table__.insert(), {
+                    "order_id": code, "customer_id": "customer-1", "total_amount": 10,
+                    "currency": "EUR", "items_count": 1, "version": 2
+                })
+                connection.execute(OrderItemModel.__table__.insert(), {
+                    "order_id": code, "sku": "LAPTOP123", "quantity": 1, "price": 10, "subtotal": 10
+                })
+
+    def tearDown(self):
+        for engine in self.engines:
+            engine.dispose()
+        self.tmp.cleanup()
+
+    def _codes_in(self, engine) -> set:
+        with engine.connect() as connection:
+            return set(connection.execute(select(OrderModel.order_id)).scalars())
+
+    def _item_count(self) -> int:
+        total = 0
+        for engine in self.engines:
+            with engine.connect() as connection:
+                total += connection.execute(select(func.count()).select_from(OrderItemModel)).scalar()
+        return total
+
+    def test_dry_run_counts_without_moving(self):
+        """Test: --dry-run solo informa de las órdenes que cambiarían de shard"""
+        report = reshard(self.urls[:2], self.urls, batch_size=7, dry_run=True)
+
+        expected = sum(shard_index(code, 2) != shard_index(code, 3) for code in self.codes)
+        self.assertEqual(report.scanned, 60)
+        self.assertEqual(report.total_moved, expected)
+        self.assertEqual(self._codes_in(self.engines[2]), set())
+
+    def test_reshard_moves_orders_to_their_new_shard(self):
+        """Test: Tras añadir un shard cada orden queda en su shard, con versión e items"""
+        report = reshard(self.urls[:2], self.urls, batch_size=7)
+
+        self.assertGreater(report.total_moved, 0)
+        self.assertTrue(all(target == self.urls[2] for (_, target) in report.moved))
+        for index, engine in enumerate(self.engines):
+            self.assertEqual(self._codes_in(engine), {c for c in self.codes if shard_index(c, 3) == index})
+        self.assertEqual(self._item_count(), 60)
+        with self.engines[2].connect() as connection:
+            self.assertEqual(set(connection.execute(select(OrderModel.version)).scalars()), {2})
+
+        # Volver a ejecutarlo no mueve nada
+        self.assertEqual(reshard(self.urls[:2], self.urls).total_moved, 0)
+
+    def test_reshard_moves_archived_orders_too(self):
+        """Test: Las órdenes de orders_archive también quedan en el shard que les corresponde"""
+        archived = [f"ARCHIVED-{i:03d}" for i in range(20)]
+        for code in archived:
+            with self.engines[shard_index(code, 2)].begin() as connection:
+                connection.execute(OrderArchiveModel.__table__.insert(), {
+                    "order_id": code, "customer_id": "customer-1", "payload": code.encode()
+                })
+
+        report = reshard(self.urls[:2], self.urls, batch_size=7)
+
+        self.assertEqual(report.scanned, 80)
+        for index, engine in enumerate(self.engines):
+            with engine.connect() as connection:
+                rows = dict(connection.execute(
+                    select(OrderArchiveModel.order_id, OrderArchiveModel.payload)
+                ).all())
+            expected = {c for c in archived if shard_index(c, 3) == index}
+            self.assertEqual(set(rows), expected)
+            self.assertTrue(all(rows[code] == code.encode() for code in expected))
+
+    def test_reshard_moves_event_sourced_orders(self):
+        """Test: Snapshots y eventos se mueven juntos y la orden se reconstruye igual en su nuevo shard"""
+        streams = [f"STREAM-{i:03d}" for i in range(20)]
+        for code in streams:
+            with EventSourcedUnitOfWork(sessionmaker(bind=self.engines[shard_index(code, 2)]), snapshot_every=2) as uow:
+                uow.orders.save(_order(code))
+                uow.commit()
+            with EventSourcedUnitOfWork(sessionmaker(bind=self.engines[shard_index(code, 2)]), snapshot_every=2) as uow:
+                order = uow.orders.get(code)
+                order.add_item(SKU("MOUSE456"), Quantity(2), Price(5.0))
+                uow.orders.save(order)
+                order = uow.orders.get(code)
+                order.add_item(SKU("MOUSE456"), Quantity(1), Price(5.0))
+                uow.orders.save(order)
+                uow.commit()
+
+        report = reshard(self.urls[:2], self.urls, batch_size=7)
+
+        self.assertEqual(report.scanned, 80)
+        for index, engine in enumerate(self.engines):
+            with EventSourcedUnitOfWork(sessionmaker(bind=engine), read_only=True) as uow:
+                orders = {order.order_id.code: order for order in uow.orders.get_all()}
+                summaries = uow.summaries.list_summaries(None, 100)
+            expected = {c for c in streams if shard_index(c, 3) == index}
+            self.assertEqual(set(orders), expected)
+            self.assertTrue(all((len(o.items), o.version) == (3, 3) for o in orders.values()))
+            self.assertEqual({s.order_id for s in summaries}, expected)
+            self.assertTrue(all(s.items_count == 3 for s in summaries))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+"""
+Tests para SQLAlchemyUnitOfWork como único límite transaccional (COMMITs por petición)
+"""
+import unittest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.order_items_dtos import OrderLineDTO, OrderItemsRequestDTO
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase, AsyncCreateOrderUseCase
+from infrastructure.database.connection import Base
+from infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from infrastructure.database.group_commit import GroupCommitAborted, async_group_commit, group_commit
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.database.sqlalchemy_async_unit_of_work import SQLAlchemyAsyncUnitOfWork
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+from infrastructure.events.group_commit_event_bus import GroupCommitEventBus
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+
+class TestSQLAlchemyUnitOfWorkCommits(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = instrument_engine(create_engine("sqlite://", poolclass=StaticPool))
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.published = InMemoryEventBus()
+        self.event_bus = GroupCommitEventBus(self.published)
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def _create_order(self):
+        use_case = CreateOrderUseCase(SQLAlchemyUnitOfWork(self.session_factory), self.event_bus)
+        return use_case.execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+
+    def _count_orders(self):
+        session = self.session_factory()
+        count = session.query(OrderModel).count()
+        session.close()
+        return count
+
+    def test_one_commit_per_use_case(self):
+        """Test: Crear una orden y añadir varias líneas emite un COMMIT por caso de uso"""
+        with track_statements() as create_stats:
+            order_id = self._create_order()
+
+        add_items = AddItemsToOrderUseCase(
+            SQLAlchemyUnitOfWork(self.session_factory), StaticPricingService(), self.event_bus
+        )
+        with track_statements() as add_stats:
+            add_items.execute(OrderItemsRequestDTO(order_id=order_id, lines=[
+                OrderLineDTO(sku="LAPTOP123", quantity=1),
+                OrderLineDTO(sku="MOUSE456", quantity=2),
+                OrderLineDTO(sku="KEYBOARD789", quantity=1),
+            ]))
+
+        self.assertEqual(create_stats.commits, 1)
+        self.assertEqual(add_stats.commits, 1)
+        session = self.session_factory()
+        self.assertEqual(session.query(OrderItemModel).count(), 3)
+        session.close()
+
+    def test_group_commit_merges_use_cases_into_one_transaction(self):
+        """Test: Dentro de group_commit varios casos de uso comparten un único COMMIT"""
+        with track_statements() as stats:
+            with group_commit(self.session_factory):
+                for _ in range(5):
+                    self._create_order()
+                # Los eventos esperan al COMMIT del grupo
+                self.assertEqual(self.published.get_events_count(), 0)
+
+        self.assertEqual(stats.commits, 1)
+        self.assertEqual(self._count_orders(), 5)
+        self.assertEqual(self.published.get_events_count(), 5)
+
+    def test_failure_inside_group_discards_whole_group(self):
+        """Test: Si un caso de uso del grupo falla no se confirma nada ni se publica ningún evento"""
+        with track_statements() as stats:
+            with self.assertRaises(RuntimeError):
+                with group_commit(self.session_factory):
+                    self._create_order()
+                    with SQLAlchemyUnitOfWork(self.session_factory):
+                        raise RuntimeError("boom")
+
+        self.assertEqual(stats.commits, 0)
+        self.assertEqual(self._count_orders(), 0)
+        self.assertEqual(self.published.get_events_count(), 0)
+
+    def test_events_are_published_immediately_outside_a_group(self):
+        """Test: Sin group_commit cada caso de uso publica al confirmar su Unit of Work"""
+        self._create_order()
+
+        self.assertEqual(self.published.get_events_count(), 1)
+
+    def test_swallowed_failure_inside_group_fails_later_members_and_the_group(self):
+        """Test: Tras un fallo capturado, los casos de uso siguientes y el bloque lanzan GroupCommitAborted"""
+        with track_statements() as stats:
+            with self.assertRaises(GroupCommitAborted):
+                with group_commit(self.session_factory):
+                    self._create_order()
+                    try:
+                        with SQLAlchemyUnitOfWork(self.session_factory):
+                            raise RuntimeError("boom")
+                    except RuntimeError:
+                        pass
+                    with self.assertRaises(GroupCommitAborted):
+                        self._create_order()
+
+        self.assertEqual(stats.commits, 0)
+        self.assertEqual(self._count_orders(), 0)
+
+
+class TestSQLAlchemyAsyncUnitOfWorkCommits(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+        instrument_engine(self.engine.sync_engine)
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        self.session_factory = async_sessionmaker(self.engine, expire_on_commit=False)
+        self.published = InMemoryEventBus()
+        self.event_bus = GroupCommitEventBus(self.published)
+
+    async def asyncTearDown(self):
+        await self.engine.dispose()
+
+    async def _create_order(self):
+        use_case = AsyncCreateOrderUseCase(SQLAlchemyAsyncUnitOfWork(self.session_factory), self.event_bus)
+        await use_case.execute(CreateOrderRequestDTO(customer_id="customer-1"))
+
+    async def test_one_commit_per_use_case_and_per_group(self):
+        """Test: Un COMMIT por caso de uso, y uno solo para todo un grupo"""
+        with track_statements() as single_stats:
+            await self._create_order()
+
+        with track_statements() as group_stats:
+            async with async_group_commit(self.session_factory):
+                for _ in range(3):
+                    await self._create_order()
+
+        self.assertEqual(single_stats.commits, 1)
+        self.assertEqual(group_stats.commits, 1)
+        self.assertEqual(self.published.get_events_count(), 4)
+        async with SQLAlchemyAsyncUnitOfWork(self.session_factory) as uow:
+            self.assertEqual(len(await uow.orders.get_all()), 4)
+
+    async def test_swallowed_failure_inside_async_group_aborts_the_group(self):
+        """Test: El bloque asíncrono no sale como confirmado si un Unit of Work del grupo falló"""
+        with self.assertRaises(GroupCommitAborted):
+            async with async_group_commit(self.session_factory):
+                await self._create_order()
+                try:
+                    async with SQLAlchemyAsyncUnitOfWork(self.session_factory):
+                        raise RuntimeError("boom")
+                except RuntimeError:
+                    pass
+                with self.assertRaises(GroupCommitAborted):
+                    await self._create_order()
+
+        self.assertEqual(self.published.get_events_count(), 0)
+        async with SQLAlchemyAsyncUnitOfWork(self.session_factory) as uow:
+            self.assertEqual(await uow.orders.get_all(), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+"""
+Tests para el backend SQLite embebido (WAL): conexión, Unit of Work y
+selección desde el Container
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase
+from application.use_cases.get_order_use_case import GetOrderUseCase
+from container import Container
+from infrastructure.database.init_db import migrate
+from infrastructure.database.sqlite_connection import create_sqlite_engine, sqlite_settings_from_env
+from infrastructure.database.sqlite_unit_of_work import SQLiteUnitOfWork
+from infrastructure.database.statement_counter import track_statements
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.repositories.sqlite_order_repository import SQLiteOrderRepository
+from infrastructure.services.static_pricing_service import StaticPricingService
+
+
+class TestSQLiteUnitOfWork(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        path = os.path.join(self.tmp.name, "orders.db")
+        migrate(f"sqlite:///{path}")
+        self.engine = create_sqlite_engine(path)
+        self.session_factory = sessionmaker(bind=self.engine)
+
+    def tearDown(self):
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def _create_order(self) -> str:
+        use_case = CreateOrderUseCase(SQLiteUnitOfWork(self.session_factory), InMemoryEventBus())
+        return use_case.execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+
+    def test_pragmas_are_applied_to_each_connection(self):
+        """Test: WAL, synchronous=NORMAL y claves foráneas activas"""
+        with self.engine.connect() as connection:
+            self.assertEqual(connection.execute(text("PRAGMA journal_mode")).scalar(), "wal")
+            self.assertEqual(connection.execute(text("PRAGMA synchronous")).scalar(), 1)
+            self.assertEqual(connection.execute(text("PRAGMA foreign_keys")).scalar(), 1)
+
+    def test_writes_begin_immediate_and_reads_do_not_commit(self):
+        """Test: Las escrituras toman el bloqueo de escritor al empezar; las lecturas no confirman"""
+        with track_statements() as write_stats:
+            order_id = self._create_order()
+        self.assertEqual(write_stats.statements[0], "BEGIN IMMEDIATE")
+        self.assertEqual(write_stats.commits, 1)
+
+        with track_statements() as read_stats:
+            response = GetOrderUseCase(SQLiteUnitOfWork(self.session_factory, read_only=True)).execute(
+                GetOrderRequestDTO(order_id=order_id)
+            )
+        self.assertEqual(response.order_id, order_id)
+        self.assertEqual(read_stats.statements[0], "BEGIN")
+        self.assertEqual(read_stats.commits, 0)
+
+    def test_use_cases_round_trip(self):
+        """Test: Crear, añadir items y leer con el repositorio SQLite"""
+        order_id = self._create_order()
+        AddItemToOrderUseCase(SQLiteUnitOfWork(self.session_factory), StaticPricingService(), InMemoryEventBus()).execute(
+            AddItemToOrderRequestDTO(order_id=order_id, sku="LAPTOP123", quantity=2)
+        )
+
+        with SQLiteUnitOfWork(self.session_factory) as uow:
+            self.assertIsInstance(uow.orders, SQLiteOrderRepository)
+            order = uow.orders.get_for_update(order_id)
+        self.assertEqual(order.version, 2)
+        self.assertEqual(len(order.items), 1)
+
+    def test_one_connection_per_thread(self):
+        """Test: Cada hilo reutiliza su conexión y hilos distintos no la comparten"""
+        def connection_id():
+            with self.engine.connect() as connection:
+                return id(connection.connection.dbapi_connection)
+
+        here = [connection_id(), connection_id()]
+        other = []
+        thread = threading.Thread(target=lambda: other.append(connection_id()))
+        thread.start()
+        thread.join()
+
+        self.assertEqual(here[0], here[1])
+        self.assertNotEqual(here[0], other[0])
+
+
+class TestSQLiteContainer(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {
+            "ORDERS_BACKEND": "sqlite", "SQLITE_PATH": os.path.join(self.tmp.name, "orders.db")
+        })
+        self.env.start()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmp.cleanup()
+
+    def _dispose(self, container):
+        container._sqlite_engine.dispose()
+        asyncio.run(container._async_sqlite_engine.dispose())
+
+    def test_settings_from_env(self):
+        """Test: Ruta e hilos configurables por entorno"""
+        self.assertEqual(sqlite_settings_from_env({}), {"path": "orders.db", "threads": 40})
+
+    def test_container_selects_sqlite_and_data_survives_restart(self):
+        """Test: ORDERS_BACKEND=sqlite crea el esquema y las órdenes persisten entre Containers"""
+        container = Container()
+        created = container.create_order_use_case().execute(CreateOrderRequestDTO(customer_id="customer-1"))
+        self.assertEqual(container.get_database_pool_status()["backend"], "sqlite")
+        self._dispose(container)
+
+        restarted = Container()
+        found = restarted.get_order_use_case().execute(GetOrderRequestDTO(order_id=created.order_id))
+        async_found = asyncio.run(
+            restarted.async_get_order_use_case().execute(GetOrderRequestDTO(order_id=created.order_id))
+        )
+        self._dispose(restarted)
+
+        self.assertEqual(found.order_id, created.order_id)
+        self.assertEqual(async_found.order_id, created.order_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
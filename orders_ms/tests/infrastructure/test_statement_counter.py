@@ -0,0 +1,49 @@
+"""
+Tests para el contador de sentencias SQL por petición
+"""
+import unittest
+from sqlalchemy import create_engine, text
+
+from infrastructure.database.statement_counter import instrument_engine, track_statements
+
+
+class TestStatementCounter(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.engine = instrument_engine(create_engine("sqlite://"))
+
+    def tearDown(self):
+        self.engine.dispose()
+
+    def test_counts_statements_inside_block(self):
+        """Test: Cuenta las sentencias ejecutadas dentro del bloque"""
+        with track_statements() as stats:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                conn.execute(text("SELECT 2"))
+
+        self.assertEqual(stats.count, 2)
+        self.assertEqual(stats.statements, ["SELECT 1", "SELECT 2"])
+
+    def test_statements_outside_block_are_not_counted(self):
+        """Test: Fuera del bloque no se cuenta nada"""
+        with track_statements() as stats:
+            pass
+        with self.engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        self.assertEqual(stats.count, 0)
+
+    def test_instrument_engine_is_idempotent(self):
+        """Test: Instrumentar dos veces no duplica el conteo"""
+        instrument_engine(self.engine)
+        with track_statements() as stats:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+
+        self.assertEqual(stats.count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
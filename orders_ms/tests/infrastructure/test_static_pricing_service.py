@@ -39,5 +39,11 @@ class TestStaticPricingService(unittest.TestCase):
         exists = self.pricing_service.product_exists(sku)
         self.assertFalse(exists)
 
+    def test_get_prices_omits_unknown_products(self):
+        """Test: Obtener varios precios a la vez; los SKUs desconocidos no aparecen"""
+        prices = self.pricing_service.get_prices([SKU("LAPTOP123"), SKU("UNKNOWN000"), SKU("MOUSE456")])
+        self.assertEqual(set(prices), {"LAPTOP123", "MOUSE456"})
+        self.assertEqual(prices["MOUSE456"].amount, Decimal("29.99"))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,307 @@
+"""
+Tests para el write-behind de órdenes: fusión de guardados, lotes por
+intervalo/tamaño, durabilidad sync/async y cierre ordenado
+"""
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+
+from application.dtos.create_order_dtos import CreateOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
+from application.dtos.order_items_dtos import OrderItemsRequestDTO, OrderLineDTO
+from application.use_cases.add_items_to_order_use_case import AddItemsToOrderUseCase, AsyncAddItemsToOrderUseCase
+from application.use_cases.create_order_use_case import CreateOrderUseCase
+from application.use_cases.get_order_use_case import AsyncGetOrderUseCase
+from application.use_cases.replace_order_items_use_case import ReplaceOrderItemsUseCase
+from container import Container
+from infrastructure.database.connection import Base
+from infrastructure.database.in_memory_async_unit_of_work import InMemoryAsyncUnitOfWork
+from infrastructure.database.in_memory_unit_of_work import InMemoryUnitOfWork
+from infrastructure.database.models.order_model import OrderItemModel
+from infrastructure.database.sqlalchemy_unit_of_work import SQLAlchemyUnitOfWork
+from infrastructure.database.write_behind import ASYNC, SYNC, WriteBehindBuffer, write_behind_settings_from_env
+from infrastructure.database.write_behind_async_unit_of_work import AsyncWriteBehindUnitOfWork
+from infrastructure.database.write_behind_unit_of_work import WriteBehindUnitOfWork
+from infrastructure.events.in_memory_event_bus import InMemoryEventBus
+from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
+from infrastructure.services.static_pricing_service import AsyncStaticPricingService, StaticPricingService
+
+
+def _add(uow, order_id: str, *lines) -> None:
+    AddItemsToOrderUseCase(uow, StaticPricingService(), InMemoryEventBus()).execute(
+        OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO(sku, qty) for sku, qty in lines])
+    )
+
+
+class FailingUnitOfWork(InMemoryUnitOfWork):
+    """Unit of Work que falla al abrirse las primeras `failures` veces"""
+
+    failures = 0
+
+    def __enter__(self):
+        if FailingUnitOfWork.failures:
+            FailingUnitOfWork.failures -= 1
+            raise RuntimeError("database unavailable")
+        return super().__enter__()
+
+
+class BlockingUnitOfWork(InMemoryUnitOfWork):
+    """Unit of Work que avisa al abrirse y espera a `release` (lote en curso)"""
+
+    def __init__(self, repository, entered: threading.Event, release: threading.Event):
+        super().__init__(repository)
+        self.entered = entered
+        self.release = release
+
+    def __enter__(self):
+        self.entered.set()
+        self.release.wait(5)
+        return super().__enter__()
+
+
+class TestWriteBehindBuffer(unittest.TestCase):
+
+    def setUp(self):
+        """Se ejecuta antes de cada test"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self.tmp.name, 'orders.db')}")
+        Base.metadata.create_all(self.engine)
+        self.session_factory = sessionmaker(bind=self.engine)
+        self.buffers = []
+
+    def tearDown(self):
+        for buffer in self.buffers:
+            buffer.close()
+        self.engine.dispose()
+        self.tmp.cleanup()
+
+    def _buffer(self, mode=ASYNC, **options) -> WriteBehindBuffer:
+        options.setdefault("interval", 60)
+        buffer = WriteBehindBuffer(lambda: SQLAlchemyUnitOfWork(self.session_factory), mode, **options)
+        self.buffers.append(buffer)
+        return buffer
+
+    def _uow(self, buffer, read_only=False):
+        return WriteBehindUnitOfWork(SQLAlchemyUnitOfWork(self.session_factory, read_only=read_only), buffer)
+
+    def _stored_items(self) -> int:
+        with self.engine.connect() as connection:
+            return connection.execute(select(func.count()).select_from(OrderItemModel)).scalar()
+
+    def _create(self, buffer) -> str:
+        return CreateOrderUseCase(self._uow(buffer), InMemoryEventBus()).execute(
+            CreateOrderRequestDTO(customer_id="customer-1")
+        ).order_id
+
+    def test_async_mode_coalesces_saves_into_one_write(self):
+        """Test: Muchos guardados de la misma orden se fusionan y se escriben en un lote"""
+        buffer = self._buffer()
+        order_id = self._create(buffer)
+        for _ in range(20):
+            _add(self._uow(buffer), order_id, ("MOUSE456", 1))
+
+        self.assertEqual(self._stored_items(), 0)
+        with self._uow(buffer, read_only=True) as uow:
+            self.assertEqual(len(uow.orders.get(order_id).items), 20)
+
+        self.assertTrue(buffer.flush(timeout=5))
+        status = buffer.status()
+        self.assertEqual(self._stored_items(), 20)
+        self.assertEqual((status["saves"], status["coalesced"], status["flushes"]), (21, 20, 1))
+
+    def test_replace_and_appends_are_merged_in_order(self):
+        """Test: Añadir, reemplazar y añadir deja el mismo estado que sin write-behind"""
+        buffer = self._buffer()
+        order_id = self._create(buffer)
+        _add(self._uow(buffer), order_id, ("LAPTOP123", 1))
+        buffer.flush(timeout=5)
+        _add(self._uow(buffer), order_id, ("MOUSE456", 2))
+        ReplaceOrderItemsUseCase(self._uow(buffer), StaticPricingService(), InMemoryEventBus()).execute(
+            OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("MOUSE456", 3)])
+        )
+        _add(self._uow(buffer), order_id, ("LAPTOP123", 4))
+        buffer.flush(timeout=5)
+
+        with SQLAlchemyUnitOfWork(self.session_factory, read_only=True) as uow:
+            order = uow.orders.get(order_id)
+        self.assertEqual([(sku.code, qty.amount) for sku, qty, _ in order.items], [("MOUSE456", 3), ("LAPTOP123", 4)])
+        # Un UPDATE por lote: alta + primer item (v1) y los tres cambios siguientes (v2)
+        self.assertEqual(order.version, 2)
+
+    def test_replace_after_create_keeps_the_full_write(self):
+        """Test: Crear y reemplazar los items antes del lote escribe la orden (no se pierde)"""
+        repository = InMemoryOrderRepository()
+        buffer = WriteBehindBuffer(lambda: InMemoryUnitOfWork(repository), ASYNC, interval=60)
+        self.buffers.append(buffer)
+        order_id = CreateOrderUseCase(
+            WriteBehindUnitOfWork(InMemoryUnitOfWork(repository), buffer), InMemoryEventBus()
+        ).execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+        ReplaceOrderItemsUseCase(
+            WriteBehindUnitOfWork(InMemoryUnitOfWork(repository), buffer), StaticPricingService(), InMemoryEventBus()
+        ).execute(OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("MOUSE456", 2)]))
+
+        self.assertTrue(buffer.flush(timeout=5))
+        order = repository.get(order_id)
+        self.assertIsNotNone(order)
+        self.assertEqual([(sku.code, qty.amount) for sku, qty, _ in order.items], [("MOUSE456", 2)])
+
+    def test_delete_waits_for_the_batch_being_written(self):
+        """Test: Un borrado durante la escritura del lote de la orden no deja que el lote la resucite"""
+        repository = InMemoryOrderRepository()
+        entered, release = threading.Event(), threading.Event()
+        buffer = WriteBehindBuffer(lambda: BlockingUnitOfWork(repository, entered, release), ASYNC, interval=0.01)
+        self.buffers.append(buffer)
+        order_id = CreateOrderUseCase(
+            WriteBehindUnitOfWork(InMemoryUnitOfWork(repository), buffer), InMemoryEventBus()
+        ).execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+        self.assertTrue(entered.wait(5))
+
+        def delete():
+            with WriteBehindUnitOfWork(InMemoryUnitOfWork(repository), buffer) as uow:
+                uow.orders.delete(order_id)
+                uow.commit()
+
+        deleter = threading.Thread(target=delete)
+        deleter.start()
+        deleter.join(0.05)
+        self.assertTrue(deleter.is_alive())
+        release.set()
+        deleter.join(5)
+
+        self.assertTrue(buffer.flush(timeout=5))
+        self.assertIsNone(repository.get(order_id))
+
+    def test_size_threshold_triggers_flush(self):
+        """Test: Al llegar a max_batch órdenes pendientes se escriben sin esperar al intervalo"""
+        buffer = self._buffer(max_batch=2)
+        self._create(buffer)
+        self._create(buffer)
+        deadline = time.monotonic() + 5
+        while buffer.status()["orders_written"] < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(buffer.status()["orders_written"], 2)
+
+    def test_sync_mode_commit_waits_for_the_write(self):
+        """Test: En modo sync, al volver el caso de uso la escritura ya está confirmada"""
+        buffer = self._buffer(SYNC)
+        order_id = self._create(buffer)
+        _add(self._uow(buffer), order_id, ("LAPTOP123", 1), ("MOUSE456", 1))
+        self.assertEqual(self._stored_items(), 2)
+        self.assertEqual(buffer.status()["pending"], 0)
+
+    def test_sync_mode_failure_is_reported_to_the_caller(self):
+        """Test: En modo sync un lote fallido llega como error al commit (nada se da por escrito)"""
+        repository = InMemoryOrderRepository()
+        buffer = WriteBehindBuffer(lambda: FailingUnitOfWork(repository), SYNC)
+        self.buffers.append(buffer)
+        FailingUnitOfWork.failures = 1
+        with self.assertRaises(RuntimeError):
+            CreateOrderUseCase(WriteBehindUnitOfWork(InMemoryUnitOfWork(repository), buffer), InMemoryEventBus()).execute(
+                CreateOrderRequestDTO(customer_id="customer-1")
+            )
+        self.assertEqual(repository.get_all(), [])
+        self.assertEqual(buffer.status()["failures"], 1)
+
+    def test_async_mode_retries_failed_flushes(self):
+        """Test: En modo async un lote fallido vuelve al buffer y se reintenta"""
+        repository = InMemoryOrderRepository()
+        buffer = WriteBehindBuffer(lambda: FailingUnitOfWork(repository), ASYNC, interval=0.01)
+        self.buffers.append(buffer)
+        FailingUnitOfWork.failures = 2
+        order_id = CreateOrderUseCase(
+            WriteBehindUnitOfWork(InMemoryUnitOfWork(repository), buffer), InMemoryEventBus()
+        ).execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+
+        self.assertTrue(buffer.flush(timeout=5))
+        self.assertIsNotNone(repository.get(order_id))
+        self.assertEqual(buffer.status()["failures"], 2)
+
+    def test_close_flushes_pending_writes(self):
+        """Test: close() (hook de apagado) escribe lo pendiente y no admite más cambios"""
+        buffer = self._buffer()
+        order_id = self._create(buffer)
+        _add(self._uow(buffer), order_id, ("LAPTOP123", 1))
+        buffer.close()
+
+        self.assertEqual(self._stored_items(), 1)
+        with self.assertRaises(RuntimeError):
+            self._create(buffer)
+
+    def test_async_unit_of_work_shares_the_buffer(self):
+        """Test: La ruta asíncrona difiere sus guardados al mismo buffer y lee lo pendiente"""
+        repository = InMemoryOrderRepository()
+        buffer = WriteBehindBuffer(lambda: InMemoryUnitOfWork(repository), ASYNC, interval=60)
+        self.buffers.append(buffer)
+        order_id = self._create_in_memory(repository, buffer)
+
+        async def scenario():
+            await AsyncAddItemsToOrderUseCase(
+                AsyncWriteBehindUnitOfWork(InMemoryAsyncUnitOfWork(repository), buffer),
+                AsyncStaticPricingService(), InMemoryEventBus()
+            ).execute(OrderItemsRequestDTO(order_id=order_id, lines=[OrderLineDTO("MOUSE456", 2)]))
+            return await AsyncGetOrderUseCase(
+                AsyncWriteBehindUnitOfWork(InMemoryAsyncUnitOfWork(repository), buffer)
+            ).execute(GetOrderRequestDTO(order_id=order_id))
+
+        response = asyncio.run(scenario())
+        self.assertEqual(len(response.items), 1)
+        self.assertIsNone(repository.get(order_id))
+        buffer.flush(timeout=5)
+        self.assertEqual(len(repository.get(order_id).items), 1)
+
+    def test_get_version_is_unknown_while_changes_are_pending(self):
+        """Test: Con cambios sin escribir get_version devuelve None (la versión escrita no identifica lo leído)"""
+        buffer = self._buffer()
+        order_id = self._create(buffer)
+        buffer.flush(timeout=5)
+        with self._uow(buffer, read_only=True) as uow:
+            self.assertEqual(uow.orders.get_version(order_id), 1)
+
+        _add(self._uow(buffer), order_id, ("MOUSE456", 1))
+        with self._uow(buffer, read_only=True) as uow:
+            self.assertIsNone(uow.orders.get_version(order_id))
+
+        buffer.flush(timeout=5)
+        with self._uow(buffer, read_only=True) as uow:
+            self.assertEqual(uow.orders.get_version(order_id), 2)
+
+    def _create_in_memory(self, repository, buffer) -> str:
+        return CreateOrderUseCase(
+            WriteBehindUnitOfWork(InMemoryUnitOfWork(repository), buffer), InMemoryEventBus()
+        ).execute(CreateOrderRequestDTO(customer_id="customer-1")).order_id
+
+
+class TestWriteBehindContainer(unittest.TestCase):
+
+    def test_settings_from_env(self):
+        """Test: Desactivado por defecto; modo, intervalo y lote configurables"""
+        self.assertIsNone(write_behind_settings_from_env({}))
+        self.assertEqual(
+            write_behind_settings_from_env({
+                "ORDER_WRITE_BEHIND": "sync", "ORDER_WRITE_BEHIND_INTERVAL_MS": "20", "ORDER_WRITE_BEHIND_MAX_BATCH": "10"
+            }),
+            {"mode": "sync", "interval": 0.02, "max_batch": 10}
+        )
+
+    def test_container_enables_write_behind(self):
+        """Test: ORDER_WRITE_BEHIND=sync envuelve los Unit of Work del Container"""
+        with patch.dict(os.environ, {"ORDER_WRITE_BEHIND": "sync"}):
+            container = Container()
+        created = container.create_order_use_case().execute(CreateOrderRequestDTO(customer_id="customer-1"))
+        found = container.get_order_use_case().execute(GetOrderRequestDTO(order_id=created.order_id))
+        status = container.get_write_behind_status()
+        container.shutdown()
+
+        self.assertEqual(found.order_id, created.order_id)
+        self.assertEqual((status["mode"], status["orders_written"]), ("sync", 1))
+        self.assertIsNone(Container().get_write_behind_status())
+
+
+if __name__ == '__main__':
+    unittest.main()
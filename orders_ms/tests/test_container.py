@@ -6,12 +6,16 @@ from container import Container
 from application.use_cases.create_order_use_case import CreateOrderUseCase
 from application.use_cases.add_item_to_order_use_case import AddItemToOrderUseCase
 from application.use_cases.get_order_use_case import GetOrderUseCase
-from application.use_cases.list_orders_use_case import ListOrdersUseCase
+from application.use_cases.list_orders_use_case import ListOrdersUseCase, AsyncListOrdersUseCase
+from application.use_cases.create_order_use_case import AsyncCreateOrderUseCase
+from application.use_cases.add_item_to_order_use_case import AsyncAddItemToOrderUseCase
+from application.use_cases.get_order_use_case import AsyncGetOrderUseCase
 from infrastructure.repositories.in_memory_order_repository import InMemoryOrderRepository
 from infrastructure.services.static_pricing_service import StaticPricingService
 from infrastructure.events.in_memory_event_bus import InMemoryEventBus
 from application.dtos.create_order_dtos import CreateOrderRequestDTO
 from application.dtos.add_item_to_order_dtos import AddItemToOrderRequestDTO
+from application.dtos.get_order_dtos import GetOrderRequestDTO
 
 class TestContainer(unittest.TestCase):
     
@@ -31,6 +35,13 @@ class TestContainer(unittest.TestCase):
         self.assertIsInstance(self.container.get_order_use_case(), GetOrderUseCase)
         self.assertIsInstance(self.container.list_orders_use_case(), ListOrdersUseCase)
     
+    def test_container_creates_async_use_cases(self):
+        """Test: Container crea las variantes asíncronas de los casos de uso"""
+        self.assertIsInstance(self.container.async_create_order_use_case(), AsyncCreateOrderUseCase)
+        self.assertIsInstance(self.container.async_add_item_use_case(), AsyncAddItemToOrderUseCase)
+        self.assertIsInstance(self.container.async_get_order_use_case(), AsyncGetOrderUseCase)
+        self.assertIsInstance(self.container.async_list_orders_use_case(), AsyncListOrdersUseCase)
+    
     def test_use_cases_share_same_dependencies(self):
         """Test: Los casos de uso comparten las mismas instancias de dependencias"""
         # Verificar que el container usa las mismas instancias
@@ -96,5 +107,21 @@ class TestContainer(unittest.TestCase):
         self.assertIsNone(container2.get_repository().get(order_id))
         self.assertEqual(container2.get_event_bus().get_events_count(), 0)
 
+    def test_database_pool_status_in_memory(self):
+        """Test: En testing no hay pool de conexiones que reportar"""
+        status = self.container.get_database_pool_status()
+        self.assertEqual(status, {"backend": "in_memory", "pools": {}})
+
+    def test_read_use_cases_accept_consistency_token_in_memory(self):
+        """Test: Sin réplica no hay token y las lecturas con token ven la escritura"""
+        order_id = self.container.create_order_use_case().execute(
+            CreateOrderRequestDTO(customer_id="customer-123")
+        ).order_id
+        token = self.container.consistency_token()
+
+        self.assertIsNone(token)
+        use_case = self.container.get_order_use_case(consistency_token=token)
+        self.assertIsNotNone(use_case.execute(GetOrderRequestDTO(order_id=order_id)))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file